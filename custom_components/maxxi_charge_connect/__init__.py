@@ -10,7 +10,13 @@ import logging
 
 from homeassistant.const import Platform
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 from homeassistant.helpers import entity_registry as er
 
@@ -26,18 +32,31 @@ from .const import (
     CONF_NEEDS_DEVICE_ID,
     DEFAULT_ENABLE_LOCAL_CLOUD_PROXY,
     DOMAIN,
+    ENERGY_ACCUMULATOR,
+    FRAME_ARCHIVE,
+    FRAME_BUFFER,
+    WINTER_CONTROLLER,
     NOTIFY_MIGRATION,
     OPTIONAL,
     REQUIRED,
     NEIN,
     DEFAULT_WINTER_MODE,
     CONF_WINTER_MODE,
+    CONF_WINTER_FORECAST,
+    DEFAULT_WINTER_FORECAST,
     CONF_SUMMER_MIN_CHARGE,
     DEFAULT_SUMMER_MIN_CHARGE,
 )
+from .devices.frame_buffer import (
+    QUERY_RECENT_SCHEMA,
+    SERVICE_QUERY_RECENT,
+    async_handle_query_recent,
+)
 from .http_scan.maxxi_data_update_coordinator import MaxxiDataUpdateCoordinator
 from .migration.migration_from_yaml import MigrateFromYaml
 from .reverse_proxy.proxy_server import MaxxiProxyServer
+from .sensor import CONVERTER_MANAGER, SENSOR_MANAGER
+from .tools import get_entity
 from .webhook import async_register_webhook, async_unregister_webhook
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,6 +68,21 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+def _validate_mappings(mappings) -> None:
+    """Prüft die Mappings eines Migrations-Service-Aufrufs.
+
+    Raises:
+        ValueError: Wenn die Mappings nicht das erwartete Format haben.
+    """
+    if not isinstance(mappings, list) or not all(
+        isinstance(item, dict) for item in mappings
+    ):
+        raise ValueError("Mappings must be a list of dictionaries.")
+    for item in mappings:
+        if "old_sensor" not in item or "new_sensor" not in item:
+            raise ValueError("Each mapping must contain 'old_sensor' and 'new_sensor'.")
+
+
 async def check_device_id_issue(hass):
     """Prüfen, ob die Device ID gesetzt wurde."""
     _LOGGER.debug("CHECK Device_ID.....")
@@ -114,8 +148,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         CONF_SUMMER_MIN_CHARGE, DEFAULT_SUMMER_MIN_CHARGE
     )
 
-    hass.data[DOMAIN][CONF_WINTER_MODE] = winter_mode
-    hass.data[DOMAIN][CONF_SUMMER_MIN_CHARGE] = summer_min_discharge
+    hass.data[DOMAIN][entry.entry_id][CONF_WINTER_MODE] = winter_mode
+    hass.data[DOMAIN][entry.entry_id][CONF_SUMMER_MIN_CHARGE] = summer_min_discharge
+    hass.data[DOMAIN][entry.entry_id][CONF_WINTER_FORECAST] = entry.options.get(
+        CONF_WINTER_FORECAST, DEFAULT_WINTER_FORECAST
+    )
 
     coordinator = MaxxiDataUpdateCoordinator(hass, entry, sensor_list)
 
@@ -140,15 +177,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         mappings = call.data.get("mappings", [])
 
         try:
-            if not isinstance(mappings, list) or not all(
-                isinstance(item, dict) for item in mappings
-            ):
-                raise ValueError("Mappings must be a list of dictionaries.")
-            for item in mappings:
-                if "old_sensor" not in item or "new_sensor" not in item:
-                    raise ValueError(
-                        "Each mapping must contain 'old_sensor' and 'new_sensor'."
-                    )
+            _validate_mappings(mappings)
         except ValueError as e:
             _LOGGER.error("Invalid mappings provided for migration: %s", e)
             return
@@ -162,6 +191,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         DOMAIN, "migration_von_yaml_konfiguration", handle_trigger_migration
     )
 
+    async def handle_plan_migration(call: ServiceCall) -> ServiceResponse:
+        mappings = call.data.get("mappings", [])
+
+        try:
+            _validate_mappings(mappings)
+        except ValueError as e:
+            raise ServiceValidationError(str(e)) from e
+
+        return await migrator.async_plan_migration(mappings)
+
+    hass.services.async_register(
+        DOMAIN,
+        "migration_planen",
+        handle_plan_migration,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def handle_query_recent(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_query_recent(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_RECENT,
+        handle_query_recent,
+        schema=QUERY_RECENT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
     # Migration-Hinweis
     notify_migration = entry.data.get(NOTIFY_MIGRATION, False)
     if notify_migration:
@@ -230,6 +287,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Entlädt die Integration vollständig und deregistriert den Webhook."""
     await async_unregister_webhook(hass, entry)
 
+    accumulator = hass.data[DOMAIN].get(entry.entry_id, {}).get(ENERGY_ACCUMULATOR)
+    if accumulator is not None:
+        await accumulator.async_unload()
+
+    winter_controller = (
+        hass.data[DOMAIN].get(entry.entry_id, {}).get(WINTER_CONTROLLER)
+    )
+    if winter_controller is not None:
+        await winter_controller.async_unload()
+
+    frame_buffer = hass.data[DOMAIN].get(entry.entry_id, {}).pop(FRAME_BUFFER, None)
+    if frame_buffer is not None:
+        frame_buffer.async_unload()
+
+    frame_archive = hass.data[DOMAIN].get(entry.entry_id, {}).pop(FRAME_ARCHIVE, None)
+    if frame_archive is not None:
+        await frame_archive.async_unload()
+
+    for managers in (SENSOR_MANAGER, CONVERTER_MANAGER):
+        manager = managers.pop(entry.entry_id, None)
+        if manager is not None:
+            manager.async_unload()
+
     unload_ok = all(
         await asyncio.gather(
             *[
@@ -292,11 +372,9 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
             f"{config_entry.entry_id}_pv_self_consumption_energy_total",
             f"{config_entry.entry_id}_pv_self_consumption_energy_today",
         ]
-        for entity in list(entity_registry.entities.values()):
-            if (
-                entity.config_entry_id == config_entry.entry_id
-                and entity.unique_id in unique_ids_to_remove
-            ):
+        for unique_id in unique_ids_to_remove:
+            entity = get_entity(hass, DOMAIN, unique_id, "sensor")
+            if entity is not None and entity.config_entry_id == config_entry.entry_id:
                 _LOGGER.info("Entferne veraltete Entität: %s", entity.entity_id)
                 entity_registry.async_remove(entity.entity_id)
         version = 3
@@ -370,15 +448,14 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
             old_unique_id = f"{config_entry.entry_id}_error_sensor"
 
-            for entity_id, entry in registry.entities.items():
-                if entry.unique_id == old_unique_id:
-                    registry.async_remove(entity_id)
-                    _LOGGER.info(
-                        "Alte Error-Sensor Entity entfernt:  %s | %s",
-                        entity_id,
-                        old_unique_id,
-                    )
-                    break
+            entity = get_entity(hass, DOMAIN, old_unique_id)
+            if entity is not None:
+                registry.async_remove(entity.entity_id)
+                _LOGGER.info(
+                    "Alte Error-Sensor Entity entfernt:  %s | %s",
+                    entity.entity_id,
+                    old_unique_id,
+                )
 
             minor_version = 3
             hass.config_entries.async_update_entry(
@@ -397,15 +474,14 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
             old_unique_id = f"{config_entry.entry_id}_last_message_sensor"
 
-            for entity_id, entry in registry.entities.items():
-                if entry.unique_id == old_unique_id:
-                    registry.async_remove(entity_id)
-                    _LOGGER.info(
-                        "Alte Last-Message-Sensor Entity entfernt:  %s | %s",
-                        entity_id,
-                        old_unique_id,
-                    )
-                    break
+            entity = get_entity(hass, DOMAIN, old_unique_id)
+            if entity is not None:
+                registry.async_remove(entity.entity_id)
+                _LOGGER.info(
+                    "Alte Last-Message-Sensor Entity entfernt:  %s | %s",
+                    entity.entity_id,
+                    old_unique_id,
+                )
 
             minor_version = 4
             hass.config_entries.async_update_entry(
@@ -19,6 +19,14 @@ from .const import (
     CONF_REFRESH_CONFIG_FROM_CLOUD,
     CONF_TIMEOUT_RECEIVE,
     DEFAULT_TIMEOUT_RECEIVE,
+    CONF_ENERGY_CHECKPOINT_INTERVAL,
+    DEFAULT_ENERGY_CHECKPOINT_INTERVAL,
+    MIN_ENERGY_CHECKPOINT_INTERVAL,
+    CONF_FRAME_ARCHIVE,
+    DEFAULT_FRAME_ARCHIVE,
+    CONF_FRAME_ARCHIVE_RETENTION_DAYS,
+    DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS,
+    MAX_FRAME_ARCHIVE_RETENTION_DAYS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +51,9 @@ class MaxxiChargeConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     _enable_forward_to_cloud: bool = DEFAULT_ENABLE_FORWARD_TO_CLOUD
     _enable_cloud_data: bool = False
     _refresh_cloud_data: bool = False
+    _checkpoint_interval: int = DEFAULT_ENERGY_CHECKPOINT_INTERVAL
+    _frame_archive: bool = DEFAULT_FRAME_ARCHIVE
+    _frame_archive_retention_days: int = DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS
 
     _entry: config_entries.ConfigEntry | None = None  # nur beim Reconfigure
 
@@ -103,6 +114,15 @@ class MaxxiChargeConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._enable_local_cloud_proxy = user_input.get(
                 CONF_ENABLE_LOCAL_CLOUD_PROXY, False
             )
+            self._checkpoint_interval = user_input.get(
+                CONF_ENERGY_CHECKPOINT_INTERVAL, DEFAULT_ENERGY_CHECKPOINT_INTERVAL
+            )
+            self._frame_archive = user_input.get(
+                CONF_FRAME_ARCHIVE, DEFAULT_FRAME_ARCHIVE
+            )
+            self._frame_archive_retention_days = user_input.get(
+                CONF_FRAME_ARCHIVE_RETENTION_DAYS, DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS
+            )
 
             # Pflichtfeldprüfung
             if not self._timeout_receive:
@@ -161,15 +181,24 @@ class MaxxiChargeConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_ENABLE_CLOUD_DATA: self._enable_cloud_data,
             CONF_REFRESH_CONFIG_FROM_CLOUD: self._refresh_cloud_data,
         }
-        _LOGGER.debug("Creating entry with data: %s", data)
+        # Einstellungen, die zur Laufzeit aus entry.options gelesen werden
+        options = {
+            CONF_ENERGY_CHECKPOINT_INTERVAL: self._checkpoint_interval,
+            CONF_FRAME_ARCHIVE: self._frame_archive,
+            CONF_FRAME_ARCHIVE_RETENTION_DAYS: self._frame_archive_retention_days,
+        }
+        _LOGGER.debug("Creating entry with data: %s, options: %s", data, options)
 
         if entry is not None:
+            options = {**entry.options, **options}
             self.hass.config_entries.async_update_entry(
-                entry, data=data, title=self._name
+                entry, data=data, title=self._name, options=options
+            )
+            return self.async_update_reload_and_abort(
+                entry, data_updates=data, options=options
             )
-            return self.async_update_reload_and_abort(entry, data_updates=data)
 
-        return self.async_create_entry(title=self._name, data=data)
+        return self.async_create_entry(title=self._name, data=data, options=options)
 
     # ----------------------------------------
     # Schema & Defaults
@@ -211,6 +240,29 @@ class MaxxiChargeConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_ENABLE_LOCAL_CLOUD_PROXY, DEFAULT_ENABLE_LOCAL_CLOUD_PROXY
                     ),
                 ): BooleanSelector(),
+                vol.Optional(
+                    CONF_ENERGY_CHECKPOINT_INTERVAL,
+                    default=defaults.get(
+                        CONF_ENERGY_CHECKPOINT_INTERVAL,
+                        DEFAULT_ENERGY_CHECKPOINT_INTERVAL,
+                    ),
+                ): vol.All(
+                    vol.Coerce(int), vol.Range(min=MIN_ENERGY_CHECKPOINT_INTERVAL)
+                ),
+                vol.Optional(
+                    CONF_FRAME_ARCHIVE,
+                    default=defaults.get(CONF_FRAME_ARCHIVE, DEFAULT_FRAME_ARCHIVE),
+                ): BooleanSelector(),
+                vol.Optional(
+                    CONF_FRAME_ARCHIVE_RETENTION_DAYS,
+                    default=defaults.get(
+                        CONF_FRAME_ARCHIVE_RETENTION_DAYS,
+                        DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS,
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=1, max=MAX_FRAME_ARCHIVE_RETENTION_DAYS),
+                ),
             }
         )
 
@@ -249,6 +301,9 @@ class MaxxiChargeConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_TIMEOUT_RECEIVE: self._timeout_receive,
             NOTIFY_MIGRATION: self._notify_migration,
             CONF_ENABLE_LOCAL_CLOUD_PROXY: self._enable_local_cloud_proxy,
+            CONF_ENERGY_CHECKPOINT_INTERVAL: self._checkpoint_interval,
+            CONF_FRAME_ARCHIVE: self._frame_archive,
+            CONF_FRAME_ARCHIVE_RETENTION_DAYS: self._frame_archive_retention_days,
         }
 
     def _get_defaults_for_proxy_step(self):
@@ -282,6 +337,15 @@ class MaxxiChargeConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
         self._enable_cloud_data = entry.data.get(CONF_ENABLE_CLOUD_DATA, False)
         self._refresh_cloud_data = entry.data.get(CONF_REFRESH_CONFIG_FROM_CLOUD, False)
+        self._checkpoint_interval = entry.options.get(
+            CONF_ENERGY_CHECKPOINT_INTERVAL, DEFAULT_ENERGY_CHECKPOINT_INTERVAL
+        )
+        self._frame_archive = entry.options.get(
+            CONF_FRAME_ARCHIVE, DEFAULT_FRAME_ARCHIVE
+        )
+        self._frame_archive_retention_days = entry.options.get(
+            CONF_FRAME_ARCHIVE_RETENTION_DAYS, DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS
+        )
 
         _LOGGER.debug(
             "Reconfigure internal state: %s",
@@ -297,6 +361,9 @@ class MaxxiChargeConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "enable_cloud_data": self._enable_cloud_data,
                 "refresh_cloud_data": self._refresh_cloud_data,
                 "timeout_receive": self._timeout_receive,
+                "checkpoint_interval": self._checkpoint_interval,
+                "frame_archive": self._frame_archive,
+                "frame_archive_retention_days": self._frame_archive_retention_days,
             },
         )
         return await self.async_step_user(user_input)
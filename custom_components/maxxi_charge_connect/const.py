@@ -29,6 +29,7 @@ NOTIFY_MIGRATION = "notify_migration"
 # Fehler die per Reverse-Proxy reinkommen
 PROXY_STATUS_EVENTNAME = "MaxxiChargeStatusEvent"
 HTTP_SCAN_EVENTNAME = "MaxxiChargeHttpScanEvent"
+MIGRATION_PROGRESS_EVENTNAME = "MaxxiChargeMigrationProgressEvent"
 PROXY_ERROR_CCU = "ccu"
 PROXY_ERROR_IP = "ip_addr"
 PROXY_ERROR_DEVICE_ID = "deviceId"
@@ -67,6 +68,23 @@ WEBHOOK_SIGNAL_STATE = "signal_state"
 WEBHOOK_LAST_UPDATE = "webhook_last_update"
 WEBHOOK_WATCHDOG_TASK = "webhook_watchdog_task"
 
+# Energiezählung (key in hass.data[DOMAIN][entry_id])
+ENERGY_ACCUMULATOR = "energy_accumulator"
+ENERGY_ENTITIES = "energy_entities"  # unique_id → Energie-Sensor des Eintrags
+WINTER_CONTROLLER = "winter_controller"  # WinterModeController des Eintrags
+FRAME_BUFFER = "frame_buffer"  # FrameBuffer (Ringpuffer) des Eintrags
+FRAME_ARCHIVE = "frame_archive_writer"  # FrameArchive des Eintrags
+CONF_ENERGY_CHECKPOINT_INTERVAL = "energy_checkpoint_interval"
+DEFAULT_ENERGY_CHECKPOINT_INTERVAL = 300  # Sekunden
+MIN_ENERGY_CHECKPOINT_INTERVAL = 30  # Sekunden
+
+# Spaltenarchiv der Rohdaten (ein File je Tag)
+CONF_FRAME_ARCHIVE = "frame_archive"
+DEFAULT_FRAME_ARCHIVE = False
+CONF_FRAME_ARCHIVE_RETENTION_DAYS = "frame_archive_retention_days"
+DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS = 365
+MAX_FRAME_ARCHIVE_RETENTION_DAYS = 3650
+
 # Winterbetrieb related constants
 CONF_WINTER_MODE = "winter_mode"
 CONF_WINTER_MIN_CHARGE = "winter_min_charge"
@@ -76,6 +94,10 @@ DEFAULT_WINTER_MIN_CHARGE = 20  # %
 DEFAULT_WINTER_MAX_CHARGE = 60  # %
 DEFAULT_WINTER_MODE = False
 
+# Prognose-Modus: minSOC vor dem Erreichen der Schwelle umschalten
+CONF_WINTER_FORECAST = "winter_forecast"
+DEFAULT_WINTER_FORECAST = False
+
 WINTER_MODE_CHANGED_EVENT = f"{DOMAIN}_winter_mode_changed"
 EVENT_WINTER_MIN_CHARGE_CHANGED = f"{DOMAIN}_winter_min_charge_changed"
 EVENT_WINTER_MAX_CHARGE_CHANGED = f"{DOMAIN}_winter_max_charge_changed"
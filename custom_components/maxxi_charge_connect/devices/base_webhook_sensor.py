@@ -14,7 +14,6 @@ import logging
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import Event
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.restore_state import RestoreEntity
 
@@ -24,12 +23,10 @@ from ..const import (
     CONF_DEVICE_ID,
     CONF_ENABLE_CLOUD_DATA,
     DOMAIN,
-    PROXY_ERROR_DEVICE_ID,
-    PROXY_STATUS_EVENTNAME,
-    HTTP_SCAN_EVENTNAME,
     WEBHOOK_SIGNAL_STATE,
     WEBHOOK_SIGNAL_UPDATE,
 )
+from ..tools import proxy_frame_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,8 +79,11 @@ class BaseWebhookSensor(RestoreEntity, SensorEntity):
 
         if self._enable_cloud_data:
             _LOGGER.info("Daten kommen vom Proxy")
-            self.hass.bus.async_listen(
-                PROXY_STATUS_EVENTNAME, self.async_update_from_event
+            # Nur die Daten dieses Geräts (kein Filtern aller Proxy-Events)
+            self._unsub_update = async_dispatcher_connect(
+                self.hass,
+                proxy_frame_signal(self._entry.data.get(CONF_DEVICE_ID)),
+                self._wrapper_update,
             )
         else:
             # Dispatcher abonnieren
@@ -120,29 +120,17 @@ class BaseWebhookSensor(RestoreEntity, SensorEntity):
 
     async def async_will_remove_from_hass(self):
         """Abmelden beim Dispatcher."""
-        if hasattr(self, "_unsub_update"):
+        if getattr(self, "_unsub_update", None):
             self._unsub_update()
-        if hasattr(self, "_unsub_stale"):
+            self._unsub_update = None
+        if getattr(self, "_unsub_stale", None):
             self._unsub_stale()
+            self._unsub_stale = None
 
     #
     # ---- Dispatcher-Wrapper ----
     #
 
-    async def async_update_from_event(self, event: Event):
-        """Aktualisiert Sensor von Proxy-Event."""
-
-        _LOGGER.debug("Sensor(async_update_from_event) %s, %s: Event empfangen: %s", self.__class__.__name__, event.event_type, event)
-
-        # HTTP-Scan Events ignorieren - diese haben keine Batterie-Daten
-        if event.event_type == HTTP_SCAN_EVENTNAME:
-            return
-
-        json_data = event.data.get("payload", {})
-
-        if json_data.get(PROXY_ERROR_DEVICE_ID) == self._entry.data.get(CONF_DEVICE_ID):
-            await self._wrapper_update(json_data)
-
     async def check_valid(self, data: dict) -> bool:
         """Prüft, ob die empfangenen Daten gültig sind."""
 
@@ -4,8 +4,6 @@ Definiert eine Sensor-Entität, die die Ladeleistung einer einzelnen Batterie da
 dynamische Aktualisierungen verarbeitet und Geräteinformationen für Home Assistant bereitstellt.
 """
 
-import logging
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorStateClass,
@@ -14,12 +12,10 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfPower
 
-from .base_webhook_sensor import BaseWebhookSensor
-
-_LOGGER = logging.getLogger(__name__)
+from .battery_column_sensor import BatteryColumnSensor
 
 
-class BatteryChargeSensor(BaseWebhookSensor):
+class BatteryChargeSensor(BatteryColumnSensor):
     """Sensor-Entität zur Darstellung der Ladeleistung einer bestimmten Batterie.
 
     Attribute:
@@ -28,6 +24,7 @@ class BatteryChargeSensor(BaseWebhookSensor):
 
     """
 
+    _column = "charge"
     _attr_entity_registry_enabled_default = True
     _attr_translation_key = "BatteryChargeSensor"
     _attr_has_entity_name = True
@@ -40,8 +37,7 @@ class BatteryChargeSensor(BaseWebhookSensor):
             index (int): Index der Batterie, für die der Sensor steht.
 
         """
-        super().__init__(entry)
-        self._index = index
+        super().__init__(entry, index)
         self._attr_translation_placeholders = {"index": str(index + 1)}
         self._attr_suggested_display_precision = 2
         self._attr_unique_id = f"{entry.entry_id}_battery_charge_sensor_{index}"
@@ -49,64 +45,3 @@ class BatteryChargeSensor(BaseWebhookSensor):
         self._attr_device_class = SensorDeviceClass.POWER
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UnitOfPower.WATT
-
-    async def handle_update(self, data):
-        """Verarbeitet eine Aktualisierung und aktualisiert den Sensorwert.
-        Args:
-            data (dict): Die eingehenden Aktualisierungsdaten mit Batterieinformationen.
-        """
-        try:
-            batteries_info = data.get("batteriesInfo", [])
-
-            if not batteries_info or self._index >= len(batteries_info):
-                _LOGGER.debug(
-                    "BatteryChargeSensor[%s]: Keine Batterie-Daten oder Index außerhalb Bereich",
-                    self._index
-                )
-                return
-
-            battery_data = batteries_info[self._index]
-            battery_power = battery_data.get("batteryPower")
-
-            if battery_power is None:
-                _LOGGER.debug(
-                    "BatteryChargeSensor[%s]: batteryPower fehlt",
-                    self._index
-                )
-                return
-
-            # Konvertiere zu float
-            charge_power = float(battery_power)
-
-            # Nur positive Werte sind Ladeleistung
-            if charge_power < 0:
-                _LOGGER.debug(
-                    "BatteryChargeSensor[%s]: Negative Leistung (%s W) - keine Ladeleistung",
-                    self._index, charge_power
-                )
-                charge_power = 0
-
-            # Plausibilitätsprüfung: Ladeleistung sollte vernünftig sein
-            if charge_power > 20000:  # 20kW als vernünftige Obergrenze
-                _LOGGER.warning(
-                    "BatteryChargeSensor[%s]: Unplausible Ladeleistung: %s W",
-                    self._index, charge_power
-                )
-                return
-
-            self._attr_native_value = charge_power
-            _LOGGER.debug(
-                "BatteryChargeSensor[%s]: Aktualisiert auf %s W",
-                self._index, charge_power
-            )
-
-        except (IndexError, KeyError) as err:
-            _LOGGER.warning(
-                "BatteryChargeSensor[%s]: Datenstrukturfehler: %s",
-                self._index, err
-            )
-        except (ValueError, TypeError) as err:
-            _LOGGER.warning(
-                "BatteryChargeSensor[%s]: Konvertierungsfehler: %s",
-                self._index, err
-            )
@@ -0,0 +1,65 @@
+"""Basisklasse für Sensoren, die eine Metrik einer einzelnen Batterie anzeigen.
+
+Die Sensoren werten batteriesInfo nicht mehr selbst aus, sondern lesen ihren
+Wert aus den Spalten, die der BatterySensorManager einmal pro Frame erzeugt
+(siehe battery_columns). Ohne Manager wird der Frame selbst ausgewertet.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+
+from .base_webhook_sensor import BaseWebhookSensor
+from .battery_columns import BatteryColumnCache, column_value
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BatteryColumnSensor(BaseWebhookSensor):
+    """Sensor für den Wert einer Batterie aus einer Spalte.
+
+    Abgeleitete Klassen setzen `_column` auf den Namen ihrer Spalte und für
+    andere Listen als batteriesInfo `_cache_class`.
+
+    Attribute:
+        _index (int): Index der Batterie, die dieser Sensor repräsentiert.
+        column_cache (BatteryColumnCache | None): Gemeinsamer Cache des Managers.
+    """
+
+    _column: str = ""
+    _cache_class: type[BatteryColumnCache] = BatteryColumnCache
+
+    def __init__(self, entry: ConfigEntry, index: int) -> None:
+        """Initialisiert den Sensor für die Batterie mit dem Index index."""
+        super().__init__(entry)
+        self._index = index
+        self.column_cache: BatteryColumnCache | None = None
+
+    async def handle_update(self, data):
+        """Übernimmt den Wert dieser Batterie aus den Spalten des Frames.
+
+        Args:
+            data (dict): Die eingehenden Aktualisierungsdaten mit Batterieinformationen.
+
+        """
+        cache = self.column_cache or self._cache_class()
+        value = column_value(cache.columns_for(data), self._column, self._index)
+
+        if value is None:
+            _LOGGER.debug(
+                "%s[%s]: Kein gültiger Wert in Spalte %s",
+                self.__class__.__name__,
+                self._index,
+                self._column,
+            )
+            return
+
+        self._attr_native_value = value
+        _LOGGER.debug(
+            "%s[%s]: Aktualisiert auf %s",
+            self.__class__.__name__,
+            self._index,
+            value,
+        )
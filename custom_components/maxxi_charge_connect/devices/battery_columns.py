@@ -0,0 +1,221 @@
+"""Spaltenweise Auswertung der Batteriedaten eines Frames.
+
+`batteriesInfo` wird pro Frame genau einmal durchlaufen. Dabei entsteht je
+Metrik eine Spalte mit einem Wert pro Batterie. Skalierung und
+Plausibilitätsgrenzen werden danach je Spalte in einem Schritt angewendet;
+fehlende, nicht konvertierbare oder unplausible Werte stehen als None in der
+Spalte. Die Batterie-Sensoren lesen nur noch ihren Platz (Spalte, Index).
+Aus denselben Spalten werden die Kennzahlen des gesamten Speichers berechnet.
+
+Attributes:
+    COLUMNS: Tupel (Spalte, Feld in batteriesInfo, Teiler, Minimum, Maximum,
+        Werte unter dem Minimum auf das Minimum setzen statt verwerfen).
+
+Classes:
+    BatteryColumnCache: Merkt sich die Spalten des zuletzt gesehenen Frames.
+
+Functions:
+    extract_columns: Erzeugt Spalten nach einer Spaltentabelle.
+    extract_battery_columns: Erzeugt die Spalten aus batteriesInfo.
+    compute_pack_aggregates: Berechnet die Kennzahlen des gesamten Speichers.
+    column_value: Liest den Wert einer Batterie aus einer Spalte.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any
+
+COLUMNS: tuple[tuple[str, str, float, float, float, bool], ...] = (
+    ("soe", "batteryCapacity", 1.0, 0.0, 100000.0, False),
+    ("soc", "batterySOC", 1.0, 0.0, 100.0, False),
+    ("voltage", "batteryVoltage", 1000.0, 0.0, 60.0, False),
+    ("current", "batteryCurrent", 1000.0, -200.0, 200.0, False),
+    ("pv_voltage", "pvVoltage", 1000.0, 0.0, 100.0, False),
+    ("pv_current", "pvCurrent", 1000.0, 0.0, 100.0, False),
+    ("pv_power", "pvPower", 1.0, 0.0, 10000.0, False),
+    ("mppt_voltage", "mpptVoltage", 1000.0, 0.0, 100.0, False),
+    ("mppt_current", "mpptCurrent", 1000.0, -100.0, 100.0, False),
+    # Positive Batterieleistung ist Ladeleistung, negative Entladeleistung
+    ("charge", "batteryPower", 1.0, 0.0, 20000.0, True),
+    ("discharge", "batteryPower", -1.0, 0.0, 20000.0, True),
+)
+
+_NO_DATA: dict = {}
+
+
+def _to_float(value: Any) -> float | None:
+    """Konvertiert einen Rohwert zu float oder liefert None."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _scale_and_bound(
+    raw: list[float | None], divisor: float, low: float, high: float, clip: bool
+) -> list[float | None]:
+    """Skaliert eine Spalte und prüft sie gegen ihre Grenzen."""
+    scaled = [None if v is None else v / divisor for v in raw]
+    if clip:
+        scaled = [None if v is None else v if v > low else low for v in scaled]
+    return [v if v is not None and low <= v <= high else None for v in scaled]
+
+
+def extract_columns(
+    items: list, table: tuple[tuple[str, str, float, float, float, bool], ...]
+) -> dict[str, list[float | None]]:
+    """Erzeugt in einem Durchlauf über items eine Spalte je Eintrag der Tabelle.
+
+    Args:
+        items (list): Eine Liste aus dem Frame, z. B. batteriesInfo.
+        table (tuple): Spaltentabelle im Format von COLUMNS.
+
+    Returns:
+        dict[str, list[float | None]]: Spaltenname → ein Wert pro Eintrag,
+        None für fehlende oder unplausible Werte.
+    """
+    # Jedes Feld wird nur einmal gelesen, auch wenn mehrere Spalten es nutzen
+    keys = tuple(dict.fromkeys(key for _, key, *_ in table))
+    raw: dict[str, list[float | None]] = {key: [] for key in keys}
+    for item in items:
+        fields = item if isinstance(item, dict) else _NO_DATA
+        for key in keys:
+            raw[key].append(_to_float(fields.get(key)))
+
+    return {
+        name: _scale_and_bound(raw[key], divisor, low, high, clip)
+        for name, key, divisor, low, high, clip in table
+    }
+
+
+def extract_battery_columns(batteries: list) -> dict[str, list[float | None]]:
+    """Erzeugt aus batteriesInfo eine Spalte je Metrik (siehe COLUMNS)."""
+    return extract_columns(batteries, COLUMNS)
+
+
+def _valid(column: list[float | None]) -> list[float]:
+    """Liefert die gültigen Werte einer Spalte."""
+    return [v for v in column if v is not None]
+
+
+def compute_pack_aggregates(
+    columns: dict[str, list[float | None]],
+) -> dict[str, float | None]:
+    """Berechnet die Kennzahlen des gesamten Speichers aus den Spalten.
+
+    Ungültige Werte einzelner Batterien werden übersprungen. Ohne gültige
+    Werte ist die jeweilige Kennzahl None.
+
+    Args:
+        columns (dict): Ergebnis von extract_battery_columns.
+
+    Returns:
+        dict[str, float | None]: Gesamtenergie (Wh), minimaler, maximaler und
+        mittlerer SoC (%), SoC-Ungleichgewicht (Prozentpunkte), Spannungsspreizung
+        (V) und MPPT-Gesamtleistung (W).
+    """
+    soe = _valid(columns["soe"])
+    soc = _valid(columns["soc"])
+    voltage = _valid(columns["voltage"])
+    mppt = [
+        v * a
+        for v, a in zip(columns["mppt_voltage"], columns["mppt_current"])
+        if v is not None and a is not None
+    ]
+
+    return {
+        "energy_total": sum(soe) if soe else None,
+        "soc_min": min(soc) if soc else None,
+        "soc_max": max(soc) if soc else None,
+        "soc_avg": sum(soc) / len(soc) if soc else None,
+        "soc_imbalance": max(soc) - min(soc) if soc else None,
+        "voltage_spread": max(voltage) - min(voltage) if voltage else None,
+        "mppt_power_total": sum(mppt) if mppt else None,
+    }
+
+
+class BatteryColumnCache:
+    """Liefert die Spalten eines Frames und wertet jeden Frame nur einmal aus.
+
+    Alle Batterie-Sensoren eines Eintrags erhalten denselben Frame (dasselbe
+    dict). Der erste Sensor löst die Auswertung aus, alle weiteren lesen das
+    Ergebnis. Die Kennzahlen des Speichers entstehen im selben Schritt.
+    Nebenbei werden die Kosten pro Frame erfasst.
+
+    Für andere Listen des Frames (z. B. convertersInfo) werden INFO_KEY,
+    _extract und _aggregate überschrieben.
+    """
+
+    INFO_KEY = "batteriesInfo"
+
+    def __init__(self) -> None:
+        """Initialisiert einen leeren Cache."""
+        self._frame: dict | None = None
+        self._columns: dict[str, list[float | None]] | None = None
+        self._aggregates: dict[str, float | None] = {}
+        self.frames = 0
+        self.items = 0
+        self.last_duration = 0.0
+        self.total_duration = 0.0
+
+    def columns_for(self, data: dict) -> dict[str, list[float | None]] | None:
+        """Liefert die Spalten zu data oder None ohne gültige Einträge."""
+        if data is self._frame:
+            return self._columns
+
+        start = perf_counter()
+        items = data.get(self.INFO_KEY) if isinstance(data, dict) else None
+        if isinstance(items, list) and items:
+            columns = self._extract(items)
+            self._aggregates = self._aggregate(columns)
+            self.items = len(items)
+        else:
+            columns = None
+            self._aggregates = {}
+            self.items = 0
+        self.last_duration = perf_counter() - start
+        self.total_duration += self.last_duration
+        self.frames += 1
+
+        self._frame = data
+        self._columns = columns
+        return columns
+
+    def aggregates_for(self, data: dict) -> dict[str, float | None]:
+        """Liefert die Kennzahlen zu data (leer ohne gültige Einträge)."""
+        self.columns_for(data)
+        return self._aggregates
+
+    def _extract(self, items: list) -> dict[str, list[float | None]]:
+        """Erzeugt die Spalten aus den Einträgen."""
+        return extract_battery_columns(items)
+
+    def _aggregate(
+        self, columns: dict[str, list[float | None]]
+    ) -> dict[str, float | None]:
+        """Berechnet die Kennzahlen aus den Spalten."""
+        return compute_pack_aggregates(columns)
+
+    def stats(self) -> dict[str, Any]:
+        """Gibt die Kosten der Auswertung zurück (Zeiten in Millisekunden)."""
+        return {
+            "frames": self.frames,
+            "items": self.items,
+            "last_ms": round(self.last_duration * 1000, 3),
+            "avg_ms": round(self.total_duration * 1000 / self.frames, 3)
+            if self.frames
+            else 0.0,
+        }
+
+
+def column_value(columns: dict | None, name: str, index: int) -> float | None:
+    """Liest den Wert einer Batterie aus einer Spalte (None, wenn nicht vorhanden)."""
+    if not columns:
+        return None
+    column = columns[name]
+    if not 0 <= index < len(column):
+        return None
+    return column[index]
@@ -4,8 +4,6 @@ Definiert eine Sensor-Entität, die die MPPT-Spannung einer einzelnen Batterie d
 dynamische Aktualisierungen verarbeitet und Geräteinformationen für Home Assistant bereitstellt.
 """
 
-import logging
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorStateClass,
@@ -14,12 +12,10 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfElectricPotential
 
-from .base_webhook_sensor import BaseWebhookSensor
-
-_LOGGER = logging.getLogger(__name__)
+from .battery_column_sensor import BatteryColumnSensor
 
 
-class BatteryMpptVoltageSensor(BaseWebhookSensor):
+class BatteryMpptVoltageSensor(BatteryColumnSensor):
     """Sensor-Entität zur Darstellung der MPPT-Spannung einer bestimmten Batterie.
 
     Attribute:
@@ -28,6 +24,7 @@ class BatteryMpptVoltageSensor(BaseWebhookSensor):
 
     """
 
+    _column = "mppt_voltage"
     _attr_entity_registry_enabled_default = False
     _attr_translation_key = "BatteryMpptVoltageSensor"
     _attr_has_entity_name = True
@@ -40,8 +37,7 @@ class BatteryMpptVoltageSensor(BaseWebhookSensor):
             index (int): Index der Batterie, für die der Sensor steht.
 
         """
-        super().__init__(entry)
-        self._index = index
+        super().__init__(entry, index)
         self._attr_translation_placeholders = {"index": str(index + 1)}
         self._attr_suggested_display_precision = 2
         self._attr_unique_id = f"{entry.entry_id}_battery_mppt_voltage_sensor_{index}"
@@ -49,61 +45,3 @@ class BatteryMpptVoltageSensor(BaseWebhookSensor):
         self._attr_device_class = SensorDeviceClass.VOLTAGE
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-
-    async def handle_update(self, data):
-        """Verarbeitet eine Aktualisierung und aktualisiert den Sensorwert.
-
-        Args:
-            data (dict): Die eingehenden Aktualisierungsdaten mit Batterieinformationen.
-
-        """
-        try:
-            batteries_info = data.get("batteriesInfo", [])
-
-            if not batteries_info or self._index >= len(batteries_info):
-                _LOGGER.debug(
-                    "BatteryMpptVoltageSensor[%s]: Keine Batterie-Daten oder Index außerhalb Bereich",
-                    self._index,
-                )
-                return
-
-            battery_data = batteries_info[self._index]
-            mppt_voltage = battery_data.get("mpptVoltage")
-
-            if mppt_voltage is None:
-                _LOGGER.debug(
-                    "BatteryMpptVoltageSensor[%s]: mpptVoltage fehlt", self._index
-                )
-                return
-
-            # Konvertiere mV zu V
-            mppt_volts = float(mppt_voltage) / 1000.0
-
-            # Plausibilitätsprüfung: MPPT-Spannung sollte vernünftig sein
-            if mppt_volts < 0 or mppt_volts > 100:  # 0-100V als vernünftiger Bereich
-                _LOGGER.warning(
-                    "BatteryMpptVoltageSensor[%s]: Unplausible MPPT-Spannung: %s V",
-                    self._index,
-                    mppt_volts,
-                )
-                return
-
-            self._attr_native_value = mppt_volts
-            _LOGGER.debug(
-                "BatteryMpptVoltageSensor[%s]: Aktualisiert auf %s V",
-                self._index,
-                mppt_volts,
-            )
-
-        except (IndexError, KeyError) as err:
-            _LOGGER.warning(
-                "BatteryMpptVoltageSensor[%s]: Datenstrukturfehler: %s",
-                self._index,
-                err,
-            )
-        except (ValueError, TypeError) as err:
-            _LOGGER.warning(
-                "BatteryMpptVoltageSensor[%s]: Konvertierungsfehler: %s",
-                self._index,
-                err,
-            )
@@ -0,0 +1,109 @@
+"""Modul für die BatteryPackSensor-Entitäten der maxxi_charge_connect Integration.
+
+Definiert Sensor-Entitäten für Kennzahlen über alle Batterien hinweg
+(Gesamtenergie, SoC-Minimum/-Maximum/-Mittelwert, Ungleichgewicht,
+Spannungsspreizung, MPPT-Gesamtleistung). Die Werte entstehen im selben
+Durchlauf wie die Spalten der einzelnen Batterien (siehe battery_columns).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfPower,
+)
+
+from .base_webhook_sensor import BaseWebhookSensor
+from .battery_columns import BatteryColumnCache
+
+_LOGGER = logging.getLogger(__name__)
+
+# (Kennzahl, Translation-Key, Einheit, Device-Class, Icon)
+PackSensorDescription = tuple[str, str, str, SensorDeviceClass | None, str]
+
+PACK_SENSORS: tuple[PackSensorDescription, ...] = (
+    ("energy_total", "BatteryPackEnergy", UnitOfEnergy.WATT_HOUR,
+     SensorDeviceClass.ENERGY_STORAGE, "mdi:home-battery"),
+    ("soc_min", "BatteryPackSOCMin", PERCENTAGE,
+     SensorDeviceClass.BATTERY, "mdi:battery-arrow-down"),
+    ("soc_max", "BatteryPackSOCMax", PERCENTAGE,
+     SensorDeviceClass.BATTERY, "mdi:battery-arrow-up"),
+    ("soc_avg", "BatteryPackSOCAvg", PERCENTAGE,
+     SensorDeviceClass.BATTERY, "mdi:battery-50"),
+    ("soc_imbalance", "BatteryPackSOCImbalance", PERCENTAGE,
+     None, "mdi:scale-unbalanced"),
+    ("voltage_spread", "BatteryPackVoltageSpread", UnitOfElectricPotential.VOLT,
+     SensorDeviceClass.VOLTAGE, "mdi:arrow-expand-vertical"),
+    ("mppt_power_total", "BatteryPackMpptPower", UnitOfPower.WATT,
+     SensorDeviceClass.POWER, "mdi:solar-power"),
+)
+
+
+class BatteryPackSensor(BaseWebhookSensor):
+    """Sensor-Entität für eine Kennzahl über alle Batterien.
+
+    Attribute:
+        _key (str): Name der Kennzahl (siehe compute_pack_aggregates).
+        column_cache (BatteryColumnCache | None): Gemeinsamer Cache des Managers.
+    """
+
+    _attr_has_entity_name = True
+    _cache_class: type[BatteryColumnCache] = BatteryColumnCache
+    _unique_id_prefix = "battery_pack"
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        description: PackSensorDescription,
+    ) -> None:
+        """Initialisiert die BatteryPackSensor-Entität.
+
+        Args:
+            entry (ConfigEntry): Der Konfigurationseintrag der Integration.
+            description (PackSensorDescription): Kennzahl, Translation-Key,
+                Einheit, Device-Class und Icon, siehe PACK_SENSORS.
+
+        """
+        super().__init__(entry)
+        key, translation_key, unit, device_class, icon = description
+        self._key = key
+        self.column_cache: BatteryColumnCache | None = None
+        self._attr_translation_key = translation_key
+        self._attr_suggested_display_precision = 2
+        self._attr_unique_id = f"{entry.entry_id}_{self._unique_id_prefix}_{key}"
+        self._attr_icon = icon
+        self._attr_device_class = device_class
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = unit
+
+    async def handle_update(self, data):
+        """Übernimmt die Kennzahl aus der Auswertung des Frames.
+
+        Args:
+            data (dict): Die eingehenden Aktualisierungsdaten mit Batterieinformationen.
+
+        """
+        cache = self.column_cache or self._cache_class()
+        value = cache.aggregates_for(data).get(self._key)
+
+        if value is None:
+            _LOGGER.debug(
+                "%s[%s]: Kein gültiger Wert", self.__class__.__name__, self._key
+            )
+            return
+
+        self._attr_native_value = value
+
+
+def create_pack_sensors(entry: ConfigEntry) -> list[BatteryPackSensor]:
+    """Erzeugt je Kennzahl einen BatteryPackSensor."""
+    return [BatteryPackSensor(entry, description) for description in PACK_SENSORS]
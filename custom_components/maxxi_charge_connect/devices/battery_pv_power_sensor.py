@@ -12,12 +12,12 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfPower
-from .base_webhook_sensor import BaseWebhookSensor
+from .battery_column_sensor import BatteryColumnSensor
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class BatteryPVPowerSensor(BaseWebhookSensor):
+class BatteryPVPowerSensor(BatteryColumnSensor):
     """Sensor zur Überwachung und Anzeige der PV-Leistung einer Batterie.
 
     Dieser Sensor zeigt die aktuelle PV-Leistung (Photovoltaik-Leistung) einer bestimmten Batterie
@@ -30,6 +30,7 @@ class BatteryPVPowerSensor(BaseWebhookSensor):
 
     """
 
+    _column = "pv_power"
     _attr_entity_registry_enabled_default = False
     _attr_translation_key = "BatteryPVPowerSensor"
     _attr_has_entity_name = True
@@ -42,8 +43,7 @@ class BatteryPVPowerSensor(BaseWebhookSensor):
             index (int): Index der Batterie, für die der Sensor steht.
 
         """
-        super().__init__(entry)
-        self._index = index
+        super().__init__(entry, index)
         self._attr_translation_placeholders = {"index": str(index + 1)}
         self._attr_suggested_display_precision = 2
         self._attr_unique_id = f"{entry.entry_id}_battery_pv_power_sensor_{index}"
@@ -53,62 +53,3 @@ class BatteryPVPowerSensor(BaseWebhookSensor):
         self._attr_native_unit_of_measurement = UnitOfPower.WATT
 
         _LOGGER.debug("BatteryPVPowerSensor initialized for battery index %d", index)
-
-    async def handle_update(self, data):
-        """Verarbeitet eine Aktualisierung und aktualisiert den Sensorwert.
-
-        Args:
-            data (dict): Die eingehenden Aktualisierungsdaten mit Batterieinformationen.
-
-        """
-        try:
-            # Batterieinformationen sicher abfragen
-            batteries_info = data.get("batteriesInfo", [])
-            if not batteries_info or self._index >= len(batteries_info):
-                _LOGGER.debug(
-                    "BatteryPVPowerSensor[%s]: batteriesInfo leer oder Index außerhalb des Bereichs",
-                    self._index,
-                )
-                return
-
-            battery_data = batteries_info[self._index]
-            pv_power_raw = battery_data.get("pvPower")
-
-            if pv_power_raw is None:
-                _LOGGER.debug("BatteryPVPowerSensor[%s]: pvPower fehlt", self._index)
-                return
-
-            # Konvertierung zu float
-            pv_power = float(pv_power_raw)
-
-            # Plausibilitätsprüfung: PV-Leistung sollte nicht negativ sein
-            if pv_power < 0:
-                _LOGGER.warning(
-                    "BatteryPVPowerSensor[%s]: Negative PV-Leistung: %s W",
-                    self._index,
-                    pv_power,
-                )
-                return
-
-            # Plausibilitätsprüfung: Maximale PV-Leistung (z.B. 10kW)
-            if pv_power > 10000:
-                _LOGGER.warning(
-                    "BatteryPVPowerSensor[%s]: Unplausible PV-Leistung: %s W",
-                    self._index,
-                    pv_power,
-                )
-                return
-
-            self._attr_native_value = pv_power
-            _LOGGER.debug(
-                "BatteryPVPowerSensor[%s]: Aktualisiert auf %s W", self._index, pv_power
-            )
-
-        except (IndexError, KeyError) as err:
-            _LOGGER.warning(
-                "BatteryPVPowerSensor[%s]: Datenstrukturfehler: %s", self._index, err
-            )
-        except (ValueError, TypeError) as err:
-            _LOGGER.warning(
-                "BatteryPVPowerSensor[%s]: Konvertierungsfehler: %s", self._index, err
-            )
@@ -2,8 +2,12 @@
 
 Dieses Modul enthält die BatterySensorManager-Klasse, die beim Eintreffen von
 Webhook-Daten neue Sensoren für verschiedene Batterie-Metriken erzeugt und registriert.
-Sensoren werden nur einmalig beim ersten Datenempfang initialisiert und anschließend
-bei jedem Update aktualisiert.
+Sensoren werden beim ersten Datenempfang initialisiert und anschließend bei jedem
+Update aktualisiert. Ändert sich die Belegung (Anzahl der Batterien bzw. die
+Kennung einer Batterie an einem Index), werden nur die Sensoren der betroffenen
+Batterien angelegt oder entfernt. Die
+Batteriedaten eines Frames werden dabei nur einmal in Spalten zerlegt (siehe
+battery_columns), aus denen alle Sensoren lesen.
 """
 
 import logging
@@ -11,19 +15,21 @@ from typing import Dict, List, Any
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.const import STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 
 from ..const import (
     DOMAIN,
-    PROXY_STATUS_EVENTNAME,
     CONF_ENABLE_CLOUD_DATA,
     CONF_DEVICE_ID,
-    PROXY_ERROR_DEVICE_ID,
     WEBHOOK_SIGNAL_UPDATE,
     WEBHOOK_SIGNAL_STATE,
 )  # noqa: TID252
+from ..tools import proxy_frame_signal  # noqa: TID252
 from .base_webhook_sensor import BaseWebhookSensor
+from .battery_columns import BatteryColumnCache
+from .battery_pack_sensor import create_pack_sensors
 from .battery_soe_sensor import BatterySoESensor
 from .battery_soc_sensor import BatterySOCSensor
 from .battery_voltage_sensor import BatteryVoltageSensor
@@ -43,10 +49,20 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
     """Manager zur dynamischen Erstellung und Verwaltung von Battery-Sensoren.
 
     Erzeugt bei Empfang der ersten Daten automatisch eine Entität pro Batteriespeicher
-    und pro Metrik. Nach der Initialisierung werden alle zugehörigen Listener bei jedem
-    weiteren Datenupdate über das Dispatcher-Signal informiert.
+    und pro Metrik sowie je eine Entität für die Kennzahlen über alle Batterien.
+    Nach der Initialisierung werden alle zugehörigen Listener bei jedem weiteren
+    Datenupdate über das Dispatcher-Signal informiert.
+
+    Abgeleitete Manager für andere Listen des Frames überschreiben INFO_KEY,
+    SENSOR_CLASSES, COLUMN_CACHE und _build_pack_sensors.
     """
 
+    # Liste im Frame, aus der die Sensoren erzeugt werden
+    INFO_KEY = "batteriesInfo"
+    # Felder, die einen Eintrag eindeutig kennzeichnen (das erste vorhandene zählt)
+    IDENTITY_KEYS = ("batterySerial", "serialNumber", "serial", "sn", "id")
+    COLUMN_CACHE = BatteryColumnCache
+
     # Sensor-Klassen für automatische Erstellung
     SENSOR_CLASSES = [
         ("battery_soe", BatterySoESensor),
@@ -77,7 +93,10 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
         self.entry = entry
         self.async_add_entities = async_add_entities
         self.sensors: Dict[str, SensorEntity] = {}
+        self.pack_sensors: Dict[str, SensorEntity] = {}
         self._pending_sensors: List[SensorEntity] = []
+        self.columns = self.COLUMN_CACHE()
+        self._layout: tuple = ()
         self._registered = False
         self._unsub_update = None
         self._unsub_stale = None
@@ -98,9 +117,7 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
 
             if self._enable_cloud_data:
                 _LOGGER.info("Daten kommen vom Proxy")
-                self.hass.bus.async_listen(
-                    PROXY_STATUS_EVENTNAME, self.async_update_from_event
-                )
+                self._connect_proxy()
             else:
                 _LOGGER.info("Daten kommen vom Webhook")
                 entry_data = self.hass.data[DOMAIN][self.entry.entry_id]
@@ -154,11 +171,9 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
                 self._registered = True
                 _LOGGER.debug("BatterySensorManager Dispatcher registriert")
         else:
-            # Cloud-Modus: Event Bus abonnieren
+            # Cloud-Modus: Daten dieses Geräts vom Proxy
             _LOGGER.info("Daten kommen vom Proxy")
-            self.hass.bus.async_listen(
-                PROXY_STATUS_EVENTNAME, self.async_update_from_event
-            )
+            self._connect_proxy()
 
             # Stale-Signal abonnieren
             entry_data = self.hass.data[DOMAIN][self.entry.entry_id]
@@ -181,11 +196,29 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error("Fehler im BatterySensorManager beim Stale-Handling: %s", err)
 
-    async def async_update_from_event(self, event: Event):
-        """Aktualisiert Sensor von Proxy-Event."""
-        try:
-            json_data = event.data.get("payload", {})
+    def _connect_proxy(self) -> None:
+        """Abonniert das Proxy-Signal dieses Geräts (nur einmal)."""
+        if self._registered:
+            return
+        self._unsub_update = async_dispatcher_connect(
+            self.hass,
+            proxy_frame_signal(self.entry.data.get(CONF_DEVICE_ID)),
+            self.async_update_from_proxy,
+        )
+        self._registered = True
+
+    def async_unload(self) -> None:
+        """Meldet alle Dispatcher-Abonnements ab."""
+        for unsub in (self._unsub_update, self._unsub_stale):
+            if unsub:
+                unsub()
+        self._unsub_update = None
+        self._unsub_stale = None
+        self._registered = False
 
+    async def async_update_from_proxy(self, json_data: dict):
+        """Aktualisiert die Sensoren mit Proxy-Daten dieses Geräts."""
+        try:
             # HTTP-Scan Events ignorieren (erkennbar an http:// in ip_addr)
             ip_addr = json_data.get("ip_addr", "")
             if ip_addr.startswith("http://") or ip_addr.startswith("https://"):
@@ -193,21 +226,23 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
                 return
 
             # Prüfen, ob Batterie-Daten vorhanden sind (nicht bei HTTP-Scan Events)
-            if "batteriesInfo" not in json_data:
-                _LOGGER.debug("BatterySensorManager: Keine batteriesInfo im Event, ignoriere")
+            if self.INFO_KEY not in json_data:
+                _LOGGER.debug(
+                    "%s: Keine %s im Event, ignoriere",
+                    self.__class__.__name__,
+                    self.INFO_KEY,
+                )
                 return
 
-            if json_data.get(PROXY_ERROR_DEVICE_ID) == self.entry.data.get(
-                CONF_DEVICE_ID
-            ):
-                await self.handle_update(json_data)
+            await self.handle_update(json_data)
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error("Fehler beim Proxy-Update: %s", err)
 
     async def handle_stale(self):
         """Setzt alle verwalteten Sensoren auf 'unavailable'."""
-        _LOGGER.debug("Setze %d Sensoren auf unavailable", len(self.sensors))
-        for sensor_key, sensor in self.sensors.items():
+        sensors = {**self.sensors, **self.pack_sensors}
+        _LOGGER.debug("Setze %d Sensoren auf unavailable", len(sensors))
+        for sensor_key, sensor in sensors.items():
             try:
                 if sensor is not None and sensor.hass is not None:
                     sensor._attr_available = False  # pylint: disable=protected-access
@@ -229,49 +264,179 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
         try:
             # Zusätzliche Validierung der Datenstruktur
             if not data or not isinstance(data, dict):
-                _LOGGER.warning("BatterySensorManager: Leere oder ungültige Datenstruktur erhalten: %s", data)
+                _LOGGER.warning(
+                    "%s: Leere oder ungültige Datenstruktur erhalten: %s",
+                    self.__class__.__name__,
+                    data,
+                )
                 return
 
-            batteries = data.get("batteriesInfo", [])
+            batteries = data.get(self.INFO_KEY, [])
 
             if not batteries:
-                _LOGGER.debug("Keine Batterie-Informationen im Update")
+                _LOGGER.debug(
+                    "%s: Keine %s im Update", self.__class__.__name__, self.INFO_KEY
+                )
                 return
 
             # Prüfen, ob batteriesInfo eine Liste ist
             if not isinstance(batteries, list):
-                _LOGGER.warning("BatterySensorManager: batteriesInfo ist keine Liste: %s", type(batteries))
+                _LOGGER.warning(
+                    "%s: %s ist keine Liste: %s",
+                    self.__class__.__name__,
+                    self.INFO_KEY,
+                    type(batteries),
+                )
                 return
 
             # Prüfen, ob die Liste Elemente hat
             if len(batteries) == 0:
-                _LOGGER.debug("BatterySensorManager: batteriesInfo ist leer")
+                _LOGGER.debug("%s: %s ist leer", self.__class__.__name__, self.INFO_KEY)
                 return
 
-            # Initialisiere Sensoren, falls noch nicht vorhanden
-            if not self.sensors:
-                new_sensors = await self._create_sensors_for_batteries(batteries)
-                if new_sensors:
-                    _LOGGER.info(
-                        "Erstelle %d neue Battery-Sensoren für %d Batterien",
-                        len(new_sensors),
-                        len(batteries),
-                    )
-                    if self.async_add_entities is not None:
-                        _LOGGER.debug("Rufe async_add_entities für %d Sensoren auf", len(new_sensors))
-                        self.async_add_entities(new_sensors)
-                    else:
-                        _LOGGER.warning(
-                            "async_add_entities ist None. Speichere %d Sensoren für spätere Addition.",
-                            len(new_sensors)
-                        )
-                        self._pending_sensors.extend(new_sensors)
+            # Abgleich nur, wenn sich die Belegung geändert hat
+            layout = self._fingerprint(batteries)
+            if layout != self._layout:
+                await self._reconcile(batteries, layout)
 
             # Update alle Sensoren über die Listener
             await self._update_all_listeners(data)
 
         except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.error("Fehler bei der Verarbeitung der Battery-Daten: %s", err)
+            _LOGGER.error(
+                "%s: Fehler bei der Verarbeitung von %s: %s",
+                self.__class__.__name__,
+                self.INFO_KEY,
+                err,
+            )
+
+    def _fingerprint(self, batteries: List[Dict[str, Any]]) -> tuple:
+        """Kennung der Belegung: je Eintrag das erste vorhandene IDENTITY_KEYS-Feld.
+
+        Ohne Kennungsfeld ist der Eintrag None; dann zählt nur die Anzahl.
+        """
+        layout = []
+        for battery in batteries:
+            identity = None
+            if isinstance(battery, dict):
+                identity = next(
+                    (battery[key] for key in self.IDENTITY_KEYS if battery.get(key) is not None),
+                    None,
+                )
+            layout.append(identity)
+        return tuple(layout)
+
+    async def _reconcile(self, batteries: List[Dict[str, Any]], layout: tuple) -> None:
+        """Gleicht die Sensoren an die aktuelle Belegung an.
+
+        Für neue Batterien werden nur deren Sensoren erzeugt, Sensoren
+        entfernter Batterien werden aus Home Assistant und der Entity-Registry
+        genommen. Hat sich die Kennung an einem Index geändert (Tausch oder
+        andere Reihenfolge), werden dessen Sensoren neu angelegt, damit kein
+        Zustand der vorherigen Batterie übernommen wird.
+
+        Args:
+            batteries: Liste der Batterie-Informationen
+            layout: Ergebnis von _fingerprint für batteries
+        """
+        old_count = len(self._layout)
+        count = len(layout)
+        swapped = [
+            index
+            for index, (old, new) in enumerate(zip(self._layout, layout))
+            if old != new
+        ]
+        _LOGGER.info(
+            "%s: Belegung von %s geändert: %d -> %d Einträge, getauscht: %s",
+            self.__class__.__name__,
+            self.INFO_KEY,
+            old_count,
+            count,
+            swapped,
+        )
+
+        await self._retire_sensors([*swapped, *range(count, old_count)])
+
+        new_sensors = await self._create_sensors_for_batteries(batteries)
+        if not self.pack_sensors:
+            new_sensors.extend(self._create_pack_sensors())
+        self._layout = layout
+        if not new_sensors:
+            return
+
+        _LOGGER.info(
+            "%s: Erstelle %d neue Sensoren für %d Einträge in %s",
+            self.__class__.__name__,
+            len(new_sensors),
+            count,
+            self.INFO_KEY,
+        )
+        if self.async_add_entities is not None:
+            _LOGGER.debug("Rufe async_add_entities für %d Sensoren auf", len(new_sensors))
+            self.async_add_entities(new_sensors)
+        else:
+            _LOGGER.warning(
+                "async_add_entities ist None. Speichere %d Sensoren für spätere Addition.",
+                len(new_sensors)
+            )
+            self._pending_sensors.extend(new_sensors)
+
+    async def _retire_sensors(self, indices: List[int]) -> None:
+        """Entfernt die Sensoren der Batterien an den angegebenen Indizes.
+
+        Die Entitäten werden aus Home Assistant und aus der Entity-Registry
+        entfernt, damit keine verwaisten Einträge zurückbleiben. Die Historie
+        im Recorder bleibt unter der entity_id erhalten; kommt die Batterie
+        wieder, erhält sie dieselbe entity_id.
+
+        Args:
+            indices: Indizes der zu entfernenden Batterien
+        """
+        for index in indices:
+            for sensor_name, _ in self.SENSOR_CLASSES:
+                unique_key = f"{self.entry.entry_id}_{sensor_name}_{index}"
+                sensor = self.sensors.pop(unique_key, None)
+                if sensor is None:
+                    continue
+                if sensor in self._pending_sensors:
+                    self._pending_sensors.remove(sensor)
+                try:
+                    if sensor.hass is not None:
+                        await sensor.async_remove()
+                    if sensor.entity_id:
+                        registry = async_get_entity_registry(self.hass)
+                        if registry.async_get(sensor.entity_id) is not None:
+                            registry.async_remove(sensor.entity_id)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning(
+                        "Fehler beim Entfernen von %s für %s[%d]: %s",
+                        sensor_name,
+                        self.INFO_KEY,
+                        index,
+                        err,
+                    )
+            _LOGGER.info("Sensoren für %s[%d] entfernt", self.INFO_KEY, index)
+
+    def _create_pack_sensors(self) -> List[SensorEntity]:
+        """Erstellt die Sensoren für die Kennzahlen über alle Batterien.
+
+        Returns:
+            Liste der neu erstellten Sensoren
+        """
+        try:
+            pack_sensors = self._build_pack_sensors()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Fehler beim Erstellen der Speicher-Sensoren: %s", err)
+            return []
+
+        for sensor in pack_sensors:
+            sensor.column_cache = self.columns
+            self.pack_sensors[sensor.unique_id] = sensor
+        return pack_sensors
+
+    def _build_pack_sensors(self) -> List[SensorEntity]:
+        """Erzeugt die (noch nicht registrierten) Sensoren für die Kennzahlen."""
+        return create_pack_sensors(self.entry)
 
     async def _create_sensors_for_batteries(
         self, batteries: List[Dict[str, Any]]
@@ -291,14 +456,18 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
 
                     if unique_key not in self.sensors:
                         try:
-                            _LOGGER.debug("Erstelle %s für Batterie %d", sensor_name, i)
+                            _LOGGER.debug(
+                                "Erstelle %s für %s[%d]", sensor_name, self.INFO_KEY, i
+                            )
                             sensor = sensor_class(self.entry, i)
+                            sensor.column_cache = self.columns
                             self.sensors[unique_key] = sensor
                             new_sensors.append(sensor)
                         except Exception as err:  # pylint: disable=broad-except
                             _LOGGER.error(
-                                "Fehler beim Erstellen von %s für Batterie %d: %s",
+                                "Fehler beim Erstellen von %s für %s[%d]: %s",
                                 sensor_name,
+                                self.INFO_KEY,
                                 i,
                                 err,
                             )
@@ -341,6 +510,14 @@ class BatterySensorManager:  # pylint: disable=too-few-public-methods
         """
         return len(self.sensors)
 
+    def get_frame_stats(self) -> Dict[str, Any]:
+        """Gibt die Kosten der Auswertung der Batteriedaten pro Frame zurück.
+
+        Returns:
+            Dictionary mit Anzahl Frames, Batterien und Dauer in Millisekunden
+        """
+        return self.columns.stats()
+
     def get_sensor_info(self) -> Dict[str, Dict[str, Any]]:
         """Gibt Informationen über die verwalteten Sensoren zurück.
 
@@ -1,6 +1,6 @@
 """Modul für die BatteryTodayEnergyCharge-Entität der maxxi_charge_connect Integration.
 
-Dieses Modul definiert eine IntegrationSensor-Entität, die den heutigen Lade-Energieverbrauch
+Dieses Modul definiert eine Energie-Sensor-Entität, die den heutigen Lade-Energieverbrauch
 der Batterie misst. Die Werte werden per Trapezregel integriert und täglich um Mitternacht
 zurückgesetzt.
 """
@@ -20,3 +20,5 @@ class BatteryTodayEnergyCharge(TodayIntegralSensor):
         _last_reset (datetime): Der letzte Zeitpunkt des Tagesresets (UTC).
 
     """
+
+    _power_channel = "battery_power_charge"
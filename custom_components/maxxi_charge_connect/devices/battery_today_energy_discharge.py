@@ -3,7 +3,7 @@
 Dieser Sensor integriert die aus der Batterie entladene Energie über den Tag hinweg.
 Er setzt sich täglich um Mitternacht zurück, um nur die tagesaktuelle Entladung zu zeigen.
 
-Verwendet die IntegrationSensor-Basis aus Home Assistant.
+Verwendet den EnergyIntegrator dieser Integration.
 """
 
 from .today_integral_sensor import TodayIntegralSensor
@@ -21,3 +21,5 @@ class BatteryTodayEnergyDischarge(TodayIntegralSensor):
         _last_reset (datetime): Zeitpunkt des letzten Resets (Mitternacht lokal).
 
     """
+
+    _power_channel = "battery_power_discharge"
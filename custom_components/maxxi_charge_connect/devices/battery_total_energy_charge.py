@@ -1,6 +1,6 @@
 """Sensor für die gesamte Batterieladeenergie (BatteryTotalEnergyCharge).
 
-Dieses Modul definiert eine benutzerdefinierte IntegrationSensor-Entität für Home Assistant,
+Dieses Modul definiert eine benutzerdefinierte Energie-Sensor-Entität für Home Assistant,
 die die gesamte in die Batterie eingespeiste Energie über die Zeit aufsummiert.
 
 Die Energiemenge wird mithilfe der Trapezregel integriert, auf Kilo­watt­stunden normiert und
@@ -30,3 +30,5 @@ class BatteryTotalEnergyCharge(TotalIntegralSensor):
         _attr_native_unit_of_measurement (str): Die verwendete Energieeinheit (kWh).
 
     """
+
+    _power_channel = "battery_power_charge"
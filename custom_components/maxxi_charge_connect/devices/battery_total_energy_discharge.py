@@ -1,6 +1,6 @@
 """Sensor für die gesamte Batterieentladeenergie (BatteryTotalEnergyDischarge).
 
-Dieses Modul definiert eine benutzerdefinierte IntegrationSensor-Entität für Home Assistant,
+Dieses Modul definiert eine benutzerdefinierte Energie-Sensor-Entität für Home Assistant,
 die die gesamte aus der Batterie entnommene Energie über die Zeit aufsummiert.
 
 Die Energiemenge wird mittels der Trapezregel aus der Entladeleistung (Watt) integriert
@@ -31,4 +31,5 @@ class BatteryTotalEnergyDischarge(TotalIntegralSensor):
 
     """
 
+    _power_channel = "battery_power_discharge"
     _attr_entity_registry_enabled_default = True
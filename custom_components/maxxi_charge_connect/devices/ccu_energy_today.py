@@ -1,6 +1,6 @@
 """Sensor zur Anzeige der täglichen Energieerfassung der CCU.
 
-Dieses Modul definiert eine benutzerdefinierte IntegrationSensor-Entität für Home Assistant,
+Dieses Modul definiert eine benutzerdefinierte Energie-Sensor-Entität für Home Assistant,
 die die täglich verbrauchte Energie einer Quelle über den Tag aufsummiert. Der Zähler wird
 jeden Tag um Mitternacht zurückgesetzt.
 
@@ -23,3 +23,5 @@ class CcuEnergyToday(TodayIntegralSensor):
         _unsub_time_reset (Callable | None): Callback zum Abmelden des täglichen Resets.
 
     """
+
+    _power_channel = "ccu_power"
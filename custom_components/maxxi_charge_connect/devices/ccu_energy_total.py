@@ -1,6 +1,6 @@
 """Sensor zur Gesamtenergieintegration der CCU.
 
-Dieses Modul definiert eine benutzerdefinierte IntegrationSensor-Entität für Home Assistant,
+Dieses Modul definiert eine benutzerdefinierte Energie-Sensor-Entität für Home Assistant,
 die die gesamte Energie berechnet, die über einen Zeitraum verbraucht oder erzeugt wurde.
 Die Integration erfolgt über eine trapezförmige Methode mit automatischer Einheitenskalierung.
 
@@ -24,4 +24,5 @@ class CcuEnergyTotal(TotalIntegralSensor):
 
     """
 
+    _power_channel = "ccu_power"
     _attr_entity_registry_enabled_default = True
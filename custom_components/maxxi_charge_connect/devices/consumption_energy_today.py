@@ -10,4 +10,5 @@ from .today_integral_sensor import TodayIntegralSensor
 class ConsumptionEnergyToday(TodayIntegralSensor):
     """Sensor zur Integration der PV-Eigenverbrauchsleistung (kWh heute)."""
 
+    _power_channel = "power_consumption"
     _attr_entity_registry_enabled_default = False
@@ -9,4 +9,5 @@ from .total_integral_sensor import TotalIntegralSensor
 class ConsumptionEnergyTotal(TotalIntegralSensor):
     """Sensor zur Integration der Eigenverbrauchsleistung (kWh gesamt)."""
 
+    _power_channel = "power_consumption"
     _attr_entity_registry_enabled_default = False
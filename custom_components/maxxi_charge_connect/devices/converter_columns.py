@@ -0,0 +1,67 @@
+"""Spaltenweise Auswertung der Converter-Daten eines Frames.
+
+Wie bei den Batterien (siehe battery_columns) wird `convertersInfo` pro Frame
+genau einmal durchlaufen. Je Feld entsteht eine Spalte mit einem Wert pro
+Converter; die Kennzahlen über alle Converter werden im selben Schritt
+berechnet.
+
+Attributes:
+    CONVERTER_COLUMNS: Spaltentabelle im Format von battery_columns.COLUMNS.
+        Weitere Felder von convertersInfo werden hier ergänzt.
+
+Classes:
+    ConverterColumnCache: Merkt sich die Spalten des zuletzt gesehenen Frames.
+
+Functions:
+    extract_converter_columns: Erzeugt die Spalten aus convertersInfo.
+    compute_converter_aggregates: Berechnet die Kennzahlen über alle Converter.
+"""
+
+from __future__ import annotations
+
+from .battery_columns import BatteryColumnCache, extract_columns
+
+CONVERTER_COLUMNS: tuple[tuple[str, str, float, float, float, bool], ...] = (
+    ("temperature", "ccuTemperature", 1.0, -40.0, 85.0, False),
+)
+
+
+def extract_converter_columns(converters: list) -> dict[str, list[float | None]]:
+    """Erzeugt aus convertersInfo eine Spalte je Feld (siehe CONVERTER_COLUMNS)."""
+    return extract_columns(converters, CONVERTER_COLUMNS)
+
+
+def compute_converter_aggregates(
+    columns: dict[str, list[float | None]],
+) -> dict[str, float | None]:
+    """Berechnet Minimum, Maximum und Mittelwert der Temperatur über alle Converter.
+
+    Args:
+        columns (dict): Ergebnis von extract_converter_columns.
+
+    Returns:
+        dict[str, float | None]: Kleinste, größte und mittlere gültige
+        Temperatur (°C), None ohne gültige Werte.
+    """
+    temperature = [v for v in columns["temperature"] if v is not None]
+    return {
+        "temperature_min": min(temperature) if temperature else None,
+        "temperature_max": max(temperature) if temperature else None,
+        "temperature_avg": sum(temperature) / len(temperature) if temperature else None,
+    }
+
+
+class ConverterColumnCache(BatteryColumnCache):
+    """Liefert Spalten und Kennzahlen zu convertersInfo, einmal pro Frame."""
+
+    INFO_KEY = "convertersInfo"
+
+    def _extract(self, items: list) -> dict[str, list[float | None]]:
+        """Erzeugt die Spalten aus convertersInfo."""
+        return extract_converter_columns(items)
+
+    def _aggregate(
+        self, columns: dict[str, list[float | None]]
+    ) -> dict[str, float | None]:
+        """Berechnet die Kennzahlen über alle Converter."""
+        return compute_converter_aggregates(columns)
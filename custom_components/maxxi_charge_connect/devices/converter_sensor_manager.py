@@ -0,0 +1,40 @@
+"""Verwaltung dynamischer Converter-Sensoren in MaxxiCharge Connect.
+
+Der ConverterSensorManager arbeitet wie der BatterySensorManager, nur auf
+`convertersInfo`: Beim ersten Frame und bei jeder Änderung der Anzahl der
+Converter werden die Sensoren je Converter angelegt bzw. entfernt, dazu einmal
+die Sensoren für Minimum und Maximum über alle Converter.
+"""
+
+import logging
+from typing import List
+
+from homeassistant.components.sensor import SensorEntity
+
+from .battery_sensor_manager import BatterySensorManager
+from .converter_columns import ConverterColumnCache
+from .converter_sensors import (
+    ConverterTemperatureSensor,
+    create_converter_aggregate_sensors,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConverterSensorManager(BatterySensorManager):
+    """Manager zur dynamischen Erstellung und Verwaltung von Converter-Sensoren."""
+
+    INFO_KEY = "convertersInfo"
+    COLUMN_CACHE = ConverterColumnCache
+
+    SENSOR_CLASSES = [
+        ("converter_temperature_sensor", ConverterTemperatureSensor),
+    ]
+
+    def _build_pack_sensors(self) -> List[SensorEntity]:
+        """Erzeugt die Sensoren für Minimum und Maximum über alle Converter."""
+        return create_converter_aggregate_sensors(self.entry)
+
+    async def _update_all_listeners(self, data: dict):  # pylint: disable=unused-argument
+        """Die Listener des Eintrags werden bereits vom BatterySensorManager bedient."""
+        _LOGGER.debug("ConverterSensorManager: Keine Listener-Verteilung")
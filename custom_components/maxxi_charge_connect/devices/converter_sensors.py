@@ -0,0 +1,73 @@
+"""Sensor-Entitäten für die einzelnen Converter der CCU.
+
+Definiert einen Temperatursensor pro Converter sowie Sensoren für Minimum und
+Maximum über alle Converter. Alle lesen aus der gemeinsamen Auswertung des
+ConverterSensorManager (siehe converter_columns).
+"""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTemperature
+
+from .battery_column_sensor import BatteryColumnSensor
+from .battery_pack_sensor import BatteryPackSensor, PackSensorDescription
+from .converter_columns import ConverterColumnCache
+
+# (Kennzahl, Translation-Key, Einheit, Device-Class, Icon)
+CONVERTER_AGGREGATE_SENSORS: tuple[PackSensorDescription, ...] = (
+    ("temperature_min", "ConverterTemperatureMin", UnitOfTemperature.CELSIUS,
+     SensorDeviceClass.TEMPERATURE, "mdi:thermometer-low"),
+    ("temperature_max", "ConverterTemperatureMax", UnitOfTemperature.CELSIUS,
+     SensorDeviceClass.TEMPERATURE, "mdi:thermometer-high"),
+)
+
+
+class ConverterTemperatureSensor(BatteryColumnSensor):
+    """Sensor-Entität zur Anzeige der Temperatur eines bestimmten Converters."""
+
+    _column = "temperature"
+    _cache_class = ConverterColumnCache
+    _attr_entity_registry_enabled_default = False
+    _attr_translation_key = "ConverterTemperatureSensor"
+    _attr_has_entity_name = True
+
+    def __init__(self, entry: ConfigEntry, index: int) -> None:
+        """Initialisiert den Temperatursensor des Converters mit dem Index index.
+
+        Args:
+            entry (ConfigEntry): Der Konfigurationseintrag der Integration.
+            index (int): Index des Converters, für den der Sensor steht.
+
+        """
+        super().__init__(entry, index)
+        self._attr_translation_placeholders = {"index": str(index + 1)}
+        self._attr_suggested_display_precision = 1
+        self._attr_unique_id = f"{entry.entry_id}_converter_temperature_sensor_{index}"
+        self._attr_icon = "mdi:temperature-celsius"
+        self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+
+class ConverterAggregateSensor(BatteryPackSensor):
+    """Sensor-Entität für eine Kennzahl über alle Converter."""
+
+    _cache_class = ConverterColumnCache
+    _unique_id_prefix = "converter"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+
+def create_converter_aggregate_sensors(
+    entry: ConfigEntry,
+) -> list[ConverterAggregateSensor]:
+    """Erzeugt je Kennzahl einen ConverterAggregateSensor."""
+    return [
+        ConverterAggregateSensor(entry, description)
+        for description in CONVERTER_AGGREGATE_SENSORS
+    ]
@@ -0,0 +1,666 @@
+"""Gemeinsame Energiezählung für alle Energie-Sensoren eines ConfigEntries.
+
+Der EnergyAccumulator abonniert die Webhook-Daten genau einmal pro Eintrag und
+integriert bei jedem Frame alle Leistungskanäle in einem Durchlauf. Für jeden
+Kanal gibt es einen Tages- und einen Gesamtzähler; die Zähler liegen kompakt in
+`array`-Objekten. Die Energie-Sensoren (Today/Total) sind nur Ansichten auf
+einen Zähler und werden per Listener über Änderungen informiert.
+
+Um Mitternacht (lokale Zeit) setzt der Accumulator alle Tageszähler in einem
+Schritt zurück und legt die Endstände in der EnergyHistory ab.
+
+Der Zustand wird regelmäßig im EnergyCheckpoint gesichert und beim Start
+wiederhergestellt. Die Lücke bis zum ersten Frame nach dem Neustart wird über
+die Geräte-Uptime überbrückt.
+
+Fehlen Frames länger als max_sub_interval (Neustart von Home Assistant,
+WLAN-Ausfall), wird die Lücke beim ersten Frame danach nachgetragen, sofern
+Uptime oder sendCount belegen, dass das Gerät durchgelaufen ist. Jede
+Nachbuchung wird als Korrektur protokolliert.
+
+Classes:
+    EnergyAccumulator: Mehrkanaliger Energiezähler pro ConfigEntry.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import logging
+import math
+import time
+from typing import Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import (
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util
+
+from ..const import (
+    CONF_DEVICE_ID,
+    CONF_ENABLE_CLOUD_DATA,
+    CONF_ENERGY_CHECKPOINT_INTERVAL,
+    DEFAULT_ENERGY_CHECKPOINT_INTERVAL,
+    DOMAIN,
+    MIN_ENERGY_CHECKPOINT_INTERVAL,
+    WEBHOOK_SIGNAL_STATE,
+    WEBHOOK_SIGNAL_UPDATE,
+)
+from ..tools import proxy_frame_signal
+from .energy_checkpoint import EnergyCheckpoint
+from .energy_history import EnergyHistory
+from .energy_integrator import (
+    MAX_SUB_INTERVAL,
+    METHOD_LEFT,
+    METHOD_TRAPEZOIDAL,
+    POWER_CHANNELS,
+    WS_PER_KWH,
+    frame_battery_energy,
+    frame_delta_seconds,
+    frame_powers,
+    frame_send_count,
+    frame_uptime,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Zähler pro Kanal: Index 0 = gesamt, 1 = heute
+_TOTAL = 0
+_TODAY = 1
+_COUNTERS_PER_CHANNEL = 2
+
+# Mindestabstand zwischen zwei Einträgen im Write-Ahead-Log (Sekunden)
+WAL_INTERVAL = 30.0
+
+# Längste Lücke, die über die Leistung interpoliert wird (Sekunden)
+MAX_BACKFILL_INTERVAL = 6 * 3600.0
+
+# Anzahl der protokollierten Korrekturen
+MAX_CORRECTIONS = 10
+
+_CHARGE = POWER_CHANNELS.index("battery_power_charge")
+_DISCHARGE = POWER_CHANNELS.index("battery_power_discharge")
+
+
+# Der Zähler hält den gesamten Integrationszustand eines Eintrags flach in
+# eigenen Attributen, damit der Frame-Pfad ohne Umwege darauf zugreift.
+class EnergyAccumulator:  # pylint: disable=too-many-instance-attributes
+    """Integriert alle Leistungskanäle eines ConfigEntries zu Energie (kWh).
+
+    Pro Frame wird der Zeitabstand einmal bestimmt und für alle Kanäle
+    verwendet. Kanäle ohne gültigen Wert im aktuellen Frame behalten ihren
+    letzten Wert (Halteglied), bis wieder ein gültiger Wert kommt.
+    Die Zähler werden mit Neumaier-Kompensation summiert.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        method: str = METHOD_TRAPEZOIDAL,
+        max_sub_interval: float = MAX_SUB_INTERVAL,
+    ) -> None:
+        """Initialisiert den Zähler.
+
+        Args:
+            hass (HomeAssistant): Die Home Assistant Instanz.
+            entry (ConfigEntry): Der Konfigurationseintrag.
+            method (str): "trapezoidal" oder "left".
+            max_sub_interval (float): Größter Frame-Abstand in Sekunden, über den
+                integriert wird. Größere Lücken werden übersprungen.
+        """
+        if method not in (METHOD_TRAPEZOIDAL, METHOD_LEFT):
+            raise ValueError(f"Unbekannte Integrationsmethode: {method}")
+
+        self.hass = hass
+        self.entry = entry
+        self._trapezoidal = method == METHOD_TRAPEZOIDAL
+        self._max_sub_interval = max_sub_interval
+
+        channels = len(POWER_CHANNELS)
+        counters = channels * _COUNTERS_PER_CHANNEL
+        self._sums = array("d", [0.0] * counters)
+        self._compensations = array("d", [0.0] * counters)
+        self._last_powers = array("d", [math.nan] * channels)
+        self._last_timestamp: Optional[float] = None
+        self._last_uptime_ms: Optional[int] = None
+        self._last_send_count: Optional[int] = None
+        self._last_battery_wh: Optional[float] = None
+
+        # Nachgebuchte Energie je Zähler und Protokoll der Korrekturen
+        self._backfilled = array("d", [0.0] * counters)
+        self.corrections: list[dict] = []
+
+        # Beginn des aktuellen Tages (UTC), gilt für alle Tageszähler
+        self.last_reset: datetime = dt_util.as_utc(dt_util.start_of_local_day())
+        self.history = EnergyHistory(hass, entry.entry_id)
+
+        self.checkpoint = EnergyCheckpoint(hass, entry.entry_id)
+        self.restored = False
+        self._seq = 0
+        self._last_wal: Optional[float] = None
+
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._reset_listeners: list[Callable[[datetime], Awaitable[None]]] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._enable_cloud_data = entry.data.get(CONF_ENABLE_CLOUD_DATA, False)
+
+    #
+    # ---- Zähler ----
+    #
+
+    @staticmethod
+    def counter_index(channel: str, daily: bool) -> int:
+        """Liefert den Index des Zählers für einen Kanal.
+
+        Args:
+            channel (str): Name des Leistungskanals, siehe POWER_CHANNELS.
+            daily (bool): True für den Tageszähler, False für den Gesamtzähler.
+
+        Returns:
+            int: Index des Zählers.
+        """
+        offset = _TODAY if daily else _TOTAL
+        return POWER_CHANNELS.index(channel) * _COUNTERS_PER_CHANNEL + offset
+
+    def value(self, counter: int) -> float:
+        """Aktuelle Energie eines Zählers in kWh."""
+        return self._sums[counter] + self._compensations[counter]
+
+    def set_value(self, counter: int, value: float) -> None:
+        """Setzt einen Zähler auf einen festen Wert (z.B. Wiederherstellung).
+
+        Die Integration läuft danach nahtlos weiter.
+        """
+        self._sums[counter] = float(value)
+        self._compensations[counter] = 0.0
+
+    def backfilled(self, counter: int) -> float:
+        """Summe der nachgebuchten Energie eines Zählers in kWh."""
+        return self._backfilled[counter]
+
+    def last_correction(self, channel: str) -> Optional[dict]:
+        """Liefert die letzte Korrektur, die einen Kanal betroffen hat."""
+        for correction in reversed(self.corrections):
+            if channel in correction["energy_kwh"]:
+                return correction
+        return None
+
+    def restart(self) -> None:
+        """Vergisst den letzten Frame, z.B. nach einem Verbindungsabbruch."""
+        self._last_powers = array("d", [math.nan] * len(POWER_CHANNELS))
+        self._last_timestamp = None
+        self._last_uptime_ms = None
+        self._last_send_count = None
+        self._last_battery_wh = None
+
+    def reset_daily(self, now: datetime) -> list[float]:
+        """Setzt alle Tageszähler in einem Schritt auf 0.
+
+        Args:
+            now (datetime): Zeitpunkt des Resets.
+
+        Returns:
+            list[float]: Endstände der Tageszähler je Kanal vor dem Reset.
+        """
+        values = []
+        for channel in range(len(POWER_CHANNELS)):
+            counter = channel * _COUNTERS_PER_CHANNEL + _TODAY
+            values.append(self.value(counter))
+            self._sums[counter] = 0.0
+            self._compensations[counter] = 0.0
+            self._backfilled[counter] = 0.0
+
+        self.last_reset = dt_util.as_utc(
+            dt_util.start_of_local_day(dt_util.as_local(now))
+        )
+        return values
+
+    def snapshot(self) -> dict:
+        """Liefert den aktuellen Zustand als Datensatz für den Checkpoint.
+
+        Jeder Aufruf erhält eine neue, aufsteigende Sequenznummer.
+        """
+        self._seq += 1
+        return {
+            "seq": self._seq,
+            "channels": list(POWER_CHANNELS),
+            "counters": [self.value(i) for i in range(len(self._sums))],
+            "last_powers": [
+                None if math.isnan(power) else power for power in self._last_powers
+            ],
+            "last_uptime_ms": self._last_uptime_ms,
+            "last_send_count": self._last_send_count,
+            "last_battery_wh": self._last_battery_wh,
+            "backfilled": list(self._backfilled),
+            "corrections": self.corrections,
+            "last_reset": self.last_reset.isoformat(),
+            "saved_at": dt_util.utcnow().isoformat(),
+        }
+
+    def restore(self, record: dict) -> Optional[datetime]:
+        """Übernimmt einen Datensatz aus dem Checkpoint.
+
+        Die letzte Uptime und die letzten Leistungen werden mit übernommen,
+        damit der erste Frame nach dem Neustart nahtlos weiterintegriert, sofern
+        das Gerät in der Zwischenzeit nicht neu gestartet ist.
+
+        Args:
+            record (dict): Datensatz aus EnergyCheckpoint.async_load().
+
+        Returns:
+            datetime | None: Der gespeicherte Tagesreset (UTC).
+        """
+        for counter, value in enumerate(record["counters"]):
+            self.set_value(counter, value)
+        for channel, power in enumerate(record["last_powers"]):
+            self._last_powers[channel] = math.nan if power is None else float(power)
+
+        self._last_timestamp = None
+        self._last_uptime_ms = record.get("last_uptime_ms")
+        self._last_send_count = record.get("last_send_count")
+        self._last_battery_wh = record.get("last_battery_wh")
+        backfilled = record.get("backfilled") or []
+        if len(backfilled) == len(self._backfilled):
+            self._backfilled = array("d", backfilled)
+        self.corrections = list(record.get("corrections") or [])
+        self._seq = record["seq"]
+        self.restored = True
+
+        last_reset = dt_util.parse_datetime(record.get("last_reset") or "")
+        return dt_util.as_utc(last_reset) if last_reset else None
+
+    def add_frame(self, data: dict, timestamp: float) -> None:
+        """Integriert alle Kanäle eines Frames in einem Durchlauf.
+
+        Args:
+            data (dict): Die empfangenen Webhook-Daten.
+            timestamp (float): Lokale, monotone Zeit des Frames in Sekunden.
+        """
+        powers = frame_powers(data)
+        uptime_ms = frame_uptime(data)
+        send_count = frame_send_count(data)
+        battery_wh = frame_battery_energy(data)
+
+        delta = frame_delta_seconds(
+            self._last_timestamp, timestamp, self._last_uptime_ms, uptime_ms
+        )
+
+        integrate = delta is not None and 0 < delta <= self._max_sub_interval
+        if delta is not None and delta > self._max_sub_interval:
+            _LOGGER.debug(
+                "Frame-Abstand %.1f s größer als %.1f s – Integration pausiert",
+                delta,
+                self._max_sub_interval,
+            )
+            self._backfill(delta, powers, uptime_ms, send_count, battery_wh)
+
+        self._last_timestamp = timestamp
+        self._last_uptime_ms = uptime_ms
+        if send_count is not None:
+            self._last_send_count = send_count
+        if battery_wh is not None:
+            self._last_battery_wh = battery_wh
+
+        self._integrate(powers, delta if integrate else None)
+
+    def _integrate(self, powers: list[Optional[float]], delta: Optional[float]) -> None:
+        """Addiert die Energie seit dem letzten Frame auf alle Zähler.
+
+        Args:
+            powers (list): Leistungen des Frames je Kanal, None ohne gültigen Wert.
+            delta (float | None): Zeitabstand in Sekunden, None wenn nicht
+                integriert wird. Die Halteglieder werden trotzdem aktualisiert.
+        """
+        sums = self._sums
+        compensations = self._compensations
+        last_powers = self._last_powers
+
+        for channel, power in enumerate(powers):
+            last_power = last_powers[channel]
+            if power is None:
+                # Halteglied: letzter gültiger Wert gilt weiter
+                power = last_power
+            else:
+                last_powers[channel] = power
+
+            if delta is None or math.isnan(last_power):
+                continue
+
+            if self._trapezoidal:
+                energy = (last_power + power) / 2 * delta / WS_PER_KWH
+            else:
+                energy = last_power * delta / WS_PER_KWH
+
+            base = channel * _COUNTERS_PER_CHANNEL
+            for counter in (base + _TOTAL, base + _TODAY):
+                current = sums[counter]
+                total = current + energy
+                if abs(current) >= abs(energy):
+                    compensations[counter] += (current - total) + energy
+                else:
+                    compensations[counter] += (energy - total) + current
+                sums[counter] = total
+
+    def _backfill(
+        self,
+        gap: float,
+        powers: list[Optional[float]],
+        uptime_ms: Optional[int],
+        send_count: Optional[int],
+        battery_wh: Optional[float],
+    ) -> None:
+        """Bucht die Energie einer Lücke nach.
+
+        Nur wenn das Gerät nachweislich durchgelaufen ist: die Uptime ist über
+        die Lücke gestiegen, oder sendCount zeigt verlorene Telegramme. Die
+        Leistung wird linear zwischen dem Frame vor und nach der Lücke
+        interpoliert (höchstens MAX_BACKFILL_INTERVAL). Für Lade- und
+        Entladeenergie hat die Änderung der gespeicherten Batterieenergie
+        (batteryCapacity) Vorrang.
+
+        Liegt der Tagesreset in der Lücke, geht nur der Anteil nach dem Reset
+        in den Tageszähler.
+        """
+        source = self._backfill_source(uptime_ms, send_count)
+        if source is None:
+            return
+
+        energies = self._gap_energies(gap, powers, battery_wh)
+        from_battery = self._last_battery_wh is not None and battery_wh is not None
+
+        if not any(energies):
+            return
+
+        now = dt_util.utcnow()
+        today_share = min(max((now - self.last_reset).total_seconds() / gap, 0.0), 1.0)
+
+        booked = {}
+        for channel, energy in enumerate(energies):
+            if energy <= 0:
+                continue
+            base = channel * _COUNTERS_PER_CHANNEL
+            self._add(base + _TOTAL, energy)
+            self._add(base + _TODAY, energy * today_share)
+            booked[POWER_CHANNELS[channel]] = round(energy, 4)
+
+        self.corrections.append(
+            {
+                "time": now.isoformat(),
+                "gap_s": round(gap, 1),
+                "source": source,
+                "missed_frames": (
+                    send_count - self._last_send_count - 1
+                    if send_count is not None and self._last_send_count is not None
+                    else None
+                ),
+                "battery_from_soe": from_battery,
+                "today_share": round(today_share, 3),
+                "energy_kwh": booked,
+            }
+        )
+        del self.corrections[:-MAX_CORRECTIONS]
+        _LOGGER.info(
+            "Lücke von %.0f s nachgebucht (%s): %s", gap, source, booked
+        )
+
+    def _backfill_source(
+        self, uptime_ms: Optional[int], send_count: Optional[int]
+    ) -> Optional[str]:
+        """Belegt, dass das Gerät über die Lücke durchgelaufen ist.
+
+        Returns:
+            str | None: "uptime" oder "sendCount", None ohne Nachweis.
+        """
+        last_uptime_ms = self._last_uptime_ms
+        if last_uptime_ms is not None and uptime_ms is not None and uptime_ms > last_uptime_ms:
+            return "uptime"
+        if (
+            self._last_send_count is not None
+            and send_count is not None
+            and send_count - self._last_send_count > 1
+        ):
+            return "sendCount"
+        return None
+
+    def _gap_energies(
+        self, gap: float, powers: list[Optional[float]], battery_wh: Optional[float]
+    ) -> list[float]:
+        """Energie je Kanal über die Lücke in kWh.
+
+        Die Leistung wird linear interpoliert, Lücken über MAX_BACKFILL_INTERVAL
+        gar nicht. Lade- und Entladeenergie kommen bevorzugt aus der Änderung
+        der gespeicherten Batterieenergie.
+        """
+        energies = [0.0] * len(POWER_CHANNELS)
+        if gap <= MAX_BACKFILL_INTERVAL:
+            for channel, power in enumerate(powers):
+                last_power = self._last_powers[channel]
+                if power is None:
+                    power = last_power
+                if not math.isnan(last_power):
+                    energies[channel] = (last_power + power) / 2 * gap / WS_PER_KWH
+
+        if self._last_battery_wh is not None and battery_wh is not None:
+            stored_kwh = (battery_wh - self._last_battery_wh) / 1000.0
+            energies[_CHARGE] = max(stored_kwh, 0.0)
+            energies[_DISCHARGE] = max(-stored_kwh, 0.0)
+        return energies
+
+    def _add(self, counter: int, energy: float) -> None:
+        """Addiert nachgebuchte Energie kompensiert auf einen Zähler."""
+        current = self._sums[counter]
+        total = current + energy
+        if abs(current) >= abs(energy):
+            self._compensations[counter] += (current - total) + energy
+        else:
+            self._compensations[counter] += (energy - total) + current
+        self._sums[counter] = total
+        self._backfilled[counter] += energy
+
+    #
+    # ---- Listener ----
+    #
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Registriert einen Listener, der nach jedem Frame aufgerufen wird.
+
+        Returns:
+            Callable: Funktion zum Abmelden des Listeners.
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_reset_listener(
+        self, reset_callback: Callable[[datetime], Awaitable[None]]
+    ) -> Callable[[], None]:
+        """Registriert einen Listener, der nach dem Tagesreset aufgerufen wird.
+
+        Der Listener erhält den neuen Reset-Zeitpunkt (UTC).
+
+        Returns:
+            Callable: Funktion zum Abmelden des Listeners.
+        """
+        self._reset_listeners.append(reset_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if reset_callback in self._reset_listeners:
+                self._reset_listeners.remove(reset_callback)
+
+        return remove_listener
+
+    async def _async_midnight(self, now: datetime):
+        """Tageswechsel: alle Tageszähler zurücksetzen und Endstände speichern."""
+        day = dt_util.as_local(self.last_reset).date()
+        values = self.reset_daily(now)
+        _LOGGER.info("Tagesreset der Energiezähler für %s", day)
+
+        try:
+            await self.history.async_add_day(day, values)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Fehler beim Speichern der Energie-Historie: %s", err)
+        await self._async_checkpoint()
+
+        for reset_callback in list(self._reset_listeners):
+            await reset_callback(self.last_reset)
+
+    @callback
+    def _notify_listeners(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    #
+    # ---- Datenquelle ----
+    #
+
+    async def async_restore(self) -> None:
+        """Stellt den letzten Checkpoint wieder her.
+
+        Stammt der Checkpoint von einem früheren Tag, werden dessen Tageszähler
+        in der Historie abgelegt und zurückgesetzt.
+        """
+        try:
+            record = await self.checkpoint.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Fehler beim Laden des Energie-Checkpoints: %s", err)
+            return
+
+        if record is None:
+            return
+
+        last_reset = self.restore(record)
+        _LOGGER.info("Energiezähler aus Checkpoint %s wiederhergestellt", record["seq"])
+
+        if last_reset is not None and last_reset < self.last_reset:
+            day = dt_util.as_local(last_reset).date()
+            values = self.reset_daily(dt_util.utcnow())
+            try:
+                await self.history.async_add_day(day, values)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error("Fehler beim Speichern der Energie-Historie: %s", err)
+
+    async def _async_checkpoint(self, _now=None) -> None:
+        """Schreibt einen vollständigen Checkpoint."""
+        try:
+            await self.checkpoint.async_save(self.snapshot())
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Fehler beim Speichern des Energie-Checkpoints: %s", err)
+
+    async def _async_write_ahead(self) -> None:
+        """Hängt den Zustand an das Write-Ahead-Log an (höchstens alle WAL_INTERVAL s)."""
+        now = time.monotonic()
+        if self._last_wal is not None and now - self._last_wal < WAL_INTERVAL:
+            return
+        self._last_wal = now
+        try:
+            await self.checkpoint.async_write_ahead(self.snapshot())
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Fehler beim Schreiben des Energie-Logs: %s", err)
+
+    async def setup(self):
+        """Abonniert die Webhook- bzw. Proxy-Daten dieses Eintrags (einmalig).
+
+        Stellt vorher den letzten Checkpoint wieder her. Registriert außerdem
+        den gemeinsamen Tagesreset um 0:00 Uhr lokale Zeit und das regelmäßige
+        Sichern des Zustands.
+        """
+        if self._unsubs:
+            return
+
+        await self.async_restore()
+
+        try:
+            interval = max(
+                int(
+                    self.entry.options.get(
+                        CONF_ENERGY_CHECKPOINT_INTERVAL,
+                        DEFAULT_ENERGY_CHECKPOINT_INTERVAL,
+                    )
+                ),
+                MIN_ENERGY_CHECKPOINT_INTERVAL,
+            )
+        except (TypeError, ValueError):
+            _LOGGER.warning("Ungültiges Checkpoint-Intervall, nutze Standardwert")
+            interval = DEFAULT_ENERGY_CHECKPOINT_INTERVAL
+        self._unsubs.append(
+            async_track_time_change(
+                self.hass, self._async_midnight, hour=0, minute=0, second=0
+            )
+        )
+        self._unsubs.append(
+            async_track_time_interval(
+                self.hass, self._async_checkpoint, timedelta(seconds=interval)
+            )
+        )
+        self._unsubs.append(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_checkpoint
+            )
+        )
+
+        entry_data = self.hass.data[DOMAIN][self.entry.entry_id]
+
+        if self._enable_cloud_data:
+            _LOGGER.info("EnergyAccumulator: Daten kommen vom Proxy")
+            self._unsubs.append(
+                async_dispatcher_connect(
+                    self.hass,
+                    proxy_frame_signal(self.entry.data.get(CONF_DEVICE_ID)),
+                    self._wrapper_update,
+                )
+            )
+        else:
+            self._unsubs.append(
+                async_dispatcher_connect(
+                    self.hass, entry_data[WEBHOOK_SIGNAL_UPDATE], self._wrapper_update
+                )
+            )
+
+        self._unsubs.append(
+            async_dispatcher_connect(
+                self.hass, entry_data[WEBHOOK_SIGNAL_STATE], self._wrapper_stale
+            )
+        )
+
+    async def async_unload(self) -> None:
+        """Meldet alle Abonnements und Listener ab und sichert den Zustand."""
+        if self._unsubs:
+            await self._async_checkpoint()
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._listeners.clear()
+        self._reset_listeners.clear()
+
+    async def _wrapper_update(self, data: dict):
+        """Ablauf bei einem eingehenden Frame."""
+        try:
+            self.add_frame(data, time.monotonic())
+            self._notify_listeners()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Fehler im EnergyAccumulator beim Update: %s", err)
+            return
+        await self._async_write_ahead()
+
+    async def _wrapper_stale(self, _):
+        """Bei fehlenden Daten pausiert die Integration bis zum nächsten Frame.
+
+        Der letzte Frame bleibt als Bezug erhalten, damit die Lücke beim
+        nächsten Frame nachgebucht werden kann.
+        """
+        _LOGGER.debug("EnergyAccumulator: keine Daten – Integration pausiert")
@@ -0,0 +1,132 @@
+"""Absturzsicherer Zwischenstand der Energiezähler.
+
+Der EnergyAccumulator sichert seinen Zustand (Zählerstände, letzte Leistungen,
+letzte Uptime, Tagesreset) in zwei Stufen:
+
+* Checkpoint: vollständiger Stand im Home Assistant Store. Der Store schreibt
+  über eine temporäre Datei und benennt sie anschließend um, die Datei ist also
+  immer entweder alt oder neu, nie halb geschrieben.
+* Write-Ahead-Log: zwischen zwei Checkpoints wird der Stand als einzelne
+  JSON-Zeile an eine Logdatei angehängt. Nach einem erfolgreichen Checkpoint
+  wird das Log geleert.
+
+Beim Laden gewinnt der Datensatz mit der höchsten Sequenznummer. Eine beim
+Absturz abgeschnittene letzte Logzeile wird ignoriert.
+
+Classes:
+    EnergyCheckpoint: Checkpoint und Write-Ahead-Log pro ConfigEntry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+from .energy_integrator import POWER_CHANNELS
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class EnergyCheckpoint:
+    """Speichert und lädt den Zustand des EnergyAccumulators.
+
+    Ein Datensatz hat das Format::
+
+        {"seq": 12, "channels": [...], "counters": [...], "last_powers": [...],
+         "last_uptime_ms": 123456, "last_reset": "2026-10-18T22:00:00+00:00",
+         "saved_at": "2026-10-19T08:15:00+00:00"}
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialisiert Checkpoint und Write-Ahead-Log.
+
+        Args:
+            hass (HomeAssistant): Die Home Assistant Instanz.
+            entry_id (str): ID des ConfigEntries.
+        """
+        self.hass = hass
+        key = f"{DOMAIN}.{entry_id}.energy_checkpoint"
+        self._store = Store(hass, STORAGE_VERSION, key)
+        self._wal_path = hass.config.path(".storage", f"{key}.wal")
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> dict | None:
+        """Lädt den neuesten gültigen Datensatz aus Checkpoint und Log.
+
+        Returns:
+            dict | None: Der Datensatz oder None, wenn nichts gespeichert ist.
+        """
+        async with self._lock:
+            records = [await self._store.async_load()]
+            records.extend(
+                await self.hass.async_add_executor_job(_read_wal, self._wal_path)
+            )
+
+        valid = [record for record in records if _is_valid(record)]
+        if not valid:
+            return None
+        return max(valid, key=lambda record: record["seq"])
+
+    async def async_write_ahead(self, record: dict) -> None:
+        """Hängt einen Datensatz an das Write-Ahead-Log an."""
+        async with self._lock:
+            await self.hass.async_add_executor_job(
+                _append_wal, self._wal_path, json.dumps(record)
+            )
+
+    async def async_save(self, record: dict) -> None:
+        """Schreibt einen vollständigen Checkpoint und leert danach das Log."""
+        async with self._lock:
+            await self._store.async_save(record)
+            await self.hass.async_add_executor_job(_truncate_wal, self._wal_path)
+
+
+def _is_valid(record) -> bool:
+    """Prüft, ob ein Datensatz zur aktuellen Kanalliste passt."""
+    return (
+        isinstance(record, dict)
+        and isinstance(record.get("seq"), int)
+        and record.get("channels") == list(POWER_CHANNELS)
+        and len(record.get("counters", ())) == 2 * len(POWER_CHANNELS)
+        and len(record.get("last_powers", ())) == len(POWER_CHANNELS)
+    )
+
+
+def _read_wal(path: str) -> list[dict]:
+    """Liest alle vollständigen Zeilen des Logs (Executor)."""
+    records = []
+    try:
+        with open(path, encoding="utf-8") as wal:
+            for line in wal:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    _LOGGER.debug("Unvollständige Zeile im Energie-Log ignoriert")
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def _append_wal(path: str, line: str) -> None:
+    """Hängt eine Zeile an und schreibt sie auf den Datenträger (Executor)."""
+    with open(path, "a", encoding="utf-8") as wal:
+        wal.write(line + "\n")
+        wal.flush()
+        os.fsync(wal.fileno())
+
+
+def _truncate_wal(path: str) -> None:
+    """Leert das Log nach einem erfolgreichen Checkpoint (Executor)."""
+    try:
+        with open(path, "w", encoding="utf-8"):
+            pass
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,88 @@
+"""Tageshistorie der Energiezähler.
+
+Beim Tageswechsel werden die Endstände aller Tageszähler eines ConfigEntries
+als eine kompakte Zeile (Datum + ein Wert je Kanal) in `.storage` abgelegt.
+
+Classes:
+    EnergyHistory: Persistente Tageshistorie pro ConfigEntry.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+from .energy_integrator import POWER_CHANNELS
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Anzahl der Tage, die aufbewahrt werden
+HISTORY_MAX_DAYS = 400
+
+
+class EnergyHistory:
+    """Speichert die Tagesendstände der Energiezähler.
+
+    Format im Store::
+
+        {"channels": [...], "days": [["2026-10-18", 1.234, ...], ...]}
+
+    Die Werte je Tag stehen in der Reihenfolge von "channels".
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, max_days: int = HISTORY_MAX_DAYS
+    ) -> None:
+        """Initialisiert die Historie.
+
+        Args:
+            hass (HomeAssistant): Die Home Assistant Instanz.
+            entry_id (str): ID des ConfigEntries.
+            max_days (int): Anzahl der Tage, die aufbewahrt werden.
+        """
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.energy_history")
+        self._max_days = max_days
+        self._days: list[list] | None = None
+
+    async def async_load(self) -> list[list]:
+        """Lädt die gespeicherten Tage (einmalig).
+
+        Returns:
+            list[list]: Zeilen [Datum, Wert je Kanal ...], älteste zuerst.
+        """
+        if self._days is None:
+            stored = await self._store.async_load()
+            days = []
+            if stored and stored.get("channels") == list(POWER_CHANNELS):
+                days = stored.get("days", [])
+            elif stored:
+                _LOGGER.warning(
+                    "Energie-Historie mit abweichenden Kanälen wird verworfen"
+                )
+            self._days = days
+        return self._days
+
+    async def async_add_day(self, day: date, values: list[float]) -> None:
+        """Speichert die Endstände eines Tages.
+
+        Ein bereits vorhandener Eintrag für denselben Tag wird ersetzt.
+
+        Args:
+            day (date): Der abgeschlossene Tag (lokal).
+            values (list[float]): Endstände in kWh je Kanal.
+        """
+        days = await self.async_load()
+        key = day.isoformat()
+
+        if days and days[-1][0] == key:
+            days.pop()
+        days.append([key, *(round(value, 4) for value in values)])
+        del days[: -self._max_days]
+
+        await self._store.async_save({"channels": list(POWER_CHANNELS), "days": days})
@@ -0,0 +1,215 @@
+"""Hilfsfunktionen für die native Energie-Integration aus Webhook-Frames.
+
+Dieses Modul ermittelt aus den dekodierten Webhook-Daten die Leistung (W)
+aller Energiekanäle und den Zeitabstand zwischen zwei Frames. Als Zeitbasis
+dient bevorzugt die `uptime` des Geräts, sodass Verzögerungen bei der
+Zustellung oder Drosselung beim Schreiben der Zustände das Ergebnis nicht
+verfälschen. Die eigentliche Aufsummierung übernimmt der EnergyAccumulator.
+
+Constants:
+    POWER_CHANNELS (tuple): Namen der Leistungskanäle in fester Reihenfolge.
+    METHOD_TRAPEZOIDAL, METHOD_LEFT (str): Unterstützte Integrationsmethoden.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from ..tools import is_pccu_ok, is_power_total_ok, is_pr_ok
+
+METHOD_TRAPEZOIDAL = "trapezoidal"
+METHOD_LEFT = "left"
+
+# Größter Abstand zwischen zwei Frames, über den noch integriert wird (Sekunden)
+MAX_SUB_INTERVAL = 120.0
+
+# Umrechnung Ws → kWh
+WS_PER_KWH = 3_600_000.0
+
+
+def _read(data: dict, key: str) -> Optional[float]:
+    try:
+        return float(data[key])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+# Leistungskanäle, benannt nach den zugehörigen Leistungssensoren
+POWER_CHANNELS: tuple[str, ...] = (
+    "pv_power",
+    "ccu_power",
+    "battery_power_charge",
+    "battery_power_discharge",
+    "grid_export",
+    "grid_import",
+    "pv_self_consumption",
+    "power_consumption",
+)
+
+
+def frame_powers(data: dict) -> list[Optional[float]]:
+    """Ermittelt die Leistung aller Kanäle aus einem Webhook-Frame.
+
+    Die Rohwerte (PV_power_total, Pccu, Pr) werden nur einmal gelesen und
+    geprüft; die Berechnungen entsprechen denen der Leistungssensoren.
+
+    Args:
+        data (dict): Die empfangenen Webhook-Daten.
+
+    Returns:
+        list[float | None]: Leistung in Watt je Kanal in der Reihenfolge von
+        POWER_CHANNELS. None, wenn der Frame für den Kanal keine plausiblen
+        Werte enthält.
+    """
+    pv_power = _read(data, "PV_power_total")
+    if pv_power is not None and not is_power_total_ok(
+        pv_power, data.get("batteriesInfo", [])
+    ):
+        pv_power = None
+
+    pccu = _read(data, "Pccu")
+    if pccu is not None and not is_pccu_ok(pccu):
+        pccu = None
+
+    pr = _read(data, "Pr")
+    if pr is not None and not is_pr_ok(pr):
+        pr = None
+
+    battery = None
+    if pv_power is not None and pccu is not None:
+        battery = round(pv_power - pccu, 3)
+
+    grid_export = None if pr is None else round(max(-pr, 0.0), 2)
+    grid_import = None if pr is None else max(pr, 0.0)
+
+    return [
+        pv_power,
+        pccu,
+        None if battery is None else max(battery, 0.0),
+        None if battery is None else max(-battery, 0.0),
+        grid_export,
+        grid_import,
+        None
+        if pv_power is None or grid_export is None
+        else round(pv_power - grid_export, 2),
+        None if pccu is None or grid_import is None else round(pccu + grid_import, 2),
+    ]
+
+
+def channel_power(channel: str, data: dict) -> Optional[float]:
+    """Ermittelt die Leistung eines einzelnen Kanals aus einem Webhook-Frame.
+
+    Args:
+        channel (str): Name des Leistungskanals, siehe POWER_CHANNELS.
+        data (dict): Die empfangenen Webhook-Daten.
+
+    Returns:
+        float | None: Leistung in Watt oder None, wenn der Kanal unbekannt ist
+        oder der Frame keine plausiblen Werte enthält.
+    """
+    if channel not in POWER_CHANNELS:
+        return None
+    return frame_powers(data)[POWER_CHANNELS.index(channel)]
+
+
+def frame_uptime(data: dict) -> Optional[int]:
+    """Liefert die Geräte-Uptime eines Frames in Millisekunden.
+
+    Args:
+        data (dict): Die empfangenen Webhook-Daten.
+
+    Returns:
+        int | None: Uptime in ms oder None, wenn nicht vorhanden bzw. ungültig.
+    """
+    try:
+        uptime_ms = int(data["uptime"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return uptime_ms if uptime_ms >= 0 else None
+
+
+def frame_send_count(data: dict) -> Optional[int]:
+    """Liefert den Telegrammzähler (sendCount) eines Frames.
+
+    Args:
+        data (dict): Die empfangenen Webhook-Daten.
+
+    Returns:
+        int | None: sendCount oder None, wenn nicht vorhanden bzw. ungültig.
+    """
+    try:
+        return int(data["sendCount"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def frame_battery_energy(data: dict) -> Optional[float]:
+    """Liefert die gespeicherte Energie aller Batterien eines Frames.
+
+    Args:
+        data (dict): Die empfangenen Webhook-Daten.
+
+    Returns:
+        float | None: Summe von batteryCapacity in Wh oder None, wenn keine
+        Batterie gemeldet wird oder ein Wert fehlt.
+    """
+    batteries = data.get("batteriesInfo")
+    if not isinstance(batteries, list) or not batteries:
+        return None
+
+    total = 0.0
+    for battery in batteries:
+        try:
+            total += float(battery["batteryCapacity"])
+        except (KeyError, TypeError, ValueError):
+            return None
+    return total
+
+
+def frame_battery_power(data: dict) -> Optional[float]:
+    """Liefert die Batterieleistung eines Frames (PV_power_total - Pccu).
+
+    Args:
+        data (dict): Die empfangenen Webhook-Daten.
+
+    Returns:
+        float | None: Leistung in W, positiv beim Laden, negativ beim Entladen.
+        None, wenn ein Wert fehlt oder nicht plausibel ist.
+    """
+    pv_power = _read(data, "PV_power_total")
+    pccu = _read(data, "Pccu")
+    if pv_power is None or pccu is None or not is_pccu_ok(pccu):
+        return None
+    if not is_power_total_ok(pv_power, data.get("batteriesInfo", [])):
+        return None
+    return round(pv_power - pccu, 3)
+
+
+def frame_delta_seconds(
+    last_timestamp: Optional[float],
+    timestamp: float,
+    last_uptime_ms: Optional[int],
+    uptime_ms: Optional[int],
+) -> Optional[float]:
+    """Berechnet den Zeitabstand zwischen zwei Frames.
+
+    Bevorzugt wird die Differenz der Geräte-Uptime. Fehlt sie oder ist sie nicht
+    monoton (z.B. nach einem Neustart des Geräts), wird auf die lokale Zeit
+    zurückgegriffen.
+
+    Args:
+        last_timestamp (float | None): Lokale Zeit des vorherigen Frames in Sekunden.
+        timestamp (float): Lokale Zeit des aktuellen Frames in Sekunden.
+        last_uptime_ms (int | None): Uptime des vorherigen Frames in ms.
+        uptime_ms (int | None): Uptime des aktuellen Frames in ms.
+
+    Returns:
+        float | None: Abstand in Sekunden oder None, wenn es keinen vorherigen Frame gibt.
+    """
+    if last_uptime_ms is not None and uptime_ms is not None and uptime_ms > last_uptime_ms:
+        return (uptime_ms - last_uptime_ms) / 1000.0
+
+    if last_timestamp is None:
+        return None
+
+    return timestamp - last_timestamp
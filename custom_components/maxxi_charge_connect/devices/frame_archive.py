@@ -0,0 +1,462 @@
+"""Kompaktes spaltenweises Tagesarchiv der Rohdaten eines Eintrags.
+
+Der FrameArchive legt jeden angenommenen Frame in einer Datei pro Tag ab
+(`<config>/maxxi_charge_connect/archive/<entry_id>/JJJJ-MM-TT.mca`). Das
+Schreiben übernimmt ein eigener Thread; die Event-Loop stellt nur die Zeile
+(siehe frame_row) in eine begrenzte Queue. Um Mitternacht (lokale Zeit) wird
+eine neue Datei begonnen und Dateien außerhalb der Aufbewahrungsdauer werden
+gelöscht.
+
+Dateiformat (little endian):
+
+- Kopf: ``b"MCA1"`` und Beginn des Tages als int64 in ms seit 1970.
+- Schema-Satz: ``0x00``, varint Basiszeit (ms seit Tagesbeginn), varint Anzahl
+  Spalten, je Spalte varint Länge und UTF-8-Name. Setzt alle Werte auf NaN
+  zurück; wird beim Öffnen der Datei und bei neuen Spalten geschrieben.
+- Daten-Satz: ``0x01``, varint Abstand zum vorigen Satz in ms, varint
+  Bitmaske der geänderten Spalten, je geänderter Spalte ein float32.
+
+Unveränderte Spalten kosten damit nur ein Bit je Frame.
+
+Classes:
+    FrameArchive: Archiv-Schreiber eines ConfigEntries.
+
+Functions:
+    read_archive_file: Liest eine Archivdatei spaltenweise.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+import logging
+import math
+import os
+import queue
+import struct
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+from ..const import (
+    CONF_FRAME_ARCHIVE_RETENTION_DAYS,
+    DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS,
+    DOMAIN,
+)
+from .battery_columns import BatteryColumnCache
+from .frame_buffer import frame_row, frame_signal
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"MCA1"
+SUFFIX = ".mca"
+
+RECORD_SCHEMA = 0x00
+RECORD_DATA = 0x01
+
+# Obergrenze der wartenden Frames; darüber wird verworfen
+MAX_QUEUE = 10000
+
+_FLOAT = struct.Struct("<f")
+_NAN_PACKED = _FLOAT.pack(float("nan"))
+
+_STOP = object()
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Hängt value als LEB128-varint an (value >= 0)."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    """Liest einen varint ab pos; liefert Wert und neue Position."""
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _day_start_ms(day: date) -> int:
+    """Beginn des lokalen Tages in ms seit 1970."""
+    return int(dt_util.start_of_local_day(day).timestamp() * 1000)
+
+
+def _read_schema(buf: bytes, pos: int) -> tuple[int, list[str], int]:
+    """Liest einen Schema-Satz ab pos (nach der Satzart).
+
+    Returns:
+        tuple: Basiszeit in ms seit Tagesbeginn, Spaltennamen und neue Position.
+    """
+    base, pos = _read_varint(buf, pos)
+    count, pos = _read_varint(buf, pos)
+    names = []
+    for _ in range(count):
+        length, pos = _read_varint(buf, pos)
+        if pos + length > len(buf):
+            raise IndexError
+        names.append(buf[pos:pos + length].decode("utf-8"))
+        pos += length
+    return base, names, pos
+
+
+def _read_data(
+    buf: bytes, pos: int, values: list[float]
+) -> tuple[int, list[float], int]:
+    """Liest einen Daten-Satz ab pos (nach der Satzart).
+
+    Args:
+        buf (bytes): Inhalt der Archivdatei.
+        pos (int): Position nach der Satzart.
+        values (list[float]): Werte des vorigen Satzes; bleiben unverändert.
+
+    Returns:
+        tuple: Abstand zum vorigen Satz in ms, Werte je Spalte und neue Position.
+    """
+    delta, pos = _read_varint(buf, pos)
+    mask, pos = _read_varint(buf, pos)
+    row = []
+    for index, value in enumerate(values):
+        if mask >> index & 1:
+            value = _FLOAT.unpack_from(buf, pos)[0]
+            pos += 4
+        row.append(value)
+    return delta, row, pos
+
+
+def _append_row(
+    columns: dict[str, list[Optional[float]]], names: list[str], values: list[float]
+) -> None:
+    """Hängt die Werte eines Satzes an alle bekannten Spalten an."""
+    current = dict(zip(names, values))
+    for name, column in columns.items():
+        value = current.get(name, math.nan)
+        column.append(None if math.isnan(value) else value)
+
+
+def read_archive_file(path: str) -> dict[str, Any]:
+    """Liest eine Archivdatei und setzt die Spalten wieder zusammen.
+
+    Ein unvollständiger letzter Satz (z. B. nach einem Absturz) wird ignoriert.
+
+    Args:
+        path (str): Pfad der Archivdatei.
+
+    Returns:
+        dict: ``timestamps`` (Unix-Zeit in s) und ``columns`` (Spaltenname →
+        Werte je Zeitstempel, None für fehlende Werte).
+
+    Raises:
+        ValueError: Wenn die Datei kein Archiv ist.
+    """
+    with open(path, "rb") as file:
+        buf = file.read()
+
+    if buf[:4] != MAGIC or len(buf) < 12:
+        raise ValueError(f"Keine Archivdatei: {path}")
+    day_start = int.from_bytes(buf[4:12], "little", signed=True)
+
+    timestamps: list[float] = []
+    columns: dict[str, list[Optional[float]]] = {}
+    names: list[str] = []
+    values: list[float] = []
+    current_ms = day_start
+    pos = 12
+
+    while pos < len(buf):
+        try:
+            kind = buf[pos]
+            pos += 1
+            if kind == RECORD_SCHEMA:
+                base, names, pos = _read_schema(buf, pos)
+                values = [math.nan] * len(names)
+                current_ms = day_start + base
+                for name in names:
+                    columns.setdefault(name, [None] * len(timestamps))
+            elif kind == RECORD_DATA:
+                delta, values, pos = _read_data(buf, pos, values)
+                current_ms += delta
+                timestamps.append(current_ms / 1000.0)
+                _append_row(columns, names, values)
+            else:
+                _LOGGER.warning("Unbekannter Satz im Archiv %s bei %s", path, pos - 1)
+                break
+        except (IndexError, struct.error):
+            # Letzter Satz unvollständig
+            break
+
+    return {"timestamps": timestamps, "columns": columns}
+
+
+class _DayFile:
+    """Geöffnete Archivdatei eines Tages (nur im Schreib-Thread verwendet).
+
+    Attribute:
+        day (date | None): Tag der geöffneten Datei, None wenn geschlossen.
+        names (list[str]): Spalten des letzten Schema-Satzes.
+    """
+
+    def __init__(self) -> None:
+        """Initialisiert den Zustand ohne geöffnete Datei."""
+        self.file: BinaryIO | None = None
+        self.day: date | None = None
+        self.names: list[str] = []
+        self._day_start = 0
+        self._last_ms = 0
+        self._last: list[bytes] = []
+
+    def open(self, path: str, day: date) -> None:
+        """Öffnet die Datei des Tages zum Anhängen und schreibt ggf. den Kopf."""
+        self.close()
+        self.file = open(path, "ab")  # pylint: disable=consider-using-with
+        self.day = day
+        self._day_start = _day_start_ms(day)
+        if self.file.tell() == 0:
+            self.file.write(MAGIC + self._day_start.to_bytes(8, "little", signed=True))
+        # Jede Sitzung beginnt mit einem Schema-Satz
+        self.names = []
+
+    def close(self) -> None:
+        """Schließt die Datei."""
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+        self.day = None
+
+    def write(self, timestamp_ms: int, row: dict[str, float]) -> None:
+        """Schreibt eine Zeile; nur geänderte Spalten werden abgelegt."""
+        if (
+            not self.names
+            or timestamp_ms < self._last_ms
+            or any(name not in self.names for name in row)
+        ):
+            names = list(self.names)
+            names.extend(name for name in row if name not in names)
+            self._write_schema(names, max(timestamp_ms, self._day_start))
+
+        out = bytearray([RECORD_DATA])
+        _write_varint(out, max(timestamp_ms - self._last_ms, 0))
+        mask = 0
+        payload = bytearray()
+        last = self._last
+        for index, name in enumerate(self.names):
+            packed = _FLOAT.pack(row.get(name, math.nan))
+            if packed != last[index]:
+                mask |= 1 << index
+                payload += packed
+                last[index] = packed
+        _write_varint(out, mask)
+        out += payload
+        self.file.write(out)
+        self._last_ms = max(timestamp_ms, self._last_ms)
+
+    def _write_schema(self, names: list[str], timestamp_ms: int) -> None:
+        out = bytearray([RECORD_SCHEMA])
+        _write_varint(out, timestamp_ms - self._day_start)
+        _write_varint(out, len(names))
+        for name in names:
+            encoded = name.encode("utf-8")
+            _write_varint(out, len(encoded))
+            out += encoded
+        self.file.write(out)
+        self.names = names
+        self._last = [_NAN_PACKED] * len(names)
+        self._last_ms = timestamp_ms
+
+
+class FrameArchive:
+    """Schreibt die Frames eines ConfigEntries in ein Tagesarchiv.
+
+    Attribute:
+        frames (int): Anzahl der geschriebenen Frames.
+        dropped (int): Anzahl der wegen voller Queue verworfenen Frames.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        column_cache: BatteryColumnCache | None = None,
+        directory: str | None = None,
+    ) -> None:
+        """Initialisiert den Schreiber, ohne ihn zu starten.
+
+        Args:
+            hass (HomeAssistant): Die Home Assistant-Instanz.
+            entry (ConfigEntry): Der Konfigurationseintrag.
+            column_cache (BatteryColumnCache | None): Spalten-Cache des
+                BatterySensorManagers.
+            directory (str | None): Zielverzeichnis; standardmäßig
+                ``<config>/maxxi_charge_connect/archive/<entry_id>``.
+        """
+        self.hass = hass
+        self.entry = entry
+        self.directory = directory or hass.config.path(
+            DOMAIN, "archive", entry.entry_id
+        )
+        self.retention_days = int(
+            entry.options.get(
+                CONF_FRAME_ARCHIVE_RETENTION_DAYS, DEFAULT_FRAME_ARCHIVE_RETENTION_DAYS
+            )
+        )
+        self._column_cache = column_cache or BatteryColumnCache()
+        self._queue: queue.Queue = queue.Queue(maxsize=MAX_QUEUE)
+        self._thread: threading.Thread | None = None
+        self._unsubs: list[Callable[[], None]] = []
+        self.frames = 0
+        self.dropped = 0
+
+        # Zustand des Schreib-Threads
+        self._day_file = _DayFile()
+
+    # --- Event-Loop -------------------------------------------------------
+
+    def setup(self) -> None:
+        """Startet den Schreib-Thread und abonniert die Frames des Eintrags."""
+        if self._unsubs:
+            return
+        self.start()
+        self._unsubs.append(
+            async_dispatcher_connect(
+                self.hass, frame_signal(self.hass, self.entry), self._handle_frame
+            )
+        )
+
+    async def async_unload(self) -> None:
+        """Meldet das Abonnement ab und wartet auf den Schreib-Thread."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        await self.hass.async_add_executor_job(self.stop)
+
+    async def _handle_frame(self, data: dict) -> None:
+        try:
+            self.add_frame(data, time.time())
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOGGER.error("Fehler im FrameArchive beim Update: %s", err)
+
+    def add_frame(self, data: dict, timestamp: float) -> None:
+        """Stellt einen Frame in die Queue des Schreib-Threads.
+
+        Args:
+            data (dict): Die empfangenen Webhook-Daten.
+            timestamp (float): Empfangszeit als Unix-Zeitstempel in Sekunden.
+        """
+        day = dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+        try:
+            self._queue.put_nowait(
+                (int(timestamp * 1000), day, frame_row(data, self._column_cache))
+            )
+        except queue.Full:
+            self.dropped += 1
+
+    def read_day(self, day: date) -> dict[str, Any]:
+        """Liest das Archiv eines Tages (blockierend, für den Executor).
+
+        Returns:
+            dict: Siehe read_archive_file; leer, wenn es keine Datei gibt.
+        """
+        path = self._path(day)
+        if not os.path.exists(path):
+            return {"timestamps": [], "columns": {}}
+        return read_archive_file(path)
+
+    async def async_read_day(self, day: date) -> dict[str, Any]:
+        """Liest das Archiv eines Tages im Executor."""
+        return await self.hass.async_add_executor_job(self.read_day, day)
+
+    def days(self) -> list[date]:
+        """Alle Tage, für die eine Archivdatei existiert (blockierend)."""
+        result = []
+        if not os.path.isdir(self.directory):
+            return result
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                try:
+                    result.append(date.fromisoformat(name[: -len(SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(result)
+
+    def stats(self) -> dict[str, Any]:
+        """Zähler für die Diagnose."""
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+            "columns": len(self._day_file.names),
+            "retention_days": self.retention_days,
+        }
+
+    # --- Schreib-Thread ---------------------------------------------------
+
+    def start(self) -> None:
+        """Startet den Schreib-Thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{DOMAIN}_archive_{self.entry.entry_id}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Schreibt die Queue leer und beendet den Schreib-Thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._apply_retention(dt_util.now().date())
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                try:
+                    self._write(*item)
+                except OSError as err:
+                    _LOGGER.error("Fehler beim Schreiben des Archivs: %s", err)
+                    self._day_file.close()
+                if self._queue.empty() and self._day_file.file is not None:
+                    self._day_file.file.flush()
+        finally:
+            self._day_file.close()
+
+    def _path(self, day: date) -> str:
+        return os.path.join(self.directory, f"{day.isoformat()}{SUFFIX}")
+
+    def _write(self, timestamp_ms: int, day: date, row: dict[str, float]) -> None:
+        """Schreibt eine Zeile in die Datei des Tages (Rotation um Mitternacht)."""
+        if day != self._day_file.day:
+            self._day_file.open(self._path(day), day)
+            self._apply_retention(day)
+        self._day_file.write(timestamp_ms, row)
+        self.frames += 1
+
+    def _apply_retention(self, today: date) -> None:
+        """Löscht Dateien, die älter als die Aufbewahrungsdauer sind."""
+        if self.retention_days <= 0:
+            return
+        cutoff = today - timedelta(days=self.retention_days)
+        for day in self.days():
+            if day < cutoff:
+                try:
+                    os.remove(self._path(day))
+                except OSError as err:
+                    _LOGGER.warning("Archiv %s nicht gelöscht: %s", day, err)
@@ -0,0 +1,449 @@
+"""Ringpuffer der letzten Frames eines Eintrags in hoher Auflösung.
+
+Der FrameBuffer speichert jeden Frame spaltenweise in Arrays fester Breite
+(`array` – Zeitstempel als double, Messwerte als float32). Die Kapazität wird
+beim Anlegen festgelegt, der Speicherbedarf ist damit begrenzt; ist der Puffer
+voll, überschreibt der neue Frame den ältesten.
+
+Neben Pccu, Pr, PV-Leistung und SOC werden je Batterie die Spalten aus
+BUFFER_BATTERY_COLUMNS abgelegt. Diese kommen aus dem BatteryColumnCache des
+BatterySensorManagers, `batteriesInfo` wird also nicht ein zweites Mal
+ausgewertet.
+
+Der Service `query_recent` liefert ein Zeitfenster als Rohdaten, in Intervalle
+zusammengefasst (Mittelwert) oder als Kennzahlen (min/max/mean/Perzentile).
+
+Classes:
+    FrameBuffer: Ringpuffer eines ConfigEntries.
+
+Functions:
+    frame_signal: Dispatcher-Signal der Frames eines Eintrags.
+    frame_row: Werte eines Frames je Spalte.
+    async_handle_query_recent: Service-Handler für query_recent.
+"""
+
+from __future__ import annotations
+
+from array import array
+import logging
+import math
+import time
+from typing import Any, Callable, Optional
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+from ..const import (
+    CONF_DEVICE_ID,
+    CONF_ENABLE_CLOUD_DATA,
+    DOMAIN,
+    FRAME_BUFFER,
+    WEBHOOK_SIGNAL_UPDATE,
+)
+from ..tools import proxy_frame_signal
+from .battery_columns import BatteryColumnCache
+
+_LOGGER = logging.getLogger(__name__)
+
+# Vorgehaltene Zeitspanne; bei höchstens einem Frame pro Sekunde
+DEFAULT_BUFFER_HOURS = 6
+DEFAULT_CAPACITY = DEFAULT_BUFFER_HOURS * 3600
+
+# Spalten des Frames: (Spalte, Feld im Frame)
+FRAME_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("pccu", "Pccu"),
+    ("pr", "Pr"),
+    ("pv_power", "PV_power_total"),
+    ("soc", "SOC"),
+)
+
+# Spalten je Batterie aus dem BatteryColumnCache, abgelegt als battery_<i>_<name>
+BUFFER_BATTERY_COLUMNS: tuple[str, ...] = (
+    "soc",
+    "voltage",
+    "current",
+    "pv_power",
+    "charge",
+    "discharge",
+)
+
+# Obergrenze der Punkte je Spalte in einer Service-Antwort
+MAX_POINTS = 5000
+
+STATISTICS = ("min", "max", "mean", "count")
+
+SERVICE_QUERY_RECENT = "query_recent"
+
+QUERY_RECENT_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): cv.string,
+        vol.Optional("minutes", default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional("fields"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("every"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional("statistics"): vol.All(cv.ensure_list, [vol.In(STATISTICS)]),
+        vol.Optional("percentiles"): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(float), vol.Range(min=0, max=100))]
+        ),
+    }
+)
+
+_NAN = float("nan")
+
+
+def _to_float(value: Any) -> float:
+    """Konvertiert einen Rohwert zu float, NaN bei fehlendem/ungültigem Wert."""
+    if value is None:
+        return _NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def frame_signal(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Dispatcher-Signal, über das die Frames eines Eintrags ankommen."""
+    if entry.data.get(CONF_ENABLE_CLOUD_DATA, False):
+        return proxy_frame_signal(entry.data.get(CONF_DEVICE_ID))
+    return hass.data[DOMAIN][entry.entry_id][WEBHOOK_SIGNAL_UPDATE]
+
+
+def frame_row(data: dict, column_cache: BatteryColumnCache) -> dict[str, float]:
+    """Liefert die Werte eines Frames je Spalte (NaN für fehlende Werte).
+
+    Args:
+        data (dict): Die empfangenen Webhook-Daten.
+        column_cache (BatteryColumnCache): Spalten-Cache für batteriesInfo.
+
+    Returns:
+        dict[str, float]: Spaltenname → Wert; Batteriespalten als
+        battery_<i>_<name> für jede gemeldete Batterie.
+    """
+    row = {name: _to_float(data.get(key)) for name, key in FRAME_COLUMNS}
+    battery_columns = column_cache.columns_for(data)
+    if battery_columns:
+        for metric in BUFFER_BATTERY_COLUMNS:
+            for index, value in enumerate(battery_columns.get(metric, ())):
+                row[f"battery_{index}_{metric}"] = _NAN if value is None else value
+    return row
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Perzentil mit linearer Interpolation auf einer sortierten Liste."""
+    pos = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(pos)
+    high = math.ceil(pos)
+    if low == high:
+        return ordered[low]
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def _json_value(value: float) -> Optional[float]:
+    """NaN wird in der Antwort zu None."""
+    return None if math.isnan(value) else value
+
+
+class FrameBuffer:
+    """Ringpuffer der Frames eines ConfigEntries mit spaltenweiser Ablage."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        column_cache: BatteryColumnCache | None = None,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """Initialisiert den Puffer und reserviert alle Spalten.
+
+        Args:
+            hass (HomeAssistant): Die Home Assistant-Instanz.
+            entry (ConfigEntry): Der Konfigurationseintrag.
+            column_cache (BatteryColumnCache | None): Spalten-Cache des
+                BatterySensorManagers; ohne Cache wird ein eigener verwendet.
+            capacity (int): Anzahl der vorgehaltenen Frames.
+        """
+        self.hass = hass
+        self.entry = entry
+        self.capacity = capacity
+        self._column_cache = column_cache or BatteryColumnCache()
+        self._timestamps = array("d", [_NAN]) * capacity
+        self._columns: dict[str, array] = {
+            name: array("f", [_NAN]) * capacity for name, _ in FRAME_COLUMNS
+        }
+        self._head = 0  # nächste Schreibposition
+        self._size = 0
+        self._unsubs: list[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        """Anzahl der Frames im Puffer."""
+        return self._size
+
+    @property
+    def fields(self) -> list[str]:
+        """Namen aller Spalten."""
+        return list(self._columns)
+
+    def setup(self) -> None:
+        """Abonniert die Webhook- bzw. Proxy-Daten dieses Eintrags."""
+        if self._unsubs:
+            return
+
+        self._unsubs.append(
+            async_dispatcher_connect(
+                self.hass, frame_signal(self.hass, self.entry), self._handle_frame
+            )
+        )
+
+    def async_unload(self) -> None:
+        """Meldet das Abonnement ab."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    async def _handle_frame(self, data: dict) -> None:
+        try:
+            self.add_frame(data, time.time())
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOGGER.error("Fehler im FrameBuffer beim Update: %s", err)
+
+    def _column(self, name: str) -> array:
+        """Liefert eine Spalte; neue (Batterie-)Spalten werden mit NaN angelegt."""
+        column = self._columns.get(name)
+        if column is None:
+            column = array("f", [_NAN]) * self.capacity
+            self._columns[name] = column
+        return column
+
+    def add_frame(self, data: dict, timestamp: float) -> None:
+        """Legt einen Frame im Puffer ab.
+
+        Args:
+            data (dict): Die empfangenen Webhook-Daten.
+            timestamp (float): Empfangszeit als Unix-Zeitstempel in Sekunden.
+        """
+        if self._size and timestamp < self._timestamps[(self._head - 1) % self.capacity]:
+            # Uhr zurückgestellt: die Zeitachse muss monoton bleiben
+            self._size = 0
+
+        pos = self._head
+        self._timestamps[pos] = timestamp
+        row = frame_row(data, self._column_cache)
+        for name, value in row.items():
+            self._column(name)[pos] = value
+
+        if len(row) != len(self._columns):
+            # Batterien, die in diesem Frame fehlen
+            for name, column in self._columns.items():
+                if name not in row:
+                    column[pos] = _NAN
+
+        self._head = (pos + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _position(self, index: int) -> int:
+        """Physische Position des index-ten Frames (0 = ältester)."""
+        return (self._head - self._size + index) % self.capacity
+
+    def _bisect(self, timestamp: float) -> int:
+        """Index des ersten Frames mit Zeitstempel >= timestamp."""
+        low, high = 0, self._size
+        while low < high:
+            mid = (low + high) // 2
+            if self._timestamps[self._position(mid)] < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def window(self, start: float, end: float) -> tuple[int, int]:
+        """Indexbereich [first, last) der Frames mit start <= t <= end."""
+        return self._bisect(start), self._bisect(math.nextafter(end, math.inf))
+
+    def _slice(self, column: array, first: int, last: int) -> list[float]:
+        """Liest einen zusammenhängenden Indexbereich als Liste."""
+        if first >= last:
+            return []
+        begin = self._position(first)
+        end = begin + (last - first)
+        if end <= self.capacity:
+            return column[begin:end].tolist()
+        return column[begin:].tolist() + column[: end - self.capacity].tolist()
+
+    # Die Optionen entsprechen den Feldern des Dienstes und sind nur per Name übergebbar
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        start: float,
+        end: float,
+        *,
+        fields: list[str] | None = None,
+        every: float | None = None,
+        statistics: list[str] | None = None,
+        percentiles: list[float] | None = None,
+    ) -> dict[str, Any]:
+        """Liefert die Frames eines Zeitfensters.
+
+        Args:
+            start (float): Beginn als Unix-Zeitstempel.
+            end (float): Ende als Unix-Zeitstempel.
+            fields (list[str] | None): Spalten, standardmäßig alle.
+            every (float | None): Intervall in Sekunden; je Intervall wird der
+                Mittelwert geliefert.
+            statistics (list[str] | None): Kennzahlen aus STATISTICS.
+            percentiles (list[float] | None): Perzentile (0–100).
+
+        Returns:
+            dict: Zeitstempel und Spalten; mit statistics/percentiles nur die
+            Kennzahlen je Spalte.
+
+        Raises:
+            ValueError: Bei unbekannten Spalten oder zu vielen Punkten.
+        """
+        names = fields or self.fields
+        unknown = [name for name in names if name not in self._columns]
+        if unknown:
+            raise ValueError(f"Unbekannte Spalten: {unknown}")
+
+        first, last = self.window(start, end)
+        result: dict[str, Any] = {"count": last - first}
+
+        if statistics or percentiles:
+            result["statistics"] = {
+                name: self._statistics(
+                    self._slice(self._columns[name], first, last),
+                    statistics or [],
+                    percentiles or [],
+                )
+                for name in names
+            }
+            return result
+
+        timestamps = self._slice(self._timestamps, first, last)
+        columns = {name: self._slice(self._columns[name], first, last) for name in names}
+
+        if every:
+            timestamps, columns = self._downsample(timestamps, columns, every)
+        elif len(timestamps) > MAX_POINTS:
+            raise ValueError(
+                f"{len(timestamps)} Frames im Fenster, höchstens {MAX_POINTS} "
+                "ohne 'every'"
+            )
+
+        result["timestamps"] = timestamps
+        result["columns"] = {
+            name: [_json_value(value) for value in values]
+            for name, values in columns.items()
+        }
+        return result
+
+    @staticmethod
+    def _downsample(
+        timestamps: list[float], columns: dict[str, list[float]], every: float
+    ) -> tuple[list[float], dict[str, list[float]]]:
+        """Fasst die Frames in Intervalle der Länge every zusammen (Mittelwert)."""
+        if not timestamps:
+            return [], {name: [] for name in columns}
+
+        buckets = [math.floor(t / every) for t in timestamps]
+        if buckets[-1] - buckets[0] + 1 > MAX_POINTS:
+            raise ValueError(f"Mehr als {MAX_POINTS} Intervalle, 'every' vergrößern")
+
+        bounds = [0]
+        bounds.extend(i for i in range(1, len(buckets)) if buckets[i] != buckets[i - 1])
+        bounds.append(len(buckets))
+
+        out_timestamps = [buckets[b] * every for b in bounds[:-1]]
+        out_columns = {}
+        for name, values in columns.items():
+            means = []
+            for lo, hi in zip(bounds, bounds[1:]):
+                valid = [v for v in values[lo:hi] if not math.isnan(v)]
+                means.append(sum(valid) / len(valid) if valid else _NAN)
+            out_columns[name] = means
+        return out_timestamps, out_columns
+
+    @staticmethod
+    def _statistics(
+        values: list[float], statistics: list[str], percentiles: list[float]
+    ) -> dict[str, Optional[float]]:
+        """Berechnet Kennzahlen einer Spalte, NaN-Werte werden ignoriert."""
+        valid = [v for v in values if not math.isnan(v)]
+        result: dict[str, Optional[float]] = {}
+        for stat in statistics:
+            if stat == "count":
+                result[stat] = len(valid)
+            elif not valid:
+                result[stat] = None
+            elif stat == "min":
+                result[stat] = min(valid)
+            elif stat == "max":
+                result[stat] = max(valid)
+            elif stat == "mean":
+                result[stat] = sum(valid) / len(valid)
+
+        if percentiles:
+            ordered = sorted(valid)
+            for pct in percentiles:
+                result[f"p{pct:g}"] = _percentile(ordered, pct) if ordered else None
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Belegung und Speicherbedarf für die Diagnose."""
+        return {
+            "frames": self._size,
+            "capacity": self.capacity,
+            "columns": len(self._columns),
+            "bytes": self._timestamps.itemsize * self.capacity
+            + sum(c.itemsize * self.capacity for c in self._columns.values()),
+        }
+
+
+async def async_handle_query_recent(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Service-Handler für maxxi_charge_connect.query_recent."""
+    entry_id = call.data.get("config_entry_id")
+    buffers = {
+        key: data[FRAME_BUFFER]
+        for key, data in hass.data.get(DOMAIN, {}).items()
+        if isinstance(data, dict) and data.get(FRAME_BUFFER) is not None
+    }
+
+    if entry_id is None:
+        if len(buffers) != 1:
+            raise ServiceValidationError(
+                "config_entry_id angeben, es gibt mehrere oder keine Geräte"
+            )
+        entry_id = next(iter(buffers))
+    if entry_id not in buffers:
+        raise ServiceValidationError(f"Kein Puffer für Eintrag {entry_id}")
+
+    end = dt_util.utcnow().timestamp()
+    start = end - call.data.get("minutes", 60) * 60
+
+    try:
+        result = buffers[entry_id].query(
+            start,
+            end,
+            fields=call.data.get("fields"),
+            every=call.data.get("every"),
+            statistics=call.data.get("statistics"),
+            percentiles=call.data.get("percentiles"),
+        )
+    except ValueError as err:
+        raise ServiceValidationError(str(err)) from err
+
+    return {
+        "config_entry_id": entry_id,
+        "start": dt_util.utc_from_timestamp(start).isoformat(),
+        "end": dt_util.utc_from_timestamp(end).isoformat(),
+        **result,
+    }
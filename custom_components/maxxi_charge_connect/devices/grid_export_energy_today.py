@@ -1,7 +1,7 @@
 """Grid Export Energy Sensor für Home Assistant.
 
 Dieses Modul enthält die Klasse `GridExportEnergyToday`, einen spezialisierten
-IntegrationSensor, der die heute exportierte Energie ins Stromnetz misst.
+Energie-Sensor, der die heute exportierte Energie ins Stromnetz misst.
 
 Die Energie wird täglich um Mitternacht (lokale Zeit) zurückgesetzt.
 """
@@ -12,9 +12,11 @@ from .today_integral_sensor import TodayIntegralSensor
 class GridExportEnergyToday(TodayIntegralSensor):
     """Sensor für die täglich exportierte Energie ins Stromnetz.
 
-    Nutzt die IntegrationSensor-Basisfunktionalität von Home Assistant,
+    Nutzt den EnergyIntegrator dieser Integration,
     um kontinuierlich Energie über Zeit zu integrieren (Wh), die von einem
     Quellsensor stammt (z. B. Leistungssensor).
 
     Die Energie wird täglich um Mitternacht zurückgesetzt.
     """
+
+    _power_channel = "grid_export"
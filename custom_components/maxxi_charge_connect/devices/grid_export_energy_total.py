@@ -1,4 +1,4 @@
-"""IntegrationSensor zur Erfassung der insgesamt exportierten Energie ins Netz.
+"""Energie-Sensor zur Erfassung der insgesamt exportierten Energie ins Netz.
 
 Diese Entität berechnet auf Basis eines Quell-Sensors (z. B. Momentanleistung)
 die exportierte Energie ins Stromnetz über die Zeit. Sie verwendet dafür die
@@ -13,4 +13,5 @@ from .total_integral_sensor import TotalIntegralSensor
 class GridExportEnergyTotal(TotalIntegralSensor):
     """Sensor zur Berechnung der gesamten Netzeinspeisung (kWh)."""
 
+    _power_channel = "grid_export"
     _attr_entity_registry_enabled_default = True
@@ -11,8 +11,10 @@ from .today_integral_sensor import TodayIntegralSensor
 class GridImportEnergyToday(TodayIntegralSensor):
     """Sensor-Entität zur Erfassung der importierten Energie (heute).
 
-    Verwendet die IntegrationSensor-Funktionalität von Home Assistant,
+    Verwendet den EnergyIntegrator dieser Integration,
     um kontinuierlich Energie (kWh) basierend auf einem Quell-Leistungssensor
     über den Tag hinweg zu integrieren. Die Energie wird täglich um 0:00 Uhr
     lokale Zeit zurückgesetzt.
     """
+
+    _power_channel = "grid_import"
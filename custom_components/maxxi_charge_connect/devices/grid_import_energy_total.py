@@ -12,9 +12,10 @@ from .total_integral_sensor import TotalIntegralSensor
 class GridImportEnergyTotal(TotalIntegralSensor):
     """Sensor-Entität zur Messung der insgesamt importierten Energie.
 
-    Verwendet die IntegrationSensor-Funktionalität von Home Assistant, um
+    Verwendet den EnergyIntegrator dieser Integration, um
     kontinuierlich Energie (kWh) auf Basis eines Quell-Leistungssensors zu
     integrieren. Die gemessene Energie steigt monoton an (TOTAL_INCREASING).
     """
 
+    _power_channel = "grid_import"
     _attr_entity_registry_enabled_default = True
@@ -12,7 +12,6 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import Event
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from ..const import (
@@ -20,11 +19,10 @@ from ..const import (
     CONF_ENABLE_CLOUD_DATA,
     DEVICE_INFO,
     DOMAIN,
-    PROXY_ERROR_DEVICE_ID,
-    PROXY_STATUS_EVENTNAME,
     WEBHOOK_SIGNAL_STATE,
     WEBHOOK_SIGNAL_UPDATE,
 )  # noqa: TID252
+from ..tools import proxy_frame_signal  # noqa: TID252
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,8 +68,11 @@ class OnlineStatusSensor(BinarySensorEntity):
 
         if self._enable_cloud_data:
             _LOGGER.info("Daten kommen vom Proxy")
-            self.hass.bus.async_listen(
-                PROXY_STATUS_EVENTNAME, self.async_update_from_event
+            # Nur die Daten dieses Geräts (kein Filtern aller Proxy-Events)
+            self._unsub_update = async_dispatcher_connect(
+                self.hass,
+                proxy_frame_signal(self._entry.data.get(CONF_DEVICE_ID)),
+                self._wrapper_update,
             )
         else:
             # Dispatcher abonnieren
@@ -98,10 +99,12 @@ class OnlineStatusSensor(BinarySensorEntity):
 
     async def async_will_remove_from_hass(self):
         """Abmelden beim Dispatcher."""
-        if hasattr(self, "_unsub_update"):
+        if getattr(self, "_unsub_update", None):
             self._unsub_update()
-        if hasattr(self, "_unsub_stale"):
+            self._unsub_update = None
+        if getattr(self, "_unsub_stale", None):
             self._unsub_stale()
+            self._unsub_stale = None
 
     async def _wrapper_update(self, data: dict):
         """Ablauf bei einem eingehenden Update-Event."""
@@ -160,14 +163,6 @@ class OnlineStatusSensor(BinarySensorEntity):
         except ValueError as e:
             _LOGGER.warning("Uptime-Wert ungültig: %s", e)
 
-    async def async_update_from_event(self, event: Event):
-        """Aktualisiert Sensor von Proxy-Event."""
-
-        json_data = event.data.get("payload", {})
-
-        if json_data.get(PROXY_ERROR_DEVICE_ID) == self._entry.data.get(CONF_DEVICE_ID):
-            await self.handle_update(json_data)
-
     @property
     def device_info(self):
         """Liefert die Geräteinformationen für diese Sensor-Entity.
@@ -9,4 +9,6 @@ from .today_integral_sensor import TodayIntegralSensor
 
 class PvSelfConsumptionEnergyToday(TodayIntegralSensor):
     """Sensor zur Integration der PV-Eigenverbrauchsleistung (kWh heute)."""
+
+    _power_channel = "pv_self_consumption"
     _attr_entity_registry_enabled_default = False
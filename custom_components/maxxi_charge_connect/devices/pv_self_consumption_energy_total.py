@@ -9,4 +9,5 @@ from .total_integral_sensor import TotalIntegralSensor
 class PvSelfConsumptionEnergyTotal(TotalIntegralSensor):
     """Sensor zur Integration der PV-Eigenverbrauchsleistung (kWh gesamt)."""
 
+    _power_channel = "pv_self_consumption"
     _attr_entity_registry_enabled_default = False
@@ -9,3 +9,5 @@ from .today_integral_sensor import TodayIntegralSensor
 
 class PvTodayEnergy(TodayIntegralSensor):
     """Sensor zur Integration der PV-Produktionsleistung (kWh heute)."""
+
+    _power_channel = "pv_power"
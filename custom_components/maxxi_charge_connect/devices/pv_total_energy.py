@@ -8,3 +8,5 @@ from .total_integral_sensor import TotalIntegralSensor
 
 class PvTotalEnergy(TotalIntegralSensor):
     """Sensor zur Integration der PV-Produktionsleistung (kWh gesamt)."""
+
+    _power_channel = "pv_power"
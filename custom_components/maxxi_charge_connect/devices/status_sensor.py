@@ -14,10 +14,10 @@ from ..const import (
     ERROR,
     ERRORS,
     HTTP_SCAN_EVENTNAME,
-    PROXY_STATUS_EVENTNAME,
     DOMAIN,
     WEBHOOK_SIGNAL_STATE,
 )  # noqa: TID252
+from ..tools import proxy_error_signal, proxy_frame_signal  # noqa: TID252
 
 from .base_webhook_sensor import BaseWebhookSensor
 
@@ -36,6 +36,8 @@ class StatusSensor(BaseWebhookSensor):
         self._attr_unique_id = f"{entry.entry_id}_status_sensor"
 
         self._unsub_dispatcher = None
+        self._unsub_http_scan = None
+        self._unsub_error = None
         self._state = str(None)
         self._attr_native_value = None
         self._attr_device_class = None
@@ -50,15 +52,19 @@ class StatusSensor(BaseWebhookSensor):
         await super().async_added_to_hass()
 
         # StatusSensor hört IMMER auf HTTP-Scan-Events
-        self.hass.bus.async_listen(
+        self._unsub_http_scan = self.hass.bus.async_listen(
             HTTP_SCAN_EVENTNAME, self.async_update_from_event
         )
 
-        # Zusätzlich je nach Konfiguration auf Webhook/Cloud-Events hören
+        # Zusätzlich je nach Konfiguration auf Webhook/Cloud-Daten hören
         if self._enable_cloud_data:
-            # Cloud-Modus: Auf PROXY_STATUS_EVENTNAME hören
-            self.hass.bus.async_listen(
-                PROXY_STATUS_EVENTNAME, self.async_update_from_event
+            # Cloud-Modus: Daten und Fehlermeldungen dieses Geräts vom Proxy
+            device_id = self._entry.data.get(CONF_DEVICE_ID)
+            self._unsub_update = async_dispatcher_connect(
+                self.hass, proxy_frame_signal(device_id), self._async_update_from_proxy
+            )
+            self._unsub_error = async_dispatcher_connect(
+                self.hass, proxy_error_signal(device_id), self._async_update_from_proxy
             )
         else:
             # Webhook-Modus: Auf WEBHOOK_SIGNAL_UPDATE hören (Dispatcher)
@@ -97,18 +103,25 @@ class StatusSensor(BaseWebhookSensor):
 
         return self._attr_extra_state_attributes
 
+    async def async_will_remove_from_hass(self):
+        """Abmelden bei Dispatcher und Event-Bus."""
+        await super().async_will_remove_from_hass()
+        for unsub in (self._unsub_http_scan, self._unsub_error):
+            if unsub:
+                unsub()
+        self._unsub_http_scan = None
+        self._unsub_error = None
+
+    async def _async_update_from_proxy(self, data: dict):
+        """Verarbeitet Daten oder Fehlermeldungen des Proxys für dieses Gerät."""
+        await self.handle_update(data)
+        self.async_write_ha_state()
+
     async def async_update_from_event(self, event):
-        """Empfängt sowohl Webhook- als auch HTTP-Scan-Events."""
+        """Empfängt HTTP-Scan-Events dieses Geräts."""
         json_data = event.data.get("payload", {})
 
-        # Bei HTTP-Scan Events deviceId prüfen, bei Webhook Events PROXY_ERROR_DEVICE_ID
-        device_id_match = False
-        if event.event_type == HTTP_SCAN_EVENTNAME:
-            device_id_match = json_data.get("deviceId") == self._entry.data.get(CONF_DEVICE_ID)
-        else:
-            device_id_match = json_data.get(PROXY_ERROR_DEVICE_ID) == self._entry.data.get(CONF_DEVICE_ID)
-
-        if device_id_match:
+        if json_data.get("deviceId") == self._entry.data.get(CONF_DEVICE_ID):
             await self.handle_update(json_data)
 
     async def handle_update(self, data):
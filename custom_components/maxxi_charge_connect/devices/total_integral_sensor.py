@@ -1,50 +1,44 @@
 """Oberklassen-Sensor für die Gesamtenergiezählung.
 
-Dieses Modul definiert eine benutzerdefinierte IntegrationSensor-Entität für Home Assistant,
+Dieses Modul definiert eine Sensor-Entität für Home Assistant,
 die die gesamte Energie über die Zeit aufsummiert.
 
-Die Energiemenge wird mittels der Trapezregel integriert und in Kilowattstunden dargestellt.
+Die Energiemenge wird vom EnergyAccumulator des ConfigEntries direkt aus den
+Webhook-Frames integriert (Trapezregel) und in Kilowattstunden dargestellt.
 
 Classes:
     TotalIntegralSensor: Oberklassen-Sensorentität zur Anzeige der aufsummierten Energie
 """
 
-from datetime import UTC, datetime, timedelta
+from __future__ import annotations
+
 from decimal import Decimal
 import logging
 
-from homeassistant.components.integration.sensor import (
-    UNIT_PREFIXES,
-    UNIT_TIME,
-    IntegrationSensor,
-    UnitOfTime,
-    _IntegrationMethod,
-    _IntegrationTrigger,
-)
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
-from homeassistant.const import UnitOfEnergy
-from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfEnergy
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from ..const import DEVICE_INFO, DOMAIN  # noqa: TID252
 from ..tools import clean_title
+from .energy_accumulator import EnergyAccumulator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-# pylint: disable=too-many-instance-attributes
-class TotalIntegralSensor(IntegrationSensor):
+class TotalIntegralSensor(RestoreEntity, SensorEntity):
     """Sensorentität zur Anzeige der gesamten Energie (kWh).
 
-    Diese Entität summiert Energie über die Zeit auf, um
-    die Insgesamtenergie zu berechnen. Sie nutzt dafür die Trapezregel
-    zur Integration und stellt den Wert in Kilowattstunden dar.
+    Die Entität ist eine Ansicht auf einen Zähler des EnergyAccumulators.
+    Sie hat keinen eigenen Listener auf die Webhook-Daten, sondern wird vom
+    Accumulator nach jedem Frame benachrichtigt.
 
     Attributes:
-        _attr_entity_registry_enabled_default (bool): Gibt an, ob die Entität standardmäßig
-           aktiviert ist.
+        _power_channel (str): Leistungskanal aus energy_integrator.POWER_CHANNELS,
+            der angezeigt wird. Wird von den Kindklassen gesetzt.
+        _daily (bool): True für den Tageszähler des Kanals.
         _entry (ConfigEntry): Die Konfigurationsdaten dieser Entität.
-        _attr_icon (str): Das Symbol, das in der Benutzeroberfläche angezeigt wird.
         _attr_device_class (str): Gibt den Typ des Sensors an (hier: ENERGY).
         _attr_state_class (str): Gibt die Art des Sensorzustands an (TOTAL_INCREASING).
         _attr_native_unit_of_measurement (str): Die verwendete Energieeinheit (kWh).
@@ -52,61 +46,72 @@ class TotalIntegralSensor(IntegrationSensor):
     """
 
     _attr_has_entity_name = True
-
-    # pylint: disable=super-init-not-called
-    def __init__(self, hass: HomeAssistant, entry, source_entity_id: str) -> None:
+    _attr_entity_registry_enabled_default = True
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _round_digits = 3
+    _attr_suggested_display_precision = _round_digits
+    _power_channel: str = ""
+    _daily = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry,
+        source_entity_id: str,
+        accumulator: EnergyAccumulator,
+    ) -> None:
         """Initialisiert die Sensorentität für die gesamte Energie.
 
         Args:
             hass (HomeAssistant): Die Home Assistant-Instanz.
             entry (ConfigEntry): Der Konfigurationseintrag mit den Einstellungen dieser Entität.
-            source_entity_id (str): Die Quell-Entity-ID, die den Wert in Watt liefert.
+            source_entity_id (str): Der Leistungssensor (W), dessen Kanal angezeigt wird.
+            accumulator (EnergyAccumulator): Der gemeinsame Zähler des Eintrags.
 
         """
         self.hass = hass
+        self._entry = entry
         self._attr_translation_key = self.__class__.__name__
         self._attr_unique_id = (
             f"{entry.entry_id}_{clean_title(self.__class__.__name__)}"
         )
         self._source_entity = source_entity_id
-        self._sensor_source_id = source_entity_id
-        self._round_digits = 3
-        self._state = None
-        self._integration_method = self._method = _IntegrationMethod.from_name(
-            "trapezoidal"
-        )
-
-        # self._attr_name = name if name is not None else f"{source_entity} integral"
-        self._unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self.unit_prefix = "k"
-        self._unit_prefix_string = "" if self.unit_prefix is None else self.unit_prefix
-        self._unit_prefix = UNIT_PREFIXES[self.unit_prefix]
-        self.unit_time = UnitOfTime.HOURS
-        self._unit_time = UNIT_TIME[self.unit_time]
-        self._unit_time_str = self.unit_time
-        self._last_valid_state = None
-        # self._attr_device_info = device_info
-        self._max_sub_interval = timedelta(seconds=120)
-        self._last_integration_time = datetime.now(tz=UTC)
-        self._last_integration_trigger = _IntegrationTrigger.StateEvent
-        self._attr_suggested_display_precision = self._round_digits or 2
-        # Zuweisung
-        self._max_sub_interval_exceeded_callback = (
-            self._handle_max_sub_interval_exceeded
+        self._accumulator = accumulator
+        self._counter = EnergyAccumulator.counter_index(
+            self._power_channel, self._daily
         )
 
-        # Setzte neue Attribute
-        self._entry = entry
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_native_value = None
         self.my_icon = "mdi:counter"
         self._attr_icon = self.my_icon
 
-        # Setze initialen Reset-Zeitpunkt auf heutige Mitternacht lokal
-        self._unsub_time_reset = None
-        local_midnight = dt_util.start_of_local_day()
-        self._last_reset = dt_util.as_utc(local_midnight)
+    @property
+    def _state(self) -> float:
+        """Aktuelle Energie des Zählers in kWh."""
+        return self._accumulator.value(self._counter)
+
+    @_state.setter
+    def _state(self, value) -> None:
+        self._accumulator.set_value(self._counter, float(value))
+        self._attr_native_value = round(self._state, self._round_digits)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Quelle des Zählers und nachgebuchte Energie aus Lücken.
+
+        `backfill_kwh` ist die Summe aller Nachbuchungen dieses Zählers,
+        `last_backfill` die letzte Korrektur, die den Kanal betroffen hat.
+        """
+        attributes = {"source": self._source_entity}
+        backfilled = self._accumulator.backfilled(self._counter)
+        if backfilled:
+            attributes["backfill_kwh"] = round(backfilled, self._round_digits)
+            attributes["last_backfill"] = self._accumulator.last_correction(
+                self._power_channel
+            )
+        return attributes
 
     def set_state_from_migration(self, value: Decimal):
         """Einen valid Status setzen, nach der Migration.
@@ -121,27 +126,49 @@ class TotalIntegralSensor(IntegrationSensor):
 
         _LOGGER.info("Setze neuen State: %s", value)
         self._state = value
-        self._last_valid_state = value
         self.async_write_ha_state()
 
-    def _handle_max_sub_interval_exceeded(self):
-        _LOGGER.debug(
-            "[%s] Kein neuer Wert innerhalb von %s empfangen – Integration pausiert",
-            self.entity_id,
-            self._max_sub_interval,
-        )
-        # self._state = None
-        # self.async_write_ha_state()
-
     async def async_added_to_hass(self):
         """Wird aufgerufen, wenn die Entität zu Home Assistant hinzugefügt wird.
 
-        Registriert einen täglichen Reset der Energiewerte um 0:00 Uhr lokale Zeit.
+        Übernimmt den letzten Zustand in den Zähler und meldet die Entität
+        beim Accumulator an. Hat der Accumulator einen Checkpoint geladen, hat
+        dieser Vorrang vor dem gespeicherten Zustand der Entität.
         """
         await super().async_added_to_hass()
 
-        if self._unsub_time_reset is not None:
-            self.async_on_remove(self._unsub_time_reset)
+        old_state = await self.async_get_last_state()
+        if self._accumulator.restored:
+            self._attr_native_value = round(self._state, self._round_digits)
+        elif (
+            old_state is not None
+            and old_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+            and self._is_restorable(old_state)
+        ):
+            try:
+                self._state = float(old_state.state)
+            except (TypeError, ValueError) as err:
+                _LOGGER.warning(
+                    "Sensor %s: Konnte Zustand nicht wiederherstellen: %s",
+                    self.__class__.__name__,
+                    err,
+                )
+
+        self.async_on_remove(
+            self._accumulator.async_add_listener(self._handle_accumulator_update)
+        )
+
+    def _is_restorable(self, old_state: State) -> bool:  # pylint: disable=unused-argument
+        """Prüft, ob der letzte Zustand in den Zähler übernommen werden darf."""
+        return True
+
+    @callback
+    def _handle_accumulator_update(self) -> None:
+        """Schreibt den Zustand, wenn sich der gerundete Wert geändert hat."""
+        native_value = round(self._state, self._round_digits)
+        if native_value != self._attr_native_value:
+            self._attr_native_value = native_value
+            self.async_write_ha_state()
 
     @property
     def icon(self):
@@ -150,7 +177,7 @@ class TotalIntegralSensor(IntegrationSensor):
 
     @property
     def available(self) -> bool:
-        """Der Energiesensor bleibt verfügbar, auch wenn der Quellsensor 'unavailable' ist.
+        """Der Energiesensor bleibt verfügbar, auch wenn keine Daten mehr kommen.
 
         Er zeigt dann einfach den letzten gespeicherten Wert an.
         """
@@ -0,0 +1,79 @@
+"""Diagnosedaten für MaxxiChargeConnect.
+
+Neben der (geschwärzten) Konfiguration werden die Anzahl der Listener je
+Event und je Dispatcher-Signal des Eintrags ausgegeben. So lässt sich prüfen,
+ob nur die Empfänger des jeweiligen Geräts auf Proxy-Daten reagieren.
+Außerdem werden die Kosten der Auswertung der Batterie- und Converter-Daten
+pro Frame sowie die Belegung des Ringpuffers gemeldet.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import DATA_DISPATCHER
+
+from .const import (
+    CONF_DEVICE_ID,
+    DOMAIN,
+    FRAME_ARCHIVE,
+    FRAME_BUFFER,
+    HTTP_SCAN_EVENTNAME,
+    MIGRATION_PROGRESS_EVENTNAME,
+    PROXY_STATUS_EVENTNAME,
+    WEBHOOK_SIGNAL_STATE,
+    WEBHOOK_SIGNAL_UPDATE,
+)
+from .sensor import CONVERTER_MANAGER, SENSOR_MANAGER
+from .tools import proxy_error_signal, proxy_frame_signal
+
+TO_REDACT = {CONF_WEBHOOK_ID}
+
+EVENTS = (PROXY_STATUS_EVENTNAME, HTTP_SCAN_EVENTNAME, MIGRATION_PROGRESS_EVENTNAME)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Liefert die Diagnosedaten eines ConfigEntries."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    device_id = entry.data.get(CONF_DEVICE_ID)
+
+    signals = {
+        "update": entry_data.get(WEBHOOK_SIGNAL_UPDATE),
+        "stale": entry_data.get(WEBHOOK_SIGNAL_STATE),
+        "proxy_frame": proxy_frame_signal(device_id) if device_id else None,
+        "proxy_error": proxy_error_signal(device_id) if device_id else None,
+    }
+    dispatchers = hass.data.get(DATA_DISPATCHER, {})
+    event_listeners = hass.bus.async_listeners()
+    manager = SENSOR_MANAGER.get(entry.entry_id)
+    converter_manager = CONVERTER_MANAGER.get(entry.entry_id)
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "listeners": {
+            "events": {event: event_listeners.get(event, 0) for event in EVENTS},
+            "signals": {
+                name: len(dispatchers.get(signal, {})) if signal else 0
+                for name, signal in signals.items()
+            },
+        },
+        "battery_frames": manager.get_frame_stats() if manager else None,
+        "converter_frames": converter_manager.get_frame_stats()
+        if converter_manager
+        else None,
+        "frame_buffer": entry_data[FRAME_BUFFER].stats()
+        if entry_data.get(FRAME_BUFFER)
+        else None,
+        "frame_archive": entry_data[FRAME_ARCHIVE].stats()
+        if entry_data.get(FRAME_ARCHIVE)
+        else None,
+    }
@@ -9,7 +9,7 @@ Verwendet wird der DataUpdateCoordinator aus `hass.data[DOMAIN][entry.entry_id][
 Abhängigkeiten:
     - aiohttp
     - Home Assistant Core und Komponenten
-    - Lokale Hilfsmodule: const, tools
+    - Lokale Hilfsmodule: const
 
 """
 
@@ -24,6 +24,7 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_IP_ADDRESS, EntityCategory
 from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from ..const import (
     DEVICE_INFO,
@@ -31,8 +32,7 @@ from ..const import (
     WINTER_MODE_CHANGED_EVENT,
     EVENT_SUMMER_MIN_CHARGE_CHANGED,
 )  # pylint: disable=relative-beyond-top-level
-
-from ..tools import as_float  # pylint: disable=relative-beyond-top-level
+from ..tools import entry_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -103,14 +103,8 @@ class NumberConfigEntity(
         self._remove_summer_listener = None
         self._show_current_value_immediately = False
 
-        _LOGGER.debug("Wert: %s", as_float(self._coordinator.data.get(self._value_key)))
-
-        if self._coordinator.data:
-            self._attr_native_value = as_float(
-                self._coordinator.data.get(self._value_key)
-            )
-        else:
-            self._attr_native_value = None
+        self._attr_native_value = self._coordinator.get_float(self._value_key)
+        _LOGGER.debug("Wert: %s", self._attr_native_value)
 
     async def async_added_to_hass(self):
         """Registriert Callback bei Datenaktualisierung durch den Koordinator."""
@@ -121,13 +115,16 @@ class NumberConfigEntity(
         if (
             self._depends_on_winter_mode
         ):  # Nur registrieren, wenn abhängig vom Wintermodus
-            self._remove_listener = self.hass.bus.async_listen(
-                WINTER_MODE_CHANGED_EVENT,
+            # Nur die Signale des eigenen Eintrags, nicht die anderer Geräte
+            self._remove_listener = async_dispatcher_connect(
+                self.hass,
+                entry_signal(WINTER_MODE_CHANGED_EVENT, self._entry.entry_id),
                 self._handle_winter_mode_changed,
             )
 
-            self._remove_summer_listener = self.hass.bus.async_listen(
-                EVENT_SUMMER_MIN_CHARGE_CHANGED,
+            self._remove_summer_listener = async_dispatcher_connect(
+                self.hass,
+                entry_signal(EVENT_SUMMER_MIN_CHARGE_CHANGED, self._entry.entry_id),
                 self._handle_summer_charge_changed,
             )
 
@@ -252,35 +249,25 @@ class NumberConfigEntity(
 
     @property
     def native_value(self):
-        """Gibt den aktuellen Wert der Text-Entität zurück.
+        """Gibt den aktuellen Wert der Number-Entität zurück.
 
         Returns:
-            str | None: Der extrahierte Wert aus dem Koordinator oder None,
-                        falls keine Daten vorhanden sind.
+            float | None: Der geparste Wert aus dem Koordinator oder None,
+                          falls keine Daten vorhanden sind.
 
         """
-        _LOGGER.debug(
-            "Value: %s", as_float(self._coordinator.data.get(self._value_key))
-        )
-
         if self._show_current_value_immediately:
-            result = self._attr_native_value
             self._show_current_value_immediately = False
-        else:
-            result = (
-                as_float(self._coordinator.data.get(self._value_key))
-                if self._coordinator.data
-                else None
-            )
+            return self._attr_native_value
 
-        return result
+        # Der Koordinator parst die Werte einmal pro Aktualisierung
+        return self._coordinator.get_float(self._value_key)
 
     @callback
-    def _handle_summer_charge_changed(self, event):
-        """Handle summer min charge changed event."""
+    def _handle_summer_charge_changed(self, value):
+        """Handle summer min charge changed signal."""
 
         if self._depends_on_winter_mode:
-            value = event.data.get("value")
 
             _LOGGER.warning(
                 "SummerMinCharge received summer min charge changed event: %s", value
@@ -300,8 +287,8 @@ class NumberConfigEntity(
             self.async_write_ha_state()
 
     @callback
-    def _handle_winter_mode_changed(self, event):  # pylint: disable=unused-argument
-        """Handle winter mode changed event."""
+    def _handle_winter_mode_changed(self, enabled):  # pylint: disable=unused-argument
+        """Handle winter mode changed signal."""
         self.async_write_ha_state()
 
     @property
@@ -3,10 +3,15 @@
 Dieses Modul definiert die Klasse MaxxiDataUpdateCoordinator, die regelmäßig
 eine Web-Oberfläche per HTTP abruft, HTML parst und definierte Werte extrahiert,
 um sie als Sensordaten in Home Assistant bereitzustellen.
+
+Neben den Rohtexten legt der Koordinator pro Aktualisierung einmalig die
+geparsten Werte (Zahl und Einheit) als `ScanValue` ab, damit Entitäten beim
+Lesen ihres Zustands nicht erneut parsen müssen.
 """
 
 import logging
 from datetime import timedelta, datetime, timezone
+from typing import NamedTuple, Optional
 import aiohttp
 import async_timeout
 from bs4 import BeautifulSoup
@@ -16,13 +21,27 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 
 from ..const import REQUIRED, NEIN, CONF_DEVICE_ID, HTTP_SCAN_EVENTNAME
 
-from ..tools import fire_status_event
+from ..tools import fire_status_event, split_value
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=30)  # z.B. alle 30 Sekunden aktualisieren
 
 
+class ScanValue(NamedTuple):
+    """Geparster Wert eines HTML-Labels.
+
+    Attributes:
+        raw (str): Der extrahierte Text, z.B. "800 W".
+        value (float | None): Der Zahlenwert, z.B. 800.0, oder None.
+        unit (str | None): Die Einheit hinter der Zahl, z.B. "W", oder None.
+    """
+
+    raw: str
+    value: Optional[float]
+    unit: Optional[str]
+
+
 class MaxxiDataUpdateCoordinator(DataUpdateCoordinator):
     """Koordinator zur zyklischen Abfrage und Extraktion von HTML-Werten für MaxxiChargeConnect."""
 
@@ -47,6 +66,7 @@ class MaxxiDataUpdateCoordinator(DataUpdateCoordinator):
 
         self._sensor_list = sensor_list
         self.entry = entry
+        self.values: dict[str, ScanValue] = {}
         self._device_id = entry.data[CONF_DEVICE_ID].strip()
         self._resource = entry.data[CONF_IP_ADDRESS].strip()
 
@@ -82,7 +102,46 @@ class MaxxiDataUpdateCoordinator(DataUpdateCoordinator):
 
         return result_label
 
+    @staticmethod
+    def parse_values(data: dict) -> dict[str, ScanValue]:
+        """Zerlegt die Rohtexte einmalig in Zahl und Einheit.
+
+        Args:
+            data (dict): Rohdaten aus `_async_update_data`.
+
+        Returns:
+            dict: Schlüssel → ScanValue
+
+        """
+        return {
+            key: ScanValue(raw, *split_value(raw)) for key, raw in data.items()
+        }
+
+    def get_float(self, key: str) -> Optional[float]:
+        """Liefert den bereits geparsten Zahlenwert zu einem Schlüssel.
+
+        Args:
+            key (str): Schlüssel, z.B. "MaximumPower".
+
+        Returns:
+            float | None: Der Zahlenwert oder None, falls nicht vorhanden.
+
+        """
+        scan_value = self.values.get(key)
+        return scan_value.value if scan_value is not None else None
+
     async def _async_update_data(self):
+        """Aktualisiert die Rohdaten und die geparsten Werte.
+
+        Returns:
+            dict: Schlüssel-Wert-Paare der extrahierten Sensordaten (Rohtexte).
+
+        """
+        data = await self._async_scan()
+        self.values = self.parse_values(data)
+        return data
+
+    async def _async_scan(self):
         """Führt eine HTTP-Abfrage durch, parst HTML und extrahiert Sensordaten.
 
         Returns:
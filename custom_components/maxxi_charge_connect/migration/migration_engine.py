@@ -0,0 +1,805 @@
+"""Datenbank-Migration aller Sensor-Mappings in einem Lauf.
+
+Die MigrationEngine öffnet genau eine Verbindung zur Recorder-Datenbank,
+löst alle Metadaten-IDs gesammelt auf und führt die Änderungen für alle
+Mappings gemeinsam mit `executemany` aus. Sie ist blockierend und wird im
+Executor ausgeführt.
+
+Phasen:
+    states_meta: States der alten Entität auf die neue umhängen und den letzten
+        gültigen Zustand übernehmen.
+    logbook: entity_id in den state_changed-Events ersetzen. Alle Mappings
+        werden in einem Durchlauf mit einem gemeinsamen Muster ersetzt. Bei
+        aktuellem Schema werden nur die geteilten Event-Daten (event_data)
+        gelesen, die über den Index von events.event_type_id zu
+        state_changed gehören.
+    statistics_meta: Metadaten der neuen Statistiken anlegen.
+    statistics: Statistiken (lang- und kurzfristig) in Blöcken nach id umhängen.
+
+Die ersten drei Phasen laufen in einer Transaktion. Die Statistiken werden
+danach blockweise übertragen, jeder Block in einer eigenen Transaktion. Der
+Fortschritt wird in einer Cursor-Datei gespeichert, sodass eine abgebrochene
+Migration beim nächsten Lauf fortgesetzt wird. Erst nach dem letzten Block
+werden die alten Metadaten gelöscht.
+
+Mit plan() lässt sich vorab abschätzen, wie viele Zeilen betroffen sind und
+wie lange die Migration dauern wird, ohne Daten zu ändern.
+
+Classes:
+    MigrationEngine: Führt die Migration aus und liefert einen Bericht.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import sqlite3
+import time
+
+from homeassistant.util.file import write_utf8_file_atomic
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pragmas für die Dauer der Migration
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=30000",
+)
+
+# SQLite erlaubt standardmäßig höchstens 999 Parameter pro Statement
+_MAX_PARAMS = 900
+
+STATISTICS_TABLES = ("statistics", "statistics_short_term")
+
+# Zeilen pro fetchmany/executemany beim Umschreiben von JSON-Spalten
+_FETCH_SIZE = 5_000
+
+# Breite eines Blocks (id-Bereich) und Pause zwischen zwei Blöcken
+CHUNK_SIZE = 10_000
+CHUNK_PAUSE = 0.05  # Sekunden
+
+# Stichprobe für die Durchsatzmessung in plan()
+SAMPLE_ROWS = 2_000
+
+# Durchsatz (Zeilen/s), falls keine Stichprobe gemessen werden kann
+DEFAULT_UPDATE_RATE = 50_000.0
+DEFAULT_SCAN_RATE = 200_000.0
+
+
+class MigrationEngine:
+    """Migriert States, Logbuch und Statistiken mehrerer Sensoren gemeinsam.
+
+    Attributes:
+        db_path (str): Pfad zur Recorder-Datenbank (SQLite).
+        report (dict): Bericht des letzten Laufs, siehe run().
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        cursor_path: str | None = None,
+        progress: Callable[[dict], None] | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        chunk_pause: float = CHUNK_PAUSE,
+    ) -> None:
+        """Initialisiert die Engine.
+
+        Args:
+            db_path (str): Pfad zur Recorder-Datenbank.
+            cursor_path (str | None): Datei für den Fortschritt der Statistik-
+                Migration. Ohne Angabe ist die Migration nicht fortsetzbar.
+            progress (Callable | None): Wird nach jedem Block mit
+                {"table", "last_id", "max_id", "rows"} aufgerufen (im Executor-Thread).
+            chunk_size (int): Breite eines Blocks im id-Bereich.
+            chunk_pause (float): Pause zwischen zwei Blöcken in Sekunden.
+        """
+        self.db_path = db_path
+        self.cursor_path = cursor_path
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.chunk_pause = chunk_pause
+        self.report: dict = {}
+        self._statistic_pairs: list[tuple[int, int]] = []
+
+    def run(self, mappings: list[tuple[str, str]]) -> dict:
+        """Führt alle Phasen aus (blockierend).
+
+        Bei einem Fehler in den ersten Phasen wird die gesamte Transaktion
+        zurückgerollt. Ein Fehler während der Statistik-Blöcke lässt die
+        bereits übertragenen Blöcke bestehen; der nächste Lauf setzt fort.
+
+        Args:
+            mappings (list[tuple[str, str]]): Paare (alte entity_id, neue entity_id).
+
+        Returns:
+            dict: {"phases": [{"phase", "rows", "seconds"}], "states": {neue
+            entity_id: letzter gültiger Zustand}, "mappings": Anzahl}.
+        """
+        mappings = [(old, new) for old, new in mappings if old and new and old != new]
+        self.report = {
+            "phases": [],
+            "states": {},
+            "mappings": len(mappings),
+            "logbook": {"scanned": 0, "modified": 0},
+        }
+
+        if not mappings:
+            return self.report
+
+        if not os.path.exists(self.db_path):
+            _LOGGER.error("Recorder-DB nicht gefunden unter: %s", self.db_path)
+            return self.report
+
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self._phase("states_meta", self._migrate_states, cursor, mappings)
+                self._phase("logbook", self._migrate_logbook, cursor, mappings)
+                self._phase(
+                    "statistics_meta", self._migrate_statistics_meta, cursor, mappings
+                )
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                self.report["states"] = {}
+                raise
+
+            self._phase("statistics", self._migrate_statistics, cursor, mappings)
+        finally:
+            conn.close()
+
+        return self.report
+
+    def plan(self, mappings: list[tuple[str, str]]) -> dict:
+        """Schätzt Umfang und Laufzeit einer Migration ab (blockierend).
+
+        Die Recorder-DB wird nur lesend geöffnet; es werden nur indizierte
+        COUNT-Abfragen über metadata_id bzw. den Event-Typ ausgeführt. Der
+        Durchsatz wird an einer kleinen Stichprobe gemessen: Umhängen von
+        States in einer Kopie der Stichprobe im Arbeitsspeicher und Ersetzen in
+        state_changed-Events. Die laufende Recorder-DB wird weder verändert
+        noch gesperrt.
+
+        Args:
+            mappings (list[tuple[str, str]]): Paare (alte entity_id, neue entity_id).
+
+        Returns:
+            dict: {"mappings": [{"old_sensor", "new_sensor", "states",
+            "statistics", "statistics_short_term"}], "rows": {Tabelle: Anzahl},
+            "statistics_chunks": Anzahl Blöcke, "throughput": {"update_rows_per_s",
+            "scan_rows_per_s"}, "estimated_seconds": geschätzte Laufzeit}.
+        """
+        mappings = [(old, new) for old, new in mappings if old and new and old != new]
+        plan: dict = {
+            "mappings": [],
+            "rows": {"states": 0, "events": 0, **dict.fromkeys(STATISTICS_TABLES, 0)},
+            "statistics_chunks": 0,
+            "throughput": {
+                "update_rows_per_s": DEFAULT_UPDATE_RATE,
+                "scan_rows_per_s": DEFAULT_SCAN_RATE,
+            },
+            "estimated_seconds": 0.0,
+        }
+
+        if not mappings:
+            return plan
+
+        if not os.path.exists(self.db_path):
+            _LOGGER.error("Recorder-DB nicht gefunden unter: %s", self.db_path)
+            return plan
+
+        conn = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            isolation_level=None,
+        )
+        try:
+            conn.execute("PRAGMA busy_timeout=30000")
+            cursor = conn.cursor()
+            state_ids = self._count_mapping_rows(cursor, mappings, plan)
+            plan["rows"]["events"], events_sql, events_params = _count_events(cursor)
+
+            throughput = plan["throughput"]
+            update_rate = _measure_update_rate(cursor, state_ids)
+            if update_rate:
+                throughput["update_rows_per_s"] = round(update_rate)
+            if events_sql:
+                scan_rate = _measure_scan_rate(
+                    cursor, events_sql, events_params, EntityIdRewriter(mappings)
+                )
+                if scan_rate:
+                    throughput["scan_rows_per_s"] = round(scan_rate)
+        finally:
+            conn.close()
+
+        rows = plan["rows"]
+        plan["estimated_seconds"] = round(
+            (rows["states"] + sum(rows[table] for table in STATISTICS_TABLES))
+            / throughput["update_rows_per_s"]
+            + rows["events"] / throughput["scan_rows_per_s"]
+            + plan["statistics_chunks"] * self.chunk_pause,
+            1,
+        )
+        _LOGGER.info(
+            "Migrationsplan: %s Zeilen, geschätzt %.1f s",
+            rows,
+            plan["estimated_seconds"],
+        )
+        return plan
+
+    def _count_mapping_rows(
+        self, cursor: sqlite3.Cursor, mappings: list[tuple[str, str]], plan: dict
+    ) -> list[int]:
+        """Zählt States und Statistiken je Mapping und die Statistik-Blöcke.
+
+        Trägt die Zahlen in den Plan ein.
+
+        Returns:
+            list[int]: metadata_ids der alten States (für die Durchsatzmessung).
+        """
+        olds = [old for old, _ in mappings]
+        state_ids = _select_ids(
+            cursor,
+            "SELECT entity_id, metadata_id FROM states_meta WHERE entity_id IN ({})",
+            olds,
+        )
+        statistic_ids = _select_ids(
+            cursor,
+            "SELECT statistic_id, id FROM statistics_meta WHERE statistic_id IN ({})",
+            olds,
+        )
+
+        for old, new in mappings:
+            entry = {"old_sensor": old, "new_sensor": new, "states": 0}
+            if old in state_ids:
+                entry["states"] = _count(
+                    cursor, "states", "metadata_id = ?", state_ids[old]
+                )
+            for table in STATISTICS_TABLES:
+                entry[table] = 0
+                if old in statistic_ids:
+                    entry[table] = _count(
+                        cursor, table, "metadata_id = ?", statistic_ids[old]
+                    )
+            plan["mappings"].append(entry)
+            for table in ("states", *STATISTICS_TABLES):
+                plan["rows"][table] += entry[table]
+
+        if statistic_ids:
+            old_ids = list(statistic_ids.values())
+            for table in STATISTICS_TABLES:
+                bounds = _id_range(cursor, table, old_ids)
+                if bounds is not None:
+                    plan["statistics_chunks"] += -(
+                        -(bounds[1] - bounds[0] + 1) // self.chunk_size
+                    )
+
+        return list(state_ids.values())
+
+    def _phase(self, name: str, func, cursor: sqlite3.Cursor, mappings) -> None:
+        """Führt eine Phase aus und misst Zeilen und Laufzeit."""
+        start = time.perf_counter()
+        rows = func(cursor, mappings)
+        seconds = time.perf_counter() - start
+        self.report["phases"].append(
+            {"phase": name, "rows": rows, "seconds": round(seconds, 3)}
+        )
+        _LOGGER.info("Migration %s: %d Zeilen in %.3f s", name, rows, seconds)
+
+    #
+    # ---- Phasen ----
+    #
+
+    def _migrate_states(self, cursor: sqlite3.Cursor, mappings) -> int:
+        """Hängt die States um und übernimmt den letzten gültigen Zustand."""
+        ids = _select_ids(
+            cursor,
+            "SELECT entity_id, metadata_id FROM states_meta WHERE entity_id IN ({})",
+            {entity for mapping in mappings for entity in mapping},
+        )
+
+        pairs = [(old, new) for old, new in mappings if old in ids]
+        for old, _ in mappings:
+            if old not in ids:
+                _LOGGER.warning("Keine states_meta für %s gefunden.", old)
+
+        missing = sorted({new for _, new in pairs if new not in ids})
+        if missing:
+            cursor.executemany(
+                "INSERT INTO states_meta (entity_id) VALUES (?)",
+                [(new,) for new in missing],
+            )
+            ids.update(
+                _select_ids(
+                    cursor,
+                    "SELECT entity_id, metadata_id FROM states_meta WHERE entity_id IN ({})",
+                    missing,
+                )
+            )
+
+        cursor.executemany(
+            "UPDATE states SET metadata_id = ? WHERE metadata_id = ?",
+            [(ids[new], ids[old]) for old, new in pairs],
+        )
+        rows = cursor.rowcount
+
+        # Letzten gültigen Zustand auf den neuesten State übertragen
+        updates = []
+        for _, new in pairs:
+            metadata_id = ids[new]
+            valid = cursor.execute(
+                "SELECT state FROM states WHERE metadata_id = ? "
+                "AND state NOT IN ('unavailable', 'unknown') "
+                "ORDER BY last_updated_ts DESC LIMIT 1",
+                (metadata_id,),
+            ).fetchone()
+            latest = cursor.execute(
+                "SELECT state_id FROM states WHERE metadata_id = ? "
+                "ORDER BY last_updated_ts DESC LIMIT 1",
+                (metadata_id,),
+            ).fetchone()
+            if not valid or not latest:
+                _LOGGER.warning("Keine gültigen states für %s gefunden.", new)
+                continue
+            self.report["states"][new] = valid[0]
+            updates.append((valid[0], latest[0]))
+
+        if updates:
+            cursor.executemany(
+                "UPDATE states SET state = ? WHERE state_id = ?", updates
+            )
+            rows += cursor.rowcount
+
+        return rows
+
+    def _migrate_logbook(self, cursor: sqlite3.Cursor, mappings) -> int:
+        """Ersetzt die entity_id in den state_changed-Events (ein Durchlauf).
+
+        Unterstützt das alte Schema (JSON direkt in events.event_data) und das
+        aktuelle Schema (geteilte JSON-Daten in event_data.shared_data). Die
+        Anzahl gelesener und geänderter Zeilen steht in report["logbook"].
+        """
+        rewriter = EntityIdRewriter(mappings)
+        stats = self.report["logbook"]
+        tables = _tables(cursor)
+        if "events" not in tables:
+            raise sqlite3.OperationalError("no such table: events")
+        event_columns = _columns(cursor, "events")
+
+        if {"event_type", "event_data"} <= event_columns:
+            scanned, modified = _rewrite_rows(
+                cursor,
+                (
+                    "SELECT event_id, event_data FROM events "
+                    "WHERE event_type = 'state_changed' AND event_data IS NOT NULL",
+                    (),
+                ),
+                "UPDATE events SET event_data = ? WHERE event_id = ?",
+                rewriter,
+            )
+            stats["scanned"] += scanned
+            stats["modified"] += modified
+
+        if {"event_data", "event_types"} <= tables and "data_id" in event_columns:
+            type_row = cursor.execute(
+                "SELECT event_type_id FROM event_types WHERE event_type = 'state_changed'"
+            ).fetchone()
+            if type_row:
+                scanned, modified = _rewrite_rows(
+                    cursor,
+                    (
+                        "SELECT data_id, shared_data FROM event_data WHERE data_id IN "
+                        "(SELECT DISTINCT data_id FROM events WHERE event_type_id = ?)",
+                        (type_row[0],),
+                    ),
+                    "UPDATE event_data SET shared_data = ?, hash = ? WHERE data_id = ?",
+                    rewriter,
+                    with_hash=True,
+                )
+                stats["scanned"] += scanned
+                stats["modified"] += modified
+
+        _LOGGER.info(
+            "Logbuch: %d Zeilen gelesen, %d geändert", stats["scanned"], stats["modified"]
+        )
+        return stats["modified"]
+
+    def _migrate_statistics_meta(self, cursor: sqlite3.Cursor, mappings) -> int:
+        """Legt fehlende Metadaten an und merkt sich die Paare (alt, neu)."""
+        query = "SELECT statistic_id, id FROM statistics_meta WHERE statistic_id IN ({})"
+        ids = _select_ids(
+            cursor, query, {entity for mapping in mappings for entity in mapping}
+        )
+
+        pairs = [(old, new) for old, new in mappings if old in ids]
+        for old, _ in mappings:
+            if old not in ids:
+                _LOGGER.warning("Keine Statistikdaten für alten Sensor %s", old)
+
+        missing = {new: old for old, new in pairs if new not in ids}
+        if missing:
+            columns = [
+                row[1] for row in cursor.execute("PRAGMA table_info(statistics_meta)")
+            ]
+            columns.remove("id")
+            copy_columns = ", ".join(
+                "?" if column == "statistic_id" else column for column in columns
+            )
+            cursor.executemany(
+                f"INSERT INTO statistics_meta ({', '.join(columns)}) "  # noqa: S608
+                f"SELECT {copy_columns} FROM statistics_meta WHERE id = ?",
+                [(new, ids[old]) for new, old in missing.items()],
+            )
+            ids.update(_select_ids(cursor, query, missing))
+
+        self._statistic_pairs = [(ids[old], ids[new]) for old, new in pairs]
+        return len(missing)
+
+    def _migrate_statistics(self, cursor: sqlite3.Cursor, _mappings) -> int:
+        """Überträgt die Statistiken blockweise und löscht die alten Metadaten.
+
+        Es wird nur der id-Bereich durchlaufen, in dem Zeilen der alten
+        Metadaten liegen. Jeder Block umfasst einen id-Bereich der Breite
+        chunk_size und wird einzeln committet. Danach wird der Cursor
+        gespeichert und kurz pausiert, damit Home Assistant reaktionsfähig bleibt.
+        """
+        pairs = self._statistic_pairs
+        if not pairs:
+            return 0
+
+        table, last_id = self._load_cursor(pairs)
+        old_ids = [old_id for old_id, _ in pairs]
+        rows = 0
+
+        for current in STATISTICS_TABLES:
+            if STATISTICS_TABLES.index(current) < STATISTICS_TABLES.index(table):
+                continue
+            if current != table:
+                last_id = 0
+
+            bounds = _id_range(cursor, current, old_ids)
+            if bounds is None:
+                continue
+            min_id, max_id = bounds
+            last_id = max(last_id, min_id - 1)
+            while last_id < max_id:
+                end = last_id + self.chunk_size
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    f"UPDATE {current} SET metadata_id = ? "  # noqa: S608
+                    "WHERE metadata_id = ? AND id > ? AND id <= ?",
+                    [(new_id, old_id, last_id, end) for old_id, new_id in pairs],
+                )
+                chunk_rows = cursor.rowcount
+                cursor.execute("COMMIT")
+
+                rows += chunk_rows
+                last_id = min(end, max_id)
+                self._save_cursor(pairs, current, last_id)
+                if self.progress is not None:
+                    self.progress(
+                        {
+                            "table": current,
+                            "last_id": last_id,
+                            "max_id": max_id,
+                            "rows": chunk_rows,
+                        }
+                    )
+                if self.chunk_pause:
+                    time.sleep(self.chunk_pause)
+
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(
+            "DELETE FROM statistics_meta WHERE id = ?", [(old_id,) for old_id, _ in pairs]
+        )
+        cursor.execute("COMMIT")
+        self._remove_cursor()
+        return rows
+
+    #
+    # ---- Cursor ----
+    #
+
+    def _load_cursor(self, pairs: list[tuple[int, int]]) -> tuple[str, int]:
+        """Liefert Tabelle und letzte id eines passenden, gespeicherten Cursors."""
+        start = (STATISTICS_TABLES[0], 0)
+        if self.cursor_path is None or not os.path.exists(self.cursor_path):
+            return start
+
+        try:
+            with open(self.cursor_path, encoding="utf-8") as file:
+                stored = json.load(file)
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Migrations-Cursor nicht lesbar: %s", err)
+            return start
+
+        if (
+            stored.get("pairs") != [list(pair) for pair in pairs]
+            or stored.get("table") not in STATISTICS_TABLES
+        ):
+            return start
+
+        _LOGGER.info(
+            "Setze Statistik-Migration fort: %s ab id %s",
+            stored["table"],
+            stored.get("last_id", 0),
+        )
+        return stored["table"], int(stored.get("last_id", 0))
+
+    def _save_cursor(self, pairs: list[tuple[int, int]], table: str, last_id: int) -> None:
+        """Speichert den Fortschritt atomar."""
+        if self.cursor_path is None:
+            return
+        write_utf8_file_atomic(
+            self.cursor_path,
+            json.dumps(
+                {"pairs": [list(pair) for pair in pairs], "table": table, "last_id": last_id}
+            ),
+        )
+
+    def _remove_cursor(self) -> None:
+        """Entfernt den Cursor nach einer vollständigen Migration."""
+        if self.cursor_path is not None and os.path.exists(self.cursor_path):
+            os.remove(self.cursor_path)
+
+
+class EntityIdRewriter:
+    """Ersetzt mehrere entity_ids in JSON-Texten mit einem gemeinsamen Muster.
+
+    Ersetzt werden nur vollständige JSON-Strings ("sensor.alt"), damit z.B.
+    "sensor.alt_2" unverändert bleibt.
+    """
+
+    def __init__(self, mappings: list[tuple[str, str]]) -> None:
+        """Initialisiert das Muster aus den Paaren (alt, neu)."""
+        self._replacements = {f'"{old}"': f'"{new}"' for old, new in mappings}
+        # Längere IDs zuerst, falls eine ID Präfix einer anderen ist
+        alternatives = sorted(self._replacements, key=len, reverse=True)
+        self._pattern = re.compile("|".join(re.escape(item) for item in alternatives))
+
+    def rewrite(self, text: str) -> str:
+        """Liefert den Text mit allen ersetzten entity_ids."""
+        return self._pattern.sub(lambda match: self._replacements[match.group(0)], text)
+
+    def changed_rows(self, rows: list[tuple], with_hash: bool = False) -> list[tuple]:
+        """Ersetzt in (id, json)-Zeilen und liefert die Parameter der Updates.
+
+        Args:
+            rows (list[tuple]): Gelesene Paare (id, json).
+            with_hash (bool): Den Recorder-Hash der geteilten Daten mitliefern.
+
+        Returns:
+            list[tuple]: (json, id) bzw. (json, hash, id) der geänderten Zeilen.
+        """
+        if with_hash:
+            # pylint: disable-next=import-outside-toplevel
+            from homeassistant.components.recorder.db_schema import EventData
+
+        updates = []
+        for row_id, text in rows:
+            if text is None:
+                continue
+            new_text = self.rewrite(text)
+            if new_text == text:
+                continue
+            if with_hash:
+                shared_hash = EventData.hash_shared_data_bytes(new_text.encode())
+                updates.append((new_text, shared_hash, row_id))
+            else:
+                updates.append((new_text, row_id))
+        return updates
+
+
+def _tables(cursor: sqlite3.Cursor) -> set[str]:
+    """Namen aller Tabellen der Datenbank."""
+    return {
+        row[0]
+        for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+
+
+def _columns(cursor: sqlite3.Cursor, table: str) -> set[str]:
+    """Spaltennamen einer Tabelle."""
+    return {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+
+
+def _rewrite_rows(
+    cursor: sqlite3.Cursor,
+    select: tuple[str, tuple],
+    update_sql: str,
+    rewriter: EntityIdRewriter,
+    with_hash: bool = False,
+) -> tuple[int, int]:
+    """Liest (id, json)-Zeilen blockweise, ersetzt und schreibt geänderte zurück.
+
+    Args:
+        cursor (sqlite3.Cursor): Offener Cursor (innerhalb der Transaktion).
+        select (tuple[str, tuple]): Abfrage, die Paare (id, json) liefert, und
+            ihre Parameter.
+        update_sql (str): Update mit den Parametern (json, id) bzw.
+            (json, hash, id) bei with_hash.
+        rewriter (EntityIdRewriter): Das gemeinsame Ersetzungsmuster.
+        with_hash (bool): Den Recorder-Hash der geteilten Daten neu berechnen.
+
+    Returns:
+        tuple[int, int]: Gelesene und geänderte Zeilen.
+    """
+    # Erst vollständig lesen, dann schreiben: keine Änderungen an der Tabelle,
+    # solange die Abfrage noch läuft
+    reader = cursor.connection.cursor()
+    reader.execute(*select)
+    scanned = 0
+    updates = []
+
+    while rows := reader.fetchmany(_FETCH_SIZE):
+        scanned += len(rows)
+        updates.extend(rewriter.changed_rows(rows, with_hash))
+    reader.close()
+
+    for start in range(0, len(updates), _FETCH_SIZE):
+        cursor.executemany(update_sql, updates[start : start + _FETCH_SIZE])
+    return scanned, len(updates)
+
+
+def _id_range(
+    cursor: sqlite3.Cursor, table: str, metadata_ids: list[int]
+) -> tuple[int, int] | None:
+    """Kleinste und größte id der Zeilen mit den angegebenen metadata_ids.
+
+    Returns:
+        tuple | None: (min_id, max_id) oder None, wenn es keine Zeilen gibt.
+    """
+    low = high = None
+    for start in range(0, len(metadata_ids), _MAX_PARAMS):
+        block = metadata_ids[start : start + _MAX_PARAMS]
+        placeholders = ", ".join("?" * len(block))
+        row = cursor.execute(
+            f"SELECT MIN(id), MAX(id) FROM {table} "  # noqa: S608
+            f"WHERE metadata_id IN ({placeholders})",
+            block,
+        ).fetchone()
+        if row[0] is None:
+            continue
+        low = row[0] if low is None else min(low, row[0])
+        high = row[1] if high is None else max(high, row[1])
+    if low is None:
+        return None
+    return low, high
+
+
+def _count(cursor: sqlite3.Cursor, table: str, where: str, *params) -> int:
+    """Zählt Zeilen einer Tabelle (Bedingung über eine indizierte Spalte)."""
+    return cursor.execute(
+        f"SELECT COUNT(*) FROM {table} WHERE {where}", params  # noqa: S608
+    ).fetchone()[0]
+
+
+def _count_events(cursor: sqlite3.Cursor) -> tuple[int, str | None, tuple]:
+    """Zählt die state_changed-Events, die die Logbuch-Phase lesen muss.
+
+    Returns:
+        tuple: Anzahl sowie Abfrage und Parameter, die (id, json) dieser Events
+        liefern (für die Durchsatzmessung), oder None ohne Events.
+    """
+    tables = _tables(cursor)
+    if "events" not in tables:
+        return 0, None, ()
+    event_columns = _columns(cursor, "events")
+
+    if {"event_type", "event_data"} <= event_columns:
+        count = _count(cursor, "events", "event_type = ?", "state_changed")
+        if count:
+            return (
+                count,
+                "SELECT event_id, event_data FROM events WHERE event_type = ?",
+                ("state_changed",),
+            )
+
+    if {"event_data", "event_types"} <= tables and "data_id" in event_columns:
+        type_row = cursor.execute(
+            "SELECT event_type_id FROM event_types WHERE event_type = 'state_changed'"
+        ).fetchone()
+        if type_row:
+            return (
+                _count(cursor, "events", "event_type_id = ?", type_row[0]),
+                "SELECT data_id, shared_data FROM event_data WHERE data_id IN "
+                "(SELECT data_id FROM events WHERE event_type_id = ?)",
+                (type_row[0],),
+            )
+
+    return 0, None, ()
+
+
+def _measure_update_rate(cursor: sqlite3.Cursor, metadata_ids: list[int]) -> float | None:
+    """Misst den Durchsatz beim Umhängen von States (Zeilen/s).
+
+    Die Stichprobe wird mit Tabellendefinition und Indizes in eine Datenbank
+    im Arbeitsspeicher kopiert und dort umgehängt, damit die Recorder-DB nicht
+    gesperrt wird.
+    """
+    if not metadata_ids:
+        return None
+
+    schema = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE tbl_name = 'states' AND sql IS NOT NULL"
+    ).fetchall()
+    sample = cursor.execute(
+        "SELECT * FROM states WHERE metadata_id = ? LIMIT ?",
+        (metadata_ids[0], SAMPLE_ROWS),
+    ).fetchall()
+    if not schema or not sample:
+        return None
+
+    memory = sqlite3.connect(":memory:")
+    try:
+        for (sql,) in schema:
+            memory.execute(sql)
+        placeholders = ", ".join("?" * len(sample[0]))
+        memory.executemany(
+            f"INSERT INTO states VALUES ({placeholders})", sample  # noqa: S608
+        )
+        start = time.perf_counter()
+        rows = memory.execute(
+            "UPDATE states SET metadata_id = metadata_id WHERE metadata_id = ?",
+            (metadata_ids[0],),
+        ).rowcount
+        seconds = time.perf_counter() - start
+    except sqlite3.Error as err:
+        _LOGGER.debug("Durchsatzmessung nicht möglich: %s", err)
+        return None
+    finally:
+        memory.close()
+
+    if rows < 1 or seconds <= 0:
+        return None
+    return rows / seconds
+
+
+def _measure_scan_rate(
+    cursor: sqlite3.Cursor, select_sql: str, params: tuple, rewriter: EntityIdRewriter
+) -> float | None:
+    """Misst den Durchsatz beim Lesen und Ersetzen von Events (Zeilen/s)."""
+    start = time.perf_counter()
+    rows = 0
+    for _, text in cursor.execute(f"{select_sql} LIMIT ?", (*params, SAMPLE_ROWS)):
+        rows += 1
+        if text is not None:
+            rewriter.rewrite(text)
+    seconds = time.perf_counter() - start
+
+    if rows < 1 or seconds <= 0:
+        return None
+    return rows / seconds
+
+
+def _select_ids(cursor: sqlite3.Cursor, query: str, keys) -> dict:
+    """Löst mehrere Schlüssel mit IN-Abfragen auf (in Blöcken).
+
+    Args:
+        cursor (sqlite3.Cursor): Offener Cursor.
+        query (str): Abfrage mit einem Platzhalter `{}` für die IN-Liste, die
+            Paare (Schlüssel, ID) liefert.
+        keys: Die gesuchten Schlüssel.
+
+    Returns:
+        dict: Schlüssel → ID für alle gefundenen Schlüssel.
+    """
+    keys = list(keys)
+    result = {}
+    for start in range(0, len(keys), _MAX_PARAMS):
+        block = keys[start : start + _MAX_PARAMS]
+        placeholders = ", ".join("?" * len(block))
+        result.update(cursor.execute(query.format(placeholders), block).fetchall())
+    return result
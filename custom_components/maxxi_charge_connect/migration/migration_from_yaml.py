@@ -6,24 +6,34 @@ Dieses Modul beihnhaltet alles, was für eine Migration notwendig ist.
 # pylint:disable=too-many-lines
 import logging
 import os
-import re
 import sqlite3
-import asyncio
 import json
-from functools import partial
 # import datetime
 
 from pathlib import Path
 from datetime import datetime, timezone
 
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import restore_state
+from homeassistant.helpers.entity_registry import (
+    async_entries_for_config_entry,
+    async_get as async_get_entity_registry,
+)
 from homeassistant.components.integration.sensor import IntegrationSensor
+from homeassistant.util.file import write_utf8_file_atomic
 
-from ..const import DOMAIN  # pylint:disable=relative-beyond-top-level
+from ..const import (  # pylint:disable=relative-beyond-top-level
+    DOMAIN,
+    ENERGY_ENTITIES,
+    MIGRATION_PROGRESS_EVENTNAME,
+)
+from .migration_engine import MigrationEngine
+from .sensor_types import NEW_TO_OLD, OLD_TO_NEW, RIEMANN_SENSORS
+from .yaml_rewriter import rewrite_entity_ids
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +41,9 @@ _LOGGER = logging.getLogger(__name__)
 ID_E_LEISTUNG = "E-Leistung"
 ID_BATTERIE_LEISTUNG = "Batterie_Leistung"
 
+# Neue Typen der Riemann-Energiezähler; werden separat migriert
+RIEMANN_TYPES = frozenset(new for _, new in RIEMANN_SENSORS)
+
 
 class MigrateFromYaml:
     """Migrationsklasse.
@@ -43,6 +56,7 @@ class MigrateFromYaml:
         self._entry = entry
         self._sensor_map: dict = {}
         self._current_sensors = None
+        self._integral_index: dict[str, IntegrationSensor] | None = None
 
     def load_current_sensors(self):
         """Lädt aktuelle Entitäten zum Gerät aus der HA - Registry"""
@@ -50,246 +64,58 @@ class MigrateFromYaml:
         entity_registry = async_get_entity_registry(self._hass)
         neu_sensor_map = {}
 
-        for entity in entity_registry.entities.values():
-            if (
-                entity.config_entry_id == self._entry.entry_id
-                and entity.domain == "sensor"
-            ):
+        # Index der Registry nach config_entry_id statt Scan aller Entitäten
+        for entity in async_entries_for_config_entry(
+            entity_registry, self._entry.entry_id
+        ):
+            if entity.domain == "sensor":
                 typ = entity.unique_id.removeprefix(f"{self._entry.entry_id}_").lower()
                 old_typ = self.get_type(typ)
                 neu_sensor_map[entity.entity_id] = (typ, old_typ, entity)
 
         return neu_sensor_map
 
-    # pylint:disable=too-many-return-statements,too-many-branches
     def get_type(self, value):
         """Liefert den Sensor-Type.
 
         Es wird aus dem übergebenen String ermittelt, ob der Sensor-Typ einen alten Typ
-        von Joern-R beinhaltet"""
-
-        typ = value.lower()
-
-        if typ.endswith("battery_power_discharge"):
-            return "batterie_entladen"
-
-        if typ.endswith("battery_soe"):
-            return "ladestand_detail"
-
-        if typ.endswith("battery_power_charge"):
-            return "batterie_laden"
-
-        if typ.endswith("battery_soc"):
-            return "ladestand"
-
-        if typ.endswith("battery_power"):
-            return "batterie_leistung"
-
-        if typ.endswith("ccu_power"):
-            return "ccu_leistung"
-
-        if typ.endswith("firmware_version"):
-            return "ccu_version"
-
-        if typ.endswith("deviceid"):
-            return "deviceid"
-
-        if typ.endswith("rssi"):
-            return "wifi_signalstarke_dbm"
-
-        if typ.endswith("pv_power"):
-            return "pv_leistung"
-
-        if typ.endswith("power_meter"):
-            return "e_zaehler_leistungswert"
-
-        if typ.endswith("grid_import"):
-            return "e_zaehler_netzbezug"
-
-        if typ.endswith("grid_export"):
-            return "e_zaehler_netzeinspeisung"
-
-        if typ.endswith("powermeterip"):
-            return "konf_lok_meter_ip"
+        von Joern-R beinhaltet (längster passender Suffix, siehe SENSOR_TYPES)."""
 
-        if typ.endswith("maximumpower"):
-            return "konf_lok_max_leistung"
-
-        if typ.endswith("offlineoutputpower"):
-            return "konf_lok_offline_leistung"
-
-        if typ.endswith("numberofbatteries"):
-            return "konf_lok_batterien"
-
-        if typ.endswith("outputoffset"):
-            return "konf_lok_ausgabekorrektur"
-
-        if typ.endswith("responsetolerance"):
-            return "konf_lok_reak_toleranz"
-
-        if typ.endswith("minimumbatterydischarge"):
-            return "konf_lok_min_soc"
-
-        if typ.endswith("maximumbatterycharge"):
-            return "konf_lok_max_soc"
-
-        # if typ.endswith("konf_lok_meter_auto"):
-        #     return None
-
-        if typ.endswith("powermetertype"):
-            return "konf_lok_meter_manu"
-
-        if typ.endswith("dc/dc-algorithmus"):
-            return "konf_dc_algorithm"
-
-        if typ.endswith("microinverter"):
-            return "konf_wr"
-
-        if typ.endswith("ccuspeed"):
-            return "konf_ccu_speed"
-
-        if typ.endswith("cloudservice"):
-            return "konf_lok_cloud"
-
-        if typ.endswith("localserver"):
-            return "konf_lok_lserver"
-
-        if typ.endswith("apiroute"):
-            return "konf_api_route"
-
-        return None
+        return NEW_TO_OLD.match(value)
 
     def get_new_sensor(self, old_entity):
         """Ermittelt den neuen Sensor, der dem alten Sensor entspricht"""
         if old_entity is None or self._current_sensors is None:
             return None
 
+        target = self.get_type_from_unique_id(old_entity.unique_id)
+        if target is None:
+            return None
+
         for entity_id, (sensor_type, old_type, entity) in self._current_sensors.items():  # pylint:disable=unused-variable
-            if sensor_type is not None and sensor_type == self.get_type_from_unique_id(
-                old_entity.unique_id
-            ):
+            if sensor_type == target:
                 return entity_id
 
         return None
 
-    # pylint:disable=too-many-return-statements,too-many-branches
     def get_type_from_unique_id(self, unique_id):
-        """Extrahiert aus der unique_id den Typ."""
-
-        typ = unique_id.lower()
-
-        if typ.endswith("batterie_entladen"):
-            return "battery_power_discharge"
-
-        if typ.endswith("ladestand_detail"):
-            return "battery_soe"
-
-        if typ.endswith("batterie_laden"):
-            return "battery_power_charge"
-
-        if typ.endswith("ladestand"):
-            return "battery_soc"
-
-        if typ.endswith("batterie_leistung"):
-            return "battery_power"
-
-        if typ.endswith("ccu_gesamtleistung"):
-            return "ccu_power"
-
-        if typ.endswith("ccu_version"):
-            return "firmware_version"
-
-        if typ.endswith("deviceid"):
-            return "deviceid"
-
-        if typ.endswith("wifi-dbm"):
-            return "rssi"
-
-        if typ.endswith("pv_leistung"):
-            return "pv_power"
-
-        if typ.endswith("e-leistung"):
-            return "power_meter"
-
-        if typ.endswith("e_zaehler_netzbezug"):
-            return "grid_import"
-
-        if typ.endswith("e_zaehler_netzeinspeisung"):
-            return "grid_export"
-
-        if typ.endswith("ladestanddetail"):
-            return "battery_soe"
-
-        if typ.endswith("konf_lok_meter_ip"):
-            return "powermeterip"
-
-        if typ.endswith("konf_lok_max_leistung"):
-            return "maximumpower"
+        """Extrahiert aus der unique_id den Typ (längster passender Suffix)."""
 
-        if typ.endswith("konf_lok_offline_leistung"):
-            return "offlineoutputpower"
-
-        if typ.endswith("konf_lok_batterien"):
-            return "numberofbatteries"
-
-        if typ.endswith("konf_lok_ausgabekorrektur"):
-            return "outputoffset"
-
-        if typ.endswith("konf_lok_reak_toleranz"):
-            return "responsetolerance"
-
-        if typ.endswith("konf_lok_min_soc"):
-            return "minimumbatterydischarge"
-
-        if typ.endswith("konf_lok_max_soc"):
-            return "maximumbatterycharge"
-
-        # if typ.endswith("konf_lok_meter_auto"):
-        #     return None
-
-        if typ.endswith("konf_lok_meter_manu"):
-            return "powermetertype"
-
-        if typ.endswith("konf_dc_algorithm"):
-            return "dc/dc-algorithmus"
-
-        if typ.endswith("konf_wr"):
-            return "microinverter"
-
-        if typ.endswith("konf_ccu_speed"):
-            return "ccuspeed"
-
-        if typ.endswith("konf_lok_cloud"):
-            return "cloudservice"
-
-        if typ.endswith("konf_lok_lserver"):
-            return "localserver"
-
-        if typ.endswith("konf_api_route"):
-            return "apiroute"
-
-        return None
+        return OLD_TO_NEW.match(unique_id)
 
     def get_riemann_entities_for_migrate(self):
         """Liefert eine Liste der Riemann-Sensoren, die migriert werden sollen."""
 
         entity_registry = async_get_entity_registry(self._hass)
         all_entries = list(entity_registry.entities.values())
+        self.build_integral_index()
 
         sensors_temp = {}
         sensors_temp2 = {}
         sensors_kwh = {}
 
-        riemann_list = {
-            ("BatterieLaden_1", "batterytotalenergycharge"),
-            ("E-Zaehler_Netzbezug1", "gridimportenergytotal"),
-            ("E-Zaehler Netzeinspeisung", "gridexportenergytotal"),
-            ("Akku_Entladen_1", "batterytotalenergydischarge"),
-            ("PV_Leistung", "pvtotalenergy"),
-        }
-
         for entry in all_entries:
-            for key, key_neu in riemann_list:
+            for key, key_neu in RIEMANN_SENSORS:
                 if entry.unique_id.endswith(key):
                     sensors_temp[key] = self.find_integral_helpers_by_input_sensor(
                         entry.entity_id
@@ -318,14 +144,7 @@ class MigrateFromYaml:
                 and entry.domain == "sensor"
                 and "maxxi" in entry.entity_id
                 and typ is not None
-                and typ
-                not in {
-                    "batterytotalenergycharge",
-                    "batterytotalenergydischarge",
-                    "gridimportenergytotal",
-                    "gridexportenergytotal",
-                    "pvtotalenergy",
-                }
+                and typ not in RIEMANN_TYPES
             ):
                 sensors[entry.entity_id] = entry
 
@@ -402,16 +221,20 @@ class MigrateFromYaml:
             },
         )
 
-    # pylint:disable=too-many-locals
-    async def async_handle_trigger_migration(
-        self, sensor_mapping: list[dict] | None = None
-    ):
-        """Service - Trigger zum Starten des Migrationsvorgangs."""
+    def _resolve_mappings(
+        self, sensor_mapping: list[dict], skipped: list[dict] | None = None
+    ) -> list[tuple] | None:
+        """Prüft alle Mappings gegen States und Entity-Registry.
 
-        _LOGGER.info("Starte Migration ...")
-        await self._hass.services.async_call("recorder", "disable")
-        await self._hass.async_block_till_done()
+        Args:
+            sensor_mapping (list[dict]): Mappings mit old_sensor und new_sensor.
+            skipped (list[dict] | None): Nimmt übersprungene Mappings mit Grund auf.
 
+        Returns:
+            list[tuple] | None: Tripel (alte entity_id, neue entity_id,
+            RegistryEntry) oder None, wenn die aktuellen Sensoren nicht geladen
+            werden konnten.
+        """
         self._current_sensors = self.load_current_sensors()
         entity_registry = async_get_entity_registry(self._hass)
 
@@ -419,10 +242,21 @@ class MigrateFromYaml:
             _LOGGER.error(
                 "Aktuelle Senoren konnten nicht geladen werden. Migration nicht möglch"
             )
-            return
+            return None
+
+        def skip(mapping: dict, reason: str) -> None:
+            if skipped is not None:
+                skipped.append(
+                    {
+                        "old_sensor": mapping.get("old_sensor"),
+                        "new_sensor": mapping.get("new_sensor"),
+                        "reason": reason,
+                    }
+                )
 
         # Hole alle States nur einmal
         all_states = {s.entity_id: s for s in self._hass.states.async_all()}
+        migrations = []
 
         for mapping in sensor_mapping:
             old_entity_id = mapping.get("old_sensor")
@@ -430,129 +264,140 @@ class MigrateFromYaml:
 
             if not old_entity_id or not new_entity_id:
                 _LOGGER.warning("Ungültiges Mapping übersprungen: %s", mapping)
+                skip(mapping, "Ungültiges Mapping")
                 continue
 
             old_state = all_states.get(old_entity_id)
             if not old_state:
                 _LOGGER.warning("Alter Sensor %s nicht gefunden", old_entity_id)
+                skip(mapping, "Alter Sensor nicht gefunden")
                 continue
 
             # hole zugehörige Entity aus current_sensors
             sensor_info = self._current_sensors.get(new_entity_id)
             if not sensor_info:
                 _LOGGER.warning("Neue Entity %s nicht gefunden", new_entity_id)
+                skip(mapping, "Neue Entity nicht gefunden")
                 continue
 
             typ, old_type, entity = sensor_info  # pylint:disable=unused-variable
 
-            # if typ or not entity:
-            #     _LOGGER.warning(
-            #         "Sensor-Typ von %s konnte nicht erkannt werden", new_entity_id
-            #     )
-            #     continue
+            if not (
+                entity_registry.entities.get(old_entity_id)
+                and entity_registry.entities.get(new_entity_id)
+            ):
+                _LOGGER.error(
+                    "Neuer Unique-Key konnte nicht gesetzt werden: %s", new_entity_id
+                )
+                skip(mapping, "Entität nicht in der Registry")
+                continue
 
-            # sensor_map[old_type] = new_entity_id
             _LOGGER.warning(
                 "Mapping: %s → %s (Typ: %s)", old_entity_id, new_entity_id, typ
             )
+            migrations.append((old_entity_id, new_entity_id, entity))
 
-            db_path = self._hass.config.path("home-assistant_v2.db")
+        return migrations
 
-            try:
-                # if entity:
-                #     _LOGGER.warning("%s -> %s", new_entity_id, old_entity_id)
+    async def async_plan_migration(self, sensor_mapping: list[dict]) -> dict:
+        """Probelauf: schätzt Umfang und Dauer der Migration ab.
 
-                #     entity_registry.async_remove(old_entity_id)
-                #     await self._hass.async_block_till_done()
+        Der Recorder bleibt aktiv, es werden weder Datenbank noch YAML-Dateien
+        verändert.
 
-                #     entity_registry.async_update_entity(
-                #         entity_id=new_entity_id, new_entity_id=old_entity_id
-                #     )
-                entity_old = entity_registry.entities.get(old_entity_id)
-                entity_new = entity_registry.entities.get(new_entity_id)
+        Args:
+            sensor_mapping (list[dict]): Mappings mit old_sensor und new_sensor.
 
-                if entity_old and entity_new:
-                    _LOGGER.info("%s -> %s", new_entity_id, old_entity_id)
+        Returns:
+            dict: Plan der MigrationEngine (siehe MigrationEngine.plan()),
+            ergänzt um "skipped" und "yaml_files" ({"path", "replacements"}).
+        """
+        skipped: list[dict] = []
+        migrations = self._resolve_mappings(sensor_mapping, skipped) or []
+        pairs = [(old, new) for old, new, _ in migrations]
+
+        engine = MigrationEngine(self._hass.config.path("home-assistant_v2.db"))
+        plan = await self._hass.async_add_executor_job(engine.plan, pairs)
+        yaml_report = await self._hass.async_add_executor_job(
+            rewrite_entity_ids, self._hass.config.config_dir, pairs, True
+        )
 
-                    # Entferne den alten Entity-Eintrag (macht den Namen frei)
-                    # entity_registry.async_remove(old_entity_id)
-                    # await self._hass.async_block_till_done()
+        plan["skipped"] = skipped
+        plan["yaml_files"] = [
+            {"path": path, "replacements": info["replacements"]}
+            for path, info in yaml_report["files"].items()
+        ]
+        return plan
 
-                    await self.migrate_states_meta(db_path, old_entity_id, entity)
-                    await self._hass.async_block_till_done()
+    # pylint:disable=too-many-locals
+    async def async_handle_trigger_migration(
+        self, sensor_mapping: list[dict] | None = None
+    ):
+        """Service - Trigger zum Starten des Migrationsvorgangs.
 
-                    self.migrate_logbook_entries(db_path, old_entity_id, new_entity_id)
-
-                    # # Spezialbehandlung von Statistics
-                    # if typ == "batterytotalenergydischarge":
-                    #     self.migrate_negative_statistics(
-                    #         db_path,
-                    #         self.resolve_entity_id_from_unique_id(ID_BATTERIE_LEISTUNG),
-                    #         new_entity_id,
-                    #     )
-                    # elif typ == "gridexportenergytotal":
-                    #     self.migrate_negative_statistics(
-                    #         db_path,
-                    #         self.resolve_entity_id_from_unique_id(ID_E_LEISTUNG),
-                    #         new_entity_id,
-                    #     )
-
-                    # elif typ == "gridimportenergytotal":
-                    #     self.migrate_positive_statistics(
-                    #         db_path,
-                    #         self.resolve_entity_id_from_unique_id(ID_E_LEISTUNG),
-                    #         new_entity_id,
-                    #     )
-                    # elif typ == "batterytotalenergycharge":
-                    #     self.migrate_positive_statistics(
-                    #         db_path,
-                    #         self.resolve_entity_id_from_unique_id(ID_BATTERIE_LEISTUNG),
-                    #         new_entity_id,
-                    #     )
-
-                    # else:
-
-                    self.migrate_sqlite_statistics(
-                        old_entity_id, new_entity_id, db_path, False
-                    )
-                    # self.migrate_positive_statistics(
-                    #     db_path, old_entity_id, new_entity_id
-                    # )
+        Alle Mappings werden zuerst geprüft und anschließend gemeinsam in einer
+        Datenbank-Transaktion im Executor migriert (siehe MigrationEngine).
+        """
 
-                    # self.migrate_positive_statistics(
-                    #     db_path, old_entity_id, new_entity_id
-                    # )
-                    # self.migrate_state_history(db_path, old_entity_id, new_entity_id)
+        _LOGGER.info("Starte Migration ...")
+        await self._hass.services.async_call("recorder", "disable")
+        await self._hass.async_block_till_done()
 
-                    await self._hass.async_block_till_done()
-                    await self.async_replace_entity_ids_in_yaml_files(
-                        old_entity_id=old_entity_id, new_entity_id=new_entity_id
-                    )
+        entity_registry = async_get_entity_registry(self._hass)
+        migrations = self._resolve_mappings(sensor_mapping)
+        if migrations is None:
+            return
 
-                    # # Benenne den neuen Entity-Namen auf den alten um
-                    # entity_registry.async_update_entity(
-                    #     entity_id=new_entity_id, new_entity_id=old_entity_id
-                    # )
-                    await self._hass.async_block_till_done()
+        engine = MigrationEngine(
+            self._hass.config.path("home-assistant_v2.db"),
+            cursor_path=self._hass.config.path(".storage", f"{DOMAIN}.migration_cursor"),
+            progress=self._report_progress,
+        )
+        try:
+            report = await self._hass.async_add_executor_job(
+                engine.run, [(old, new) for old, new, _ in migrations]
+            )
+        except Exception as e:  # pylint:disable=broad-exception-caught
+            _LOGGER.exception("Fehler bei der Datenbank-Migration: %s", e)
+            report = None
+
+        if report is not None:
+            for phase in report["phases"]:
+                _LOGGER.info(
+                    "Phase %s: %d Zeilen, %.3f s",
+                    phase["phase"],
+                    phase["rows"],
+                    phase["seconds"],
+                )
+
+            await self.async_rewrite_yaml_files(
+                [(old, new) for old, new, _ in migrations]
+            )
+
+            energy_entities = (
+                self._hass.data[DOMAIN]
+                .get(self._entry.entry_id, {})
+                .get(ENERGY_ENTITIES, {})
+            )
+            restore_updates = {}
+            for old_entity_id, new_entity_id, entity in migrations:
+                try:
+                    cur_valid_state = report["states"].get(new_entity_id)
+                    sensor = energy_entities.get(entity.unique_id)
+                    if cur_valid_state is not None and sensor is not None:
+                        sensor.set_state_from_migration(cur_valid_state)
+                        try:
+                            restore_updates[new_entity_id] = Decimal(cur_valid_state)
+                        except InvalidOperation:
+                            pass
 
                     entity_registry.async_remove(old_entity_id)
                     await self._hass.async_block_till_done()
+                except Exception as e:  # pylint:disable=broad-exception-caught
+                    _LOGGER.error("Fehler beim Umbenennen der Entity: %s", e)
 
-                else:
-                    _LOGGER.error("Neuer Unique-Key konnte nicht gesetzt werden")
-                    return
-            except Exception as e:  # pylint:disable=broad-exception-caught
-                _LOGGER.error("Fehler beim Umbenennen der Entity: %s", e)
-
-            # ConfigEntry aktualisieren
-            # self._hass.config_entries.async_update_entry(
-            #     self._entry,
-            #     data={
-            #         **self._entry.data,
-            #         "migration": True,
-            #         "legacy_sensor_map": sensor_map,
-            #     },
-            # )
+            # Energiezähler sofort in restore_state sichern (ein Schreibvorgang)
+            await self.async_update_restore_states(restore_updates)
 
         await self._hass.services.async_call(
             "persistent_notification",
@@ -563,130 +408,30 @@ class MigrateFromYaml:
             },
         )
 
+        persistent_notification.async_dismiss(
+            self._hass, "maxxicharge_migration_progress"
+        )
         await self._hass.services.async_call("recorder", "enable")
 
         _LOGGER.info("Migration abgeschlossen.")
 
-    # pylint:disable=too-many-locals
-    async def migrate_states_meta(self, db_path, old_entity_id, entity_new):
-        """Kopieren der Status-Meta-Daten eines Sensors in den neuen Sensor."""
-
-        if not os.path.exists(db_path):
-            _LOGGER.error("Recorder-DB nicht gefunden unter: %s", db_path)
-            return
-
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            new_entity_id = entity_new.entity_id
-
-            # # IDs holen
-            # cursor.execute(
-            #     "SELECT metadata_id FROM states_meta WHERE entity_id = ?",
-            #     (new_entity_id,),
-            # )
-            # neu_row = cursor.fetchone()
-            # if not neu_row:
-            #     _LOGGER.warning("Keine states_meta für %s gefunden.", new_entity_id)
-            # else:
-            #     neu_id = neu_row[0]
-
-            #     cursor.execute(
-            #         "delete from states where metadata_id = ?",
-            #         (neu_id,),
-            #     )
-            #     deleted_rows = cursor.rowcount
-
-            # _LOGGER.warning("%s Zeilen gelöscht.", deleted_rows)
-
-            # IDs holen
-            cursor.execute(
-                "SELECT metadata_id FROM states_meta WHERE entity_id = ?",
-                (old_entity_id,),
-            )
-            old_row = cursor.fetchone()
-            if not old_row:
-                _LOGGER.warning("Keine states_meta für %s gefunden.", old_entity_id)
-                return
-            old_id = old_row[0]
-
-            cursor.execute(
-                "SELECT metadata_id FROM states_meta WHERE entity_id = ?",
-                (new_entity_id,),
-            )
-            new_row = cursor.fetchone()
-
-            if new_row:
-                new_id = new_row[0]
-            else:
-                cursor.execute(
-                    "INSERT INTO states_meta (entity_id) VALUES (?)", (new_entity_id,)
-                )
-                new_id = cursor.lastrowid
-                _LOGGER.info(
-                    "states_meta für %s erstellt mit ID %s", new_entity_id, new_id
-                )
-
-            # States umhängen
-            updated = cursor.execute(
-                "UPDATE states SET metadata_id = ? WHERE metadata_id = ?",
-                (new_id, old_id),
-            ).rowcount
-
-            # get Last valid value
-            # pylint:disable=line-too-long
-            cursor.execute(
-                "SELECT s.state FROM states_meta sm INNER JOIN states s ON sm.metadata_id = s.metadata_id WHERE sm.entity_id = ? and (s.state != 'unavailable' and s.state != 'unknown') order by s.last_updated_ts desc LIMIT 1",
-                (new_entity_id,),
-            )
-            cur_row = cursor.fetchone()
-
-            if not cur_row:
-                _LOGGER.warning("Keine gültigen states für %s gefunden.", new_entity_id)
-                return
-            cur_valid_state = cur_row[0]
-
-            # IDs holen
-            # pylint:disable=line-too-long
-            cursor.execute(
-                "SELECT state_id FROM states_meta sm INNER JOIN states s ON sm.metadata_id = s.metadata_id WHERE sm.entity_id = ? order by last_updated_ts desc LIMIT 1",
-                (new_entity_id,),
-            )
-            cur_row = cursor.fetchone()
-            if not cur_row:
-                _LOGGER.warning("Keine states_meta für %s gefunden.", new_entity_id)
-                return
-            cur_state_id = cur_row[0]
-
-            cursor.execute(
-                "update states set state=? where state_id = ?",
-                (
-                    cur_valid_state,
-                    cur_state_id,
-                ),
-            )
-            updated_rows = cursor.rowcount
-
-            _LOGGER.info("%s Zeilen geupdatet.", updated_rows)
-
-            conn.commit()
-
-            sensor = self._hass.data[DOMAIN].get(entity_new.unique_id)
-            if sensor is not None:
-                sensor.set_state_from_migration(cur_valid_state)
-
-            _LOGGER.info(
-                "States: %d Einträge migriert von %s nach %s.",
-                updated,
-                old_entity_id,
-                new_entity_id,
-            )
-
-        except Exception as e:  # pylint:disable=broad-exception-caught
-            _LOGGER.exception("Fehler bei State-Migration (states_meta): %s", e)
-        finally:
-            conn.close()
+    def _report_progress(self, progress: dict) -> None:
+        """Fortschritt der Statistik-Migration (aus dem Executor-Thread)."""
+        self._hass.loop.call_soon_threadsafe(self._async_report_progress, progress)
+
+    @callback
+    def _async_report_progress(self, progress: dict) -> None:
+        """Meldet den Fortschritt als Event und als persistente Benachrichtigung."""
+        self._hass.bus.async_fire(MIGRATION_PROGRESS_EVENTNAME, progress)
+
+        percent = 100 * progress["last_id"] / progress["max_id"] if progress["max_id"] else 100
+        persistent_notification.async_create(
+            self._hass,
+            f"Tabelle {progress['table']}: {percent:.0f} % "
+            f"(id {progress['last_id']} von {progress['max_id']})",
+            title="MaxxiCharge Migration läuft",
+            notification_id="maxxicharge_migration_progress",
+        )
 
     def migrate_state_history(self, db_path, old_entity_id, new_entity_id):
         """Kopieren der Status-Historie eines Sensors in den neuen Sensor."""
@@ -771,217 +516,29 @@ class MigrateFromYaml:
 
             _LOGGER.info("Migrate State History ...abgeschlossen")
 
-    def migrate_logbook_entries(self, db_path, old_entity_id, new_entity_id):
-        """Kopieren der Logbuch-Einträge eine Sensors in den neuen Sensor."""
-
-        if not os.path.exists(db_path):
-            _LOGGER.error("Recorder-DB nicht gefunden unter: %s", db_path)
-            return
-
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            old_json = f'"{old_entity_id}"'
-            new_json = f'"{new_entity_id}"'
-
-            cursor.execute(
-                """
-                UPDATE events
-                SET event_data = REPLACE(event_data, ?, ?)
-                WHERE event_type = 'state_changed'
-                AND event_data LIKE ?
-                """,
-                (old_json, new_json, f"%{old_json}%"),
-            )
-            count = cursor.rowcount
-            conn.commit()
-
-            _LOGGER.info(
-                "Logbuch: %d Einträge von %s nach %s migriert.",
-                count,
-                old_entity_id,
-                new_entity_id,
-            )
-
-        except Exception as e:  # pylint:disable=broad-exception-caught
-            _LOGGER.exception("Fehler bei Logbuch-Migration: %s", e)
-        finally:
-            conn.close()
-
-    # pylint:disable=too-many-locals
-    def migrate_sqlite_statistics(
-        self, old_sensor, new_sensor, db_path, clear_existing=True
-    ):
-        """Kopieren der Statistik eines Sensors in einen neuen Sensor."""
-
-        if old_sensor == new_sensor:
-            _LOGGER.warning(
-                "Alter und neuer Sensor sind identisch (%s) – keine Migration erforderlich.",
-                old_sensor,
-            )
-            return
-
-        if not os.path.exists(db_path):
-            _LOGGER.error("SQLite-DB nicht gefunden unter: %s", db_path)
-            return
-
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            # IDs aus statistics_meta holen
-            cursor.execute(
-                "SELECT id FROM statistics_meta WHERE statistic_id = ?", (old_sensor,)
-            )
-            old_row = cursor.fetchone()
-            if not old_row:
-                _LOGGER.warning("Keine Statistikdaten für alten Sensor %s", old_sensor)
-                return
-            old_id = old_row[0]
-
-            cursor.execute(
-                "SELECT id FROM statistics_meta WHERE statistic_id = ?", (new_sensor,)
-            )
-            new_row = cursor.fetchone()
-
-            if new_row:
-                new_id = new_row[0]
-                _LOGGER.info(
-                    "Neue Sensor-ID %s existiert bereits mit ID %s", new_sensor, new_id
-                )
-
-                if clear_existing:
-                    _LOGGER.info(
-                        "Lösche vorhandene Statistikdaten für %s (ID %s)",
-                        new_sensor,
-                        new_id,
-                    )
-                    for table in [
-                        "statistics",
-                        "statistics_short_term",
-                        "statistics_runs",
-                    ]:
-                        cursor.execute(
-                            f"DELETE FROM {table} WHERE metadata_id = ?", (new_id,)
-                        )
-            else:
-                _LOGGER.info(
-                    "Neuer Sensor %s hat noch keinen statistics_meta-Eintrag – erstelle neuen.",
-                    new_sensor,
-                )
-
-                # Alten metadata-Eintrag kopieren
-                cursor.execute("SELECT * FROM statistics_meta WHERE id = ?", (old_id,))
-                old_meta = list(cursor.fetchone())
-
-                # Spaltennamen ermitteln
-                cursor.execute("PRAGMA table_info(statistics_meta)")
-                columns_info = cursor.fetchall()
-                columns = [col[1] for col in columns_info]
-
-                # ID-Spalte entfernen, damit sie nicht eingefügt wird
-                if "id" in columns:
-                    id_index = columns.index("id")
-                    columns.pop(id_index)
-                    old_meta.pop(id_index)
-
-                # statistic_id auf neue Entität setzen
-                stat_id_index = columns.index("statistic_id")
-                old_meta[stat_id_index] = new_sensor
-
-                columns_sql = ", ".join(columns)
-                placeholders = ", ".join(["?"] * len(columns))
-
-                cursor.execute(
-                    f"INSERT INTO statistics_meta ({columns_sql}) VALUES ({placeholders})",
-                    tuple(old_meta),
-                )
-                new_id = cursor.lastrowid
-                _LOGGER.info(
-                    "Neuer statistics_meta-Eintrag erstellt für %s mit ID %s",
-                    new_sensor,
-                    new_id,
-                )
-
-            # Migration der Statistikdaten
-            for table in ["statistics", "statistics_short_term"]:
-                updated = cursor.execute(
-                    f"UPDATE {table} SET metadata_id = ? WHERE metadata_id = ?",
-                    (new_id, old_id),
-                ).rowcount
-                _LOGGER.info("Tabelle %s: %d Zeilen migriert.", table, updated)
-
-            # Alten Meta-Eintrag löschen
-            cursor.execute("DELETE FROM statistics_meta WHERE id = ?", (old_id,))
-            _LOGGER.info("Alter statistics_meta-Eintrag (%s) gelöscht.", old_sensor)
-
-            conn.commit()
-            _LOGGER.info(
-                "Statistikmigration von '%s' nach '%s' abgeschlossen.",
-                old_sensor,
-                new_sensor,
-            )
-
-        except Exception as e:  # pylint:disable=broad-exception-caught
-            _LOGGER.exception("Fehler bei Statistik-Migration: %s", e)
-        finally:
-            conn.close()
-
     async def async_replace_entity_ids_in_yaml_files(
         self, old_entity_id: str, new_entity_id: str
     ) -> None:
         """Suche, die entity_id in allen YAML-Dateien und benennt diese in die neue entity_id um."""
 
-        await asyncio.to_thread(
-            self._replace_entity_ids_in_yaml_files_blocking,
-            old_entity_id,
-            new_entity_id,
-        )
+        await self.async_rewrite_yaml_files([(old_entity_id, new_entity_id)])
 
-    def _replace_entity_ids_in_yaml_files_blocking(
-        self, old_entity_id, new_entity_id, base_path=None
-    ):
-        """Durchsucht alle .yaml-Dateien im config-Verzeichnis nach der
+    async def async_rewrite_yaml_files(self, mappings: list[tuple[str, str]]) -> dict:
+        """Benennt alle entity_ids der Mappings in den YAML-Dateien um.
 
-           alten Entity-ID und ersetzt sie durch die neue.
-        """
-        if base_path is None:
-            base_path = self._hass.config.config_dir
-
-        replaced_files = []
-        for root, _, files in os.walk(base_path):
-            for file in files:
-                if not file.endswith(".yaml"):
-                    continue
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
+        Das Konfigurationsverzeichnis wird dabei nur einmal durchlaufen.
 
-                    if old_entity_id in content:
-                        new_content = re.sub(
-                            rf"\b{re.escape(old_entity_id)}\b",
-                            new_entity_id,
-                            content,
-                        )
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            f.write(new_content)
+        Args:
+            mappings (list[tuple[str, str]]): Paare (alte entity_id, neue entity_id).
 
-                        _LOGGER.info("Ersetzt in Datei: %s", file_path)
-                        replaced_files.append(file_path)
-
-                except Exception as e:  # pylint:disable=broad-exception-caught
-                    _LOGGER.error("Fehler beim Bearbeiten von %s: %s", file_path, e)
-
-        if replaced_files:
-            _LOGGER.info(
-                "Ersetzungen abgeschlossen in %d Datei(en)", len(replaced_files)
-            )
-        else:
-            _LOGGER.info("Keine YAML-Dateien mit %s gefunden", old_entity_id)
+        Returns:
+            dict: Diff-Bericht von rewrite_entity_ids().
+        """
+        return await self._hass.async_add_executor_job(
+            rewrite_entity_ids, self._hass.config.config_dir, mappings
+        )
 
-    # pylint:disable=too-many-locals, too-many-statements
+    # pylint:disable=too-many-locals, too-many-statements, too-many-branches
     def migrate_positive_statistics(
         self, db_path, old_sensor, new_sensor, clear_existing=True
     ):
@@ -1183,104 +740,154 @@ class MigrateFromYaml:
         conn.close()
         _LOGGER.info("Fertig! Home Assistant neu starten.")
 
+    def build_integral_index(self) -> dict[str, IntegrationSensor]:
+        """Indiziert alle Integral-Helfer nach ihrem Quellsensor.
+
+        Die Sensor-Entitäten werden dabei genau einmal durchlaufen. Gibt es
+        mehrere Helfer für dieselbe Quelle, gilt wie bisher der erste.
+
+        Returns:
+            dict[str, IntegrationSensor]: Quell-entity_id → Integral-Helfer.
+        """
+        index: dict[str, IntegrationSensor] = {}
+        component = self._hass.data.get("sensor")
+        if component is not None:
+            for entity in component.entities:
+                if isinstance(entity, IntegrationSensor):
+                    # pylint:disable-next=protected-access
+                    index.setdefault(entity._source_entity, entity)
+        self._integral_index = index
+        return index
+
     def find_integral_helpers_by_input_sensor(self, input_entity_id: str):
-        """Sucht die Integralsensoren"""
-        # _LOGGER.warning("Suche kwh - Sensor für: %s", input_entity_id)
-        for entity in self._hass.data["sensor"].entities:
-            if isinstance(entity, IntegrationSensor):
-                # _LOGGER.warning("Found: %s, %s", entity._source_entity, input_entity_id)
-
-                if entity._source_entity == input_entity_id:  # pylint:disable=protected-access
-                    # pylint:disable=protected-access
-                    _LOGGER.debug(
-                        "Found: %s, %s", entity._source_entity, entity.entity_id
-                    )
-                    return entity
+        """Sucht den Integralsensor zu einem Quellsensor (über den Index)."""
+        if self._integral_index is None:
+            self.build_integral_index()
 
-        return None
+        entity = self._integral_index.get(input_entity_id)
+        if entity is not None:
+            _LOGGER.debug("Found: %s, %s", input_entity_id, entity.entity_id)
+        return entity
 
     async def update_restore_state(self, entity_id: str, new_value: Decimal):
         """Aktualisiert state / native_value / last_valid_state in core.restore_state."""
+        await self.async_update_restore_states({entity_id: new_value})
+
+    async def async_update_restore_states(self, updates: dict[str, Decimal]) -> int:
+        """Patcht mehrere Einträge in core.restore_state in einem Schritt.
+
+        Die Datei wird einmal gelesen, über einen Index nach entity_id gepatcht
+        und einmal atomar (temporäre Datei + Umbenennen) geschrieben. Danach
+        wird die In-Memory-Kopie von RestoreStateData angeglichen, damit der
+        nächste Dump (spätestens beim Beenden) den Patch nicht überschreibt.
+
+        Args:
+            updates (dict[str, Decimal]): Neuer Wert je entity_id.
+
+        Returns:
+            int: Anzahl gepatchter bzw. neu angelegter Einträge.
+        """
+        if not updates:
+            return 0
+
         restore_file = Path(self._hass.config.path(".storage/core.restore_state"))
 
-        if not restore_file.exists():
-            _LOGGER.warning("%s fehlt – nichts zu patchen", restore_file)
-            return
+        try:
+            patched = await self._hass.async_add_executor_job(
+                _patch_restore_state_file, restore_file, updates
+            )
+        except Exception as e:  # pylint:disable=broad-exception-caught
+            _LOGGER.exception("Fehler beim Patchen von restore_state: %s", e)
+            return 0
+
+        if not patched:
+            return 0
 
         try:
-            # data = json.loads(restore_file.read_text(encoding="utf-8"))
-            # Nicht blockierend lesen
+            data = restore_state.async_get(self._hass)
+        except Exception:  # pylint:disable=broad-exception-caught
+            data = None
+
+        if data is not None:
+            for entity_id, entry in patched.items():
+                if entity_id in data.entities:
+                    # Aktive Entitäten schreiben beim Dump ihren eigenen Zustand,
+                    # hier gilt set_state_from_migration
+                    _LOGGER.debug("%s ist aktiv – Patch nur in der Datei", entity_id)
+                    continue
+                data.last_states[entity_id] = restore_state.StoredState.from_dict(entry)
 
-            # Partial mit benanntem Argument
-            read_func = partial(restore_file.read_text, encoding="utf-8")
-            raw = await self._hass.async_add_executor_job(read_func)
+        _LOGGER.info("restore_state: %d Einträge aktualisiert", len(patched))
+        return len(patched)
 
-            data = json.loads(raw)
 
-            if (
-                not isinstance(data, dict)
-                or "data" not in data
-                or not isinstance(data["data"], list)
-            ):
-                _LOGGER.error("Unerwartiges Format in restore_state – Abbruch")
-                return
+def _patch_restore_state_file(restore_file: Path, updates: dict[str, Decimal]) -> dict:
+    """Patcht core.restore_state einmal für alle Einträge (Executor).
 
-            entries = data["data"]
-            now_iso = datetime.now(timezone.utc).isoformat()
-            val_str = str(new_value)
+    Returns:
+        dict: Gepatchte Einträge je entity_id; leer, wenn nichts geschrieben wurde.
+    """
+    if not restore_file.exists():
+        _LOGGER.warning("%s fehlt – nichts zu patchen", restore_file)
+        return {}
 
-            # passenden Eintrag suchen
-            entry = next(
-                (e for e in entries if e["state"]["entity_id"] == entity_id), None
-            )
+    data = json.loads(restore_file.read_text(encoding="utf-8"))
 
-            if entry is None:
-                _LOGGER.warning(
-                    "Kein restore_state-Eintrag für %s – lege neuen an", entity_id
-                )
-                entry = {
-                    "state": {
-                        "entity_id": entity_id,
-                        "state": val_str,
-                        "attributes": {},
-                        "last_changed": now_iso,
-                        "last_reported": now_iso,
-                        "last_updated": now_iso,
-                        "context": {"id": "", "parent_id": None, "user_id": None},
-                    },
-                    "extra_data": {
-                        "native_value": {
-                            "__type": "<class 'decimal.Decimal'>",
-                            "decimal_str": val_str,
-                        },
-                        "native_unit_of_measurement": None,
-                        "source_entity": None,
-                        "last_valid_state": val_str,
-                    },
-                    "last_seen": now_iso,
-                }
-                entries.append(entry)
-            else:
-                # vorhandenen Eintrag patchen
-                entry["state"]["state"] = val_str
-                entry["state"]["last_changed"] = now_iso
-                entry["state"]["last_updated"] = now_iso
-                entry["state"]["last_reported"] = now_iso
-
-                nv = {
-                    "__type": "<class 'decimal.Decimal'>",
-                    "decimal_str": val_str,
-                }
-                entry["extra_data"]["native_value"] = nv
-                entry["extra_data"]["last_valid_state"] = val_str
-                entry["last_seen"] = now_iso
-
-            # restore_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
-            new_data = json.dumps(data, indent=2)
-            write_func = partial(restore_file.write_text, new_data, encoding="utf-8")
-            await self._hass.async_add_executor_job(write_func)
-            _LOGGER.info("restore_state für %s ⇒ %s aktualisiert", entity_id, val_str)
+    if not isinstance(data, dict) or not isinstance(data.get("data"), list):
+        _LOGGER.error("Unerwartiges Format in restore_state – Abbruch")
+        return {}
 
-        except Exception as e:  # pylint:disable=broad-exception-caught
-            _LOGGER.exception("Fehler beim Patchen von restore_state: %s", e)
+    entries = data["data"]
+    index = {
+        entry["state"]["entity_id"]: entry
+        for entry in entries
+        if isinstance(entry, dict) and "state" in entry
+    }
+    now_iso = datetime.now(timezone.utc).isoformat()
+    patched = {}
+
+    for entity_id, new_value in updates.items():
+        val_str = str(new_value)
+        native_value = {"__type": "<class 'decimal.Decimal'>", "decimal_str": val_str}
+        entry = index.get(entity_id)
+
+        if entry is None:
+            _LOGGER.warning(
+                "Kein restore_state-Eintrag für %s – lege neuen an", entity_id
+            )
+            entry = {
+                "state": {
+                    "entity_id": entity_id,
+                    "state": val_str,
+                    "attributes": {},
+                    "last_changed": now_iso,
+                    "last_reported": now_iso,
+                    "last_updated": now_iso,
+                    "context": {"id": "", "parent_id": None, "user_id": None},
+                },
+                "extra_data": {
+                    "native_value": native_value,
+                    "native_unit_of_measurement": None,
+                    "source_entity": None,
+                    "last_valid_state": val_str,
+                },
+                "last_seen": now_iso,
+            }
+            entries.append(entry)
+            index[entity_id] = entry
+        else:
+            # vorhandenen Eintrag patchen
+            entry["state"]["state"] = val_str
+            entry["state"]["last_changed"] = now_iso
+            entry["state"]["last_updated"] = now_iso
+            entry["state"]["last_reported"] = now_iso
+            extra_data = entry.get("extra_data") or {}
+            extra_data["native_value"] = native_value
+            extra_data["last_valid_state"] = val_str
+            entry["extra_data"] = extra_data
+            entry["last_seen"] = now_iso
+
+        patched[entity_id] = entry
+
+    write_utf8_file_atomic(str(restore_file), json.dumps(data))
+    return patched
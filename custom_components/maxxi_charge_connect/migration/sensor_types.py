@@ -0,0 +1,103 @@
+"""Zuordnung der Sensortypen zwischen YAML-Lösung und Integration.
+
+Die Tabelle SENSOR_TYPES beschreibt jede Zuordnung genau einmal. Daraus werden
+beim Import zwei Suffix-Tries erzeugt, einer je Richtung. Ein Trie speichert
+die Suffixe rückwärts, sodass eine Suche vom Ende des Strings aus in O(Länge)
+den längsten passenden Suffix findet – unabhängig von der Reihenfolge der
+Tabelle ("battery_power" vs. "battery_power_charge").
+
+Attributes:
+    SENSOR_TYPES: Tupel (neuer Typ, alter Typ, Suffixe alter unique_ids).
+    RIEMANN_SENSORS: Paare (Suffix der alten Riemann-Quelle, neuer Typ).
+    NEW_TO_OLD: Matcher neuer Typ → alter Typ.
+    OLD_TO_NEW: Matcher alte unique_id → neuer Typ.
+
+Classes:
+    SuffixMatcher: Längster-Suffix-Suche über einen rückwärts gespeicherten Trie.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+# (neuer Typ, alter Typ, Suffixe der unique_ids der YAML-Sensoren)
+SENSOR_TYPES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("battery_power_discharge", "batterie_entladen", ("batterie_entladen",)),
+    ("battery_soe", "ladestand_detail", ("ladestand_detail", "ladestanddetail")),
+    ("battery_power_charge", "batterie_laden", ("batterie_laden",)),
+    ("battery_soc", "ladestand", ("ladestand",)),
+    ("battery_power", "batterie_leistung", ("batterie_leistung",)),
+    ("ccu_power", "ccu_leistung", ("ccu_gesamtleistung",)),
+    ("firmware_version", "ccu_version", ("ccu_version",)),
+    ("deviceid", "deviceid", ("deviceid",)),
+    ("rssi", "wifi_signalstarke_dbm", ("wifi-dbm",)),
+    ("pv_power", "pv_leistung", ("pv_leistung",)),
+    ("power_meter", "e_zaehler_leistungswert", ("e-leistung",)),
+    ("grid_import", "e_zaehler_netzbezug", ("e_zaehler_netzbezug",)),
+    ("grid_export", "e_zaehler_netzeinspeisung", ("e_zaehler_netzeinspeisung",)),
+    ("powermeterip", "konf_lok_meter_ip", ("konf_lok_meter_ip",)),
+    ("maximumpower", "konf_lok_max_leistung", ("konf_lok_max_leistung",)),
+    ("offlineoutputpower", "konf_lok_offline_leistung", ("konf_lok_offline_leistung",)),
+    ("numberofbatteries", "konf_lok_batterien", ("konf_lok_batterien",)),
+    ("outputoffset", "konf_lok_ausgabekorrektur", ("konf_lok_ausgabekorrektur",)),
+    ("responsetolerance", "konf_lok_reak_toleranz", ("konf_lok_reak_toleranz",)),
+    ("minimumbatterydischarge", "konf_lok_min_soc", ("konf_lok_min_soc",)),
+    ("maximumbatterycharge", "konf_lok_max_soc", ("konf_lok_max_soc",)),
+    ("powermetertype", "konf_lok_meter_manu", ("konf_lok_meter_manu",)),
+    ("dc/dc-algorithmus", "konf_dc_algorithm", ("konf_dc_algorithm",)),
+    ("microinverter", "konf_wr", ("konf_wr",)),
+    ("ccuspeed", "konf_ccu_speed", ("konf_ccu_speed",)),
+    ("cloudservice", "konf_lok_cloud", ("konf_lok_cloud",)),
+    ("localserver", "konf_lok_lserver", ("konf_lok_lserver",)),
+    ("apiroute", "konf_api_route", ("konf_api_route",)),
+)
+
+# (Suffix der unique_id der alten Riemann-Quelle, neuer Typ des Energiezählers)
+RIEMANN_SENSORS: tuple[tuple[str, str], ...] = (
+    ("BatterieLaden_1", "batterytotalenergycharge"),
+    ("E-Zaehler_Netzbezug1", "gridimportenergytotal"),
+    ("E-Zaehler Netzeinspeisung", "gridexportenergytotal"),
+    ("Akku_Entladen_1", "batterytotalenergydischarge"),
+    ("PV_Leistung", "pvtotalenergy"),
+)
+
+_END = ""  # Schlüssel für den Wert eines Knotens (kein gültiges Zeichen)
+
+
+class SuffixMatcher:  # pylint: disable=too-few-public-methods
+    """Findet zu einem String den Wert des längsten passenden Suffixes.
+
+    Groß-/Kleinschreibung wird ignoriert.
+    """
+
+    def __init__(self, suffixes: Iterable[tuple[str, str]]) -> None:
+        """Baut den Trie aus Paaren (Suffix, Wert) auf.
+
+        Raises:
+            ValueError: Wenn ein Suffix mit zwei verschiedenen Werten vorkommt.
+        """
+        self._root: dict = {}
+        for suffix, value in suffixes:
+            node = self._root
+            for char in reversed(suffix.lower()):
+                node = node.setdefault(char, {})
+            if node.get(_END, value) != value:
+                raise ValueError(f"Mehrdeutiger Suffix: {suffix}")
+            node[_END] = value
+
+    def match(self, value: str) -> str | None:
+        """Liefert den Wert des längsten Suffixes von value oder None."""
+        node = self._root
+        found = None
+        for char in reversed(value.lower()):
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(_END, found)
+        return found
+
+
+NEW_TO_OLD = SuffixMatcher((new, old) for new, old, _ in SENSOR_TYPES)
+OLD_TO_NEW = SuffixMatcher(
+    (suffix, new) for new, _, suffixes in SENSOR_TYPES for suffix in suffixes
+)
@@ -0,0 +1,123 @@
+"""Umbenennen von entity_ids in den YAML-Dateien der Konfiguration.
+
+Das Konfigurationsverzeichnis wird genau einmal durchlaufen und jede
+YAML-Datei genau einmal gelesen. Alle Mappings werden mit einem gemeinsamen
+regulären Ausdruck ersetzt; nur geänderte Dateien werden (atomar)
+geschrieben. Blockierend, wird im Executor ausgeführt.
+
+Functions:
+    rewrite_entity_ids: Ersetzt alle Mappings und liefert einen Diff-Bericht.
+"""
+
+from __future__ import annotations
+
+import difflib
+import logging
+import os
+import re
+
+from homeassistant.util.file import write_utf8_file_atomic
+
+_LOGGER = logging.getLogger(__name__)
+
+# Verzeichnisse, die nicht durchsucht werden (zusätzlich alle versteckten)
+SKIP_DIRS = frozenset({"deps", "backups", "backup", "__pycache__"})
+
+YAML_SUFFIXES = (".yaml", ".yml")
+
+
+def build_pattern(mappings: list[tuple[str, str]]) -> re.Pattern | None:
+    """Erzeugt ein gemeinsames Muster für alle alten entity_ids.
+
+    Wie bisher gelten Wortgrenzen: "sensor.alt" passt nicht in "sensor.alt_2".
+    Längere IDs stehen vorne, damit bei gemeinsamen Präfixen die längste passt.
+
+    Returns:
+        re.Pattern | None: Das Muster oder None ohne Mappings.
+    """
+    olds = sorted({old for old, _ in mappings}, key=len, reverse=True)
+    if not olds:
+        return None
+    return re.compile(r"\b(?:" + "|".join(re.escape(old) for old in olds) + r")\b")
+
+
+def rewrite_entity_ids(
+    base_path: str, mappings: list[tuple[str, str]], dry_run: bool = False
+) -> dict:
+    """Ersetzt alle alten entity_ids in einem Durchlauf.
+
+    Args:
+        base_path (str): Das Konfigurationsverzeichnis.
+        mappings (list[tuple[str, str]]): Paare (alte entity_id, neue entity_id).
+        dry_run (bool): Nur berichten, keine Datei schreiben.
+
+    Returns:
+        dict: {"scanned": Anzahl gelesener Dateien, "replacements": Anzahl
+        Ersetzungen, "files": {Pfad: {"replacements": n, "diff": Unified-Diff}}}.
+    """
+    report: dict = {"scanned": 0, "replacements": 0, "files": {}}
+    replacements = {old: new for old, new in mappings if old and new and old != new}
+    pattern = build_pattern(list(replacements.items()))
+    if pattern is None:
+        return report
+
+    for root, dirs, files in os.walk(base_path):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS]
+
+        for file in files:
+            if not file.endswith(YAML_SUFFIXES):
+                continue
+            file_path = os.path.join(root, file)
+            try:
+                _rewrite_file(file_path, pattern, replacements, dry_run, report)
+            except Exception as e:  # pylint:disable=broad-exception-caught
+                _LOGGER.error("Fehler beim Bearbeiten von %s: %s", file_path, e)
+
+    _LOGGER.info(
+        "YAML: %d Datei(en) gelesen, %d Ersetzung(en) in %d Datei(en)",
+        report["scanned"],
+        report["replacements"],
+        len(report["files"]),
+    )
+    return report
+
+
+def _rewrite_file(
+    file_path: str,
+    pattern: re.Pattern,
+    replacements: dict[str, str],
+    dry_run: bool,
+    report: dict,
+) -> None:
+    """Ersetzt die entity_ids in einer Datei und trägt sie in den Bericht ein."""
+    with open(file_path, encoding="utf-8") as f:
+        content = f.read()
+    report["scanned"] += 1
+
+    new_content, count = pattern.subn(
+        lambda match: replacements[match.group(0)], content
+    )
+    if not count:
+        return
+
+    if not dry_run:
+        write_utf8_file_atomic(file_path, new_content)
+    report["replacements"] += count
+    report["files"][file_path] = {
+        "replacements": count,
+        "diff": "".join(
+            difflib.unified_diff(
+                content.splitlines(keepends=True),
+                new_content.splitlines(keepends=True),
+                fromfile=file_path,
+                tofile=file_path,
+                n=0,
+            )
+        ),
+    }
+    _LOGGER.info(
+        "%s in Datei: %s (%d×)",
+        "Zu ersetzen" if dry_run else "Ersetzt",
+        file_path,
+        count,
+    )
@@ -20,6 +20,7 @@ from .const import (
 from .winterbetrieb.winter_min_charge import WinterMinCharge
 from .winterbetrieb.winter_max_charge import WinterMaxCharge
 from .winterbetrieb.summer_min_charge import SummerMinCharge
+from .tools import get_entry_data
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -125,12 +126,12 @@ async def async_setup_entry(
         DEFAULT_WINTER_MIN_CHARGE
     )
 
-    # Winterbetrieb-Daten zentral speichern
+    # Winterbetrieb-Daten je Eintrag speichern
     winter_data = {
         CONF_WINTER_MIN_CHARGE: winter_min,
         CONF_WINTER_MAX_CHARGE: winter_max
     }
-    hass.data.setdefault(DOMAIN, {}).update(winter_data)
+    get_entry_data(hass, entry.entry_id).update(winter_data)
 
     # Winterbetrieb-Entities
     winter_entities = [
@@ -19,7 +19,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers import issue_registry as ir
 
-from ..tools import fire_status_event
+from ..tools import async_dispatch_proxy_frame, fire_status_event
 
 from ..const import (
     CONF_DEVICE_ID,
@@ -442,7 +442,10 @@ class MaxxiProxyServer:
         await self._on_reverse_proxy_message(data, forwarded)
 
     async def _on_reverse_proxy_message(self, json_data: dict, forwarded: bool):
+        # Event für Automationen; die Sensoren erhalten die Daten pro Gerät
+        # über den Dispatcher
         await fire_status_event(self.hass, json_data, forwarded)
+        async_dispatch_proxy_frame(self.hass, json_data)
         # self.hass.bus.async_fire(
         #     PROXY_STATUS_EVENTNAME,
         #     {
@@ -1,14 +1,15 @@
 """Dieses Modul initialisiert und registriert die Sensor-Entitäten für die
 MaxxiChargeConnect-Integration in Home Assistant.
 
-Es verwaltet die Sensoren über den BatterySensorManager pro ConfigEntry
-und fügt alle relevanten Sensoren
+Es verwaltet die Sensoren über den BatterySensorManager und den
+ConverterSensorManager pro ConfigEntry und fügt alle relevanten Sensoren
 beim Setup hinzu. Sensoren umfassen unter anderem Geräte-ID, Batteriestatus,
 PV-Leistung, Netzbezug/-einspeisung
 und zugehörige Energie-Statistiken.
 
 Module-Level Variable:
     SENSOR_MANAGER (dict): Verwaltung der BatterySensorManager Instanzen, keyed nach entry_id.
+    CONVERTER_MANAGER (dict): Verwaltung der ConverterSensorManager Instanzen, keyed nach entry_id.
 
 """
 
@@ -22,6 +23,7 @@ from .devices.battery_power import BatteryPower
 from .devices.battery_power_charge import BatteryPowerCharge
 from .devices.battery_power_discharge import BatteryPowerDischarge
 from .devices.battery_sensor_manager import BatterySensorManager
+from .devices.converter_sensor_manager import ConverterSensorManager
 from .devices.battery_soc import BatterySoc
 from .devices.battery_soe import BatterySoE
 from .devices.battery_today_energy_charge import BatteryTodayEnergyCharge
@@ -32,6 +34,9 @@ from .devices.ccu_energy_today import CcuEnergyToday
 from .devices.ccu_energy_total import CcuEnergyTotal
 from .devices.ccu_power import CcuPower
 from .devices.device_id import DeviceId
+from .devices.energy_accumulator import EnergyAccumulator
+from .devices.frame_archive import FrameArchive
+from .devices.frame_buffer import FrameBuffer
 from .devices.firmware_version import FirmwareVersion
 from .devices.grid_export import GridExport
 from .devices.grid_export_energy_today import GridExportEnergyToday
@@ -63,10 +68,22 @@ from .devices.online_status_sensor import OnlineStatusSensor
 from .devices.ccu_temperatur_sensor import CCUTemperaturSensor
 
 from .devices.send_count import SendCount
-
-from .const import DOMAIN
+from .winterbetrieb.winter_controller import WinterModeController
+from .winterbetrieb.winter_mode_state import WinterModeState
+
+from .const import (
+    CONF_FRAME_ARCHIVE,
+    DEFAULT_FRAME_ARCHIVE,
+    DOMAIN,
+    ENERGY_ACCUMULATOR,
+    ENERGY_ENTITIES,
+    FRAME_ARCHIVE,
+    FRAME_BUFFER,
+    WINTER_CONTROLLER,
+)
 
 SENSOR_MANAGER = {}  # key: entry_id → value: BatterySensorManager
+CONVERTER_MANAGER = {}  # key: entry_id → value: ConverterSensorManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,6 +114,22 @@ async def async_setup_entry(  # pylint: disable=too-many-locals, too-many-statem
     SENSOR_MANAGER[entry.entry_id] = manager
     await manager.setup()
 
+    # Ringpuffer der letzten Frames (nutzt die Batteriespalten des Managers)
+    frame_buffer = FrameBuffer(hass, entry, manager.columns)
+    hass.data[DOMAIN][entry.entry_id][FRAME_BUFFER] = frame_buffer
+    frame_buffer.setup()
+
+    # Optionales Tagesarchiv der Rohdaten
+    if entry.options.get(CONF_FRAME_ARCHIVE, DEFAULT_FRAME_ARCHIVE):
+        frame_archive = FrameArchive(hass, entry, manager.columns)
+        hass.data[DOMAIN][entry.entry_id][FRAME_ARCHIVE] = frame_archive
+        frame_archive.setup()
+
+    # ConverterSensorManager initialisieren
+    converter_manager = ConverterSensorManager(hass, entry, async_add_entities)
+    CONVERTER_MANAGER[entry.entry_id] = converter_manager
+    await converter_manager.setup()
+
     # Coordinator initialisieren mit Fehlerbehandlung
     try:
         coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
@@ -112,7 +145,9 @@ async def async_setup_entry(  # pylint: disable=too-many-locals, too-many-statem
     pv_power_sensor = PvPower(entry)
     battery_power_charge = BatteryPowerCharge(entry)
     battery_power_discharge = BatteryPowerDischarge(entry)
-    battery_soc = BatterySoc(entry)
+    winter_controller = WinterModeController(hass, entry)
+    hass.data[DOMAIN][entry.entry_id][WINTER_CONTROLLER] = winter_controller
+    battery_soc = BatterySoc(entry, winter_controller)
     battery_soe = BatterySoE(entry)
     power_meter = PowerMeter(entry)
     firmware_version = FirmwareVersion(entry)
@@ -125,6 +160,7 @@ async def async_setup_entry(  # pylint: disable=too-many-locals, too-many-statem
     uptime_sensor = UptimeSensor(entry)
     online_status_sensor = OnlineStatusSensor(entry)
     ccu_temperatur_sensor = CCUTemperaturSensor(entry)
+    ccu_temperatur_sensor.column_cache = converter_manager.columns
     status_sensor = StatusSensor(entry)
 
     # Http-Scan Sensoren
@@ -174,6 +210,7 @@ async def async_setup_entry(  # pylint: disable=too-many-locals, too-many-statem
             battery_power_charge,
             battery_power_discharge,
             battery_soc,
+            WinterModeState(entry, winter_controller),
             battery_power,
             power_meter,
             firmware_version,
@@ -191,48 +228,65 @@ async def async_setup_entry(  # pylint: disable=too-many-locals, too-many-statem
         ]
     )
 
-    # Energie-Sensoren erstellen
-    pv_today_energy = PvTodayEnergy(hass, entry, pv_power_sensor.entity_id)
-    pv_total_energy = PvTotalEnergy(hass, entry, pv_power_sensor.entity_id)
-    ccu_energy_today = CcuEnergyToday(hass, entry, ccu_power.entity_id)
-    ccu_energy_total = CcuEnergyTotal(hass, entry, ccu_power.entity_id)
+    # Gemeinsamer Energiezähler für alle Energie-Sensoren dieses Eintrags
+    accumulator = EnergyAccumulator(hass, entry)
+    hass.data[DOMAIN][entry.entry_id][ENERGY_ACCUMULATOR] = accumulator
+    await accumulator.setup()
+
+    # Energie-Sensoren erstellen (Ansichten auf den Zähler)
+    pv_today_energy = PvTodayEnergy(
+        hass, entry, pv_power_sensor.entity_id, accumulator
+    )
+    pv_total_energy = PvTotalEnergy(
+        hass, entry, pv_power_sensor.entity_id, accumulator
+    )
+    ccu_energy_today = CcuEnergyToday(hass, entry, ccu_power.entity_id, accumulator)
+    ccu_energy_total = CcuEnergyTotal(hass, entry, ccu_power.entity_id, accumulator)
 
     battery_today_energy_charge = BatteryTodayEnergyCharge(
-        hass, entry, battery_power_charge.entity_id
+        hass, entry, battery_power_charge.entity_id, accumulator
     )
     battery_today_energy_discharge = BatteryTodayEnergyDischarge(
-        hass, entry, battery_power_discharge.entity_id
+        hass, entry, battery_power_discharge.entity_id, accumulator
     )
     battery_total_energy_charge = BatteryTotalEnergyCharge(
-        hass, entry, battery_power_charge.entity_id
+        hass, entry, battery_power_charge.entity_id, accumulator
     )
     battery_total_energy_discharge = BatteryTotalEnergyDischarge(
-        hass, entry, battery_power_discharge.entity_id
+        hass, entry, battery_power_discharge.entity_id, accumulator
     )
 
-    grid_export_energy_today = GridExportEnergyToday(hass, entry, grid_export.entity_id)
-    grid_export_energy_total = GridExportEnergyTotal(hass, entry, grid_export.entity_id)
-    grid_import_energy_today = GridImportEnergyToday(hass, entry, grid_import.entity_id)
-    grid_import_energy_total = GridImportEnergyTotal(hass, entry, grid_import.entity_id)
+    grid_export_energy_today = GridExportEnergyToday(
+        hass, entry, grid_export.entity_id, accumulator
+    )
+    grid_export_energy_total = GridExportEnergyTotal(
+        hass, entry, grid_export.entity_id, accumulator
+    )
+    grid_import_energy_today = GridImportEnergyToday(
+        hass, entry, grid_import.entity_id, accumulator
+    )
+    grid_import_energy_total = GridImportEnergyTotal(
+        hass, entry, grid_import.entity_id, accumulator
+    )
 
     pv_self_consumption_today = PvSelfConsumptionEnergyToday(
-        hass, entry, pv_self_consumption.entity_id
+        hass, entry, pv_self_consumption.entity_id, accumulator
     )
     pv_self_consumption_total = PvSelfConsumptionEnergyTotal(
-        hass, entry, pv_self_consumption.entity_id
+        hass, entry, pv_self_consumption.entity_id, accumulator
     )
 
     consumption_energy_today = ConsumptionEnergyToday(
-        hass, entry, power_consumption.entity_id
+        hass, entry, power_consumption.entity_id, accumulator
     )
     consumption_energy_total = ConsumptionEnergyTotal(
-        hass, entry, power_consumption.entity_id
+        hass, entry, power_consumption.entity_id, accumulator
     )
 
     send_count = SendCount(entry)
 
     # Energie-Sensoren hinzufügen
-    energy_entities = [
+    integral_entities = [
         pv_today_energy,
         pv_total_energy,
         ccu_energy_today,
@@ -249,21 +303,10 @@ async def async_setup_entry(  # pylint: disable=too-many-locals, too-many-statem
         pv_self_consumption_total,
         consumption_energy_today,
         consumption_energy_total,
-        send_count,
     ]
-    async_add_entities(energy_entities)
-
-    # Energie-Entities zentral in hass.data speichern
-    energy_data = {
-        pv_total_energy.unique_id: pv_total_energy,
-        pv_today_energy.unique_id: pv_today_energy,
-        battery_total_energy_charge.unique_id: battery_total_energy_charge,
-        battery_today_energy_charge.unique_id: battery_today_energy_charge,
-        battery_total_energy_discharge.unique_id: battery_total_energy_discharge,
-        battery_today_energy_discharge.unique_id: battery_today_energy_discharge,
-        grid_export_energy_total.unique_id: grid_export_energy_total,
-        grid_export_energy_today.unique_id: grid_export_energy_today,
-        grid_import_energy_total.unique_id: grid_import_energy_total,
-        grid_import_energy_today.unique_id: grid_import_energy_today,
+    async_add_entities([*integral_entities, send_count])
+
+    # Energie-Entities des Eintrags nach unique_id (z.B. für die Migration)
+    hass.data[DOMAIN][entry.entry_id][ENERGY_ENTITIES] = {
+        entity.unique_id: entity for entity in integral_entities
     }
-    hass.data.setdefault(DOMAIN, {}).update(energy_data)
@@ -5,6 +5,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .winterbetrieb.winter_forecast import WinterForecast
 from .winterbetrieb.winterbetrieb import Winterbetrieb
 
 # _LOGGER = logging.getLogger(__name__)
@@ -16,4 +17,4 @@ async def async_setup_entry(
     """Setup switches for MaxxiCharge Connect integration."""
 
     winterbetrieb = Winterbetrieb(entry)
-    async_add_entities([winterbetrieb])
+    async_add_entities([winterbetrieb, WinterForecast(entry)])
@@ -17,11 +17,13 @@ import logging
 import re
 from typing import Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 
 
 from .const import (
+    ERRORS,
     PROXY_ERROR_CCU,
     PROXY_ERROR_CODE,
     PROXY_ERROR_DEVICE_ID,
@@ -36,6 +38,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity-Domains, auf denen die Integration Entitäten anlegt
+ENTITY_DOMAINS = ("sensor", "number", "switch")
+
 
 async def fire_status_event(hass: HomeAssistant, json_data: dict, forwarded: bool, event_name: str = PROXY_STATUS_EVENTNAME):
     """Feuert ein Status-Event zum Anzeigen des Fehlers in der UI."""
@@ -59,6 +64,47 @@ async def fire_status_event(hass: HomeAssistant, json_data: dict, forwarded: boo
     )
 
 
+def proxy_frame_signal(device_id: str) -> str:
+    """Dispatcher-Signal für die Proxy-Daten eines Geräts."""
+    return f"{DOMAIN}_{device_id}_frame"
+
+
+def proxy_error_signal(device_id: str) -> str:
+    """Dispatcher-Signal für die Proxy-Fehlermeldungen eines Geräts."""
+    return f"{DOMAIN}_{device_id}_error"
+
+
+def entry_signal(signal: str, entry_id: str) -> str:
+    """Dispatcher-Signal, das nur die Entitäten eines Eintrags erreicht."""
+    return f"{signal}_{entry_id}"
+
+
+def get_entry_data(hass: HomeAssistant, entry_id: str) -> dict:
+    """Liefert den Datencontainer eines Eintrags in hass.data[DOMAIN].
+
+    Der Winter- und Sommerbetrieb wird je Eintrag hier abgelegt, damit sich
+    mehrere Geräte nicht gegenseitig beeinflussen.
+    """
+    return hass.data.setdefault(DOMAIN, {}).setdefault(entry_id, {})
+
+
+@callback
+def async_dispatch_proxy_frame(hass: HomeAssistant, json_data: dict) -> None:
+    """Leitet Proxy-Daten nur an die Empfänger des betroffenen Geräts weiter.
+
+    Normale Daten gehen an proxy_frame_signal(deviceId). Fehlermeldungen
+    (deviceId == ERRORS) nennen das Gerät im Feld ccu und gehen an
+    proxy_error_signal(ccu).
+    """
+    device_id = json_data.get(PROXY_ERROR_DEVICE_ID)
+    if device_id == ERRORS:
+        ccu = json_data.get(PROXY_ERROR_CCU)
+        if ccu:
+            async_dispatcher_send(hass, proxy_error_signal(ccu), json_data)
+    elif device_id:
+        async_dispatcher_send(hass, proxy_frame_signal(device_id), json_data)
+
+
 def validate_numeric_value(
     value: float, value_name: str, min_val: float, max_val: float
 ) -> bool:
@@ -199,34 +245,62 @@ def as_float(value: str) -> Optional[float]:
     Returns:
         float: Die extrahierte Zahl oder None
 
+    """
+    return split_value(value)[0]
+
+
+_NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def split_value(value: str) -> tuple[Optional[float], Optional[str]]:
+    """Zerlegt einen String in Zahlenwert und Einheit.
+
+    Aus "800 W" wird (800.0, "W"). Die Zahl wird wie bei `as_float`
+    ermittelt, die Einheit ist der Rest des Strings hinter der Zahl.
+    Gibt es keinen Rest, ist die Einheit None.
+
+    Args:
+        value (str): Der zu zerlegende String
+
+    Returns:
+        tuple: (Zahl oder None, Einheit oder None)
+
     """
     if not isinstance(value, str):
         value = str(value)
 
-    if value is not None:
-        # match = re.search(r"[\d.]+", value)
-        match = re.search(r"-?\d+(?:\.\d+)?", value)
+    match = _NUMBER_PATTERN.search(value)
+    if not match:
+        return None, None
 
-        if match:
-            return float(match.group())
+    unit = value[match.end():].strip()
+    return float(match.group()), unit or None
 
-    return None
 
+def get_entity(
+    hass: HomeAssistant, plattform: str, unique_id: str, domain: Optional[str] = None
+):
+    """Liefert den Registry-Eintrag einer Entity anhand der unique_id.
+
+    Die Suche nutzt den Index der Entity-Registry über
+    (domain, platform, unique_id) statt alle Entitäten zu durchlaufen.
+    Ist keine Domain angegeben, werden die Domains der Integration geprüft.
 
-def get_entity(hass: HomeAssistant, plattform: str, unique_id: str):
-    """Liefert die entity_id einer Entity anhand der unique_id.
     Args:
         hass (HomeAssistant): Die Home Assistant Instanz
-        plattform (str): Die Plattform der Entity, z.B. "number"
+        plattform (str): Die Plattform der Entity, z.B. "maxxi_charge_connect"
         unique_id (str): Die unique_id der Entity
+        domain (str | None): Die Entity-Domain, z.B. "number"
     Returns:
-        str | None: Die entity_id der Entity oder None, wenn nicht gefunden
+        RegistryEntry | None: Der Registry-Eintrag oder None, wenn nicht gefunden
     """
     entity_registry = async_get_entity_registry(hass)
+    domains = (domain,) if domain else ENTITY_DOMAINS
 
-    for entity in entity_registry.entities.values():
-        if plattform == entity.platform and entity.unique_id == unique_id:
-            return entity
+    for cur_domain in domains:
+        entity_id = entity_registry.async_get_entity_id(cur_domain, plattform, unique_id)
+        if entity_id is not None:
+            return entity_registry.async_get(entity_id)
 
     return None
 
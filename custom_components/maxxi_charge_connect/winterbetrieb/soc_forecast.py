@@ -0,0 +1,178 @@
+"""Prognose des SOC-Verlaufs für den Winterbetrieb.
+
+SocForecast hält ein gleitendes Fenster aus SOC- und Batterieleistungs-Samples
+und passt über laufende Summen eine Ausgleichsgerade SOC(t) an. Ein neues
+Sample und jedes aus dem Fenster fallende Sample ändern die Summen in O(1).
+
+Aus der Steigung wird die Zeit bis zum Erreichen einer Schwelle berechnet.
+Solange das Fenster für eine Ausgleichsgerade zu kurz ist, wird die Rate aus
+der mittleren Batterieleistung und der Kapazität abgeschätzt.
+
+Classes:
+    SocForecast: Gleitendes Fenster mit inkrementeller Ausgleichsgerade.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Optional
+
+# Länge des Fensters in Sekunden
+DEFAULT_WINDOW_SECONDS = 900.0
+
+# Obergrenze der Samples im Fenster (begrenzt den Speicher bei dichten Frames)
+MAX_SAMPLES = 1024
+
+# Mindestanforderungen für die Ausgleichsgerade
+MIN_SAMPLES = 5
+MIN_SPAN_SECONDS = 60.0
+
+# Kleinere Raten (%/s) gelten als Stillstand, es gibt keine Prognose
+MIN_RATE = 1e-5
+
+
+class SocForecast:
+    """Gleitendes Fenster aus SOC-Samples mit inkrementeller Ausgleichsgerade.
+
+    Die Zeiten werden relativ zu einem Bezugspunkt summiert. Liegt das Fenster
+    weit hinter dem Bezugspunkt, werden die Summen einmalig neu berechnet
+    (amortisiert O(1)), damit die Differenzen numerisch stabil bleiben.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_samples: int = MAX_SAMPLES,
+    ) -> None:
+        """Initialisiert ein leeres Fenster.
+
+        Args:
+            window_seconds (float): Zeitspanne des Fensters in Sekunden.
+            max_samples (int): Maximale Anzahl Samples im Fenster.
+        """
+        self.window_seconds = window_seconds
+        self._max_samples = max_samples
+        self._samples: deque[tuple[float, float, Optional[float]]] = deque()
+        self._t0 = 0.0
+        self._sum_t = 0.0
+        self._sum_s = 0.0
+        self._sum_tt = 0.0
+        self._sum_ts = 0.0
+        self._power_sum = 0.0
+        self._power_count = 0
+        self._capacity_wh: Optional[float] = None
+
+    def __len__(self) -> int:
+        """Anzahl der Samples im Fenster."""
+        return len(self._samples)
+
+    def reset(self) -> None:
+        """Verwirft alle Samples."""
+        self._samples.clear()
+        self._sum_t = self._sum_s = self._sum_tt = self._sum_ts = 0.0
+        self._power_sum = 0.0
+        self._power_count = 0
+
+    def add(
+        self,
+        timestamp: float,
+        soc: float,
+        power: Optional[float] = None,
+        energy_wh: Optional[float] = None,
+    ) -> None:
+        """Fügt ein Sample hinzu und entfernt die aus dem Fenster gefallenen.
+
+        Args:
+            timestamp (float): Monotone Zeit in Sekunden.
+            soc (float): SOC in Prozent.
+            power (float | None): Batterieleistung in W (positiv = Laden).
+            energy_wh (float | None): Gespeicherte Energie in Wh.
+        """
+        if self._samples:
+            last = self._samples[-1][0]
+            if timestamp < last:
+                # Zeitsprung rückwärts: Fenster neu beginnen
+                self.reset()
+            elif timestamp == last:
+                return
+
+        if not self._samples:
+            self._t0 = timestamp
+        elif timestamp - self._t0 > 4 * self.window_seconds:
+            self._rebase()
+
+        self._samples.append((timestamp, soc, power))
+        self._accumulate(timestamp, soc, power, 1)
+
+        if energy_wh is not None and soc > 0:
+            self._capacity_wh = energy_wh * 100.0 / soc
+
+        samples = self._samples
+        while len(samples) > self._max_samples or (
+            timestamp - samples[0][0] > self.window_seconds
+        ):
+            old_t, old_soc, old_power = samples.popleft()
+            self._accumulate(old_t, old_soc, old_power, -1)
+
+    def _accumulate(
+        self, timestamp: float, soc: float, power: Optional[float], sign: int
+    ) -> None:
+        t = timestamp - self._t0
+        self._sum_t += sign * t
+        self._sum_s += sign * soc
+        self._sum_tt += sign * t * t
+        self._sum_ts += sign * t * soc
+        if power is not None:
+            self._power_sum += sign * power
+            self._power_count += sign
+
+    def _rebase(self) -> None:
+        """Legt den Bezugspunkt auf das älteste Sample und summiert neu."""
+        samples = list(self._samples)
+        self.reset()
+        self._t0 = samples[0][0]
+        for timestamp, soc, power in samples:
+            self._samples.append((timestamp, soc, power))
+            self._accumulate(timestamp, soc, power, 1)
+
+    def slope(self) -> Optional[float]:
+        """Steigung der Ausgleichsgerade in %/s oder None, wenn unbestimmt."""
+        n = len(self._samples)
+        if n < MIN_SAMPLES:
+            return None
+        if self._samples[-1][0] - self._samples[0][0] < MIN_SPAN_SECONDS:
+            return None
+        denom = n * self._sum_tt - self._sum_t * self._sum_t
+        if denom <= 0:
+            return None
+        return (n * self._sum_ts - self._sum_t * self._sum_s) / denom
+
+    def power_rate(self) -> Optional[float]:
+        """Rate in %/s aus mittlerer Batterieleistung und Kapazität."""
+        if self._power_count <= 0 or not self._capacity_wh:
+            return None
+        mean_power = self._power_sum / self._power_count
+        return mean_power / self._capacity_wh * 100.0 / 3600.0
+
+    def rate(self) -> Optional[float]:
+        """Lade-/Entladerate in %/s (positiv = Laden) oder None."""
+        slope = self.slope()
+        return slope if slope is not None else self.power_rate()
+
+    def seconds_until(self, threshold: float) -> Optional[float]:
+        """Zeit bis zum Erreichen von threshold.
+
+        Args:
+            threshold (float): Schwelle in Prozent.
+
+        Returns:
+            float | None: Sekunden bis zur Schwelle; None, wenn keine Rate
+            bekannt ist oder sich der SOC von der Schwelle entfernt.
+        """
+        if not self._samples:
+            return None
+        rate = self.rate()
+        if rate is None or abs(rate) < MIN_RATE:
+            return None
+        seconds = (threshold - self._samples[-1][1]) / rate
+        return seconds if seconds >= 0 else None
@@ -6,6 +6,10 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, PERCENTAGE
 from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 
 from ..const import (
         DEVICE_INFO,
@@ -16,6 +20,7 @@ from ..const import (
         EVENT_SUMMER_MIN_CHARGE_CHANGED,
         CONF_WINTER_MODE
     )
+from ..tools import entry_signal, get_entry_data
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,9 +58,8 @@ class SummerMinCharge(NumberEntity):
 
         self._attr_native_value = value
 
-        # in hass.data spiegeln (für Logik / Availability)
-        self.hass.data.setdefault(DOMAIN, {})
-        self.hass.data[DOMAIN][CONF_SUMMER_MIN_CHARGE] = value
+        # in hass.data des Eintrags spiegeln (für Logik / Availability)
+        get_entry_data(self.hass, self._entry.entry_id)[CONF_SUMMER_MIN_CHARGE] = value
 
         # persistent speichern
         self.hass.config_entries.async_update_entry(
@@ -70,12 +74,13 @@ class SummerMinCharge(NumberEntity):
         self._notify_dependents()
 
     async def async_added_to_hass(self):
-        """Registriert den Listener, wenn die Entität hinzugefügt wird."""
+        """Registriert den Listener auf das Signal dieses Eintrags."""
 
-        self._remove_listener = self.hass.bus.async_listen(
-            WINTER_MODE_CHANGED_EVENT,
-            self._handle_winter_mode_changed
-            )
+        self._remove_listener = async_dispatcher_connect(
+            self.hass,
+            entry_signal(WINTER_MODE_CHANGED_EVENT, self._entry.entry_id),
+            self._handle_winter_mode_changed,
+        )
 
         self.async_write_ha_state()
 
@@ -90,22 +95,24 @@ class SummerMinCharge(NumberEntity):
         if self._attr_native_value is None:
             return
 
-        self.hass.bus.async_fire(
-            EVENT_SUMMER_MIN_CHARGE_CHANGED,
-            {"value": self._attr_native_value},
+        async_dispatcher_send(
+            self.hass,
+            entry_signal(EVENT_SUMMER_MIN_CHARGE_CHANGED, self._entry.entry_id),
+            self._attr_native_value,
         )
 
     @property
     def available(self) -> bool:
-        _LOGGER.debug("WinterMinCharge available abgefragt: %s", self.hass.data[DOMAIN].get(CONF_WINTER_MODE, False))
-        return not self.hass.data[DOMAIN].get(CONF_WINTER_MODE, False)
+        winter_mode = get_entry_data(self.hass, self._entry.entry_id).get(
+            CONF_WINTER_MODE, False
+        )
+        _LOGGER.debug("SummerMinCharge available abgefragt: %s", winter_mode)
+        return not winter_mode
 
     @callback
-    def _handle_winter_mode_changed(self, event):  # Pylint: disable=unused-argument
-        """Handle winter mode changed event."""
-        winter_enabled = event.data.get("enabled", False)
-
-        if not winter_enabled:
+    def _handle_winter_mode_changed(self, enabled):
+        """Handle winter mode changed signal."""
+        if not enabled:
             self._notify_dependents()
 
         self.async_write_ha_state()
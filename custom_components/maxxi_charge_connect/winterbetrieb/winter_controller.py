@@ -0,0 +1,294 @@
+"""Steuerung des Winterbetriebs als Hysterese-Zustandsautomat.
+
+Im Winterbetrieb pendelt minSOC zwischen zwei Werten:
+
+- Fällt der SOC auf WinterMinCharge, wird minSOC auf WinterMaxCharge gesetzt
+  (Zustand "charge": der Speicher wird nicht weiter entladen).
+- Erreicht der SOC WinterMaxCharge, wird minSOC auf WinterMinCharge gesetzt
+  (Zustand "discharge": der Speicher darf wieder entladen werden).
+
+Dazwischen liegt das Hysterese-Band. Pro Frame wird in einem bekannten Zustand
+nur der SOC mit der Schwelle verglichen, die den Zustand verlässt. Die
+minSOC-Entität wird einmal gesucht und zwischengespeichert; geschrieben wird
+nur beim Zustandswechsel, mit höchstens einem Schreibvorgang gleichzeitig.
+
+Im Prognose-Modus (CONF_WINTER_FORECAST) schätzt ein SocForecast die Lade- bzw.
+Entladerate. Wird die Schwelle voraussichtlich innerhalb von
+FORECAST_LEAD_SECONDS erreicht, wechselt der Zustand schon vorher, sodass der
+SOC im Band bleibt. Der erwartete Zeitpunkt wird als Attribut angezeigt.
+
+Classes:
+    WinterModeController: Zustandsautomat eines ConfigEntries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+
+from ..const import (
+    CONF_WINTER_FORECAST,
+    CONF_WINTER_MAX_CHARGE,
+    CONF_WINTER_MIN_CHARGE,
+    CONF_WINTER_MODE,
+    DEFAULT_WINTER_FORECAST,
+    DEFAULT_WINTER_MAX_CHARGE,
+    DEFAULT_WINTER_MIN_CHARGE,
+    DOMAIN,
+)
+from ..devices.energy_integrator import frame_battery_energy, frame_battery_power
+from ..tools import get_entry_data
+from .soc_forecast import SocForecast
+
+_LOGGER = logging.getLogger(__name__)
+
+# Verzögerung/Wiederholungen beim Schreiben von minSOC
+WINTER_MODE_CHANGE_DELAY = 5
+
+# Vorlauf, mit dem der Prognose-Modus vor der Schwelle umschaltet (Sekunden)
+FORECAST_LEAD_SECONDS = 120.0
+
+STATE_OFF = "off"  # Winterbetrieb ausgeschaltet
+STATE_WAITING = "waiting"  # noch kein Zustand bestimmt, wartet auf eine Schwelle
+STATE_CHARGE = "charge"  # minSOC = WinterMaxCharge
+STATE_DISCHARGE = "discharge"  # minSOC = WinterMinCharge
+
+STATES = [STATE_OFF, STATE_WAITING, STATE_CHARGE, STATE_DISCHARGE]
+
+
+def winter_state_signal(entry_id: str) -> str:
+    """Dispatcher-Signal für Zustandswechsel des Winterbetriebs eines Eintrags."""
+    return f"{DOMAIN}_{entry_id}_winter_state"
+
+
+class WinterModeController:
+    """Hysterese-Zustandsautomat für den Winterbetrieb eines ConfigEntries.
+
+    Attribute:
+        state (str): Aktueller Zustand (siehe STATES).
+        writes (int): Anzahl der Schreibvorgänge auf minSOC.
+        forecast (SocForecast): Gleitendes Fenster der SOC-Samples.
+        predicted_crossing (datetime | None): Erwartetes Erreichen der Schwelle.
+        early_transitions (int): Anzahl der vorgezogenen Zustandswechsel.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialisiert den Controller im Zustand "waiting"."""
+        self.hass = hass
+        self._entry = entry
+        self.state = STATE_WAITING
+        self.writes = 0
+        self._limits: tuple[float, float] | None = None
+        self._min_soc_entity = None
+        self._target: float | None = None
+        self._task: asyncio.Task | None = None
+        self.forecast = SocForecast()
+        self.predicted_crossing: datetime | None = None
+        self.early_transitions = 0
+
+    @property
+    def pending(self) -> float | None:
+        """Der Wert, der gerade auf minSOC geschrieben wird, oder None."""
+        if self._task is None or self._task.done():
+            return None
+        return self._target
+
+    def attributes(self) -> dict[str, Any]:
+        """Liefert Schwellen und laufenden Schreibvorgang für den Zustandssensor."""
+        winter_min, winter_max = self._limits or (None, None)
+        return {
+            "winter_min_charge": winter_min,
+            "winter_max_charge": winter_max,
+            "pending_min_soc": self.pending,
+            "writes": self.writes,
+            "predicted_crossing": (
+                self.predicted_crossing.isoformat()
+                if self.predicted_crossing is not None
+                else None
+            ),
+            "early_transitions": self.early_transitions,
+        }
+
+    async def async_update_soc(
+        self,
+        soc: float,
+        data: dict | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Wertet einen neuen SOC aus und schreibt minSOC beim Zustandswechsel.
+
+        Args:
+            soc (float): Aktueller SOC in Prozent.
+            data (dict | None): Der Webhook-Frame, liefert Batterieleistung
+                und gespeicherte Energie für die Prognose.
+            timestamp (float | None): Monotone Zeit des Frames in Sekunden,
+                standardmäßig time.monotonic().
+        """
+        entry_data = get_entry_data(self.hass, self._entry.entry_id)
+        if not entry_data.get(CONF_WINTER_MODE, False):
+            self._set_predicted_crossing(None)
+            self._set_state(STATE_OFF)
+            return
+
+        use_forecast = entry_data.get(CONF_WINTER_FORECAST, DEFAULT_WINTER_FORECAST)
+        if use_forecast:
+            self.forecast.add(
+                time.monotonic() if timestamp is None else timestamp,
+                soc,
+                frame_battery_power(data) if data else None,
+                frame_battery_energy(data) if data else None,
+            )
+        else:
+            self._set_predicted_crossing(None)
+
+        limits = (
+            float(entry_data.get(CONF_WINTER_MIN_CHARGE, DEFAULT_WINTER_MIN_CHARGE)),
+            float(entry_data.get(CONF_WINTER_MAX_CHARGE, DEFAULT_WINTER_MAX_CHARGE)),
+        )
+        if limits != self._limits:
+            # Neue Schwellen: Zustand neu bestimmen
+            self._limits = limits
+            self.state = STATE_WAITING
+        winter_min, winter_max = limits
+
+        if self.state == STATE_CHARGE:
+            if soc >= winter_max:
+                self._transition(STATE_DISCHARGE, winter_min)
+            elif use_forecast and self._crossing_due(winter_max):
+                self.early_transitions += 1
+                self._transition(STATE_DISCHARGE, winter_min)
+            return
+
+        if self.state == STATE_DISCHARGE:
+            if soc <= winter_min:
+                self._transition(STATE_CHARGE, winter_max)
+            elif use_forecast and self._crossing_due(winter_min):
+                self.early_transitions += 1
+                self._transition(STATE_CHARGE, winter_max)
+            return
+
+        self._evaluate_waiting(soc, winter_min, winter_max)
+
+    def _evaluate_waiting(
+        self, soc: float, winter_min: float, winter_max: float
+    ) -> None:
+        """Bestimmt den Zustand ohne Vorwissen aus SOC und aktuellem minSOC."""
+        entity = self._get_min_soc_entity()
+        if entity is None:
+            _LOGGER.warning("Wintermodus: min_soc Entität nicht verfügbar")
+            return
+
+        current = entity.native_value
+        if soc <= winter_min:
+            self._transition(STATE_CHARGE, winter_max, current)
+        elif soc >= winter_max:
+            self._transition(STATE_DISCHARGE, winter_min, current)
+        elif current == winter_max:
+            self._set_state(STATE_CHARGE)
+        elif current == winter_min:
+            self._set_state(STATE_DISCHARGE)
+        else:
+            _LOGGER.debug("Wintermodus: SOC %s im Hysterese-Band, warte", soc)
+
+    def _crossing_due(self, threshold: float) -> bool:
+        """Prüft, ob die Schwelle laut Prognose innerhalb des Vorlaufs erreicht wird."""
+        seconds = self.forecast.seconds_until(threshold)
+        if seconds is None:
+            self._set_predicted_crossing(None)
+            return False
+
+        self._set_predicted_crossing(dt_util.utcnow() + timedelta(seconds=seconds))
+        return seconds <= FORECAST_LEAD_SECONDS
+
+    def _set_predicted_crossing(self, crossing: datetime | None) -> None:
+        """Setzt den erwarteten Zeitpunkt, minutengenau, und meldet Änderungen."""
+        if crossing is not None:
+            crossing = crossing.replace(second=0, microsecond=0)
+        if crossing == self.predicted_crossing:
+            return
+        self.predicted_crossing = crossing
+        async_dispatcher_send(self.hass, winter_state_signal(self._entry.entry_id))
+
+    def _transition(
+        self, state: str, target: float, current: float | None = None
+    ) -> None:
+        """Wechselt den Zustand und schreibt minSOC, falls nötig."""
+        _LOGGER.debug("Wintermodus: %s -> %s (minSOC %s)", self.state, state, target)
+        self._set_state(state)
+        if current is None:
+            entity = self._get_min_soc_entity()
+            current = entity.native_value if entity is not None else None
+        if current != target or self.pending is not None:
+            self._request_write(target)
+
+    def _set_state(self, state: str) -> None:
+        """Setzt den Zustand und meldet Wechsel an den Zustandssensor."""
+        if state == self.state:
+            return
+        self.state = state
+        async_dispatcher_send(self.hass, winter_state_signal(self._entry.entry_id))
+
+    def _get_min_soc_entity(self):
+        """Liefert die (zwischengespeicherte) minSOC-Entität des Eintrags."""
+        entity = self._min_soc_entity
+        if entity is not None and entity.hass is not None:
+            return entity
+
+        entity = (
+            get_entry_data(self.hass, self._entry.entry_id)
+            .get("entities", {})
+            .get("minSOC")
+        )
+        self._min_soc_entity = entity
+        return entity
+
+    def _request_write(self, target: float) -> None:
+        """Schreibt target auf minSOC; ein laufender Schreibvorgang übernimmt es."""
+        if self.pending == target:
+            return
+        self._target = target
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_task(self._async_write())
+
+    async def _async_write(self) -> None:
+        """Schreibt den jeweils letzten Zielwert, bis er auf dem Gerät steht."""
+        while True:
+            target = self._target
+            entity = self._get_min_soc_entity()
+            if entity is None:
+                _LOGGER.warning("Wintermodus: min_soc Entität nicht verfügbar")
+                ok = False
+            else:
+                _LOGGER.debug("Wintermodus: Setze minSOC auf %s", target)
+                self.writes += 1
+                try:
+                    ok = await entity.set_change_limitation(
+                        target, WINTER_MODE_CHANGE_DELAY
+                    )
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    _LOGGER.error("Fehler bei Wintermodus-Steuerung: %s", err)
+                    ok = False
+
+            if not ok:
+                # Beim nächsten Frame neu bestimmen und erneut versuchen
+                self.state = STATE_WAITING
+                self._target = None
+                break
+            if self._target == target:
+                break
+
+        async_dispatcher_send(self.hass, winter_state_signal(self._entry.entry_id))
+
+    async def async_unload(self) -> None:
+        """Bricht einen laufenden Schreibvorgang ab."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
@@ -0,0 +1,118 @@
+"""SwitchEntity für den Prognose-Modus des Winterbetriebs."""
+
+import logging
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from ..const import (
+    DEVICE_INFO,
+    DOMAIN,
+    CONF_WINTER_FORECAST,
+    CONF_WINTER_MODE,
+    DEFAULT_WINTER_FORECAST,
+    WINTER_MODE_CHANGED_EVENT,
+)
+from ..tools import entry_signal, get_entry_data
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# pylint: disable=abstract-method
+class WinterForecast(SwitchEntity):
+    """SwitchEntity für den Prognose-Modus.
+
+    Ist der Schalter an, schaltet der WinterModeController minSOC bereits um,
+    wenn der SOC die Schwelle voraussichtlich in Kürze erreicht.
+    """
+
+    _attr_translation_key = "WinterForecast"
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, entry: ConfigEntry) -> None:
+
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_winter_forecast"
+        self._state: bool = DEFAULT_WINTER_FORECAST
+        self._attr_icon = "mdi:chart-timeline-variant"
+        self._attr_entity_category = EntityCategory.CONFIG
+        self._remove_listener = None
+
+    async def async_added_to_hass(self):
+        """Übernimmt den gespeicherten Zustand und abonniert den Winterbetrieb."""
+        self._state = get_entry_data(self.hass, self._entry.entry_id).get(
+            CONF_WINTER_FORECAST, DEFAULT_WINTER_FORECAST
+        )
+        self._remove_listener = async_dispatcher_connect(
+            self.hass,
+            entry_signal(WINTER_MODE_CHANGED_EVENT, self._entry.entry_id),
+            self._handle_winter_mode_changed,
+        )
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self):
+        """Entfernt den Listener, wenn die Entität entfernt wird."""
+        if self._remove_listener:
+            self._remove_listener()
+
+    @property
+    def available(self) -> bool:
+        """Nur im Winterbetrieb verfügbar."""
+        return get_entry_data(self.hass, self._entry.entry_id).get(
+            CONF_WINTER_MODE, False
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Gibt zurück, ob der Prognose-Modus aktiv ist."""
+        return bool(self._state)
+
+    async def async_turn_on(self, **kwargs):
+        """Schaltet den Prognose-Modus ein."""
+        _LOGGER.debug("Prognose-Modus aktiviert")
+        await self._save_state(True)
+
+    async def async_turn_off(self, **kwargs):
+        """Schaltet den Prognose-Modus aus."""
+        _LOGGER.debug("Prognose-Modus deaktiviert")
+        await self._save_state(False)
+
+    async def _save_state(self, value: bool):
+        """Speichert den Zustand im Eintrag und in den Eintragsoptionen."""
+        self._state = value
+        get_entry_data(self.hass, self._entry.entry_id)[CONF_WINTER_FORECAST] = value
+
+        self.hass.config_entries.async_update_entry(
+            self._entry,
+            options={
+                **self._entry.options,
+                CONF_WINTER_FORECAST: value,
+            },
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_winter_mode_changed(self, enabled):  # pylint: disable=unused-argument
+        """Handle winter mode changed signal."""
+        self.async_write_ha_state()
+
+    @property
+    def device_info(self):
+        """Liefert die Geräteinformationen für diese  Entity.
+
+        Returns:
+            dict: Ein Dictionary mit Informationen zur Identifikation
+                  des Geräts in Home Assistant, einschließlich:
+                  - identifiers: Eindeutige Identifikatoren (Domain und Entry ID)
+                  - name: Anzeigename des Geräts
+                  - manufacturer: Herstellername
+                  - model: Modellbezeichnung
+        """
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": self._entry.title,
+            **DEVICE_INFO,
+        }
@@ -5,6 +5,10 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, PERCENTAGE
 from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 
 from ..const import (
     DEVICE_INFO,
@@ -19,7 +23,9 @@ from ..const import (
 )  # noqa: TID252
 
 from ..tools import (
-    async_get_min_soc_entity
+    async_get_min_soc_entity,
+    entry_signal,
+    get_entry_data,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,9 +64,10 @@ class WinterMaxCharge(NumberEntity):
 
     def _notify_dependents(self, value: float):
         _LOGGER.debug("Feuer WinterMaxCharge changed event mit Wert: %s", value)
-        self.hass.bus.async_fire(
-            EVENT_WINTER_MAX_CHARGE_CHANGED,
-            {"value": value}
+        async_dispatcher_send(
+            self.hass,
+            entry_signal(EVENT_WINTER_MAX_CHARGE_CHANGED, self._entry.entry_id),
+            value,
         )
 
     def set_native_value(self, value):
@@ -81,10 +88,10 @@ class WinterMaxCharge(NumberEntity):
             if changed:
                 self._attr_native_value = value
 
-                # in hass.data spiegeln (für Logik / Availability)
-                self.hass.data.setdefault(DOMAIN, {})
-
-                self.hass.data[DOMAIN][CONF_WINTER_MAX_CHARGE] = value
+                # in hass.data des Eintrags spiegeln (für Logik / Availability)
+                get_entry_data(self.hass, self._entry.entry_id)[
+                    CONF_WINTER_MAX_CHARGE
+                ] = value
 
                 # persistent speichern
                 self.hass.config_entries.async_update_entry(
@@ -105,13 +112,17 @@ class WinterMaxCharge(NumberEntity):
 
     @property
     def available(self) -> bool:
-        _LOGGER.debug("WinterMaxCharge available abgefragt: %s", not self.hass.data[DOMAIN].get(CONF_WINTER_MODE, False))
-        return self.hass.data[DOMAIN].get(CONF_WINTER_MODE, False)
+        winter_mode = get_entry_data(self.hass, self._entry.entry_id).get(
+            CONF_WINTER_MODE, False
+        )
+        _LOGGER.debug("WinterMaxCharge available abgefragt: %s", winter_mode)
+        return winter_mode
 
     async def async_added_to_hass(self):
-        """Registriert den Listener, wenn die Entität hinzugefügt wird."""
-        self._remove_listener = self.hass.bus.async_listen(
-            WINTER_MODE_CHANGED_EVENT,
+        """Registriert den Listener auf das Signal dieses Eintrags."""
+        self._remove_listener = async_dispatcher_connect(
+            self.hass,
+            entry_signal(WINTER_MODE_CHANGED_EVENT, self._entry.entry_id),
             self._handle_winter_mode_changed,
         )
 
@@ -121,8 +132,8 @@ class WinterMaxCharge(NumberEntity):
             self._remove_listener()
 
     @callback
-    def _handle_winter_mode_changed(self, event):  # pylint: disable=unused-argument
-        """Handle winter mode changed event."""
+    def _handle_winter_mode_changed(self, enabled):  # pylint: disable=unused-argument
+        """Handle winter mode changed signal."""
         self.async_write_ha_state()
 
     @property
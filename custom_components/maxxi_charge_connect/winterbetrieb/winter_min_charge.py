@@ -6,6 +6,7 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, PERCENTAGE
 from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from ..const import (
     DEVICE_INFO,
@@ -20,7 +21,9 @@ from ..const import (
 )  # noqa: TID252
 
 from ..tools import (
-    async_get_min_soc_entity
+    async_get_min_soc_entity,
+    entry_signal,
+    get_entry_data,
 )
 
 
@@ -74,9 +77,10 @@ class WinterMinCharge(NumberEntity):
             if changed:
                 self._attr_native_value = value
 
-                # in hass.data spiegeln (für Logik / Availability)
-                self.hass.data.setdefault(DOMAIN, {})
-                self.hass.data[DOMAIN][CONF_WINTER_MIN_CHARGE] = value
+                # in hass.data des Eintrags spiegeln (für Logik / Availability)
+                get_entry_data(self.hass, self._entry.entry_id)[
+                    CONF_WINTER_MIN_CHARGE
+                ] = value
 
                 # persistent speichern
                 self.hass.config_entries.async_update_entry(
@@ -95,37 +99,43 @@ class WinterMinCharge(NumberEntity):
 
     @property
     def available(self) -> bool:
-        _LOGGER.debug("WinterMinCharge available abgefragt: %s", not self.hass.data[DOMAIN].get(CONF_WINTER_MODE, False))
-        return self.hass.data[DOMAIN].get(CONF_WINTER_MODE, False)
+        winter_mode = get_entry_data(self.hass, self._entry.entry_id).get(
+            CONF_WINTER_MODE, False
+        )
+        _LOGGER.debug("WinterMinCharge available abgefragt: %s", winter_mode)
+        return winter_mode
 
     async def async_added_to_hass(self):
-        """Registriert den Listener, wenn die Entität hinzugefügt wird."""
-        # self.hass.data.setdefault(DOMAIN, {})
-        # self.hass.data[DOMAIN][CONF_WINTER_MIN_CHARGE] = self._attr_native_value
+        """Registriert die Listener auf die Signale dieses Eintrags."""
+        entry_id = self._entry.entry_id
 
-        self._remove_listener = self.hass.bus.async_listen(
-            WINTER_MODE_CHANGED_EVENT,
+        self._remove_listener = async_dispatcher_connect(
+            self.hass,
+            entry_signal(WINTER_MODE_CHANGED_EVENT, entry_id),
             self._handle_winter_mode_changed,
         )
 
-        self._remove_listener_max_charge = self.hass.bus.async_listen(
-            EVENT_WINTER_MAX_CHARGE_CHANGED,
+        self._remove_listener_max_charge = async_dispatcher_connect(
+            self.hass,
+            entry_signal(EVENT_WINTER_MAX_CHARGE_CHANGED, entry_id),
             self._handle_winter_max_charge_changed,
         )
 
     async def async_will_remove_from_hass(self):
-        """Entfernt den Listener, wenn die Entität entfernt wird."""
+        """Entfernt die Listener, wenn die Entität entfernt wird."""
         if self._remove_listener:
             self._remove_listener()
 
+        if self._remove_listener_max_charge:
+            self._remove_listener_max_charge()
+
     @callback
-    def _handle_winter_mode_changed(self, event):  # pylint: disable=unused-argument
-        """Handle winter mode changed event."""
+    def _handle_winter_mode_changed(self, enabled):  # pylint: disable=unused-argument
+        """Handle winter mode changed signal."""
         self.async_write_ha_state()
 
-    @callback
-    async def _handle_winter_max_charge_changed(self, event):
-        value = event.data.get("value")
+    async def _handle_winter_max_charge_changed(self, value):
+        """Passt den Maximalwert an eine geänderte WinterMaxCharge an."""
 
         _LOGGER.info("WinterMinCharge received max charge changed event: %s", value)
 
@@ -0,0 +1,71 @@
+"""SensorEntity für den Zustand der Winterbetrieb-Steuerung."""
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from ..const import DEVICE_INFO, DOMAIN
+from .winter_controller import STATES, WinterModeController, winter_state_signal
+
+
+class WinterModeState(SensorEntity):
+    """Zeigt den Zustand des WinterModeController eines Eintrags an."""
+
+    _attr_translation_key = "WinterModeState"
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = STATES
+
+    def __init__(self, entry: ConfigEntry, controller: WinterModeController) -> None:
+        """Initialisiert den Zustandssensor.
+
+        Args:
+            entry (ConfigEntry): Der Konfigurationseintrag der Integration.
+            controller (WinterModeController): Der Controller des Eintrags.
+
+        """
+        self._entry = entry
+        self._controller = controller
+        self._attr_unique_id = f"{entry.entry_id}_winter_mode_state"
+        self._attr_icon = "mdi:snowflake-thermometer"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    async def async_added_to_hass(self):
+        """Abonniert die Zustandswechsel des Controllers."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                winter_state_signal(self._entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> str:
+        """Aktueller Zustand des Controllers."""
+        return self._controller.state
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Schwellen und laufender Schreibvorgang."""
+        return self._controller.attributes()
+
+    @property
+    def device_info(self):
+        """Liefert die Geräteinformationen für diese  Entity.
+
+        Returns:
+            dict: Ein Dictionary mit Informationen zur Identifikation
+                  des Geräts in Home Assistant, einschließlich:
+                  - identifiers: Eindeutige Identifikatoren (Domain und Entry ID)
+                  - name: Anzeigename des Geräts
+                  - manufacturer: Herstellername
+                  - model: Modellbezeichnung
+        """
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": self._entry.title,
+            **DEVICE_INFO,
+        }
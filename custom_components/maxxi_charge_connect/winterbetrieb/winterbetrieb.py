@@ -4,6 +4,7 @@ import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..const import (
     DEVICE_INFO,
@@ -11,6 +12,7 @@ from ..const import (
     CONF_WINTER_MODE,
     WINTER_MODE_CHANGED_EVENT
 )
+from ..tools import entry_signal, get_entry_data
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -32,7 +34,9 @@ class Winterbetrieb(SwitchEntity):
     async def async_added_to_hass(self):
         """Wird aufgerufen, sobald die Entität registriert ist."""
         # Sicherstellen, dass der Switch initialen Wert korrekt anzeigt
-        self._state = self.hass.data[DOMAIN].get(CONF_WINTER_MODE, False)
+        self._state = get_entry_data(self.hass, self._entry.entry_id).get(
+            CONF_WINTER_MODE, False
+        )
         self.async_write_ha_state()
 
     @property
@@ -62,7 +66,7 @@ class Winterbetrieb(SwitchEntity):
     async def _save_state(self, value: bool):
         """Speichert den aktuellen Zustand des Winterbetriebs in den Eintragsoptionen."""
         self._state = value
-        self.hass.data[DOMAIN][CONF_WINTER_MODE] = value
+        get_entry_data(self.hass, self._entry.entry_id)[CONF_WINTER_MODE] = value
 
         self.hass.config_entries.async_update_entry(
             self._entry,
@@ -75,10 +79,11 @@ class Winterbetrieb(SwitchEntity):
         self.async_write_ha_state()
 
     def _notify_dependents(self):
-        """Benachrichtigt abhängige Entitäten über den Wechsel des Winterbetriebs."""
-        self.hass.bus.async_fire(
-            WINTER_MODE_CHANGED_EVENT,
-            {"enabled": self._state},
+        """Benachrichtigt die abhängigen Entitäten dieses Eintrags."""
+        async_dispatcher_send(
+            self.hass,
+            entry_signal(WINTER_MODE_CHANGED_EVENT, self._entry.entry_id),
+            self._state,
         )
 
     @property
@@ -0,0 +1,177 @@
+"""Tests für die spaltenweise Auswertung der Batteriedaten."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.maxxi_charge_connect.devices import battery_columns
+from custom_components.maxxi_charge_connect.devices.battery_columns import (
+    BatteryColumnCache,
+    column_value,
+    compute_pack_aggregates,
+    extract_battery_columns,
+)
+from custom_components.maxxi_charge_connect.devices.battery_sensor_manager import (
+    BatterySensorManager,
+)
+
+
+def _battery(**overrides):
+    battery = {
+        "batteryCapacity": 1187.3,
+        "batterySOC": 55,
+        "batteryVoltage": 52100,
+        "batteryCurrent": -3300,
+        "pvVoltage": 38000,
+        "pvCurrent": 2500,
+        "pvPower": 95,
+        "mpptVoltage": 40000,
+        "mpptCurrent": 1200,
+        "batteryPower": -180,
+    }
+    battery.update(overrides)
+    return battery
+
+
+def test_extract_battery_columns_scales_and_splits_power():
+    """Alle Metriken werden in einem Durchlauf skaliert und aufgeteilt."""
+    columns = extract_battery_columns([_battery(), _battery(batteryPower=250)])
+
+    assert columns["soe"] == [1187.3, 1187.3]
+    assert columns["soc"] == [55.0, 55.0]
+    assert columns["voltage"] == [52.1, 52.1]
+    assert columns["current"] == [-3.3, -3.3]
+    assert columns["pv_voltage"] == [38.0, 38.0]
+    assert columns["pv_current"] == [2.5, 2.5]
+    assert columns["pv_power"] == [95.0, 95.0]
+    assert columns["mppt_voltage"] == [40.0, 40.0]
+    assert columns["mppt_current"] == [1.2, 1.2]
+    assert columns["charge"] == [0.0, 250.0]
+    assert columns["discharge"] == [180.0, 0.0]
+    assert str(columns["discharge"][1]) == "0.0"
+
+
+def test_extract_battery_columns_marks_invalid_values():
+    """Fehlende, ungültige und unplausible Werte werden zu None."""
+    columns = extract_battery_columns(
+        [
+            _battery(batterySOC=101, batteryVoltage="invalid", batteryPower=25000),
+            _battery(batteryCurrent=-250000, pvPower=None),
+            "kein dict",
+        ]
+    )
+
+    assert columns["soc"] == [None, 55.0, None]
+    assert columns["voltage"] == [None, 52.1, None]
+    assert columns["current"] == [-3.3, None, None]
+    assert columns["pv_power"] == [95.0, None, None]
+    assert columns["charge"] == [None, 0.0, None]
+    assert columns["discharge"] == [0.0, 180.0, None]
+
+
+def test_column_value_handles_missing_slots():
+    """Ohne Spalten oder außerhalb des Bereichs gibt es keinen Wert."""
+    columns = extract_battery_columns([_battery()])
+
+    assert column_value(columns, "soc", 0) == 55.0
+    assert column_value(columns, "soc", 1) is None
+    assert column_value(None, "soc", 0) is None
+
+
+def test_cache_extracts_each_frame_once():
+    """Derselbe Frame wird nur einmal ausgewertet, die Kosten werden gezählt."""
+    cache = BatteryColumnCache()
+    frame = {"batteriesInfo": [_battery(), _battery()]}
+
+    with patch.object(
+        battery_columns,
+        "extract_battery_columns",
+        wraps=extract_battery_columns,
+    ) as extract:
+        first = cache.columns_for(frame)
+        second = cache.columns_for(frame)
+        cache.columns_for({"batteriesInfo": [_battery()]})
+
+    assert first is second
+    assert extract.call_count == 2
+    stats = cache.stats()
+    assert stats["frames"] == 2
+    assert stats["items"] == 1
+    assert cache.columns_for({"batteriesInfo": []}) is None
+
+
+@pytest.mark.asyncio
+async def test_manager_sensors_share_one_extraction():
+    """Alle Sensoren des Managers lesen aus derselben Auswertung."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {}
+    hass = MagicMock()
+    hass.data = {}
+    manager = BatterySensorManager(hass, entry, MagicMock())
+    frame = {"batteriesInfo": [_battery(), _battery(batterySOC=80)]}
+
+    await manager.handle_update(frame)
+    assert len(manager.sensors) == 22
+
+    with patch.object(
+        battery_columns,
+        "extract_battery_columns",
+        wraps=extract_battery_columns,
+    ) as extract:
+        for sensor in manager.sensors.values():
+            await sensor.handle_update(frame)
+
+    assert extract.call_count == 1
+    soc = manager.sensors["entry_battery_soc_sensor_1"]
+    assert soc._attr_native_value == 80.0  # pylint: disable=protected-access
+    assert manager.get_frame_stats()["items"] == 2
+
+
+def test_compute_pack_aggregates_skips_invalid_batteries():
+    """Die Kennzahlen des Speichers überspringen ungültige Werte."""
+    columns = extract_battery_columns(
+        [
+            _battery(batterySOC=40, batteryVoltage=51000),
+            _battery(batterySOC=70, batteryVoltage=53500, mpptCurrent=None),
+            _battery(batterySOC="invalid", batteryCapacity=500),
+        ]
+    )
+
+    aggregates = compute_pack_aggregates(columns)
+
+    assert aggregates["energy_total"] == pytest.approx(2874.6)
+    assert aggregates["soc_min"] == 40.0
+    assert aggregates["soc_max"] == 70.0
+    assert aggregates["soc_avg"] == 55.0
+    assert aggregates["soc_imbalance"] == 30.0
+    assert aggregates["voltage_spread"] == pytest.approx(2.5)
+    assert aggregates["mppt_power_total"] == pytest.approx(96.0)
+
+
+def test_compute_pack_aggregates_without_valid_values():
+    """Ohne gültige Werte sind die Kennzahlen None."""
+    aggregates = compute_pack_aggregates(extract_battery_columns(["kein dict"]))
+
+    assert set(aggregates.values()) == {None}
+
+
+@pytest.mark.asyncio
+async def test_manager_creates_pack_sensors_once():
+    """Die Speicher-Sensoren entstehen einmal und lesen aus derselben Auswertung."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {}
+    hass = MagicMock()
+    hass.data = {}
+    manager = BatterySensorManager(hass, entry, MagicMock())
+
+    await manager.handle_update({"batteriesInfo": [_battery()]})
+    frame = {"batteriesInfo": [_battery(batterySOC=20), _battery(batterySOC=90)]}
+    await manager.handle_update(frame)
+
+    assert len(manager.pack_sensors) == 7
+    imbalance = manager.pack_sensors["entry_battery_pack_soc_imbalance"]
+    await imbalance.handle_update(frame)
+    assert imbalance._attr_native_value == 70.0  # pylint: disable=protected-access
+    assert manager.get_frame_stats()["frames"] == 1
@@ -6,7 +6,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.const import STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import HomeAssistant
 
 from custom_components.maxxi_charge_connect.const import (
     CONF_ENABLE_CLOUD_DATA,
@@ -46,8 +46,8 @@ def entry():
 
 @pytest.fixture
 def async_add_entities():
-    """Mock async_add_entities callback."""
-    return AsyncMock()
+    """Mock async_add_entities callback (in Home Assistant synchron)."""
+    return MagicMock()
 
 
 @pytest.fixture
@@ -105,9 +105,20 @@ class TestBatterySensorManager:
         manager = BatterySensorManager(hass, entry, async_add_entities)
 
         hass.bus = MagicMock()
-        with patch.object(hass.bus, "async_listen") as mock_listen:
+        with patch(
+            "custom_components.maxxi_charge_connect.devices.battery_sensor_manager.async_dispatcher_connect"
+        ) as mock_connect:
             await manager.setup()
-            mock_listen.assert_called_once()
+            await manager.setup()
+
+        # Nur das Signal des eigenen Geräts, kein Listener auf dem Event-Bus
+        mock_connect.assert_called_once_with(
+            hass, "maxxi_charge_connect_device123_frame", manager.async_update_from_proxy
+        )
+        hass.bus.async_listen.assert_not_called()
+
+        manager.async_unload()
+        mock_connect.return_value.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_setup_error_handling(self, manager):
@@ -167,6 +178,95 @@ class TestBatterySensorManager:
         assert manager.async_add_entities.call_count == first_call_count
         assert len(manager.sensors) == 11  # 11 Sensoren für 1 Batterie
 
+    @pytest.mark.asyncio
+    async def test_handle_update_adds_only_new_batteries(self, manager):
+        """Testet, dass bei einer zusätzlichen Batterie nur deren Sensoren entstehen."""
+        await manager.handle_update({"batteriesInfo": [{"batteryCapacity": 1000}]})
+        first_sensors = dict(manager.sensors)
+
+        await manager.handle_update(
+            {"batteriesInfo": [{"batteryCapacity": 1000}, {"batteryCapacity": 2000}]}
+        )
+
+        assert len(manager.sensors) == 22
+        added = manager.async_add_entities.call_args_list[-1].args[0]
+        assert len(added) == 11
+        assert all(sensor._index == 1 for sensor in added)  # pylint: disable=protected-access
+        for key, sensor in first_sensors.items():
+            assert manager.sensors[key] is sensor
+
+    @pytest.mark.asyncio
+    async def test_handle_update_retires_removed_batteries(self, manager):
+        """Testet, dass Sensoren einer entfernten Batterie abgemeldet werden."""
+        await manager.handle_update(
+            {"batteriesInfo": [{"batteryCapacity": 1000}, {"batteryCapacity": 2000}]}
+        )
+        removed = [
+            sensor for key, sensor in manager.sensors.items() if key.endswith("_1")
+        ]
+        for sensor in removed:
+            sensor.hass = MagicMock()
+            sensor.async_remove = AsyncMock()
+
+        await manager.handle_update({"batteriesInfo": [{"batteryCapacity": 1000}]})
+
+        assert len(manager.sensors) == 11
+        for sensor in removed:
+            sensor.async_remove.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_handle_update_removes_registry_entries(self, manager):
+        """Testet, dass entfernte Batterien keine verwaisten Registry-Einträge hinterlassen."""
+        await manager.handle_update(
+            {"batteriesInfo": [{"batteryCapacity": 1000}, {"batteryCapacity": 2000}]}
+        )
+        removed = [
+            sensor for key, sensor in manager.sensors.items() if key.endswith("_1")
+        ]
+        for number, sensor in enumerate(removed):
+            sensor.entity_id = f"sensor.battery_1_{number}"
+        registry = MagicMock()
+
+        with patch(
+            "custom_components.maxxi_charge_connect.devices.battery_sensor_manager.async_get_entity_registry",
+            return_value=registry,
+        ):
+            await manager.handle_update({"batteriesInfo": [{"batteryCapacity": 1000}]})
+
+        assert sorted(call.args[0] for call in registry.async_remove.call_args_list) == sorted(
+            sensor.entity_id for sensor in removed
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_update_detects_swapped_battery(self, manager):
+        """Testet, dass ein Tausch bei gleicher Anzahl die Sensoren des Index neu anlegt."""
+        await manager.handle_update(
+            {"batteriesInfo": [{"id": "A", "batteryCapacity": 1000}, {"id": "B"}]}
+        )
+        before = dict(manager.sensors)
+
+        await manager.handle_update(
+            {"batteriesInfo": [{"id": "C", "batteryCapacity": 1000}, {"id": "B"}]}
+        )
+
+        assert len(manager.sensors) == 22
+        added = manager.async_add_entities.call_args_list[-1].args[0]
+        assert len(added) == 11
+        assert all(sensor._index == 0 for sensor in added)  # pylint: disable=protected-access
+        for key, sensor in before.items():
+            assert (manager.sensors[key] is sensor) == key.endswith("_1")
+
+    @pytest.mark.asyncio
+    async def test_handle_update_steady_state_skips_reconcile(self, manager):
+        """Testet, dass bei gleicher Batterieanzahl kein Abgleich stattfindet."""
+        data = {"batteriesInfo": [{"batteryCapacity": 1000}]}
+        await manager.handle_update(data)
+
+        with patch.object(manager, "_reconcile", AsyncMock()) as mock_reconcile:
+            await manager.handle_update(data)
+
+        mock_reconcile.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_update_listener_distribution(self, manager):
         """Testet die Verteilung von Updates an Listener."""
@@ -231,40 +331,29 @@ class TestBatterySensorManager:
         await manager.handle_stale()
 
     @pytest.mark.asyncio
-    async def test_async_update_from_event(self, manager):
-        """Testet das Update von Proxy-Events."""
-        event = MagicMock(spec=Event)
-        event.data = {
-            "payload": {
-                PROXY_ERROR_DEVICE_ID: "device123",
-                "deviceId": "device123",
-                "batteriesInfo": [],
-                "test": "data"
-            }
+    async def test_async_update_from_proxy(self, manager):
+        """Testet das Update mit Proxy-Daten dieses Geräts."""
+        data = {
+            PROXY_ERROR_DEVICE_ID: "device123",
+            "deviceId": "device123",
+            "batteriesInfo": [],
+            "test": "data"
         }
 
         with patch.object(manager, "handle_update") as mock_handle_update:
-            await manager.async_update_from_event(event)
-            mock_handle_update.assert_called_once_with({
-                PROXY_ERROR_DEVICE_ID: "device123",
-                "deviceId": "device123",
-                "batteriesInfo": [],
-                "test": "data"
-            })
+            await manager.async_update_from_proxy(data)
+            mock_handle_update.assert_called_once_with(data)
 
     @pytest.mark.asyncio
-    async def test_async_update_from_event_wrong_device(self, manager):
-        """Testet das Update von Proxy-Events mit falscher Device ID."""
-        event = MagicMock(spec=Event)
-        event.data = {
-            "payload": {
-                PROXY_ERROR_DEVICE_ID: "wrong_device",
-                "test": "data"
-            }
+    async def test_async_update_from_proxy_without_batteries(self, manager):
+        """Testet, dass Proxy-Daten ohne batteriesInfo ignoriert werden."""
+        data = {
+            PROXY_ERROR_DEVICE_ID: "device123",
+            "test": "data"
         }
 
         with patch.object(manager, "handle_update") as mock_handle_update:
-            await manager.async_update_from_event(event)
+            await manager.async_update_from_proxy(data)
             mock_handle_update.assert_not_called()
 
     @pytest.mark.asyncio
@@ -12,6 +12,9 @@ import pytest
 from custom_components.maxxi_charge_connect.devices.battery_today_energy_charge import (
     BatteryTodayEnergyCharge,
 )
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
 
 
 @pytest.mark.asyncio
@@ -37,7 +40,7 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
     entry.entry_id = "test_entry"
     entry.title = "Test Entry"
 
-    sensor = BatteryTodayEnergyCharge(hass, entry, "sensor.pv_power")
+    sensor = BatteryTodayEnergyCharge(hass, entry, "sensor.pv_power", EnergyAccumulator(hass, entry))
     # sensor.native_value = 200.0  # pylint: disable=protected-access
     sensor.hass = hass
     sensor.async_write_ha_state = MagicMock()
@@ -54,6 +57,8 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
 
     # 🔁 Reset aufrufen
     # await sensor._reset_energy_daily(fake_now)  # pylint: disable=protected-access
+    # Den Tageszähler setzt der Accumulator zurück, der Sensor übernimmt nur den Reset
+    sensor._accumulator.reset_daily(fake_now)  # pylint: disable=protected-access
     await sensor._reset_energy_daily(fake_now)
 
     # ✅ Überprüfungen
@@ -6,6 +6,9 @@ import pytest
 from custom_components.maxxi_charge_connect.devices.battery_total_energy_charge import (
     BatteryTotalEnergyCharge,
 )
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
 
 
 @pytest.mark.asyncio
@@ -23,7 +26,7 @@ async def test_battery_total_energy_charge_init():
     dummy_config_entry.options = {}
 
     source_entity = "sensor.test_power"
-    sensor = BatteryTotalEnergyCharge(hass, dummy_config_entry, source_entity)
+    sensor = BatteryTotalEnergyCharge(hass, dummy_config_entry, source_entity, EnergyAccumulator(hass, dummy_config_entry))
 
     # Grundlegende Attribute prüfen
     assert sensor._source_entity == source_entity  # pylint: disable=protected-access
@@ -24,6 +24,9 @@ import pytest
 from custom_components.maxxi_charge_connect.devices.ccu_energy_today import (
     CcuEnergyToday,
 )
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
 
 sys.path.append(str(Path(__file__).resolve().parents[3]))
 
@@ -53,7 +56,7 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
     entry.entry_id = "test_entry"
     entry.title = "Test Entry"
 
-    sensor = CcuEnergyToday(hass, entry, "sensor.pv_power")
+    sensor = CcuEnergyToday(hass, entry, "sensor.pv_power", EnergyAccumulator(hass, entry))
     sensor.hass = hass
     sensor.async_write_ha_state = MagicMock()
     sensor._state = 200  # pylint: disable=protected-access
@@ -68,6 +71,8 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
     caplog.set_level("INFO")
 
     # 🔁 Reset aufrufen
+    # Den Tageszähler setzt der Accumulator zurück, der Sensor übernimmt nur den Reset
+    sensor._accumulator.reset_daily(fake_now)  # pylint: disable=protected-access
     await sensor._reset_energy_daily(fake_now)  # pylint: disable=protected-access
 
     # ✅ Überprüfungen
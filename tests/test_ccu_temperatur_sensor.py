@@ -8,6 +8,9 @@ import pytest
 from custom_components.maxxi_charge_connect.devices.ccu_temperatur_sensor import (
     CCUTemperaturSensor,
 )
+from custom_components.maxxi_charge_connect.devices.converter_columns import (
+    ConverterColumnCache,
+)
 
 
 @pytest.mark.asyncio
@@ -311,3 +314,22 @@ async def test_ccu_temperatur_sensor__handle_update_keine_gültige_temperaturen(
     await sensor.handle_update(data)
 
     assert sensor._attr_native_value is None  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_ccu_temperatur_sensor__nutzt_gemeinsamen_cache():
+    """Der Mittelwert kommt aus dem Cache des Managers, ohne erneutes Auswerten."""
+
+    dummy_config_entry = MagicMock()
+    dummy_config_entry.data = {}
+    data = {"convertersInfo": [{"ccuTemperature": 20}, {"ccuTemperature": 30}]}
+
+    cache = ConverterColumnCache()
+    cache.columns_for(data)  # Auswertung durch den ConverterSensorManager
+
+    sensor = CCUTemperaturSensor(dummy_config_entry)
+    sensor.column_cache = cache
+    await sensor.handle_update(data)
+
+    assert sensor._attr_native_value == 25.0  # pylint: disable=protected-access
+    assert cache.frames == 1
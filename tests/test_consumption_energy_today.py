@@ -23,6 +23,9 @@ import pytest
 from custom_components.maxxi_charge_connect.devices.consumption_energy_today import (
     ConsumptionEnergyToday,
 )
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
 
 sys.path.append(str(Path(__file__).resolve().parents[3]))
 
@@ -52,7 +55,7 @@ async def test_consumption_energy_total_daily_resets_last_reset_and_writes_state
     entry.entry_id = "test_entry"
     entry.title = "Test Entry"
 
-    sensor = ConsumptionEnergyToday(hass, entry, "sensor.pv_power")
+    sensor = ConsumptionEnergyToday(hass, entry, "sensor.pv_power", EnergyAccumulator(hass, entry))
     sensor.hass = hass
     sensor.async_write_ha_state = MagicMock()
     sensor._state = 200  # pylint: disable=protected-access
@@ -67,6 +70,8 @@ async def test_consumption_energy_total_daily_resets_last_reset_and_writes_state
     caplog.set_level("INFO")
 
     # 🔁 Reset aufrufen
+    # Den Tageszähler setzt der Accumulator zurück, der Sensor übernimmt nur den Reset
+    sensor._accumulator.reset_daily(fake_now)  # pylint: disable=protected-access
     await sensor._reset_energy_daily(fake_now)  # pylint: disable=protected-access
 
     # ✅ Überprüfungen
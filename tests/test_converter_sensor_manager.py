@@ -0,0 +1,121 @@
+"""Tests für den ConverterSensorManager und die Converter-Sensoren."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.maxxi_charge_connect.devices.converter_columns import (
+    ConverterColumnCache,
+    compute_converter_aggregates,
+    extract_converter_columns,
+)
+from custom_components.maxxi_charge_connect.devices.converter_sensor_manager import (
+    ConverterSensorManager,
+)
+from custom_components.maxxi_charge_connect.devices.converter_sensors import (
+    ConverterTemperatureSensor,
+)
+
+
+@pytest.fixture
+def manager():
+    """ConverterSensorManager mit gemocktem hass und Entry."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {}
+    hass = MagicMock()
+    hass.data = {}
+    return ConverterSensorManager(hass, entry, MagicMock())
+
+
+def test_extract_converter_columns_validates_temperature():
+    """Unplausible und fehlende Temperaturen werden zu None."""
+    columns = extract_converter_columns(
+        [
+            {"ccuTemperature": 25.5},
+            {"ccuTemperature": 90},
+            {"ccuTemperature": "invalid"},
+            "kein dict",
+            {"ccuTemperature": "31"},
+        ]
+    )
+
+    assert columns["temperature"] == [25.5, None, None, None, 31.0]
+    assert compute_converter_aggregates(columns) == {
+        "temperature_min": 25.5,
+        "temperature_max": 31.0,
+        "temperature_avg": 28.25,
+    }
+
+
+@pytest.mark.asyncio
+async def test_manager_creates_converter_and_aggregate_sensors(manager):
+    """Pro Converter ein Sensor, dazu Minimum und Maximum."""
+    frame = {
+        "convertersInfo": [{"ccuTemperature": 25.0}, {"ccuTemperature": 41.5}],
+        "batteriesInfo": [{"batteryCapacity": 1000}],
+    }
+
+    await manager.handle_update(frame)
+
+    assert sorted(manager.sensors) == [
+        "entry_converter_temperature_sensor_0",
+        "entry_converter_temperature_sensor_1",
+    ]
+    assert sorted(manager.pack_sensors) == [
+        "entry_converter_temperature_max",
+        "entry_converter_temperature_min",
+    ]
+    assert isinstance(manager.columns, ConverterColumnCache)
+
+    for sensor in [*manager.sensors.values(), *manager.pack_sensors.values()]:
+        await sensor.handle_update(frame)
+
+    values = {
+        key: sensor._attr_native_value  # pylint: disable=protected-access
+        for key, sensor in {**manager.sensors, **manager.pack_sensors}.items()
+    }
+    assert values == {
+        "entry_converter_temperature_sensor_0": 25.0,
+        "entry_converter_temperature_sensor_1": 41.5,
+        "entry_converter_temperature_min": 25.0,
+        "entry_converter_temperature_max": 41.5,
+    }
+    stats = manager.get_frame_stats()
+    assert stats["frames"] == 1
+    assert stats["items"] == 2
+
+
+@pytest.mark.asyncio
+async def test_manager_ignores_frames_without_converters(manager):
+    """Ohne convertersInfo werden keine Sensoren erzeugt."""
+    await manager.handle_update({"batteriesInfo": [{"batteryCapacity": 1000}]})
+
+    assert manager.sensors == {}
+    assert manager.pack_sensors == {}
+
+
+@pytest.mark.asyncio
+async def test_manager_does_not_call_entry_listeners(manager):
+    """Die Listener des Eintrags bedient nur der BatterySensorManager."""
+    listener = AsyncMock()
+    manager.hass.data = {"maxxi_charge_connect": {"entry": {"listeners": [listener]}}}
+
+    await manager.handle_update({"convertersInfo": [{"ccuTemperature": 30}]})
+
+    listener.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_converter_sensor_without_manager():
+    """Ohne Manager wertet der Sensor den Frame selbst aus."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {}
+    sensor = ConverterTemperatureSensor(entry, 1)
+
+    await sensor.handle_update(
+        {"convertersInfo": [{"ccuTemperature": 20}, {"ccuTemperature": 22.5}]}
+    )
+
+    assert sensor._attr_native_value == 22.5  # pylint: disable=protected-access
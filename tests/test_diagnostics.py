@@ -0,0 +1,53 @@
+"""Tests für die Diagnosedaten."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.helpers.dispatcher import DATA_DISPATCHER
+
+from custom_components.maxxi_charge_connect.const import (
+    CONF_DEVICE_ID,
+    DOMAIN,
+    PROXY_STATUS_EVENTNAME,
+    WEBHOOK_SIGNAL_STATE,
+    WEBHOOK_SIGNAL_UPDATE,
+)
+from custom_components.maxxi_charge_connect.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_count_listeners_per_signal():
+    """Listener je Event und je Signal des Eintrags werden gezählt."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {CONF_DEVICE_ID: "dev1", "webhook_id": "geheim"}
+    entry.options = {}
+
+    hass = MagicMock()
+    hass.bus.async_listeners.return_value = {PROXY_STATUS_EVENTNAME: 1}
+    hass.data = {
+        DOMAIN: {
+            "entry": {
+                WEBHOOK_SIGNAL_UPDATE: "update_signal",
+                WEBHOOK_SIGNAL_STATE: "stale_signal",
+            }
+        },
+        DATA_DISPATCHER: {
+            "stale_signal": {"a": None, "b": None},
+            f"{DOMAIN}_dev1_frame": {"a": None, "b": None, "c": None},
+        },
+    }
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["entry"]["data"]["webhook_id"] == "**REDACTED**"
+    assert result["listeners"]["events"][PROXY_STATUS_EVENTNAME] == 1
+    assert result["listeners"]["signals"] == {
+        "update": 0,
+        "stale": 2,
+        "proxy_frame": 3,
+        "proxy_error": 0,
+    }
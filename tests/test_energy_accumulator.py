@@ -0,0 +1,546 @@
+"""Tests für den EnergyAccumulator."""
+
+from datetime import UTC, date, datetime, timedelta
+import math
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.maxxi_charge_connect.const import (
+    DOMAIN,
+    WEBHOOK_SIGNAL_STATE,
+    WEBHOOK_SIGNAL_UPDATE,
+)
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
+from custom_components.maxxi_charge_connect.devices.energy_integrator import (
+    METHOD_LEFT,
+    POWER_CHANNELS,
+)
+from custom_components.maxxi_charge_connect.devices.pv_today_energy import (
+    PvTodayEnergy,
+)
+from custom_components.maxxi_charge_connect.devices.pv_total_energy import (
+    PvTotalEnergy,
+)
+
+PV_TOTAL = EnergyAccumulator.counter_index("pv_power", daily=False)
+PV_TODAY = EnergyAccumulator.counter_index("pv_power", daily=True)
+CCU_TOTAL = EnergyAccumulator.counter_index("ccu_power", daily=False)
+
+
+@pytest.fixture
+def entry():
+    """ConfigEntry im Webhook-Modus."""
+    config_entry = MagicMock()
+    config_entry.entry_id = "test_entry"
+    config_entry.title = "Test Entry"
+    config_entry.data = {}
+    config_entry.options = {}
+    return config_entry
+
+
+def _frame(pv_power, uptime_ms=None, pccu=0.0, send_count=None, battery_wh=None):
+    data = {
+        "PV_power_total": pv_power,
+        "Pccu": pccu,
+        "Pr": 0.0,
+        "batteriesInfo": [{} if battery_wh is None else {"batteryCapacity": battery_wh}],
+    }
+    if uptime_ms is not None:
+        data["uptime"] = uptime_ms
+    if send_count is not None:
+        data["sendCount"] = send_count
+    return data
+
+
+def test_counter_index_unique():
+    """Jeder Kanal hat einen eigenen Tages- und Gesamtzähler."""
+    indices = {
+        EnergyAccumulator.counter_index(channel, daily)
+        for channel in POWER_CHANNELS
+        for daily in (False, True)
+    }
+    assert indices == set(range(2 * len(POWER_CHANNELS)))
+
+
+def test_trapezoidal_integration(entry):  # pylint: disable=redefined-outer-name
+    """1000 W → 2000 W über eine Stunde ergibt 1,5 kWh in Tages- und Gesamtzähler."""
+    accumulator = EnergyAccumulator(MagicMock(), entry, max_sub_interval=7200)
+    accumulator.add_frame(_frame(1000), 0.0)
+    accumulator.add_frame(_frame(2000), 3600.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(1.5)
+    assert accumulator.value(PV_TODAY) == pytest.approx(1.5)
+
+
+def test_left_riemann_integration(entry):  # pylint: disable=redefined-outer-name
+    """Die linke Riemann-Summe verwendet nur den vorherigen Wert."""
+    accumulator = EnergyAccumulator(
+        MagicMock(), entry, method=METHOD_LEFT, max_sub_interval=7200
+    )
+    accumulator.add_frame(_frame(1000), 0.0)
+    accumulator.add_frame(_frame(2000), 3600.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(1.0)
+
+
+def test_unknown_method(entry):  # pylint: disable=redefined-outer-name
+    """Unbekannte Methoden werden abgelehnt."""
+    with pytest.raises(ValueError):
+        EnergyAccumulator(MagicMock(), entry, method="simpson")
+
+
+def test_uptime_is_used_for_all_channels(entry):  # pylint: disable=redefined-outer-name
+    """Die Geräte-Uptime bestimmt dt für alle Kanäle eines Frames."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    accumulator.add_frame(_frame(3600, 10_000, pccu=360), 100.0)
+    accumulator.add_frame(_frame(3600, 20_000, pccu=360), 190.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(0.01)
+    assert accumulator.value(CCU_TOTAL) == pytest.approx(0.001)
+
+
+def test_gap_and_restart(entry):  # pylint: disable=redefined-outer-name
+    """Lücken werden übersprungen, restart() vergisst den letzten Frame."""
+    accumulator = EnergyAccumulator(MagicMock(), entry, max_sub_interval=120)
+    accumulator.add_frame(_frame(1000), 0.0)
+    accumulator.add_frame(_frame(1000), 500.0)
+    assert accumulator.value(PV_TOTAL) == 0.0
+
+    accumulator.restart()
+    accumulator.add_frame(_frame(1000), 510.0)
+    assert accumulator.value(PV_TOTAL) == 0.0
+
+    accumulator.add_frame(_frame(1000), 546.0)
+    assert accumulator.value(PV_TOTAL) == pytest.approx(0.01)
+
+
+def test_invalid_channel_holds_last_value(entry):  # pylint: disable=redefined-outer-name
+    """Ein ungültiger Wert in einem Frame hält den letzten gültigen Wert."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    accumulator.add_frame(_frame(3600), 0.0)
+    accumulator.add_frame(_frame(None), 10.0)
+    accumulator.add_frame(_frame(3600), 20.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(0.02)
+
+
+def test_set_value_only_affects_one_counter(entry):  # pylint: disable=redefined-outer-name
+    """set_value setzt einen einzelnen Zähler, die Integration läuft weiter."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    accumulator.add_frame(_frame(3600), 0.0)
+    accumulator.set_value(PV_TOTAL, 5.0)
+    accumulator.add_frame(_frame(3600), 1.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(5.001)
+    assert accumulator.value(PV_TODAY) == pytest.approx(0.001)
+
+
+def test_compensated_summation(entry):  # pylint: disable=redefined-outer-name
+    """Viele kleine Beiträge zu einem großen Zählerstand gehen nicht verloren."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    accumulator.set_value(PV_TOTAL, 1e6)
+    naive = 1e6
+    step = 0.001 / 3_600_000
+
+    for i in range(100_001):
+        accumulator.add_frame(_frame(0.001), float(i))
+        if i:
+            naive += step
+
+    expected = 1e6 + 0.001 * 100_000 / 3_600_000
+    assert math.isclose(accumulator.value(PV_TOTAL), expected, rel_tol=0, abs_tol=1e-12)
+    assert abs(naive - expected) > abs(accumulator.value(PV_TOTAL) - expected)
+
+
+@pytest.mark.asyncio
+async def test_setup_subscribes_once(entry):  # pylint: disable=redefined-outer-name
+    """Ein Abonnement für alle Energie-Sensoren, Listener werden benachrichtigt."""
+    hass = MagicMock()
+    hass.data = {
+        DOMAIN: {
+            entry.entry_id: {
+                WEBHOOK_SIGNAL_UPDATE: "update",
+                WEBHOOK_SIGNAL_STATE: "stale",
+            }
+        }
+    }
+    accumulator = EnergyAccumulator(hass, entry)
+    accumulator.checkpoint = MagicMock()
+    accumulator.checkpoint.async_load = AsyncMock(return_value=None)
+    accumulator.checkpoint.async_save = AsyncMock()
+    accumulator.checkpoint.async_write_ahead = AsyncMock()
+    unsub = MagicMock()
+
+    with patch(
+        "custom_components.maxxi_charge_connect.devices.energy_accumulator.async_dispatcher_connect",
+        return_value=unsub,
+    ) as connect, patch(
+        "custom_components.maxxi_charge_connect.devices.energy_accumulator.async_track_time_interval"
+    ) as track_interval:
+        await accumulator.setup()
+        await accumulator.setup()
+
+    assert [call.args[1] for call in connect.call_args_list] == ["update", "stale"]
+
+    listener = MagicMock()
+    remove = accumulator.async_add_listener(listener)
+    await accumulator._wrapper_update(_frame(1000))  # pylint: disable=protected-access
+    listener.assert_called_once()
+
+    remove()
+    await accumulator._wrapper_update(_frame(1000))  # pylint: disable=protected-access
+    listener.assert_called_once()
+
+    assert track_interval.call_args.args[2] == timedelta(seconds=300)
+    accumulator.checkpoint.async_write_ahead.assert_awaited_once()
+
+    await accumulator.async_unload()
+    assert unsub.call_count == 2
+    accumulator.checkpoint.async_save.assert_awaited_once()
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("configured", "expected"), [(600, 600), (5, 30), ("kaputt", 300)]
+)
+async def test_checkpoint_interval_is_validated(entry, configured, expected):  # pylint: disable=redefined-outer-name
+    """Zu kleine oder ungültige Intervalle werden begrenzt bzw. ersetzt."""
+    entry.options = {"energy_checkpoint_interval": configured}
+    hass = MagicMock()
+    hass.data = {
+        DOMAIN: {
+            entry.entry_id: {
+                WEBHOOK_SIGNAL_UPDATE: "update",
+                WEBHOOK_SIGNAL_STATE: "stale",
+            }
+        }
+    }
+    accumulator = EnergyAccumulator(hass, entry)
+    accumulator.checkpoint = MagicMock()
+    accumulator.checkpoint.async_load = AsyncMock(return_value=None)
+    accumulator.checkpoint.async_write_ahead = AsyncMock()
+
+    with patch(
+        "custom_components.maxxi_charge_connect.devices.energy_accumulator.async_dispatcher_connect"
+    ), patch(
+        "custom_components.maxxi_charge_connect.devices.energy_accumulator.async_track_time_interval"
+    ) as track_interval:
+        await accumulator.setup()
+
+    assert track_interval.call_args.args[2] == timedelta(seconds=expected)
+
+@pytest.mark.asyncio
+async def test_views_share_accumulator(entry):  # pylint: disable=redefined-outer-name
+    """Tages- und Gesamtsensor zeigen die Zähler desselben Accumulators."""
+    hass = MagicMock()
+    accumulator = EnergyAccumulator(hass, entry)
+    today = PvTodayEnergy(hass, entry, "sensor.pv_power", accumulator)
+    total = PvTotalEnergy(hass, entry, "sensor.pv_power", accumulator)
+    for sensor in (today, total):
+        sensor.async_write_ha_state = MagicMock()
+
+    total._state = 10  # pylint: disable=protected-access
+    accumulator.add_frame(_frame(3600, 0), 0.0)
+    accumulator.add_frame(_frame(3600, 60_000), 60.0)
+
+    for sensor in (today, total):
+        sensor._handle_accumulator_update()  # pylint: disable=protected-access
+        sensor.async_write_ha_state.assert_called_once()
+
+    assert today.native_value == 0.06
+    assert total.native_value == 10.06
+
+    # Unveränderter Wert wird nicht erneut geschrieben
+    total._handle_accumulator_update()  # pylint: disable=protected-access
+    total.async_write_ha_state.assert_called_once()
+
+
+@pytest.fixture
+def berlin():
+    """Setzt die lokale Zeitzone für DST-Tests auf Europe/Berlin."""
+    original = dt_util.get_default_time_zone()
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Berlin"))
+    yield
+    dt_util.set_default_time_zone(original)
+
+
+def _local(year, month, day, hour=0, minute=0, second=0):
+    return datetime(
+        year, month, day, hour, minute, second, tzinfo=dt_util.get_default_time_zone()
+    )
+
+
+@pytest.mark.parametrize(
+    ("day", "hours"),
+    [
+        ((2026, 3, 29), 23),  # Beginn der Sommerzeit
+        ((2026, 10, 25), 25),  # Ende der Sommerzeit
+        ((2026, 6, 15), 24),
+    ],
+)
+def test_reset_daily_dst(entry, berlin, day, hours):  # pylint: disable=redefined-outer-name,unused-argument
+    """Der Reset-Zeitpunkt ist immer die lokale Mitternacht, auch an DST-Tagen."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+
+    accumulator.reset_daily(_local(*day))
+    start = accumulator.last_reset
+    assert start == dt_util.as_utc(dt_util.start_of_local_day(_local(*day)))
+
+    next_day = (_local(*day) + timedelta(days=1)).date()
+    # Scheduler ruft ggf. leicht verspätet auf, hier als UTC-Zeitpunkt
+    accumulator.reset_daily(dt_util.as_utc(_local(*next_day.timetuple()[:3], second=1)))
+
+    assert accumulator.last_reset - start == timedelta(hours=hours)
+    assert dt_util.as_local(accumulator.last_reset).date() == next_day
+
+
+def test_reset_daily_uses_local_date_of_utc_time(entry, berlin):  # pylint: disable=redefined-outer-name,unused-argument
+    """Ein UTC-Zeitpunkt kurz nach lokaler Mitternacht gehört zum neuen lokalen Tag."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    # 2026-10-24 22:30 UTC = 2026-10-25 00:30 lokal
+    accumulator.reset_daily(datetime(2026, 10, 24, 22, 30, tzinfo=UTC))
+
+    assert accumulator.last_reset == datetime(2026, 10, 24, 22, 0, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_midnight_resets_all_daily_counters(entry, berlin):  # pylint: disable=redefined-outer-name,unused-argument
+    """Alle Tageszähler werden gemeinsam zurückgesetzt und historisiert."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    accumulator.history = MagicMock()
+    accumulator.history.async_add_day = AsyncMock()
+    accumulator.last_reset = dt_util.as_utc(_local(2026, 10, 25))
+
+    for channel in POWER_CHANNELS:
+        accumulator.set_value(EnergyAccumulator.counter_index(channel, True), 1.5)
+        accumulator.set_value(EnergyAccumulator.counter_index(channel, False), 10.0)
+
+    reset_listener = AsyncMock()
+    accumulator.async_add_reset_listener(reset_listener)
+
+    await accumulator._async_midnight(_local(2026, 10, 26))  # pylint: disable=protected-access
+
+    for channel in POWER_CHANNELS:
+        assert accumulator.value(EnergyAccumulator.counter_index(channel, True)) == 0.0
+        assert accumulator.value(EnergyAccumulator.counter_index(channel, False)) == 10.0
+
+    accumulator.history.async_add_day.assert_awaited_once_with(
+        date(2026, 10, 25), [1.5] * len(POWER_CHANNELS)
+    )
+    reset_listener.assert_awaited_once_with(accumulator.last_reset)
+    assert accumulator.last_reset == datetime(2026, 10, 25, 23, 0, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_today_view_follows_shared_reset(entry):  # pylint: disable=redefined-outer-name
+    """Der Tagessensor übernimmt den Reset-Zeitpunkt des Accumulators."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    today = PvTodayEnergy(MagicMock(), entry, "sensor.pv_power", accumulator)
+    today.async_write_ha_state = MagicMock()
+    today._state = 3  # pylint: disable=protected-access
+
+    accumulator.reset_daily(dt_util.now())
+    await today._reset_energy_daily(accumulator.last_reset)  # pylint: disable=protected-access
+
+    assert today.last_reset == accumulator.last_reset
+    assert today.native_value == 0.0
+    today.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_today_view_keeps_energy_after_shared_reset(entry):  # pylint: disable=redefined-outer-name
+    """Energie, die zwischen Reset und Listener integriert wird, bleibt erhalten."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    today = PvTodayEnergy(MagicMock(), entry, "sensor.pv_power", accumulator)
+    today.async_write_ha_state = MagicMock()
+    today._state = 3  # pylint: disable=protected-access
+
+    accumulator.reset_daily(dt_util.now())
+    # Frames, während der Accumulator Historie und Checkpoint schreibt
+    accumulator.add_frame(_frame(3600), 0.0)
+    accumulator.add_frame(_frame(3600), 1.0)
+    energy = accumulator.value(PV_TODAY)
+    await today._reset_energy_daily(accumulator.last_reset)  # pylint: disable=protected-access
+
+    assert energy > 0
+    assert accumulator.value(PV_TODAY) == energy
+    assert today.native_value == round(energy, 3)
+
+
+def test_today_view_restores_only_same_day(entry):  # pylint: disable=redefined-outer-name
+    """Ein gespeicherter Tageswert vom Vortag wird nicht übernommen."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    today = PvTodayEnergy(MagicMock(), entry, "sensor.pv_power", accumulator)
+
+    same_day = State(
+        "sensor.pv_today", "2.5", {"last_reset": accumulator.last_reset.isoformat()}
+    )
+    yesterday = State(
+        "sensor.pv_today",
+        "2.5",
+        {"last_reset": (accumulator.last_reset - timedelta(days=1)).isoformat()},
+    )
+
+    assert today._is_restorable(same_day)  # pylint: disable=protected-access
+    assert not today._is_restorable(yesterday)  # pylint: disable=protected-access
+    assert not today._is_restorable(State("sensor.pv_today", "2.5"))  # pylint: disable=protected-access
+
+
+def test_checkpoint_restore_bridges_gap_with_uptime(entry):  # pylint: disable=redefined-outer-name
+    """Nach dem Neustart wird die Lücke über die Geräte-Uptime weiterintegriert."""
+    before = EnergyAccumulator(MagicMock(), entry)
+    before.add_frame(_frame(3600, 0), 0.0)
+    before.add_frame(_frame(3600, 60_000), 60.0)
+    record = before.snapshot()
+
+    after = EnergyAccumulator(MagicMock(), entry)
+    after.restore(record)
+    assert after.restored
+    assert after.value(PV_TOTAL) == pytest.approx(0.06)
+
+    # Neue monotone Zeit, aber das Gerät lief 30 s weiter
+    after.add_frame(_frame(3600, 90_000), 5.0)
+    assert after.value(PV_TOTAL) == pytest.approx(0.09)
+    assert after.snapshot()["seq"] == record["seq"] + 1
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_from_previous_day_is_archived(entry):  # pylint: disable=redefined-outer-name
+    """Ein Checkpoint vom Vortag landet in der Historie, die Tageszähler starten bei 0."""
+    before = EnergyAccumulator(MagicMock(), entry)
+    before.set_value(PV_TODAY, 2.0)
+    before.set_value(PV_TOTAL, 20.0)
+    before.last_reset -= timedelta(days=1)
+    record = before.snapshot()
+
+    after = EnergyAccumulator(MagicMock(), entry)
+    after.checkpoint = MagicMock()
+    after.checkpoint.async_load = AsyncMock(return_value=record)
+    after.history = MagicMock()
+    after.history.async_add_day = AsyncMock()
+
+    await after.async_restore()
+
+    assert after.value(PV_TODAY) == 0.0
+    assert after.value(PV_TOTAL) == 20.0
+    day, values = after.history.async_add_day.call_args.args
+    assert day == dt_util.as_local(before.last_reset).date()
+    assert values[POWER_CHANNELS.index("pv_power")] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_view_prefers_checkpoint_over_last_state(entry):  # pylint: disable=redefined-outer-name
+    """Ist ein Checkpoint geladen, wird der letzte Entitätszustand ignoriert."""
+    accumulator = EnergyAccumulator(MagicMock(), entry)
+    record = accumulator.snapshot()
+    record["counters"][PV_TOTAL] = 12.3456
+    accumulator.restore(record)
+
+    total = PvTotalEnergy(MagicMock(), entry, "sensor.pv_power", accumulator)
+    total.async_get_last_state = AsyncMock(return_value=State("sensor.pv_total", "10.0"))
+    total.async_on_remove = MagicMock()
+
+    with patch(
+        "homeassistant.helpers.restore_state.RestoreEntity.async_added_to_hass",
+        new=AsyncMock(),
+    ):
+        await total.async_added_to_hass()
+
+    assert total.native_value == 12.346
+    assert accumulator.value(PV_TOTAL) == 12.3456
+
+
+def _backfill_accumulator(entry, today_started_seconds_ago=86_400):
+    accumulator = EnergyAccumulator(MagicMock(), entry, max_sub_interval=120)
+    accumulator.last_reset = dt_util.utcnow() - timedelta(seconds=today_started_seconds_ago)
+    return accumulator
+
+
+@pytest.mark.asyncio
+async def test_backfill_gap_with_uptime(entry):  # pylint: disable=redefined-outer-name
+    """Eine Lücke mit durchlaufender Uptime wird interpoliert und protokolliert."""
+    accumulator = _backfill_accumulator(entry)
+    accumulator.add_frame(_frame(3600, 0), 0.0)
+    await accumulator._wrapper_stale(None)  # pylint: disable=protected-access
+    accumulator.add_frame(_frame(3600, 600_000), 5.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(0.6)
+    assert accumulator.value(PV_TODAY) == pytest.approx(0.6)
+    assert accumulator.backfilled(PV_TOTAL) == pytest.approx(0.6)
+
+    correction = accumulator.last_correction("pv_power")
+    assert correction["source"] == "uptime"
+    assert correction["gap_s"] == 600.0
+    assert correction["energy_kwh"] == {
+        "pv_power": 0.6,
+        "battery_power_charge": 0.6,
+        "pv_self_consumption": 0.6,
+    }
+    assert accumulator.last_correction("grid_import") is None
+
+
+def test_backfill_across_midnight_splits_today_share(entry):  # pylint: disable=redefined-outer-name
+    """Liegt der Tagesreset in der Lücke, bekommt der Tageszähler nur seinen Anteil."""
+    accumulator = _backfill_accumulator(entry, today_started_seconds_ago=300)
+    accumulator.add_frame(_frame(3600, 0), 0.0)
+    accumulator.add_frame(_frame(3600, 600_000), 600.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(0.6)
+    assert accumulator.value(PV_TODAY) == pytest.approx(0.3, abs=0.01)
+
+
+def test_backfill_from_send_count(entry):  # pylint: disable=redefined-outer-name
+    """Ohne Uptime belegen verlorene Telegramme, dass das Gerät weitergelaufen ist."""
+    accumulator = _backfill_accumulator(entry)
+    accumulator.add_frame(_frame(3600, send_count=1), 0.0)
+    accumulator.add_frame(_frame(3600, send_count=61), 600.0)
+
+    assert accumulator.value(PV_TOTAL) == pytest.approx(0.6)
+    correction = accumulator.corrections[-1]
+    assert correction["source"] == "sendCount"
+    assert correction["missed_frames"] == 59
+
+
+def test_no_backfill_without_evidence(entry):  # pylint: disable=redefined-outer-name
+    """Ohne Belege (sendCount lückenlos, keine Uptime) wird nichts nachgebucht."""
+    accumulator = _backfill_accumulator(entry)
+    accumulator.add_frame(_frame(3600, send_count=1), 0.0)
+    accumulator.add_frame(_frame(3600, send_count=2), 600.0)
+
+    assert accumulator.value(PV_TOTAL) == 0.0
+    assert not accumulator.corrections
+
+
+def test_backfill_battery_from_stored_energy(entry):  # pylint: disable=redefined-outer-name
+    """Lade- und Entladeenergie folgen der Änderung von batteryCapacity."""
+    accumulator = _backfill_accumulator(entry)
+    accumulator.add_frame(_frame(0, 0, battery_wh=1000), 0.0)
+    accumulator.add_frame(_frame(0, 3_600_000, pccu=0, battery_wh=1500), 5.0)
+
+    charge = EnergyAccumulator.counter_index("battery_power_charge", False)
+    discharge = EnergyAccumulator.counter_index("battery_power_discharge", False)
+    assert accumulator.value(charge) == pytest.approx(0.5)
+    assert accumulator.value(discharge) == 0.0
+    assert accumulator.corrections[-1]["battery_from_soe"]
+
+
+def test_backfill_is_exposed_and_checkpointed(entry):  # pylint: disable=redefined-outer-name
+    """Die Korrektur erscheint als Attribut und übersteht einen Neustart."""
+    accumulator = _backfill_accumulator(entry)
+    accumulator.add_frame(_frame(3600, 0), 0.0)
+    accumulator.add_frame(_frame(3600, 600_000), 5.0)
+
+    restored = EnergyAccumulator(MagicMock(), entry)
+    restored.restore(accumulator.snapshot())
+    total = PvTotalEnergy(MagicMock(), entry, "sensor.pv_power", restored)
+
+    attributes = total.extra_state_attributes
+    assert attributes["source"] == "sensor.pv_power"
+    assert attributes["backfill_kwh"] == 0.6
+    assert attributes["last_backfill"]["source"] == "uptime"
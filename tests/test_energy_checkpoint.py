@@ -0,0 +1,79 @@
+"""Tests für Checkpoint und Write-Ahead-Log der Energiezähler."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.maxxi_charge_connect.devices.energy_checkpoint import (
+    EnergyCheckpoint,
+)
+from custom_components.maxxi_charge_connect.devices.energy_integrator import (
+    POWER_CHANNELS,
+)
+
+
+def _record(seq):
+    return {
+        "seq": seq,
+        "channels": list(POWER_CHANNELS),
+        "counters": [float(seq)] * (2 * len(POWER_CHANNELS)),
+        "last_powers": [None] * len(POWER_CHANNELS),
+        "last_uptime_ms": None,
+        "last_reset": "2026-10-18T22:00:00+00:00",
+        "saved_at": "2026-10-19T08:00:00+00:00",
+    }
+
+
+def _checkpoint(tmp_path, stored=None):
+    hass = MagicMock()
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    (tmp_path / ".storage").mkdir()
+
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=stored)
+    store.async_save = AsyncMock()
+    with patch(
+        "custom_components.maxxi_charge_connect.devices.energy_checkpoint.Store",
+        return_value=store,
+    ):
+        checkpoint = EnergyCheckpoint(hass, "entry")
+    wal = tmp_path / ".storage" / "maxxi_charge_connect.entry.energy_checkpoint.wal"
+    return checkpoint, store, wal
+
+
+@pytest.mark.asyncio
+async def test_newest_wal_record_wins(tmp_path):
+    """Ein neuerer Log-Eintrag hat Vorrang, eine abgeschnittene Zeile wird ignoriert."""
+    checkpoint, _, wal = _checkpoint(tmp_path, _record(3))
+
+    await checkpoint.async_write_ahead(_record(4))
+    await checkpoint.async_write_ahead(_record(5))
+    with open(wal, "a", encoding="utf-8") as file:
+        file.write(json.dumps(_record(6))[:20])
+
+    loaded = await checkpoint.async_load()
+    assert loaded["seq"] == 5
+
+
+@pytest.mark.asyncio
+async def test_save_truncates_wal(tmp_path):
+    """Nach einem Checkpoint ist das Log leer."""
+    checkpoint, store, wal = _checkpoint(tmp_path)
+    await checkpoint.async_write_ahead(_record(1))
+
+    await checkpoint.async_save(_record(2))
+
+    store.async_save.assert_awaited_once_with(_record(2))
+    assert wal.read_text(encoding="utf-8") == ""
+
+
+@pytest.mark.asyncio
+async def test_other_channel_layout_is_ignored(tmp_path):
+    """Datensätze mit anderer Kanalliste werden nicht geladen."""
+    record = _record(1)
+    record["channels"] = ["pv_power"]
+    checkpoint, _, _ = _checkpoint(tmp_path, record)
+
+    assert await checkpoint.async_load() is None
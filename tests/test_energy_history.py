@@ -0,0 +1,65 @@
+"""Tests für die Tageshistorie der Energiezähler."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.maxxi_charge_connect.devices.energy_history import (
+    EnergyHistory,
+)
+from custom_components.maxxi_charge_connect.devices.energy_integrator import (
+    POWER_CHANNELS,
+)
+
+
+def _history(stored=None, max_days=400):
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=stored)
+    store.async_save = AsyncMock()
+    with patch(
+        "custom_components.maxxi_charge_connect.devices.energy_history.Store",
+        return_value=store,
+    ):
+        history = EnergyHistory(MagicMock(), "entry", max_days=max_days)
+    return history, store
+
+
+@pytest.mark.asyncio
+async def test_add_day_saves_compact_row():
+    """Ein Tag wird als Zeile [Datum, Werte je Kanal] gespeichert."""
+    history, store = _history()
+    values = [1.23456] * len(POWER_CHANNELS)
+
+    await history.async_add_day(date(2026, 10, 18), values)
+
+    saved = store.async_save.call_args.args[0]
+    assert saved["channels"] == list(POWER_CHANNELS)
+    assert saved["days"] == [["2026-10-18", *([1.2346] * len(POWER_CHANNELS))]]
+
+
+@pytest.mark.asyncio
+async def test_add_day_replaces_same_day_and_trims():
+    """Derselbe Tag wird ersetzt, alte Tage fallen heraus."""
+    stored = {
+        "channels": list(POWER_CHANNELS),
+        "days": [["2026-10-16", 1.0], ["2026-10-17", 2.0]],
+    }
+    history, store = _history(stored, max_days=2)
+    values = [3.0] * len(POWER_CHANNELS)
+
+    await history.async_add_day(date(2026, 10, 17), values)
+    await history.async_add_day(date(2026, 10, 18), values)
+
+    days = store.async_save.call_args.args[0]["days"]
+    assert [row[0] for row in days] == ["2026-10-17", "2026-10-18"]
+    assert days[0][1] == 3.0
+    store.async_load.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_load_discards_other_channel_layout():
+    """Gespeicherte Daten mit anderer Kanalreihenfolge werden verworfen."""
+    history, _ = _history({"channels": ["pv_power"], "days": [["2026-10-16", 1.0]]})
+
+    assert await history.async_load() == []
@@ -0,0 +1,91 @@
+"""Tests für die Hilfsfunktionen der Energie-Integration."""
+
+import pytest
+
+from custom_components.maxxi_charge_connect.devices.energy_integrator import (
+    POWER_CHANNELS,
+    channel_power,
+    frame_battery_energy,
+    frame_delta_seconds,
+    frame_powers,
+    frame_send_count,
+    frame_uptime,
+)
+
+
+def _frame(**kwargs):
+    data = {
+        "Pccu": 200.0,
+        "PV_power_total": 500.0,
+        "Pr": -100.0,
+        "batteriesInfo": [{"batteryCapacity": 2000}],
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_uptime_reset_falls_back_to_local_time():
+    """Nach einem Geräteneustart wird die lokale Zeit verwendet."""
+    assert frame_delta_seconds(100.0, 105.0, 50_000, 1_000) == pytest.approx(5.0)
+    assert frame_delta_seconds(None, 105.0, None, 1_000) is None
+
+
+def test_uptime_is_preferred_over_local_time():
+    """Die Geräte-Uptime bestimmt dt, auch wenn die Frames verspätet ankommen."""
+    assert frame_delta_seconds(100.0, 190.0, 10_000, 20_000) == pytest.approx(10.0)
+
+
+def test_frame_uptime():
+    """Uptime wird als int gelesen, ungültige Werte werden ignoriert."""
+    assert frame_uptime({"uptime": "1234"}) == 1234
+    assert frame_uptime({"uptime": -1}) is None
+    assert frame_uptime({"uptime": "abc"}) is None
+    assert frame_uptime({}) is None
+
+
+def test_frame_send_count_and_battery_energy():
+    """sendCount und die Summe der Batterieenergie werden robust gelesen."""
+    assert frame_send_count({"sendCount": "42"}) == 42
+    assert frame_send_count({}) is None
+
+    batteries = [{"batteryCapacity": 1000}, {"batteryCapacity": "500.5"}]
+    assert frame_battery_energy({"batteriesInfo": batteries}) == 1500.5
+    assert frame_battery_energy({"batteriesInfo": [{"batteryCapacity": 1}, {}]}) is None
+    assert frame_battery_energy({"batteriesInfo": []}) is None
+
+
+def test_channel_power():
+    """Die Kanäle entsprechen den Berechnungen der Leistungssensoren."""
+    data = _frame()
+
+    assert channel_power("pv_power", data) == 500.0
+    assert channel_power("ccu_power", data) == 200.0
+    assert channel_power("battery_power_charge", data) == 300.0
+    assert channel_power("battery_power_discharge", data) == 0.0
+    assert channel_power("grid_export", data) == 100.0
+    assert channel_power("grid_import", data) == 0.0
+    assert channel_power("pv_self_consumption", data) == 400.0
+    assert channel_power("power_consumption", data) == 200.0
+
+    discharge = _frame(PV_power_total=0.0, Pccu=300.0, Pr=50.0)
+    assert channel_power("battery_power_discharge", discharge) == 300.0
+    assert channel_power("power_consumption", discharge) == 350.0
+
+
+def test_channel_power_invalid_frames():
+    """Fehlende oder unplausible Werte liefern None."""
+    assert channel_power("pv_power", _frame(PV_power_total=None)) is None
+    assert channel_power("ccu_power", _frame(Pccu=5000.0)) is None
+    assert channel_power("grid_import", {"Pccu": 1}) is None
+    assert channel_power("pv_power", _frame(batteriesInfo=[])) is None
+    assert channel_power("unbekannt", _frame()) is None
+
+
+def test_frame_powers_order():
+    """frame_powers liefert alle Kanäle in der Reihenfolge von POWER_CHANNELS."""
+    data = _frame()
+    powers = frame_powers(data)
+
+    assert len(powers) == len(POWER_CHANNELS)
+    for channel, power in zip(POWER_CHANNELS, powers):
+        assert channel_power(channel, data) == power
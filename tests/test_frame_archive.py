@@ -0,0 +1,103 @@
+"""Tests für das Tagesarchiv der Rohdaten."""
+
+from datetime import date, datetime, timezone
+import os
+from unittest.mock import MagicMock
+
+from custom_components.maxxi_charge_connect.devices.frame_archive import (
+    FrameArchive,
+    read_archive_file,
+)
+
+DAY = date(2026, 1, 1)
+START = datetime(2026, 1, 1, 12, tzinfo=timezone.utc).timestamp()
+
+
+def _archive(tmp_path, retention_days=365):
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {}
+    entry.options = {"frame_archive_retention_days": retention_days}
+    return FrameArchive(MagicMock(), entry, directory=str(tmp_path))
+
+
+def _frame(pccu, soc=50):
+    return {"Pccu": pccu, "Pr": -100, "PV_power_total": 800, "SOC": soc}
+
+
+def _write(archive, frames):
+    archive.start()
+    for timestamp, frame in frames:
+        archive.add_frame(frame, timestamp)
+    archive.stop()
+
+
+def test_roundtrip(tmp_path):
+    """Geschriebene Frames werden mit Zeitstempel und Werten wieder gelesen."""
+    archive = _archive(tmp_path)
+    _write(archive, [(START + i * 1.5, _frame(100 + i, soc="kaputt")) for i in range(3)])
+
+    result = archive.read_day(DAY)
+
+    assert result["timestamps"] == [START, START + 1.5, START + 3.0]
+    assert result["columns"]["pccu"] == [100.0, 101.0, 102.0]
+    assert result["columns"]["soc"] == [None, None, None]
+    assert archive.stats()["frames"] == 3
+
+
+def test_only_changed_columns_are_stored(tmp_path):
+    """Unveränderte Spalten vergrößern die Datei nicht."""
+    steady = _archive(tmp_path / "steady")
+    _write(steady, [(START + i, _frame(100)) for i in range(100)])
+    changing = _archive(tmp_path / "changing")
+    _write(changing, [(START + i, _frame(100 + i, soc=i)) for i in range(100)])
+
+    steady_size = os.path.getsize(tmp_path / "steady" / "2026-01-01.mca")
+    changing_size = os.path.getsize(tmp_path / "changing" / "2026-01-01.mca")
+
+    assert steady_size < changing_size
+    assert steady.read_day(DAY)["columns"]["pccu"] == [100.0] * 100
+
+
+def test_rotation_at_midnight(tmp_path):
+    """Frames nach Mitternacht landen in der Datei des neuen Tages."""
+    midnight = datetime(2026, 1, 2, tzinfo=timezone.utc).timestamp()
+    archive = _archive(tmp_path)
+    _write(archive, [(midnight - 1, _frame(1)), (midnight + 1, _frame(2))])
+
+    assert archive.days() == [DAY, date(2026, 1, 2)]
+    assert archive.read_day(date(2026, 1, 2))["columns"]["pccu"] == [2.0]
+
+
+def test_restart_appends_to_existing_file(tmp_path):
+    """Nach einem Neustart wird an die Datei des Tages angehängt."""
+    _write(_archive(tmp_path), [(START, _frame(1))])
+    _write(_archive(tmp_path), [(START + 10, _frame(2))])
+
+    result = read_archive_file(str(tmp_path / "2026-01-01.mca"))
+
+    assert result["timestamps"] == [START, START + 10]
+    assert result["columns"]["pccu"] == [1.0, 2.0]
+
+
+def test_retention_removes_old_files(tmp_path):
+    """Dateien außerhalb der Aufbewahrungsdauer werden gelöscht."""
+    (tmp_path / "2025-12-01.mca").write_bytes(b"")
+    (tmp_path / "2025-12-30.mca").write_bytes(b"")
+    archive = _archive(tmp_path, retention_days=5)
+
+    archive._apply_retention(DAY)  # pylint: disable=protected-access
+
+    assert archive.days() == [date(2025, 12, 30)]
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    """Ein abgeschnittener letzter Satz verhindert das Lesen nicht."""
+    archive = _archive(tmp_path)
+    _write(archive, [(START + i, _frame(100 + i)) for i in range(3)])
+    path = tmp_path / "2026-01-01.mca"
+    path.write_bytes(path.read_bytes()[:-2])
+
+    result = read_archive_file(str(path))
+
+    assert result["columns"]["pccu"] == [100.0, 101.0]
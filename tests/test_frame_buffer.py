@@ -0,0 +1,133 @@
+"""Tests für den FrameBuffer und den Service query_recent."""
+
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.maxxi_charge_connect.const import DOMAIN, FRAME_BUFFER
+from custom_components.maxxi_charge_connect.devices.frame_buffer import (
+    FrameBuffer,
+    async_handle_query_recent,
+)
+
+
+def _buffer(capacity=10):
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {}
+    return FrameBuffer(MagicMock(), entry, capacity=capacity)
+
+
+def _frame(pccu, soc=50, batteries=None):
+    frame = {"Pccu": pccu, "Pr": -100, "PV_power_total": 800, "SOC": soc}
+    if batteries is not None:
+        frame["batteriesInfo"] = batteries
+    return frame
+
+
+def test_ring_overwrites_oldest_frames():
+    """Ist der Puffer voll, verdrängt der neue Frame den ältesten."""
+    buffer = _buffer(capacity=4)
+    for second in range(6):
+        buffer.add_frame(_frame(second * 10), 1000.0 + second)
+
+    result = buffer.query(0, 2000, fields=["pccu"])
+
+    assert len(buffer) == 4
+    assert result["timestamps"] == [1002.0, 1003.0, 1004.0, 1005.0]
+    assert result["columns"]["pccu"] == [20.0, 30.0, 40.0, 50.0]
+
+
+def test_query_window_and_invalid_values():
+    """Nur Frames im Fenster; ungültige Werte kommen als None."""
+    buffer = _buffer()
+    buffer.add_frame(_frame(100), 10.0)
+    buffer.add_frame(_frame("kaputt"), 20.0)
+    buffer.add_frame(_frame(300), 30.0)
+
+    result = buffer.query(15, 30, fields=["pccu", "soc"])
+
+    assert result["count"] == 2
+    assert result["columns"] == {"pccu": [None, 300.0], "soc": [50.0, 50.0]}
+
+
+def test_battery_columns_follow_battery_count():
+    """Batteriespalten werden angelegt und bei fehlender Batterie mit None gefüllt."""
+    buffer = _buffer()
+    two = [{"batterySOC": 40}, {"batterySOC": 60}]
+    buffer.add_frame(_frame(100, batteries=two), 1.0)
+    buffer.add_frame(_frame(100, batteries=two[:1]), 2.0)
+
+    result = buffer.query(0, 10, fields=["battery_0_soc", "battery_1_soc"])
+
+    assert result["columns"] == {
+        "battery_0_soc": [40.0, 40.0],
+        "battery_1_soc": [60.0, None],
+    }
+
+
+def test_downsample_and_statistics():
+    """Intervall-Mittelwerte und Kennzahlen je Spalte."""
+    buffer = _buffer(capacity=100)
+    for second in range(20):
+        buffer.add_frame(_frame(second), float(second))
+
+    downsampled = buffer.query(0, 19, fields=["pccu"], every=10)
+    assert downsampled["timestamps"] == [0.0, 10.0]
+    assert downsampled["columns"]["pccu"] == [4.5, 14.5]
+
+    stats = buffer.query(
+        0, 19, fields=["pccu"], statistics=["min", "max", "mean"], percentiles=[50]
+    )["statistics"]["pccu"]
+    assert stats == {"min": 0.0, "max": 19.0, "mean": 9.5, "p50": 9.5}
+
+
+def test_unknown_field_is_rejected():
+    """Unbekannte Spalten führen zu einem Fehler."""
+    with pytest.raises(ValueError):
+        _buffer().query(0, 1, fields=["gibt_es_nicht"])
+
+
+def test_stats_reports_bounded_memory():
+    """Der Speicherbedarf hängt nur von der Kapazität ab."""
+    buffer = _buffer(capacity=10)
+    before = buffer.stats()["bytes"]
+    for second in range(50):
+        buffer.add_frame(_frame(second), float(second))
+
+    assert buffer.stats()["bytes"] == before
+    assert buffer.stats()["frames"] == 10
+
+
+@pytest.mark.asyncio
+async def test_service_selects_single_entry():
+    """Bei nur einem Gerät muss config_entry_id nicht angegeben werden."""
+    buffer = _buffer()
+    buffer.add_frame(_frame(100), 1.0)
+    buffer.query = MagicMock(return_value={"count": 1})
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry": {FRAME_BUFFER: buffer}, "proxy": None}}
+    call = MagicMock()
+    call.data = {"minutes": 5}
+
+    response = await async_handle_query_recent(hass, call)
+
+    assert response["config_entry_id"] == "entry"
+    assert response["count"] == 1
+    start, end = buffer.query.call_args.args
+    assert math.isclose(end - start, 300)
+
+
+@pytest.mark.asyncio
+async def test_service_requires_entry_with_several_devices():
+    """Bei mehreren Geräten muss der Eintrag angegeben werden."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"a": {FRAME_BUFFER: _buffer()}, "b": {FRAME_BUFFER: _buffer()}}}
+    call = MagicMock()
+    call.data = {"minutes": 5}
+
+    with pytest.raises(ServiceValidationError):
+        await async_handle_query_recent(hass, call)
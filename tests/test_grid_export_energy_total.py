@@ -3,6 +3,9 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
 from custom_components.maxxi_charge_connect.devices.grid_export_energy_total import (
     GridExportEnergyTotal,
 )
@@ -23,7 +26,7 @@ async def test_grid_export_total_init():
     dummy_config_entry.options = {}
 
     source_entity = "sensor.test_power"
-    sensor = GridExportEnergyTotal(hass, dummy_config_entry, source_entity)
+    sensor = GridExportEnergyTotal(hass, dummy_config_entry, source_entity, EnergyAccumulator(hass, dummy_config_entry))
 
     # Grundlegende Attribute prüfen
     assert sensor._source_entity == source_entity  # pylint: disable=protected-access
@@ -12,6 +12,9 @@ from homeassistant.util import dt as dt_util
 
 import pytest
 
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
 from custom_components.maxxi_charge_connect.devices.grid_import_energy_today import (
     GridImportEnergyToday,
 )
@@ -41,7 +44,7 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
     entry.entry_id = "test_entry"
     entry.title = "Test Entry"
 
-    sensor = GridImportEnergyToday(hass, entry, "sensor.pv_power")
+    sensor = GridImportEnergyToday(hass, entry, "sensor.pv_power", EnergyAccumulator(hass, entry))
     sensor.hass = hass
     sensor.async_write_ha_state = MagicMock()
     sensor._state = 200  # pylint: disable=protected-access
@@ -56,6 +59,8 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
     caplog.set_level("INFO")
 
     # 🔁 Reset aufrufen
+    # Den Tageszähler setzt der Accumulator zurück, der Sensor übernimmt nur den Reset
+    sensor._accumulator.reset_daily(fake_now)  # pylint: disable=protected-access
     await sensor._reset_energy_daily(fake_now)  # pylint: disable=protected-access
 
     # ✅ Überprüfungen
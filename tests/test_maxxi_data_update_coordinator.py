@@ -8,6 +8,7 @@ from bs4 import BeautifulSoup
 
 from custom_components.maxxi_charge_connect.http_scan.maxxi_data_update_coordinator import (
     MaxxiDataUpdateCoordinator,
+    ScanValue,
 )
 from custom_components.maxxi_charge_connect.const import REQUIRED, NEIN
 
@@ -56,6 +57,29 @@ def test_initialization(coordinator):
     assert coordinator.update_interval.total_seconds() == 30
 
 
+def test_parse_values(coordinator):
+    """Test that raw values are parsed once into value and unit."""
+    values = coordinator.parse_values(
+        {"MaximumPower": "800 W", "PowerMeterIp": "nicht gesetzt"}
+    )
+
+    assert values["MaximumPower"] == ScanValue("800 W", 800.0, "W")
+    assert values["PowerMeterIp"] == ScanValue("nicht gesetzt", None, None)
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_sets_values(coordinator):
+    """Test that a refresh stores the parsed values alongside the raw data."""
+    with patch.object(
+        coordinator, "_async_scan", AsyncMock(return_value={"MaximumPower": "800 W"})
+    ):
+        data = await coordinator._async_update_data()
+
+    assert data == {"MaximumPower": "800 W"}
+    assert coordinator.get_float("MaximumPower") == 800.0
+    assert coordinator.get_float("Unbekannt") is None
+
+
 # def test_initialization_without_ip(hass, entry, sensor_list):
 #     """Test initialization when IP address is missing."""
 #     entry.data = {"device_id": "test_device", "ip_address": ""}
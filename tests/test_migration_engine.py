@@ -0,0 +1,429 @@
+"""Tests für die MigrationEngine (alle Mappings in einem Lauf)."""
+
+import json
+import os
+import sqlite3
+import time
+
+from homeassistant.components.recorder.db_schema import EventData
+import pytest
+
+from custom_components.maxxi_charge_connect.migration.migration_engine import (
+    EntityIdRewriter,
+    MigrationEngine,
+)
+
+SCHEMA = """
+CREATE TABLE states_meta (metadata_id INTEGER PRIMARY KEY, entity_id TEXT);
+CREATE TABLE states (
+    state_id INTEGER PRIMARY KEY, metadata_id INTEGER, state TEXT, last_updated_ts REAL
+);
+CREATE TABLE events (event_id INTEGER PRIMARY KEY, event_type TEXT, event_data TEXT);
+CREATE TABLE statistics_meta (
+    id INTEGER PRIMARY KEY, statistic_id TEXT, source TEXT, unit_of_measurement TEXT
+);
+CREATE TABLE statistics (id INTEGER PRIMARY KEY, metadata_id INTEGER, sum REAL);
+CREATE TABLE statistics_short_term (id INTEGER PRIMARY KEY, metadata_id INTEGER, sum REAL);
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Recorder-Datenbank mit zwei alten und einem bereits vorhandenen neuen Sensor."""
+    path = tmp_path / "home-assistant_v2.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO states_meta (metadata_id, entity_id) VALUES (?, ?)",
+        [(1, "sensor.old_pv"), (2, "sensor.old_grid"), (3, "sensor.new_pv")],
+    )
+    conn.executemany(
+        "INSERT INTO states (metadata_id, state, last_updated_ts) VALUES (?, ?, ?)",
+        [
+            (1, "10.5", 1.0),
+            (1, "11.5", 2.0),
+            (2, "3.0", 1.0),
+            (3, "unavailable", 3.0),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO events (event_type, event_data) VALUES (?, ?)",
+        [
+            ("state_changed", '{"entity_id": "sensor.old_pv"}'),
+            ("state_changed", '{"entity_id": "sensor.old_grid"}'),
+            ("call_service", '{"entity_id": "sensor.old_pv"}'),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO statistics_meta (id, statistic_id, source, unit_of_measurement) "
+        "VALUES (?, ?, 'recorder', 'kWh')",
+        [(1, "sensor.old_pv"), (2, "sensor.old_grid")],
+    )
+    conn.executemany(
+        "INSERT INTO statistics (metadata_id, sum) VALUES (?, ?)",
+        [(1, 1.0), (1, 2.0), (2, 3.0)],
+    )
+    conn.execute("INSERT INTO statistics_short_term (metadata_id, sum) VALUES (1, 1.0)")
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+MAPPINGS = [("sensor.old_pv", "sensor.new_pv"), ("sensor.old_grid", "sensor.new_grid")]
+
+
+def test_run_migrates_all_mappings(db_path):  # pylint: disable=redefined-outer-name
+    """States, Logbuch und Statistiken aller Mappings werden migriert."""
+    report = MigrationEngine(db_path).run(MAPPINGS)
+
+    assert [phase["phase"] for phase in report["phases"]] == [
+        "states_meta",
+        "logbook",
+        "statistics_meta",
+        "statistics",
+    ]
+    rows = {phase["phase"]: phase["rows"] for phase in report["phases"]}
+    assert rows == {"states_meta": 5, "logbook": 2, "statistics_meta": 2, "statistics": 4}
+    assert report["states"] == {"sensor.new_pv": "11.5", "sensor.new_grid": "3.0"}
+
+    conn = sqlite3.connect(db_path)
+    new_pv = conn.execute(
+        "SELECT state FROM states s JOIN states_meta m USING (metadata_id) "
+        "WHERE m.entity_id = 'sensor.new_pv' ORDER BY last_updated_ts"
+    ).fetchall()
+    assert new_pv == [("10.5",), ("11.5",), ("11.5",)]
+
+    events = conn.execute("SELECT event_data FROM events ORDER BY event_id").fetchall()
+    assert events == [
+        ('{"entity_id": "sensor.new_pv"}',),
+        ('{"entity_id": "sensor.new_grid"}',),
+        ('{"entity_id": "sensor.old_pv"}',),
+    ]
+
+    meta = dict(conn.execute("SELECT statistic_id, unit_of_measurement FROM statistics_meta"))
+    assert meta == {"sensor.new_pv": "kWh", "sensor.new_grid": "kWh"}
+    sums = conn.execute(
+        "SELECT m.statistic_id, SUM(s.sum) FROM statistics s "
+        "JOIN statistics_meta m ON m.id = s.metadata_id GROUP BY m.statistic_id"
+    ).fetchall()
+    assert dict(sums) == {"sensor.new_pv": 3.0, "sensor.new_grid": 3.0}
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    conn.close()
+
+
+def test_run_rolls_back_on_error(db_path):  # pylint: disable=redefined-outer-name
+    """Scheitert eine Phase, bleibt die Datenbank unverändert."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TABLE events")
+    conn.commit()
+    conn.close()
+
+    engine = MigrationEngine(db_path)
+    with pytest.raises(sqlite3.OperationalError):
+        engine.run(MAPPINGS)
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM states WHERE metadata_id = 1").fetchone() == (2,)
+    assert conn.execute("SELECT COUNT(*) FROM statistics_meta").fetchone() == (2,)
+    conn.close()
+    assert engine.report["states"] == {}
+
+
+def test_run_ignores_identical_and_missing_db(tmp_path):
+    """Identische Mappings und eine fehlende Datenbank führen zu keinem Lauf."""
+    engine = MigrationEngine(str(tmp_path / "missing.db"))
+
+    assert engine.run([("sensor.a", "sensor.a")])["mappings"] == 0
+    assert engine.run(MAPPINGS)["phases"] == []
+
+
+def test_plan_counts_rows_without_changes(db_path):  # pylint: disable=redefined-outer-name
+    """Der Probelauf zählt die betroffenen Zeilen und verändert nichts."""
+    with open(db_path, "rb") as file:
+        before = file.read()
+
+    plan = MigrationEngine(db_path, chunk_pause=0.5).plan(MAPPINGS)
+
+    assert plan["rows"] == {
+        "states": 3,
+        "events": 2,
+        "statistics": 3,
+        "statistics_short_term": 1,
+    }
+    assert plan["mappings"][0] == {
+        "old_sensor": "sensor.old_pv",
+        "new_sensor": "sensor.new_pv",
+        "states": 2,
+        "statistics": 2,
+        "statistics_short_term": 1,
+    }
+    assert plan["statistics_chunks"] == 2
+    assert plan["throughput"]["update_rows_per_s"] > 0
+    assert plan["throughput"]["scan_rows_per_s"] > 0
+    assert plan["estimated_seconds"] >= 1.0
+    with open(db_path, "rb") as file:
+        assert file.read() == before
+
+
+
+def test_plan_does_not_lock_database(db_path):  # pylint: disable=redefined-outer-name
+    """Der Probelauf läuft auch, während der Recorder schreibt."""
+    recorder = sqlite3.connect(db_path, isolation_level=None)
+    recorder.execute("BEGIN IMMEDIATE")
+    try:
+        plan = MigrationEngine(db_path).plan(MAPPINGS)
+        recorder.execute("UPDATE states SET state = state")
+    finally:
+        recorder.execute("ROLLBACK")
+        recorder.close()
+
+    assert plan["rows"]["states"] == 3
+    assert plan["throughput"]["update_rows_per_s"] > 0
+
+def test_plan_counts_modern_events(tmp_path):
+    """Im aktuellen Schema werden die state_changed-Events über event_type_id gezählt."""
+    path = str(tmp_path / "modern.db")
+    _modern_db(path, events=10)
+
+    plan = MigrationEngine(path).plan(MAPPINGS)
+
+    assert plan["rows"]["events"] == 7
+    assert plan["rows"]["states"] == 0
+
+
+def _add_statistics(db_path, count):
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO statistics (metadata_id, sum) VALUES (?, ?)",
+        [(1 + i % 2, 1.0) for i in range(count)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_statistics_are_moved_in_chunks(db_path, tmp_path):  # pylint: disable=redefined-outer-name
+    """Jeder Block wird gemeldet, der Cursor ist danach entfernt."""
+    _add_statistics(db_path, 47)
+    progress = []
+    cursor_path = str(tmp_path / "cursor.json")
+    engine = MigrationEngine(
+        db_path, cursor_path=cursor_path, progress=progress.append, chunk_size=10, chunk_pause=0
+    )
+
+    report = engine.run(MAPPINGS)
+
+    assert report["phases"][-1] == {
+        "phase": "statistics",
+        "rows": 51,
+        "seconds": report["phases"][-1]["seconds"],
+    }
+    assert [(p["table"], p["last_id"]) for p in progress] == [
+        ("statistics", 10),
+        ("statistics", 20),
+        ("statistics", 30),
+        ("statistics", 40),
+        ("statistics", 50),
+        ("statistics_short_term", 1),
+    ]
+    assert not (tmp_path / "cursor.json").exists()
+
+
+def test_statistics_chunks_cover_only_migrated_ids(db_path, tmp_path):  # pylint: disable=redefined-outer-name
+    """Zeilen fremder Sensoren außerhalb des id-Bereichs erzeugen keine Blöcke."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("DELETE FROM statistics")
+    conn.executemany(
+        "INSERT INTO statistics (id, metadata_id, sum) VALUES (?, ?, 1.0)",
+        [(i, 9) for i in range(1, 1001)] + [(1001, 1), (1005, 2)] + [(i, 9) for i in range(1006, 2001)],
+    )
+    conn.commit()
+    conn.close()
+    progress = []
+
+    plan = MigrationEngine(db_path, chunk_size=10).plan(MAPPINGS)
+    report = MigrationEngine(
+        db_path, cursor_path=str(tmp_path / "cursor.json"), progress=progress.append, chunk_size=10, chunk_pause=0
+    ).run(MAPPINGS)
+
+    assert plan["statistics_chunks"] == 2
+    assert [(p["table"], p["last_id"]) for p in progress] == [
+        ("statistics", 1005),
+        ("statistics_short_term", 1),
+    ]
+    assert report["phases"][-1]["rows"] == 3
+
+
+def test_interrupted_statistics_migration_resumes(db_path, tmp_path):  # pylint: disable=redefined-outer-name
+    """Nach einem Abbruch setzt der nächste Lauf am gespeicherten Cursor fort."""
+    _add_statistics(db_path, 47)
+    cursor_path = tmp_path / "cursor.json"
+
+    def interrupt(progress):
+        if progress["last_id"] == 20:
+            raise RuntimeError("Abbruch")
+
+    with pytest.raises(RuntimeError):
+        MigrationEngine(
+            db_path, cursor_path=str(cursor_path), progress=interrupt, chunk_size=10, chunk_pause=0
+        ).run(MAPPINGS)
+
+    stored = json.loads(cursor_path.read_text(encoding="utf-8"))
+    assert (stored["table"], stored["last_id"]) == ("statistics", 20)
+
+    progress = []
+    report = MigrationEngine(
+        db_path, cursor_path=str(cursor_path), progress=progress.append, chunk_size=10, chunk_pause=0
+    ).run(MAPPINGS)
+
+    assert progress[0]["last_id"] == 30
+    assert report["phases"][-1]["rows"] == 51 - 20
+
+    conn = sqlite3.connect(db_path)
+    meta = dict(conn.execute("SELECT id, statistic_id FROM statistics_meta"))
+    assert set(meta.values()) == {"sensor.new_pv", "sensor.new_grid"}
+    assert conn.execute(
+        "SELECT COUNT(*) FROM statistics WHERE metadata_id NOT IN (SELECT id FROM statistics_meta)"
+    ).fetchone() == (0,)
+    conn.close()
+
+
+MODERN_SCHEMA = """
+CREATE TABLE states_meta (metadata_id INTEGER PRIMARY KEY, entity_id TEXT);
+CREATE TABLE states (
+    state_id INTEGER PRIMARY KEY, metadata_id INTEGER, state TEXT, last_updated_ts REAL
+);
+CREATE TABLE event_types (event_type_id INTEGER PRIMARY KEY, event_type TEXT);
+CREATE TABLE event_data (data_id INTEGER PRIMARY KEY, hash INTEGER, shared_data TEXT);
+CREATE TABLE events (
+    event_id INTEGER PRIMARY KEY, event_type TEXT, event_data TEXT,
+    event_type_id INTEGER, data_id INTEGER, time_fired_ts REAL
+);
+CREATE INDEX ix_events_event_type_id_time_fired_ts ON events (event_type_id, time_fired_ts);
+CREATE TABLE statistics_meta (
+    id INTEGER PRIMARY KEY, statistic_id TEXT, source TEXT, unit_of_measurement TEXT
+);
+CREATE TABLE statistics (id INTEGER PRIMARY KEY, metadata_id INTEGER, sum REAL);
+CREATE TABLE statistics_short_term (id INTEGER PRIMARY KEY, metadata_id INTEGER, sum REAL);
+"""
+
+
+def _modern_db(path, events=0, shared=None):
+    """Datenbank im aktuellen Recorder-Schema (geteilte Event-Daten)."""
+    conn = sqlite3.connect(path)
+    conn.executescript(MODERN_SCHEMA)
+    conn.executemany(
+        "INSERT INTO event_types VALUES (?, ?)", [(1, "state_changed"), (2, "call_service")]
+    )
+    shared = shared or [
+        '{"entity_id": "sensor.old_pv"}',
+        '{"entity_id": "sensor.old_pv_2"}',
+        '{"entity_id": "sensor.old_grid"}',
+    ]
+    conn.executemany(
+        "INSERT INTO event_data (data_id, hash, shared_data) VALUES (?, 0, ?)",
+        list(enumerate(shared, start=1)),
+    )
+    # data_id 3 gehört nur zu einem call_service-Event
+    conn.executemany(
+        "INSERT INTO events (event_type_id, data_id, time_fired_ts) VALUES (?, ?, ?)",
+        [(1, 1, 1.0), (1, 2, 2.0), (2, 3, 3.0)],
+    )
+    if events:
+        conn.executemany(
+            "INSERT INTO events (event_type_id, data_id, time_fired_ts) VALUES (?, ?, ?)",
+            ((1 + i % 2, 1 + i % len(shared), float(i)) for i in range(events)),
+        )
+    conn.commit()
+    conn.close()
+
+
+def test_rewriter_replaces_whole_ids_only():
+    """Eine entity_id, die Präfix einer anderen ist, wird nicht teilweise ersetzt."""
+    rewriter = EntityIdRewriter([("sensor.a", "sensor.x"), ("sensor.a_b", "sensor.y")])
+
+    assert rewriter.rewrite('["sensor.a", "sensor.a_b", "sensor.a_c"]') == (
+        '["sensor.x", "sensor.y", "sensor.a_c"]'
+    )
+
+
+def test_logbook_uses_shared_event_data(tmp_path):
+    """Im aktuellen Schema werden nur state_changed-Daten gelesen und neu gehasht."""
+    path = str(tmp_path / "modern.db")
+    _modern_db(path)
+
+    engine = MigrationEngine(path)
+    engine.run(MAPPINGS)
+
+    assert engine.report["logbook"] == {"scanned": 2, "modified": 1}
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT data_id, hash, shared_data FROM event_data").fetchall()
+    conn.close()
+    new_data = '{"entity_id": "sensor.new_pv"}'
+    assert rows == [
+        (1, EventData.hash_shared_data_bytes(new_data.encode()), new_data),
+        (2, 0, '{"entity_id": "sensor.old_pv_2"}'),
+        (3, 0, '{"entity_id": "sensor.old_grid"}'),
+    ]
+
+
+def _legacy_logbook_migration(path, mappings):
+    """Bisheriges Verfahren: ein LIKE-Scan über alle Events je Mapping."""
+    conn = sqlite3.connect(path)
+    for old, new in mappings:
+        conn.execute(
+            "UPDATE events SET event_data = REPLACE(event_data, ?, ?) "
+            "WHERE event_type = 'state_changed' AND event_data LIKE ?",
+            (f'"{old}"', f'"{new}"', f'%"{old}"%'),
+        )
+        conn.commit()
+    conn.close()
+
+
+def _events_db(path, count):
+    """Altes Schema mit count state_changed-Events (JSON direkt in events)."""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO events (event_type, event_data) VALUES ('state_changed', ?)",
+        (
+            (f'{{"entity_id": "sensor.{("old", "other")[i % 2]}_{i % 500}", "state": "1"}}',)
+            for i in range(count)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MAXXI_BENCHMARK"),
+    reason="Benchmark nur mit MAXXI_BENCHMARK=1",
+)
+def test_benchmark_logbook_migration_1m_events(tmp_path):
+    """Benchmark: 1 Mio. Events, 40 Mappings – alt (LIKE je Mapping) gegen neu."""
+    mappings = [(f"sensor.old_{i}", f"sensor.new_{i}") for i in range(0, 80, 2)]
+    legacy_path = str(tmp_path / "legacy.db")
+    engine_path = str(tmp_path / "engine.db")
+    _events_db(legacy_path, 1_000_000)
+    _events_db(engine_path, 1_000_000)
+
+    start = time.perf_counter()
+    _legacy_logbook_migration(legacy_path, mappings)
+    legacy_seconds = time.perf_counter() - start
+
+    engine = MigrationEngine(engine_path)
+    start = time.perf_counter()
+    engine.run(mappings)
+    engine_seconds = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\nalt: {legacy_seconds:.2f} s, neu: {engine_seconds:.2f} s, "
+        f"Logbuch: {engine.report['logbook']}"
+    )
+    assert engine.report["logbook"] == {"scanned": 1_000_000, "modified": 80_000}
+
+    conn = sqlite3.connect(legacy_path)
+    expected = conn.execute("SELECT event_data FROM events ORDER BY event_id").fetchall()
+    conn.close()
+    conn = sqlite3.connect(engine_path)
+    assert conn.execute("SELECT event_data FROM events ORDER BY event_id").fetchall() == expected
+    conn.close()
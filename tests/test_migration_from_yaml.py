@@ -0,0 +1,161 @@
+"""Tests für MigrateFromYaml."""
+
+from decimal import Decimal
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.components.integration.sensor import IntegrationSensor
+
+from custom_components.maxxi_charge_connect.migration.migration_from_yaml import (
+    MigrateFromYaml,
+)
+
+
+def _entry(entity_id, state):
+    return {
+        "state": {
+            "entity_id": entity_id,
+            "state": state,
+            "attributes": {},
+            "last_changed": "2026-10-01T00:00:00+00:00",
+            "last_reported": "2026-10-01T00:00:00+00:00",
+            "last_updated": "2026-10-01T00:00:00+00:00",
+            "context": {"id": "", "parent_id": None, "user_id": None},
+        },
+        "extra_data": {"native_value": None, "last_valid_state": state},
+        "last_seen": "2026-10-01T00:00:00+00:00",
+    }
+
+
+@pytest.fixture
+def migrator(tmp_path):
+    """MigrateFromYaml mit core.restore_state im temporären Verzeichnis."""
+    (tmp_path / ".storage").mkdir()
+    hass = MagicMock()
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return MigrateFromYaml(hass, MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_restore_states_are_patched_in_one_write(migrator, tmp_path):  # pylint: disable=redefined-outer-name
+    """Alle Einträge werden mit einem Lesen und einem Schreiben gepatcht."""
+    restore_file = tmp_path / ".storage" / "core.restore_state"
+    restore_file.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "key": "core.restore_state",
+                "data": [
+                    _entry("sensor.pv_total", "1.0"),
+                    _entry("sensor.grid_total", "2.0"),
+                    _entry("sensor.other", "3.0"),
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    restore_data = MagicMock()
+    restore_data.entities = {"sensor.pv_total": MagicMock()}
+    restore_data.last_states = {}
+
+    with patch(
+        "custom_components.maxxi_charge_connect.migration.migration_from_yaml.restore_state.async_get",
+        return_value=restore_data,
+    ):
+        count = await migrator.async_update_restore_states(
+            {
+                "sensor.pv_total": Decimal("10.5"),
+                "sensor.grid_total": Decimal("20.25"),
+                "sensor.new_total": Decimal("7"),
+            }
+        )
+
+    assert count == 3
+    migrator._hass.async_add_executor_job.assert_awaited_once()  # pylint: disable=protected-access
+
+    entries = {
+        entry["state"]["entity_id"]: entry
+        for entry in json.loads(restore_file.read_text(encoding="utf-8"))["data"]
+    }
+    assert entries["sensor.pv_total"]["state"]["state"] == "10.5"
+    assert entries["sensor.grid_total"]["extra_data"]["native_value"] == {
+        "__type": "<class 'decimal.Decimal'>",
+        "decimal_str": "20.25",
+    }
+    assert entries["sensor.new_total"]["extra_data"]["last_valid_state"] == "7"
+    assert entries["sensor.other"]["state"]["state"] == "3.0"
+
+    # Aktive Entitäten nicht im Speicher patchen, die übrigen schon
+    assert set(restore_data.last_states) == {"sensor.grid_total", "sensor.new_total"}
+    assert restore_data.last_states["sensor.grid_total"].state.state == "20.25"
+
+
+@pytest.mark.asyncio
+async def test_missing_restore_file_is_ignored(migrator):  # pylint: disable=redefined-outer-name
+    """Ohne core.restore_state wird nichts geschrieben."""
+    assert await migrator.async_update_restore_states({"sensor.a": Decimal("1")}) == 0
+
+
+@pytest.mark.asyncio
+async def test_plan_migration_does_not_disable_recorder(migrator, tmp_path):  # pylint: disable=redefined-outer-name
+    """Der Probelauf liefert den Plan, ohne Recorder oder Dateien anzufassen."""
+    migrator._hass.config.config_dir = str(tmp_path)  # pylint: disable=protected-access
+    migrator._hass.services.async_call = AsyncMock()  # pylint: disable=protected-access
+    (tmp_path / "automations.yaml").write_text("entity_id: sensor.old\n", encoding="utf-8")
+    entity = MagicMock(unique_id="entry_pv")
+    migrations = [("sensor.old", "sensor.new", entity)]
+    engine_plan = {"rows": {"states": 5}, "estimated_seconds": 0.1}
+
+    def resolve(_mappings, skipped):
+        skipped.append({"old_sensor": "sensor.x", "new_sensor": None, "reason": "Ungültiges Mapping"})
+        return migrations
+
+    with (
+        patch.object(migrator, "_resolve_mappings", side_effect=resolve),
+        patch(
+            "custom_components.maxxi_charge_connect.migration.migration_from_yaml.MigrationEngine"
+        ) as engine_cls,
+    ):
+        engine_cls.return_value.plan = MagicMock(return_value=engine_plan)
+        plan = await migrator.async_plan_migration(
+            [{"old_sensor": "sensor.old", "new_sensor": "sensor.new"}]
+        )
+
+    engine_cls.return_value.plan.assert_called_once_with([("sensor.old", "sensor.new")])
+    assert plan["rows"] == {"states": 5}
+    assert plan["skipped"][0]["reason"] == "Ungültiges Mapping"
+    assert plan["yaml_files"] == [
+        {"path": str(tmp_path / "automations.yaml"), "replacements": 1}
+    ]
+    assert (tmp_path / "automations.yaml").read_text(encoding="utf-8") == (
+        "entity_id: sensor.old\n"
+    )
+    migrator._hass.services.async_call.assert_not_called()  # pylint: disable=protected-access
+
+
+def _integral(source, entity_id):
+    helper = MagicMock(spec=IntegrationSensor)
+    helper._source_entity = source  # pylint: disable=protected-access
+    helper.entity_id = entity_id
+    return helper
+
+
+def test_integral_helpers_are_indexed_once(migrator):  # pylint: disable=redefined-outer-name
+    """Die Sensor-Entitäten werden einmal indiziert, danach gilt der Index."""
+    first = _integral("sensor.pv", "sensor.pv_kwh")
+    duplicate = _integral("sensor.pv", "sensor.pv_kwh_2")
+    grid = _integral("sensor.grid", "sensor.grid_kwh")
+    entities = MagicMock()
+    entities.__iter__ = MagicMock(
+        return_value=iter([MagicMock(), first, duplicate, grid])
+    )
+    component = MagicMock(entities=entities)
+    migrator._hass.data = {"sensor": component}  # pylint: disable=protected-access
+
+    assert migrator.find_integral_helpers_by_input_sensor("sensor.pv") is first
+    assert migrator.find_integral_helpers_by_input_sensor("sensor.grid") is grid
+    assert migrator.find_integral_helpers_by_input_sensor("sensor.other") is None
+    entities.__iter__.assert_called_once()
@@ -94,6 +94,15 @@ def test_initialization(number_entity):
 #     assert number_entity.native_value is None
 
 
+def test_native_value_uses_parsed_coordinator_value(number_entity):
+    """Test that native_value reads the value parsed by the coordinator."""
+    number_entity._coordinator.get_float = MagicMock(return_value=42.5)
+    number_entity._show_current_value_immediately = False
+
+    assert number_entity.native_value == 42.5
+    number_entity._coordinator.get_float.assert_called_once_with("test_key")
+
+
 def test_native_value_show_immediately(number_entity):
     """Test _show_current_value_immediately flag."""
     number_entity._attr_native_value = 99.9
@@ -201,11 +210,8 @@ async def test_handle_summer_charge_changed_valid(number_entity):
     number_entity.set_native_value = MagicMock()
     number_entity.async_write_ha_state = MagicMock()
 
-    event = MagicMock()
-    event.data = {"value": "25.5"}
-
     number_entity._depends_on_winter_mode = True
-    number_entity._handle_summer_charge_changed(event)
+    number_entity._handle_summer_charge_changed("25.5")
 
     number_entity.set_native_value.assert_called_once_with(25.5)
 
@@ -216,11 +222,8 @@ async def test_handle_summer_charge_changed_invalid(number_entity):
     number_entity.set_native_value = MagicMock()
     number_entity.async_write_ha_state = MagicMock()
 
-    event = MagicMock()
-    event.data = {"value": "invalid"}
-
     number_entity._depends_on_winter_mode = True
-    number_entity._handle_summer_charge_changed(event)
+    number_entity._handle_summer_charge_changed("invalid")
 
     number_entity.set_native_value.assert_not_called()
 
@@ -12,6 +12,9 @@ from datetime import datetime, timedelta, UTC
 from homeassistant.util import dt as dt_util
 import pytest
 
+from custom_components.maxxi_charge_connect.devices.energy_accumulator import (
+    EnergyAccumulator,
+)
 from custom_components.maxxi_charge_connect.devices.pv_self_consumption_energy_today import (
     PvSelfConsumptionEnergyToday,
 )
@@ -42,7 +45,7 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
     entry.entry_id = "test_entry"
     entry.title = "Test Entry"
 
-    sensor = PvSelfConsumptionEnergyToday(hass, entry, "sensor.pv_power")
+    sensor = PvSelfConsumptionEnergyToday(hass, entry, "sensor.pv_power", EnergyAccumulator(hass, entry))
     sensor.hass = hass
     sensor.async_write_ha_state = MagicMock()
     sensor._state = 200  # pylint: disable=protected-access
@@ -58,6 +61,8 @@ async def test_reset_energy_daily_resets_last_reset_and_writes_state(caplog):
 
     # 🔁 Reset aufrufen
     # await sensor._reset_energy_daily(fake_now)  # pylint: disable=protected-access
+    # Den Tageszähler setzt der Accumulator zurück, der Sensor übernimmt nur den Reset
+    sensor._accumulator.reset_daily(fake_now)  # pylint: disable=protected-access
     await sensor._reset_energy_daily(fake_now)
 
     # ✅ Überprüfungen
@@ -0,0 +1,47 @@
+"""Tests für die Zuordnungstabelle der Sensortypen."""
+
+import pytest
+
+from custom_components.maxxi_charge_connect.migration.sensor_types import (
+    NEW_TO_OLD,
+    OLD_TO_NEW,
+    SENSOR_TYPES,
+    SuffixMatcher,
+)
+
+
+@pytest.mark.parametrize(("new", "old", "suffixes"), SENSOR_TYPES)
+def test_table_drives_both_directions(new, old, suffixes):
+    """Jede Zeile der Tabelle wird in beide Richtungen gefunden."""
+    assert NEW_TO_OLD.match(f"entry_{new}") == old
+    for suffix in suffixes:
+        assert OLD_TO_NEW.match(f"Maxxicharge1-{suffix.upper()}") == new
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("entry_battery_power", "batterie_leistung"),
+        ("entry_battery_power_charge", "batterie_laden"),
+        ("entry_battery_power_discharge", "batterie_entladen"),
+        ("entry_battery_pv_power", "pv_leistung"),
+        ("entry_battery_power_x", None),
+        ("", None),
+    ],
+)
+def test_longest_suffix_wins(value, expected):
+    """Der längste passende Suffix gewinnt, unabhängig von der Tabellenreihenfolge."""
+    assert NEW_TO_OLD.match(value) == expected
+
+
+def test_old_ids_with_shared_prefix():
+    """ladestand und ladestand_detail werden unterschieden."""
+    assert OLD_TO_NEW.match("maxxi_ladestand") == "battery_soc"
+    assert OLD_TO_NEW.match("maxxi_ladestand_detail") == "battery_soe"
+    assert OLD_TO_NEW.match("Maxxicharge1-LadestandDetail") == "battery_soe"
+
+
+def test_ambiguous_suffix_is_rejected():
+    """Ein Suffix mit zwei Werten ist ein Fehler in der Tabelle."""
+    with pytest.raises(ValueError):
+        SuffixMatcher([("abc", "x"), ("ABC", "y")])
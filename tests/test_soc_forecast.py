@@ -0,0 +1,50 @@
+"""Tests für SocForecast."""
+
+import pytest
+
+from custom_components.maxxi_charge_connect.winterbetrieb.soc_forecast import (
+    SocForecast,
+)
+
+
+def test_slope_and_crossing():
+    """Lineare Entladung ergibt die erwartete Rate und Restzeit."""
+    forecast = SocForecast()
+    for minute in range(6):
+        forecast.add(minute * 60.0, 50 - minute)
+
+    assert forecast.slope() == pytest.approx(-1 / 60)
+    assert forecast.seconds_until(40) == pytest.approx(300)
+    assert forecast.seconds_until(60) is None  # entfernt sich von der Schwelle
+
+
+def test_window_evicts_old_samples():
+    """Samples außerhalb des Fensters fließen nicht mehr in die Rate ein."""
+    forecast = SocForecast(window_seconds=300)
+    for minute in range(10):
+        forecast.add(minute * 60.0, 50.0)  # Stillstand
+    for minute in range(10, 16):
+        forecast.add(minute * 60.0, 50.0 + 2 * (minute - 9))
+
+    assert len(forecast) == 6
+    assert forecast.slope() == pytest.approx(2 / 60)
+
+
+def test_rebase_keeps_result():
+    """Das Neuberechnen der Summen ändert die Ausgleichsgerade nicht."""
+    forecast = SocForecast(window_seconds=120, max_samples=8)
+    for second in range(0, 5000, 10):
+        forecast.add(float(second), 80 - second / 100)
+
+    assert len(forecast) == 8
+    assert forecast.slope() == pytest.approx(-0.01)
+
+
+def test_power_rate_without_fit():
+    """Ohne Ausgleichsgerade wird die Rate aus der Batterieleistung geschätzt."""
+    forecast = SocForecast()
+    forecast.add(0.0, 50, power=1000, energy_wh=2500)
+
+    assert forecast.slope() is None
+    # 5000 Wh Kapazität, 1000 W Laden -> 20 %/h
+    assert forecast.rate() == pytest.approx(20 / 3600)
@@ -1,6 +1,6 @@
 """Tests für den StatusSensor der MaxxiChargeConnect-Integration."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -74,3 +74,18 @@ async def test_status_sensor_handle_stale_keeps_available(sensor):
 
     assert sensor.available is True
     assert sensor.native_value == "OK"
+
+
+@pytest.mark.asyncio
+async def test_status_sensor_http_scan_event_filters_device(sensor):
+    """HTTP-Scan-Events werden nur für das eigene Gerät verarbeitet."""
+    sensor.handle_update = AsyncMock()
+    event = MagicMock()
+
+    event.data = {"payload": {"deviceId": "other"}}
+    await sensor.async_update_from_event(event)
+    sensor.handle_update.assert_not_awaited()
+
+    event.data = {"payload": {"deviceId": "device-123"}}
+    await sensor.async_update_from_event(event)
+    sensor.handle_update.assert_awaited_once_with({"deviceId": "device-123"})
@@ -1,15 +1,22 @@
 """Testet die Hilfsfunktionen in tools.py des MaxxiChargeConnect Integrations."""
 
-from unittest.mock import MagicMock
+import os
+import time
+from unittest.mock import MagicMock, patch
 import pytest
 
+from homeassistant.helpers import entity_registry as er
+
 from custom_components.maxxi_charge_connect.tools import (
     is_pccu_ok,
     is_power_total_ok,
     is_pr_ok,
     clean_title,
     as_float,
-    async_get_min_soc_entity
+    split_value,
+    get_entity,
+    async_get_min_soc_entity,
+    async_dispatch_proxy_frame,
 )
 
 from custom_components.maxxi_charge_connect.const import (
@@ -161,6 +168,17 @@ async def test_tools__as_float__param_ist_none():
     assert as_float(value) is None
 
 
+@pytest.mark.asyncio
+async def test_tools__split_value():
+    """ Testet die split_value Funktion """
+
+    assert split_value("800 W") == (800.0, "W")
+    assert split_value("-20.5%") == (-20.5, "%")
+    assert split_value("42") == (42.0, None)
+    assert split_value("nicht gesetzt") == (None, None)
+    assert split_value(None) == (None, None)
+
+
 @pytest.mark.asyncio
 async def test_tools___get_min_soc_entity1():  # pylint: disable=invalid-name
     """Testet den Fall für alles OK, d.h. die Entity wurde gefunden."""
@@ -256,3 +274,125 @@ async def test_battery_soc___get_min_soc_entity3():  # pylint: disable=invalid-n
 
     mock_hass.states.get.assert_called_once_with(mock_entity.entity_id)
     assert cur_state is None
+
+
+def _build_registry(count: int):
+    """Erzeugt eine Entity-Registry mit `count` Sensor-Einträgen."""
+    items = er.EntityRegistryItems()
+    for i in range(count):
+        entity_id = f"sensor.test_{i}"
+        items[entity_id] = er.RegistryEntry(
+            entity_id=entity_id,
+            unique_id=f"entry_{i}_sensor",
+            platform=DOMAIN if i % 2 else "other",
+            config_entry_id=f"entry_{i % 10}",
+        )
+    items["number.min_soc"] = er.RegistryEntry(
+        entity_id="number.min_soc",
+        unique_id="entry_0_minSOC",
+        platform=DOMAIN,
+        config_entry_id="entry_0",
+    )
+
+    registry = er.EntityRegistry.__new__(er.EntityRegistry)
+    registry.entities = items
+    registry._entities_data = items.data  # pylint: disable=protected-access
+    return registry
+
+
+def _linear_get_entity(registry, plattform, unique_id):
+    """Alte Implementierung von get_entity als Vergleich."""
+    for entity in registry.entities.values():
+        if plattform == entity.platform and entity.unique_id == unique_id:
+            return entity
+    return None
+
+
+@pytest.fixture
+def big_registry():
+    """Registry mit 10.000 Entitäten."""
+    registry = _build_registry(10_000)
+    with patch(
+        "custom_components.maxxi_charge_connect.tools.async_get_entity_registry",
+        return_value=registry,
+    ):
+        yield registry
+
+
+def test_tools__get_entity(big_registry):  # pylint: disable=redefined-outer-name
+    """get_entity findet Einträge über den Registry-Index."""
+    hass = MagicMock()
+
+    entity = get_entity(hass, DOMAIN, "entry_9999_sensor")
+    assert entity.entity_id == "sensor.test_9999"
+
+    # Andere Domain als sensor wird ohne Angabe ebenfalls gefunden
+    assert get_entity(hass, DOMAIN, "entry_0_minSOC").entity_id == "number.min_soc"
+    assert get_entity(hass, DOMAIN, "entry_0_minSOC", "number").entity_id == (
+        "number.min_soc"
+    )
+    assert get_entity(hass, DOMAIN, "entry_0_minSOC", "sensor") is None
+
+    # Falsche Plattform oder unbekannte unique_id
+    assert get_entity(hass, DOMAIN, "entry_9998_sensor") is None
+    assert get_entity(hass, DOMAIN, "gibt_es_nicht") is None
+
+    # Ergebnis entspricht der bisherigen linearen Suche
+    assert get_entity(hass, DOMAIN, "entry_4711_sensor") is _linear_get_entity(
+        big_registry, DOMAIN, "entry_4711_sensor"
+    )
+
+
+def test_tools__get_entity_does_not_scan_registry(big_registry):  # pylint: disable=redefined-outer-name
+    """get_entity durchläuft die Registry nicht."""
+    hass = MagicMock()
+
+    with patch.object(big_registry.entities, "values") as values, patch.object(
+        big_registry.entities, "items"
+    ) as items:
+        assert get_entity(hass, DOMAIN, "entry_4711_sensor") is not None
+        assert get_entity(hass, DOMAIN, "gibt_es_nicht") is None
+
+    values.assert_not_called()
+    items.assert_not_called()
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MAXXI_BENCHMARK"),
+    reason="Benchmark nur mit MAXXI_BENCHMARK=1",
+)
+def test_tools__get_entity_timing(big_registry):  # pylint: disable=redefined-outer-name
+    """Indexierte Suche ist bei 10.000 Entitäten deutlich schneller als ein Scan."""
+    hass = MagicMock()
+    lookups = [f"entry_{i}_sensor" for i in range(1, 10_000, 500)]
+
+    start = time.perf_counter()
+    for unique_id in lookups:
+        _linear_get_entity(big_registry, DOMAIN, unique_id)
+    linear = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for unique_id in lookups:
+        get_entity(hass, DOMAIN, unique_id)
+    indexed = time.perf_counter() - start
+
+    assert indexed * 10 < linear
+
+
+def test_tools__proxy_frame_wird_pro_geraet_verteilt():
+    """ Proxy-Daten gehen nur an das Signal des betroffenen Geräts """
+
+    hass = MagicMock()
+    with patch(
+        "custom_components.maxxi_charge_connect.tools.async_dispatcher_send"
+    ) as mock_send:
+        frame = {"deviceId": "dev1", "Pccu": 100}
+        error = {"deviceId": "Errors", "ccu": "dev2", "error": 3}
+        async_dispatch_proxy_frame(hass, frame)
+        async_dispatch_proxy_frame(hass, error)
+        async_dispatch_proxy_frame(hass, {"Pccu": 100})
+
+    assert [c.args for c in mock_send.call_args_list] == [
+        (hass, f"{DOMAIN}_dev1_frame", frame),
+        (hass, f"{DOMAIN}_dev2_error", error),
+    ]
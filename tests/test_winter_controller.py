@@ -0,0 +1,229 @@
+"""Tests für den WinterModeController."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.maxxi_charge_connect.const import (
+    CONF_WINTER_FORECAST,
+    CONF_WINTER_MAX_CHARGE,
+    CONF_WINTER_MIN_CHARGE,
+    CONF_WINTER_MODE,
+    DOMAIN,
+)
+from custom_components.maxxi_charge_connect.winterbetrieb import winter_controller
+from custom_components.maxxi_charge_connect.winterbetrieb.winter_controller import (
+    STATE_CHARGE,
+    STATE_DISCHARGE,
+    STATE_OFF,
+    STATE_WAITING,
+    WinterModeController,
+)
+
+
+def _setup(min_soc=20.0, winter_mode=True, result=True):
+    """Controller mit minSOC-Entität, die set_change_limitation simuliert."""
+    entity = MagicMock()
+    entity.native_value = min_soc
+
+    async def set_change_limitation(value, _count_retry):
+        await asyncio.sleep(0)
+        if result:
+            entity.native_value = value
+        return result
+
+    entity.set_change_limitation = AsyncMock(side_effect=set_change_limitation)
+
+    hass = MagicMock()
+    hass.async_create_task = asyncio.ensure_future
+    hass.data = {
+        DOMAIN: {
+            "entry": {
+                CONF_WINTER_MODE: winter_mode,
+                CONF_WINTER_MIN_CHARGE: 20,
+                CONF_WINTER_MAX_CHARGE: 60,
+                "entities": {"minSOC": entity},
+            }
+        }
+    }
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    return WinterModeController(hass, entry), entity
+
+
+async def _settle(controller):
+    if controller._task is not None:  # pylint: disable=protected-access
+        await controller._task  # pylint: disable=protected-access
+
+
+@pytest.fixture(autouse=True)
+def _no_dispatcher():
+    with patch.object(winter_controller, "async_dispatcher_send") as send:
+        yield send
+
+
+@pytest.mark.asyncio
+async def test_lower_threshold_sets_winter_max():
+    """Unterhalb von WinterMinCharge wird minSOC auf WinterMaxCharge gesetzt."""
+    controller, entity = _setup(min_soc=20.0)
+
+    await controller.async_update_soc(15)
+    await _settle(controller)
+
+    assert controller.state == STATE_CHARGE
+    entity.set_change_limitation.assert_awaited_once_with(60.0, 5)
+
+
+@pytest.mark.asyncio
+async def test_upper_threshold_sets_winter_min():
+    """Ab WinterMaxCharge wird minSOC auf WinterMinCharge gesetzt."""
+    controller, entity = _setup(min_soc=60.0)
+
+    await controller.async_update_soc(65)
+    await _settle(controller)
+
+    assert controller.state == STATE_DISCHARGE
+    entity.set_change_limitation.assert_awaited_once_with(20.0, 5)
+
+
+@pytest.mark.asyncio
+async def test_band_derives_state_without_write():
+    """Im Hysterese-Band wird der Zustand aus minSOC bestimmt, ohne zu schreiben."""
+    controller, entity = _setup(min_soc=60.0)
+
+    await controller.async_update_soc(45)
+
+    assert controller.state == STATE_CHARGE
+    entity.set_change_limitation.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_known_state_only_checks_crossing(_no_dispatcher):
+    """In einem bekannten Zustand wird minSOC erst beim Überschreiten gelesen."""
+    controller, entity = _setup(min_soc=60.0)
+    await controller.async_update_soc(45)
+
+    entity.native_value = 33.0  # Würde im Zustand "waiting" ausgewertet
+    for soc in (30, 40, 59.9):
+        await controller.async_update_soc(soc)
+
+    assert controller.state == STATE_CHARGE
+    entity.set_change_limitation.assert_not_called()
+    _no_dispatcher.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_one_write_in_flight_per_transition():
+    """Wiederholte Frames hinter der Schwelle erzeugen nur einen Schreibvorgang."""
+    controller, entity = _setup(min_soc=20.0)
+
+    for _ in range(5):
+        await controller.async_update_soc(10)
+    assert controller.pending == 60.0
+    await _settle(controller)
+
+    entity.set_change_limitation.assert_awaited_once_with(60.0, 5)
+    assert controller.pending is None
+    assert controller.writes == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_retried_on_next_frame():
+    """Schlägt das Schreiben fehl, wird beim nächsten Frame neu bewertet."""
+    controller, entity = _setup(min_soc=20.0, result=False)
+
+    await controller.async_update_soc(10)
+    await _settle(controller)
+    assert controller.state == STATE_WAITING
+
+    await controller.async_update_soc(10)
+    await _settle(controller)
+    assert entity.set_change_limitation.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_winter_mode_off_does_nothing():
+    """Ohne Winterbetrieb wird nichts geschrieben."""
+    controller, entity = _setup(winter_mode=False)
+
+    await controller.async_update_soc(5)
+
+    assert controller.state == STATE_OFF
+    entity.set_change_limitation.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_limits_reevaluate():
+    """Geänderte Schwellen führen zu einer neuen Bewertung."""
+    controller, entity = _setup(min_soc=60.0)
+    await controller.async_update_soc(45)
+    assert controller.state == STATE_CHARGE
+
+    controller.hass.data[DOMAIN]["entry"][CONF_WINTER_MAX_CHARGE] = 40
+    await controller.async_update_soc(45)
+    await _settle(controller)
+
+    assert controller.state == STATE_DISCHARGE
+    entity.set_change_limitation.assert_awaited_once_with(20.0, 5)
+
+
+def _enable_forecast(controller):
+    controller.hass.data[DOMAIN]["entry"][CONF_WINTER_FORECAST] = True
+
+
+@pytest.mark.asyncio
+async def test_forecast_switches_before_lower_threshold():
+    """Der Prognose-Modus schaltet vor dem Erreichen von WinterMinCharge um."""
+    controller, entity = _setup(min_soc=20.0)
+    _enable_forecast(controller)
+
+    # 1 % pro Minute Entladung, im Band mit minSOC = WinterMinCharge
+    for minute, soc in enumerate((30, 29, 28, 27, 26, 25, 24, 23)):
+        await controller.async_update_soc(soc, timestamp=minute * 60.0)
+    assert controller.state == STATE_DISCHARGE
+    assert controller.predicted_crossing is not None
+    entity.set_change_limitation.assert_not_called()
+
+    # Schwelle in 2 Minuten erwartet -> minSOC wird vorgezogen gesetzt
+    await controller.async_update_soc(22, timestamp=8 * 60.0)
+    await _settle(controller)
+
+    assert controller.state == STATE_CHARGE
+    assert controller.early_transitions == 1
+    entity.set_change_limitation.assert_awaited_once_with(60.0, 5)
+    assert controller.attributes()["predicted_crossing"] is not None
+
+
+@pytest.mark.asyncio
+async def test_forecast_disabled_waits_for_threshold():
+    """Ohne Prognose-Modus wird erst an der Schwelle umgeschaltet."""
+    controller, entity = _setup(min_soc=20.0)
+
+    for minute, soc in enumerate((30, 28, 26, 24, 22, 21)):
+        await controller.async_update_soc(soc, timestamp=minute * 60.0)
+
+    assert controller.state == STATE_DISCHARGE
+    assert controller.predicted_crossing is None
+    assert len(controller.forecast) == 0
+    entity.set_change_limitation.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_forecast_uses_battery_power_before_fit():
+    """Vor der ersten Ausgleichsgerade wird die Batterieleistung verwendet."""
+    controller, entity = _setup(min_soc=20.0)
+    _enable_forecast(controller)
+    # 1000 Wh gespeichert bei 25 % -> 4000 Wh Kapazität; -2400 W = -1 %/min
+    frame = {
+        "PV_power_total": 0,
+        "Pccu": 2400,
+        "batteriesInfo": [{"batteryCapacity": 1000}],
+    }
+
+    await controller.async_update_soc(25, frame, timestamp=0.0)
+    await controller.async_update_soc(21.5, frame, timestamp=1.0)
+    await _settle(controller)
+
+    assert controller.state == STATE_CHARGE
+    entity.set_change_limitation.assert_awaited_once_with(60.0, 5)
@@ -0,0 +1,76 @@
+"""Tests für das Umbenennen von entity_ids in YAML-Dateien."""
+
+from unittest.mock import patch
+
+from custom_components.maxxi_charge_connect.migration.yaml_rewriter import (
+    rewrite_entity_ids,
+)
+
+MAPPINGS = [("sensor.old_pv", "sensor.new_pv"), ("sensor.old", "sensor.new")]
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_rewrites_all_mappings_in_one_pass(tmp_path):
+    """Jede Datei wird einmal gelesen, alle Mappings werden ersetzt."""
+    _write(
+        tmp_path / "automations.yaml",
+        "entity_id: sensor.old_pv\nother: sensor.old\nkeep: sensor.old_pv_2\n",
+    )
+    _write(tmp_path / "packages" / "energy.yaml", "source: sensor.old\n")
+    _write(tmp_path / "scripts.yaml", "entity_id: sensor.unrelated\n")
+
+    opened = []
+    real_open = open
+
+    def tracking_open(file, *args, **kwargs):
+        opened.append(str(file))
+        return real_open(file, *args, **kwargs)
+
+    with patch("builtins.open", tracking_open):
+        report = rewrite_entity_ids(str(tmp_path), MAPPINGS)
+
+    assert (tmp_path / "automations.yaml").read_text(encoding="utf-8") == (
+        "entity_id: sensor.new_pv\nother: sensor.new\nkeep: sensor.old_pv_2\n"
+    )
+    assert (tmp_path / "packages" / "energy.yaml").read_text(encoding="utf-8") == (
+        "source: sensor.new\n"
+    )
+    assert report["scanned"] == 3
+    assert report["replacements"] == 3
+    assert set(report["files"]) == {
+        str(tmp_path / "automations.yaml"),
+        str(tmp_path / "packages" / "energy.yaml"),
+    }
+    assert "+entity_id: sensor.new_pv" in report["files"][str(tmp_path / "automations.yaml")]["diff"]
+    assert sorted(opened) == sorted(set(opened))
+
+
+def test_dry_run_reports_without_writing(tmp_path):
+    """Im Probelauf werden die Dateien nur gemeldet, nicht geschrieben."""
+    _write(tmp_path / "automations.yaml", "entity_id: sensor.old_pv\n")
+
+    report = rewrite_entity_ids(str(tmp_path), MAPPINGS, dry_run=True)
+
+    assert report["replacements"] == 1
+    assert set(report["files"]) == {str(tmp_path / "automations.yaml")}
+    assert (tmp_path / "automations.yaml").read_text(encoding="utf-8") == (
+        "entity_id: sensor.old_pv\n"
+    )
+
+
+def test_skips_storage_deps_and_backups(tmp_path):
+    """.storage, deps und Backups werden nicht angefasst."""
+    for folder in (".storage", "deps", "backups"):
+        _write(tmp_path / folder / "file.yaml", "entity_id: sensor.old\n")
+
+    report = rewrite_entity_ids(str(tmp_path), MAPPINGS)
+
+    assert report == {"scanned": 0, "replacements": 0, "files": {}}
+    for folder in (".storage", "deps", "backups"):
+        assert (tmp_path / folder / "file.yaml").read_text(encoding="utf-8") == (
+            "entity_id: sensor.old\n"
+        )
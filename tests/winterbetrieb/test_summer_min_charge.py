@@ -30,7 +30,7 @@ def entry():
 def hass():
     """Mock Home Assistant instance."""
     hass = MagicMock()
-    hass.data = {DOMAIN: {}}
+    hass.data = {DOMAIN: {"test_entry": {}}}
     hass.bus = MagicMock()
     hass.config_entries = MagicMock()
     return hass
@@ -84,10 +84,11 @@ async def test_async_set_native_value(summer_min_charge, hass, entry):
     # Mock async_write_ha_state to avoid HA integration issues
     summer_min_charge.async_write_ha_state = MagicMock()
     
-    await summer_min_charge.async_set_native_value(value)
+    with patch("custom_components.maxxi_charge_connect.winterbetrieb.summer_min_charge.async_dispatcher_send"):
+        await summer_min_charge.async_set_native_value(value)
     
     assert summer_min_charge._attr_native_value == value
-    assert hass.data[DOMAIN][CONF_SUMMER_MIN_CHARGE] == value
+    assert hass.data[DOMAIN]["test_entry"][CONF_SUMMER_MIN_CHARGE] == value
     hass.config_entries.async_update_entry.assert_called_once_with(
         entry,
         options={
@@ -104,11 +105,13 @@ async def test_async_added_to_hass(summer_min_charge, hass):
     # Mock async_write_ha_state to avoid HA integration issues
     summer_min_charge.async_write_ha_state = MagicMock()
     
-    await summer_min_charge.async_added_to_hass()
-    
-    hass.bus.async_listen.assert_called_once_with(
-        WINTER_MODE_CHANGED_EVENT,
-        summer_min_charge._handle_winter_mode_changed
+    with patch("custom_components.maxxi_charge_connect.winterbetrieb.summer_min_charge.async_dispatcher_connect") as mock_connect:
+        await summer_min_charge.async_added_to_hass()
+
+    mock_connect.assert_called_once_with(
+        hass,
+        f"{WINTER_MODE_CHANGED_EVENT}_test_entry",
+        summer_min_charge._handle_winter_mode_changed,
     )
     assert summer_min_charge._remove_listener is not None
     summer_min_charge.async_write_ha_state.assert_called_once()
@@ -131,11 +134,11 @@ def test_notify_dependents(summer_min_charge, hass):
     """Test _notify_dependents method."""
     summer_min_charge._attr_native_value = 40
     
-    summer_min_charge._notify_dependents()
-    
-    hass.bus.async_fire.assert_called_once_with(
-        EVENT_SUMMER_MIN_CHARGE_CHANGED,
-        {"value": 40}
+    with patch("custom_components.maxxi_charge_connect.winterbetrieb.summer_min_charge.async_dispatcher_send") as mock_send:
+        summer_min_charge._notify_dependents()
+
+    mock_send.assert_called_once_with(
+        hass, f"{EVENT_SUMMER_MIN_CHARGE_CHANGED}_test_entry", 40
     )
 
 
@@ -143,21 +146,22 @@ def test_notify_dependents_no_value(summer_min_charge, hass):
     """Test _notify_dependents method with None value."""
     summer_min_charge._attr_native_value = None
     
-    summer_min_charge._notify_dependents()
-    
-    hass.bus.async_fire.assert_not_called()
+    with patch("custom_components.maxxi_charge_connect.winterbetrieb.summer_min_charge.async_dispatcher_send") as mock_send:
+        summer_min_charge._notify_dependents()
+
+    mock_send.assert_not_called()
 
 
 def test_available_winter_mode_disabled(summer_min_charge, hass):
     """Test available property when winter mode is disabled."""
-    hass.data[DOMAIN][CONF_WINTER_MODE] = False
+    hass.data[DOMAIN]["test_entry"][CONF_WINTER_MODE] = False
     
     assert summer_min_charge.available is True
 
 
 def test_available_winter_mode_enabled(summer_min_charge, hass):
     """Test available property when winter mode is enabled."""
-    hass.data[DOMAIN][CONF_WINTER_MODE] = True
+    hass.data[DOMAIN]["test_entry"][CONF_WINTER_MODE] = True
     
     assert summer_min_charge.available is False
 
@@ -171,14 +175,11 @@ def test_available_winter_mode_missing(summer_min_charge, hass):
 
 def test_handle_winter_mode_changed_winter_disabled(summer_min_charge, hass):
     """Test _handle_winter_mode_changed when winter mode is disabled."""
-    event = MagicMock()
-    event.data = {"enabled": False}
-    
     # Mock async_write_ha_state to avoid HA integration issues
     summer_min_charge.async_write_ha_state = MagicMock()
     
     with patch.object(summer_min_charge, '_notify_dependents') as mock_notify:
-        summer_min_charge._handle_winter_mode_changed(event)
+        summer_min_charge._handle_winter_mode_changed(False)
         
         mock_notify.assert_called_once()
         summer_min_charge.async_write_ha_state.assert_called_once()
@@ -186,32 +187,21 @@ def test_handle_winter_mode_changed_winter_disabled(summer_min_charge, hass):
 
 def test_handle_winter_mode_changed_winter_enabled(summer_min_charge, hass):
     """Test _handle_winter_mode_changed when winter mode is enabled."""
-    event = MagicMock()
-    event.data = {"enabled": True}
-    
     # Mock async_write_ha_state to avoid HA integration issues
     summer_min_charge.async_write_ha_state = MagicMock()
     
     with patch.object(summer_min_charge, '_notify_dependents') as mock_notify:
-        summer_min_charge._handle_winter_mode_changed(event)
+        summer_min_charge._handle_winter_mode_changed(True)
         
         mock_notify.assert_not_called()
         summer_min_charge.async_write_ha_state.assert_called_once()
 
 
-def test_handle_winter_mode_changed_no_data(summer_min_charge, hass):
-    """Test _handle_winter_mode_changed with no event data."""
-    event = MagicMock()
-    event.data = {}
-    
-    # Mock async_write_ha_state to avoid HA integration issues
-    summer_min_charge.async_write_ha_state = MagicMock()
-    
-    with patch.object(summer_min_charge, '_notify_dependents') as mock_notify:
-        summer_min_charge._handle_winter_mode_changed(event)
-        
-        mock_notify.assert_called_once()
-        summer_min_charge.async_write_ha_state.assert_called_once()
+def test_available_ignores_other_entries(summer_min_charge, hass):
+    """Der Winterbetrieb eines anderen Eintrags hat keinen Einfluss."""
+    hass.data[DOMAIN]["other_entry"] = {CONF_WINTER_MODE: True}
+
+    assert summer_min_charge.available is True
 
 
 def test_device_info(summer_min_charge, entry):
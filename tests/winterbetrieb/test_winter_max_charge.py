@@ -114,7 +114,7 @@ async def test_winter_max_charge__async_set_native_value1(mock_async_get_min_soc
     # Checks
     assert sensor._attr_native_value == new_value  # pylint: disable=protected-access
     assert DOMAIN in sensor.hass.data
-    assert sensor.hass.data[DOMAIN][CONF_WINTER_MAX_CHARGE] == new_value
+    assert sensor.hass.data[DOMAIN]["1234abcd"][CONF_WINTER_MAX_CHARGE] == new_value
 
     sensor.hass.config_entries.async_update_entry.assert_called_once()
 
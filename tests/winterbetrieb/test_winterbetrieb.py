@@ -27,12 +27,21 @@ def entry():
 def hass():
     """Mock Home Assistant instance."""
     hass = MagicMock()
-    hass.data = {DOMAIN: {CONF_WINTER_MODE: False}}
+    hass.data = {DOMAIN: {"test_entry": {CONF_WINTER_MODE: False}}}
     hass.bus = MagicMock()
     hass.config_entries = MagicMock()
     return hass
 
 
+@pytest.fixture
+def dispatcher_send():
+    """Patch für das Versenden der Signale."""
+    with patch(
+        "custom_components.maxxi_charge_connect.winterbetrieb.winterbetrieb.async_dispatcher_send"
+    ) as send:
+        yield send
+
+
 @pytest.fixture
 def winterbetrieb_entity(entry, hass):
     """Create Winterbetrieb instance for testing."""
@@ -79,7 +88,7 @@ def test_turn_off(winterbetrieb_entity):
 
 
 @pytest.mark.asyncio
-async def test_async_turn_on(winterbetrieb_entity, hass, entry):
+async def test_async_turn_on(winterbetrieb_entity, hass, entry, dispatcher_send):
     """Test async_turn_on method."""
     # Mock async_write_ha_state to avoid HA integration issues
     winterbetrieb_entity.async_write_ha_state = MagicMock()
@@ -87,7 +96,7 @@ async def test_async_turn_on(winterbetrieb_entity, hass, entry):
     await winterbetrieb_entity.async_turn_on()
     
     assert winterbetrieb_entity._state is True
-    assert hass.data[DOMAIN][CONF_WINTER_MODE] is True
+    assert hass.data[DOMAIN]["test_entry"][CONF_WINTER_MODE] is True
     hass.config_entries.async_update_entry.assert_called_once_with(
         entry,
         options={
@@ -95,15 +104,14 @@ async def test_async_turn_on(winterbetrieb_entity, hass, entry):
             CONF_WINTER_MODE: True,
         },
     )
-    hass.bus.async_fire.assert_called_once_with(
-        WINTER_MODE_CHANGED_EVENT,
-        {"enabled": True}
+    dispatcher_send.assert_called_once_with(
+        hass, f"{WINTER_MODE_CHANGED_EVENT}_test_entry", True
     )
     winterbetrieb_entity.async_write_ha_state.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_async_turn_off(winterbetrieb_entity, hass, entry):
+async def test_async_turn_off(winterbetrieb_entity, hass, entry, dispatcher_send):
     """Test async_turn_off method."""
     # Mock async_write_ha_state to avoid HA integration issues
     winterbetrieb_entity.async_write_ha_state = MagicMock()
@@ -111,7 +119,7 @@ async def test_async_turn_off(winterbetrieb_entity, hass, entry):
     await winterbetrieb_entity.async_turn_off()
     
     assert winterbetrieb_entity._state is False
-    assert hass.data[DOMAIN][CONF_WINTER_MODE] is False
+    assert hass.data[DOMAIN]["test_entry"][CONF_WINTER_MODE] is False
     hass.config_entries.async_update_entry.assert_called_once_with(
         entry,
         options={
@@ -119,9 +127,8 @@ async def test_async_turn_off(winterbetrieb_entity, hass, entry):
             CONF_WINTER_MODE: False,
         },
     )
-    hass.bus.async_fire.assert_called_once_with(
-        WINTER_MODE_CHANGED_EVENT,
-        {"enabled": False}
+    dispatcher_send.assert_called_once_with(
+        hass, f"{WINTER_MODE_CHANGED_EVENT}_test_entry", False
     )
     winterbetrieb_entity.async_write_ha_state.assert_called_once()
 
@@ -132,7 +139,7 @@ async def test_async_added_to_hass(winterbetrieb_entity, hass):
     # Mock async_write_ha_state to avoid HA integration issues
     winterbetrieb_entity.async_write_ha_state = MagicMock()
     
-    hass.data[DOMAIN][CONF_WINTER_MODE] = True
+    hass.data[DOMAIN]["test_entry"][CONF_WINTER_MODE] = True
     
     await winterbetrieb_entity.async_added_to_hass()
     
@@ -146,7 +153,7 @@ async def test_async_added_to_hass_missing_data(winterbetrieb_entity, hass):
     # Mock async_write_ha_state to avoid HA integration issues
     winterbetrieb_entity.async_write_ha_state = MagicMock()
     
-    hass.data[DOMAIN] = {}  # CONF_WINTER_MODE not present
+    hass.data[DOMAIN] = {"test_entry": {}}  # CONF_WINTER_MODE not present
     
     await winterbetrieb_entity.async_added_to_hass()
     
@@ -154,27 +161,25 @@ async def test_async_added_to_hass_missing_data(winterbetrieb_entity, hass):
     winterbetrieb_entity.async_write_ha_state.assert_called_once()
 
 
-def test_notify_dependents(winterbetrieb_entity, hass):
+def test_notify_dependents(winterbetrieb_entity, hass, dispatcher_send):
     """Test _notify_dependents method."""
     winterbetrieb_entity._state = True
     
     winterbetrieb_entity._notify_dependents()
     
-    hass.bus.async_fire.assert_called_once_with(
-        WINTER_MODE_CHANGED_EVENT,
-        {"enabled": True}
+    dispatcher_send.assert_called_once_with(
+        hass, f"{WINTER_MODE_CHANGED_EVENT}_test_entry", True
     )
 
 
-def test_notify_dependents_false(winterbetrieb_entity, hass):
+def test_notify_dependents_false(winterbetrieb_entity, hass, dispatcher_send):
     """Test _notify_dependents method with False state."""
     winterbetrieb_entity._state = False
     
     winterbetrieb_entity._notify_dependents()
     
-    hass.bus.async_fire.assert_called_once_with(
-        WINTER_MODE_CHANGED_EVENT,
-        {"enabled": False}
+    dispatcher_send.assert_called_once_with(
+        hass, f"{WINTER_MODE_CHANGED_EVENT}_test_entry", False
     )
 
 
@@ -189,7 +194,7 @@ def test_device_info(winterbetrieb_entity, entry):
 
 
 @pytest.mark.asyncio
-async def test_save_state(winterbetrieb_entity, hass, entry):
+async def test_save_state(winterbetrieb_entity, hass, entry, dispatcher_send):
     """Test _save_state method."""
     # Mock async_write_ha_state to avoid HA integration issues
     winterbetrieb_entity.async_write_ha_state = MagicMock()
@@ -197,7 +202,7 @@ async def test_save_state(winterbetrieb_entity, hass, entry):
     await winterbetrieb_entity._save_state(True)
     
     assert winterbetrieb_entity._state is True
-    assert hass.data[DOMAIN][CONF_WINTER_MODE] is True
+    assert hass.data[DOMAIN]["test_entry"][CONF_WINTER_MODE] is True
     hass.config_entries.async_update_entry.assert_called_once_with(
         entry,
         options={
@@ -205,8 +210,22 @@ async def test_save_state(winterbetrieb_entity, hass, entry):
             CONF_WINTER_MODE: True,
         },
     )
-    hass.bus.async_fire.assert_called_once_with(
-        WINTER_MODE_CHANGED_EVENT,
-        {"enabled": True}
+    dispatcher_send.assert_called_once_with(
+        hass, f"{WINTER_MODE_CHANGED_EVENT}_test_entry", True
     )
     winterbetrieb_entity.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_save_state_is_entry_scoped(winterbetrieb_entity, hass, dispatcher_send):
+    """Der Winterbetrieb eines Eintrags lässt andere Einträge unberührt."""
+    winterbetrieb_entity.async_write_ha_state = MagicMock()
+    hass.data[DOMAIN]["other_entry"] = {CONF_WINTER_MODE: False}
+
+    await winterbetrieb_entity._save_state(True)
+
+    assert hass.data[DOMAIN]["other_entry"][CONF_WINTER_MODE] is False
+    assert CONF_WINTER_MODE not in hass.data[DOMAIN]
+    dispatcher_send.assert_called_once_with(
+        hass, f"{WINTER_MODE_CHANGED_EVENT}_test_entry", True
+    )